@@ -0,0 +1,109 @@
+"""
+Description: 列表查询字段投影基准测试
+    在替身服务器上执行 get_tasks 的三条列表路径（search_params / filter / 关联扫描），
+    对比:
+    - 无投影: 请求全部字段（优化前行为）
+    - 有投影: 只请求摘要字段（关联扫描额外请求关联字段）
+    输出每 100 条的平均响应字节数与 JSON 解析耗时。
+Usage:
+    uv run scripts/benchmarks/bench_field_projection.py [--pages 10]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from contextlib import nullcontext
+from typing import Any, Dict
+from unittest.mock import patch
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from scripts.benchmarks.stand_in_server import PROJECT_KEY, TYPE_NAME, stand_in_server
+from src.providers.lark_project.work_item_provider import WorkItemProvider
+
+PAGE_SIZE = 100
+LIST_PATHS = ("/search/params", "/work_item/filter")
+
+CASES: Dict[str, Dict[str, Any]] = {
+    "search_params": {"status": ["待处理"]},
+    "filter": {"name_keyword": "Bench"},
+    "related_scan": {"related_to": 1},
+}
+
+
+async def run_case(pages: int, kwargs: Dict[str, Any], projected: bool) -> Dict:
+    """执行一组列表查询并统计列表响应的字节数与解析耗时"""
+    with stand_in_server(latency=0) as router:
+        provider = WorkItemProvider(
+            project_key=PROJECT_KEY, work_item_type_name=TYPE_NAME
+        )
+        # 关闭结果缓存，每页都真实请求
+        provider._query_cache.ttl = 0
+        # 预热: 加载元数据并编译查询计划
+        await provider.get_tasks(page_size=PAGE_SIZE, **kwargs)
+        warm_calls = len(router.calls)
+
+        # 无投影: 让投影计算返回 None（请求全部字段，等价于优化前）
+        no_projection = patch.object(
+            WorkItemProvider,
+            "_projection_fields",
+            staticmethod(lambda *args, **kw: None),
+        )
+        with nullcontext() if projected else no_projection:
+            if "related_to" in kwargs:
+                # 关联扫描自行分页，批大小为 _SCAN_BATCH_SIZE
+                await provider.get_tasks(**kwargs)
+            else:
+                for page in range(1, pages + 1):
+                    await provider.get_tasks(
+                        page_num=page, page_size=PAGE_SIZE, **kwargs
+                    )
+
+        sizes = []
+        parse_ms = []
+        items = 0
+        for call in list(router.calls)[warm_calls:]:
+            if not any(path in call.request.url.path for path in LIST_PATHS):
+                continue
+            content = call.response.content
+            start = time.perf_counter()
+            data = json.loads(content)
+            parse_ms.append((time.perf_counter() - start) * 1000)
+            sizes.append(len(content))
+            items += len(data["data"]["work_items"])
+
+    return {
+        "requests": len(sizes),
+        "kb_per_100": sum(sizes) / items * PAGE_SIZE / 1024,
+        "parse_ms_per_100": sum(parse_ms) / items * PAGE_SIZE,
+        "parse_ms_p50": statistics.median(parse_ms),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="列表查询字段投影基准测试")
+    parser.add_argument("--pages", type=int, default=10, help="每组分页查询的页数")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    print(f"每页 {PAGE_SIZE} 条，分页查询 {args.pages} 页")
+    print(f"{'路径':<16}{'模式':<8}{'请求数':>8}{'KB/100条':>12}{'解析ms/100条':>16}")
+    for name, kwargs in CASES.items():
+        for label, projected in (("无投影", False), ("有投影", True)):
+            result = await run_case(args.pages, kwargs, projected)
+            print(
+                f"{name:<16}{label:<8}{result['requests']:>8}"
+                f"{result['kb_per_100']:>12.1f}{result['parse_ms_per_100']:>16.2f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,74 @@
+"""
+Description: Provider 实例池基准测试
+    在替身服务器上重复调用 get_task_detail 工具，对比:
+    - 无实例池: 每次调用前清空实例池（等价于每次新建 Provider）
+    - 有实例池: 相同 (project, work_item_type) 复用 Provider
+    输出每次调用的平均/中位耗时与平均 HTTP 请求数。
+Usage:
+    uv run scripts/benchmarks/bench_provider_pool.py [--calls 50] [--latency 0.02]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+from typing import Dict
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from scripts.benchmarks.stand_in_server import PROJECT_KEY, stand_in_server
+from src import mcp_server
+
+
+async def run_case(calls: int, latency: float, pooled: bool) -> Dict[str, float]:
+    """执行一组调用并统计耗时与请求数"""
+    with stand_in_server(latency=latency) as router:
+        mcp_server._provider_pool.clear()
+        # 预热: 加载 MetadataManager 全局缓存与 token，避免计入首次冷启动
+        await mcp_server.get_task_detail(issue_id=1, project=PROJECT_KEY)
+        warm_calls = len(router.calls)
+
+        durations = []
+        for i in range(calls):
+            if not pooled:
+                mcp_server._provider_pool.clear()
+            start = time.perf_counter()
+            await mcp_server.get_task_detail(issue_id=i % 10 + 1, project=PROJECT_KEY)
+            durations.append((time.perf_counter() - start) * 1000)
+
+        requests = len(router.calls) - warm_calls
+
+    return {
+        "mean_ms": statistics.mean(durations),
+        "p50_ms": statistics.median(durations),
+        "requests_per_call": requests / calls,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Provider 实例池基准测试")
+    parser.add_argument("--calls", type=int, default=50, help="每组调用次数")
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="替身服务器单请求延迟（秒）"
+    )
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    print(f"调用次数: {args.calls}, 模拟延迟: {args.latency * 1000:.0f}ms")
+    print(f"{'模式':<10}{'平均(ms)':>12}{'中位(ms)':>12}{'请求/次':>10}")
+    for label, pooled in (("无实例池", False), ("有实例池", True)):
+        result = await run_case(args.calls, args.latency, pooled)
+        print(
+            f"{label:<10}{result['mean_ms']:>12.1f}{result['p50_ms']:>12.1f}"
+            f"{result['requests_per_call']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,215 @@
+"""
+Description: 基准测试用的飞书项目替身服务器
+    基于 respx 拦截 https://project.feishu.cn 的请求，按固定延迟返回构造数据，
+    用于在无真实凭证的环境下对比优化前后的调用次数与耗时。
+Usage:
+    from scripts.benchmarks.stand_in_server import stand_in_server
+
+    with stand_in_server(latency=0.02) as router:
+        ...
+        print(len(router.calls))
+"""
+
+import asyncio
+import json
+import os
+import sys
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+import respx
+from httpx import Request, Response
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from src.core import project_client as client_module
+from src.core.config import settings
+from src.providers.lark_project.managers import MetadataManager
+
+BASE_URL = "https://project.feishu.cn"
+PROJECT_KEY = "project_bench"
+PROJECT_NAME = "Bench Project"
+TYPE_KEY = "issue_type"
+TYPE_NAME = "问题管理"
+USER_COUNT = 20
+LIST_TOTAL = 1000  # 列表查询的工作项总数
+CUSTOM_FIELD_COUNT = 40  # 列表查询条目附带的自定义字段数（模拟真实空间的宽条目）
+
+FIELDS: List[Dict] = [
+    {"field_key": "name", "field_name": "名称", "field_type_key": "text"},
+    {
+        "field_key": "priority",
+        "field_name": "优先级",
+        "field_alias": "priority",
+        "field_type_key": "select",
+        "options": [{"value": f"opt_p{i}", "label": f"P{i}"} for i in range(4)],
+    },
+    {
+        "field_key": "work_item_status",
+        "field_name": "状态",
+        "field_alias": "status",
+        "field_type_key": "select",
+        "options": [
+            {"value": "opt_todo", "label": "待处理"},
+            {"value": "opt_done", "label": "已完成"},
+        ],
+    },
+    {
+        "field_key": "owner",
+        "field_name": "负责人",
+        "field_alias": "owner",
+        "field_type_key": "user",
+    },
+    {
+        "field_key": "watchers",
+        "field_name": "关注人",
+        "field_type_key": "multi_user",
+    },
+    {
+        "field_key": "related_story",
+        "field_name": "关联需求",
+        "field_type_key": "work_item_related_select",
+    },
+]
+
+
+def build_work_item(item_id: int, custom_fields: int = 0) -> Dict:
+    """构造一个带用户字段的工作项，可附带若干自定义文本字段"""
+    item = {
+        "id": item_id,
+        "name": f"Bench Item {item_id}",
+        "project_key": PROJECT_KEY,
+        "work_item_type_key": TYPE_KEY,
+        "fields": [
+            {"field_key": "priority", "field_value": {"value": f"opt_p{item_id % 4}"}},
+            {"field_key": "work_item_status", "field_value": {"value": "opt_todo"}},
+            {"field_key": "owner", "field_value": f"user_{item_id % USER_COUNT}"},
+            {
+                "field_key": "watchers",
+                "field_value": [
+                    f"user_{(item_id + k) % USER_COUNT}" for k in range(1, 4)
+                ],
+            },
+            {"field_key": "related_story", "field_value": item_id // 10 + 1},
+        ],
+    }
+    item["fields"].extend(
+        {
+            "field_key": f"field_custom_{k}",
+            "field_type_key": "text",
+            "field_value": f"自定义字段 {k} 的内容，工作项 {item_id}" * 2,
+        }
+        for k in range(custom_fields)
+    )
+    return item
+
+
+def build_page(body: Dict) -> Dict:
+    """按请求的分页与字段投影构造列表查询结果"""
+    page_num = body.get("page_num") or 1
+    page_size = body.get("page_size") or 20
+    start = (page_num - 1) * page_size
+    ids = range(start + 1, min(start + page_size, LIST_TOTAL) + 1)
+    items = [build_work_item(i, CUSTOM_FIELD_COUNT) for i in ids]
+
+    fields = body.get("fields")
+    if fields:
+        wanted = set(fields)
+        for item in items:
+            item["fields"] = [f for f in item["fields"] if f["field_key"] in wanted]
+
+    return {
+        "work_items": items,
+        "pagination": {
+            "total": LIST_TOTAL,
+            "page_num": page_num,
+            "page_size": page_size,
+        },
+    }
+
+
+def _ok(data) -> Response:
+    return Response(200, json={"err_code": 0, "err_msg": "", "data": data})
+
+
+@contextmanager
+def stand_in_server(latency: float = 0.02) -> Iterator[respx.MockRouter]:
+    """
+    启动替身服务器
+
+    Args:
+        latency: 每个请求的模拟网络延迟（秒）
+
+    Yields:
+        respx 路由器，可通过 router.calls 统计请求次数
+    """
+    settings.FEISHU_PROJECT_PLUGIN_ID = "bench_pid"
+    settings.FEISHU_PROJECT_PLUGIN_SECRET = "bench_secret"
+    settings.FEISHU_PROJECT_USER_KEY = "bench_user"
+    settings.FEISHU_PROJECT_KEY = PROJECT_KEY
+    client_module._project_client = None
+    MetadataManager.reset_instance()
+
+    def delayed(builder):
+        async def handler(request: Request) -> Response:
+            await asyncio.sleep(latency)
+            return builder(request)
+
+        return handler
+
+    def query_users(request: Request) -> Response:
+        body = json.loads(request.content or b"{}")
+        keys = body.get("user_keys") or []
+        return _ok([{"user_key": k, "name_cn": f"用户{k[5:]}"} for k in keys])
+
+    def query_items(request: Request) -> Response:
+        body = json.loads(request.content or b"{}")
+        ids = body.get("work_item_ids") or []
+        return _ok([build_work_item(int(i)) for i in ids])
+
+    def list_items(request: Request) -> Response:
+        return _ok(build_page(json.loads(request.content or b"{}")))
+
+    with respx.mock(base_url=BASE_URL, assert_all_called=False) as router:
+        router.post("/open_api/authen/plugin_token").mock(
+            return_value=Response(
+                200, json={"data": {"token": "bench_token", "expire_time": 7200}}
+            )
+        )
+        router.post("/open_api/projects").mock(
+            side_effect=delayed(lambda r: _ok([PROJECT_KEY]))
+        )
+        router.post("/open_api/projects/detail").mock(
+            side_effect=delayed(
+                lambda r: _ok(
+                    {PROJECT_KEY: {"project_key": PROJECT_KEY, "name": PROJECT_NAME}}
+                )
+            )
+        )
+        router.get(f"/open_api/{PROJECT_KEY}/work_item/all-types").mock(
+            side_effect=delayed(
+                lambda r: _ok([{"type_key": TYPE_KEY, "name": TYPE_NAME}])
+            )
+        )
+        router.post(f"/open_api/{PROJECT_KEY}/field/all").mock(
+            side_effect=delayed(lambda r: _ok(FIELDS))
+        )
+        router.post(f"/open_api/{PROJECT_KEY}/relation/rules").mock(
+            side_effect=delayed(lambda r: _ok([]))
+        )
+        router.get(f"/open_api/{PROJECT_KEY}/work_item/relation").mock(
+            side_effect=delayed(lambda r: _ok([]))
+        )
+        router.post("/open_api/user/query").mock(side_effect=delayed(query_users))
+        router.post(f"/open_api/{PROJECT_KEY}/work_item/{TYPE_KEY}/query").mock(
+            side_effect=delayed(query_items)
+        )
+        router.post(f"/open_api/{PROJECT_KEY}/work_item/{TYPE_KEY}/search/params").mock(
+            side_effect=delayed(list_items)
+        )
+        router.post(f"/open_api/{PROJECT_KEY}/work_item/filter").mock(
+            side_effect=delayed(list_items)
+        )
+        yield router
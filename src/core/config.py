@@ -32,6 +32,25 @@ class Settings(BaseSettings):
     FEISHU_PROJECT_PLUGIN_ID: str | None = None
     FEISHU_PROJECT_PLUGIN_SECRET: str | None = None
 
+    # 列表查询结果缓存 TTL（秒），0 表示禁用
+    QUERY_CACHE_TTL: float = 15
+
+    # 同一工作项字段更新的合并窗口（秒），0 表示禁用
+    UPDATE_COALESCE_WINDOW: float = 0
+
+    # 写入并发窗口 (AIMD): 初始值、上下限，以及延迟相对基线的容忍倍数（0 表示不按延迟降窗）
+    WRITE_CONCURRENCY_INITIAL: int = 2
+    WRITE_CONCURRENCY_MIN: int = 1
+    WRITE_CONCURRENCY_MAX: int = 15
+    WRITE_LATENCY_TOLERANCE: float = 2.0
+
+    # HTTP 批量导入文件及检查点的落盘目录
+    IMPORT_DIR: str = "data/imports"
+
+    # HTTP 后台任务: 状态文件目录与同时运行的任务数
+    JOB_STORE_DIR: str = "data/jobs"
+    JOB_WORKERS: int = 2
+
     # Logging
     LOG_LEVEL: str = "INFO"  # DEBUG, INFO, WARNING, ERROR, CRITICAL
 
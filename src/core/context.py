@@ -1,5 +1,33 @@
 from contextvars import ContextVar
-from typing import Optional
+from typing import Any, Optional, Protocol, Sequence
 
 # 定义一个 ContextVar 来存储当前请求的 user_key
 user_key_context: ContextVar[Optional[str]] = ContextVar("user_key", default=None)
+
+
+class ProgressReporter(Protocol):
+    """长时间运行操作的进度接收方（如后台任务）"""
+
+    def set_total(self, total: int) -> None: ...
+
+    def advance(self, results: Sequence[Any]) -> None: ...
+
+
+# 当前操作的进度接收方；未设置时进度上报为空操作
+progress_context: ContextVar[Optional[ProgressReporter]] = ContextVar(
+    "progress", default=None
+)
+
+
+def report_total(total: int) -> None:
+    """上报当前操作的总工作量（如待写入的字段数）"""
+    reporter = progress_context.get()
+    if reporter is not None:
+        reporter.set_total(total)
+
+
+def report_results(results: Sequence[Any]) -> None:
+    """上报已完成的部分结果"""
+    reporter = progress_context.get()
+    if reporter is not None and results:
+        reporter.advance(results)
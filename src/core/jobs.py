@@ -0,0 +1,364 @@
+"""
+JobManager - 后台任务管理
+
+HTTP 调用方（如 n8n）对长时间运行的批量工具调用容易超时并丢失结果。
+提交为后台任务后立即返回任务 ID，调用方轮询状态、进度与部分结果。
+
+特性:
+- 有界: 固定数量的 worker 协程消费任务队列，限制同时运行的工具调用数
+- 进度: 运行期间通过 progress_context 接收工具上报的总量与部分结果
+- 持久化: 每个任务一个 JSON 文件，状态变化时原子写入，进度更新按间隔节流；
+  进程重启后排队中的任务重新入队，运行中的任务标记为 interrupted
+  （工具调用不一定幂等，不自动重跑）
+- 取消: 排队中的任务直接取消，运行中的任务取消其协程
+- 归属: 提交者的 user_key 只保存在内存中，落盘的只有其哈希（owner）；
+  任务只对同一 user_key 可见，匿名提交的任务只对匿名调用方可见。
+  重启后无法恢复身份，带 owner 的排队任务标记为 interrupted，不以其他身份执行
+- 有界结果: 只保留最近 MAX_PARTIAL_RESULTS 条部分结果，
+  更早的结果只计入 done/failed 计数与 results_dropped
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from src.core.context import progress_context
+
+logger = logging.getLogger(__name__)
+
+# 工具执行函数: (tool_name, parameters) -> 结果
+ToolRunner = Callable[[str, Dict[str, Any]], Awaitable[Any]]
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+INTERRUPTED = "interrupted"
+FINISHED_STATUSES = frozenset({SUCCEEDED, FAILED, CANCELLED, INTERRUPTED})
+
+
+def _owner_of(user_key: Optional[str]) -> Optional[str]:
+    """user_key 的哈希（用于落盘与访问校验，不保存明文）"""
+    if not user_key:
+        return None
+    return hashlib.sha256(user_key.encode("utf-8")).hexdigest()
+
+
+def _serialize(value: Any) -> Any:
+    """将 NamedTuple 结果（UpdateResult/CreateResult）转换为可 JSON 序列化的字典"""
+    if hasattr(value, "_asdict"):
+        return value._asdict()
+    return value
+
+
+class Job:
+    """单个后台任务的状态"""
+
+    # 保留的部分结果条数上限（持久化文件与内存占用不随任务规模增长）
+    MAX_PARTIAL_RESULTS = 500
+
+    # 持久化/返回给调用方的字段
+    FIELDS = (
+        "id",
+        "tool_name",
+        "parameters",
+        "status",
+        "created_at",
+        "started_at",
+        "finished_at",
+        "total",
+        "done",
+        "failed",
+        "partial_results",
+        "results_dropped",
+        "result",
+        "error",
+        "owner",
+    )
+
+    def __init__(
+        self,
+        tool_name: str,
+        parameters: Dict[str, Any],
+        user_key: Optional[str] = None,
+    ):
+        self.id = uuid.uuid4().hex
+        self.tool_name = tool_name
+        self.parameters = parameters
+        # 提交者身份：明文只在内存中，执行时注入工具参数
+        self.user_key = user_key
+        self.owner = _owner_of(user_key)
+        self.status = QUEUED
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.total: Optional[int] = None
+        self.done = 0
+        self.failed = 0
+        self.partial_results: List[Any] = []
+        # 因超出上限被丢弃的最早部分结果条数（results_offset 的起点）
+        self.results_dropped = 0
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.task: Optional["asyncio.Task[Any]"] = None
+
+    # ProgressReporter 协议
+    def set_total(self, total: int) -> None:
+        self.total = total
+
+    def advance(self, results: Sequence[Any]) -> None:
+        serialized = [_serialize(r) for r in results]
+        self.done += len(serialized)
+        self.failed += sum(
+            1 for r in serialized if isinstance(r, dict) and r.get("success") is False
+        )
+        self.partial_results.extend(serialized)
+        excess = len(self.partial_results) - self.MAX_PARTIAL_RESULTS
+        if excess > 0:
+            del self.partial_results[:excess]
+            self.results_dropped += excess
+
+    def results_since(self, offset: int) -> List[Any]:
+        """
+        返回绝对位置 offset 之后仍保留的部分结果
+
+        Args:
+            offset: 调用方已读取的结果条数（从任务开始计）
+
+        Returns:
+            部分结果列表；offset 早于已丢弃的结果时从最早保留的一条开始
+        """
+        return self.partial_results[max(0, offset - self.results_dropped) :]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    def visible_to(self, user_key: Optional[str]) -> bool:
+        """只对提交者可见；匿名提交的任务只对匿名调用方可见"""
+        return self.owner == _owner_of(user_key)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Job":
+        job = cls(data["tool_name"], data.get("parameters") or {})
+        for name in cls.FIELDS:
+            if name in data:
+                setattr(job, name, data[name])
+        return job
+
+
+class JobManager:
+    """
+    后台任务管理器
+
+    单线程异步场景下状态修改之间没有 await，无需加锁。
+    """
+
+    # 运行中进度写盘的最小间隔（秒）
+    SAVE_INTERVAL = 1.0
+
+    def __init__(
+        self,
+        runner: ToolRunner,
+        store_dir: str,
+        workers: int = 2,
+        retention: float = 7 * 24 * 3600,
+    ):
+        """
+        初始化任务管理器
+
+        Args:
+            runner: 工具执行函数
+            store_dir: 任务状态文件目录
+            workers: 同时运行的任务数上限
+            retention: 已结束任务的保留时间（秒），启动时清理过期任务
+        """
+        self.runner = runner
+        self.store_dir = Path(store_dir)
+        self.workers = max(1, workers)
+        self.retention = retention
+        self._jobs: Dict[str, Job] = {}
+        self._queue: "asyncio.Queue[str]" = asyncio.Queue()
+        self._worker_tasks: List["asyncio.Task[None]"] = []
+        self._stopping = False
+
+    async def start(self) -> None:
+        """加载持久化的任务并启动 worker"""
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        self._stopping = False
+        self._load()
+        self._worker_tasks = [
+            asyncio.create_task(self._worker()) for _ in range(self.workers)
+        ]
+        logger.info(
+            "JobManager started: %d worker(s), %d job(s) loaded",
+            self.workers,
+            len(self._jobs),
+        )
+
+    async def stop(self) -> None:
+        """停止 worker；运行中的任务标记为 interrupted"""
+        self._stopping = True
+        for job in self._jobs.values():
+            if job.task is not None and not job.task.done():
+                job.task.cancel()
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+
+    def submit(
+        self,
+        tool_name: str,
+        parameters: Dict[str, Any],
+        user_key: Optional[str] = None,
+    ) -> Job:
+        """
+        提交任务（立即返回，任务在后台排队执行）
+
+        Args:
+            tool_name: 工具名称
+            parameters: 工具参数（不含 user_key）
+            user_key: 提交者身份（可选，执行时注入，不落盘）
+
+        Returns:
+            新建的 Job
+        """
+        job = Job(tool_name, parameters, user_key)
+        self._jobs[job.id] = job
+        self._save(job)
+        self._queue.put_nowait(job.id)
+        logger.info("Job %s queued: tool=%s", job.id, tool_name)
+        return job
+
+    def get(self, job_id: str, user_key: Optional[str] = None) -> Optional[Job]:
+        """
+        获取任务
+
+        Args:
+            job_id: 任务 ID
+            user_key: 调用方身份
+
+        Returns:
+            任务；不存在或不属于该调用方时返回 None
+        """
+        job = self._jobs.get(job_id)
+        if job is None or not job.visible_to(user_key):
+            return None
+        return job
+
+    def cancel(self, job_id: str, user_key: Optional[str] = None) -> Optional[Job]:
+        """
+        取消任务：排队中的任务直接标记为 cancelled，运行中的任务取消其协程
+
+        Args:
+            job_id: 任务 ID
+            user_key: 调用方身份
+
+        Returns:
+            任务（不存在或不属于该调用方时返回 None）；已结束的任务保持原状态
+        """
+        job = self.get(job_id, user_key)
+        if job is None or job.status in FINISHED_STATUSES:
+            return job
+        if job.status == QUEUED:
+            self._finish(job, CANCELLED)
+        elif job.task is not None:
+            job.task.cancel()
+        return job
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            job = self._jobs.get(job_id)
+            if job is None or job.status != QUEUED:
+                continue
+            job.task = asyncio.create_task(self._execute(job))
+            # 等待而不传播取消：取消任务不应终止 worker
+            await asyncio.wait({job.task})
+
+    async def _execute(self, job: Job) -> None:
+        job.status = RUNNING
+        job.started_at = time.time()
+        self._save(job)
+        token = progress_context.set(job)
+        saver = asyncio.create_task(self._save_periodically(job))
+        parameters = dict(job.parameters)
+        if job.user_key:
+            parameters["user_key"] = job.user_key
+        try:
+            result = await self.runner(job.tool_name, parameters)
+        except asyncio.CancelledError:
+            self._finish(job, INTERRUPTED if self._stopping else CANCELLED)
+        except Exception as e:
+            logger.warning("Job %s failed: %s", job.id, e)
+            job.error = str(e)
+            self._finish(job, FAILED)
+        else:
+            job.result = result
+            self._finish(job, SUCCEEDED)
+        finally:
+            saver.cancel()
+            progress_context.reset(token)
+
+    async def _save_periodically(self, job: Job) -> None:
+        """运行期间按间隔保存进度，供进程重启后查看已完成的部分结果"""
+        while True:
+            await asyncio.sleep(self.SAVE_INTERVAL)
+            self._save(job)
+
+    def _finish(self, job: Job, status: str) -> None:
+        job.status = status
+        job.finished_at = time.time()
+        self._save(job)
+        logger.info("Job %s %s (%d done)", job.id, status, job.done)
+
+    def _path(self, job_id: str) -> Path:
+        return self.store_dir / f"{job_id}.json"
+
+    def _save(self, job: Job) -> None:
+        """原子写入任务状态（先写临时文件再替换）"""
+        path = self._path(job.id)
+        tmp = path.with_name(path.name + ".tmp")
+        try:
+            tmp.write_text(
+                json.dumps(job.to_dict(), ensure_ascii=False, default=str),
+                encoding="utf-8",
+            )
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning("Failed to persist job %s: %s", job.id, e)
+
+    def _load(self) -> None:
+        """加载持久化的任务：排队中的重新入队，运行中的标记为 interrupted"""
+        now = time.time()
+        for path in sorted(self.store_dir.glob("*.json")):
+            try:
+                job = Job.from_dict(json.loads(path.read_text(encoding="utf-8")))
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning("Skipping unreadable job file %s: %s", path, e)
+                continue
+            if job.id in self._jobs:
+                continue
+            if (
+                job.status in FINISHED_STATUSES
+                and job.finished_at
+                and now - job.finished_at > self.retention
+            ):
+                path.unlink(missing_ok=True)
+                continue
+            self._jobs[job.id] = job
+            if job.status == RUNNING:
+                self._finish(job, INTERRUPTED)
+            elif job.status == QUEUED and job.owner is not None:
+                # 提交者身份未落盘，不能以其他身份执行
+                job.error = "服务重启后提交者身份不可用，请重新提交"
+                self._finish(job, INTERRUPTED)
+            elif job.status == QUEUED:
+                self._queue.put_nowait(job.id)
@@ -0,0 +1,120 @@
+"""
+ProviderPool - Provider 实例池
+
+按 (project, work_item_type) 复用 Provider 实例，避免每次工具调用都重新构建
+Provider 及其内部缓存（类型 Key 解析结果、用户/工作项名称缓存等）。
+
+特性:
+- 有界: 超过 max_size 时按 LRU 淘汰最久未使用的实例
+- TTL: 实例创建超过 ttl 秒后淘汰重建，防止内部缓存长期陈旧
+- 事件循环隔离: Provider 内部持有 asyncio.Lock/Semaphore，
+  跨事件循环复用会报错，因此检测到事件循环变化时重建实例
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ProviderPool:
+    """
+    有界、带 TTL 的 Provider 实例池
+
+    单线程异步场景下 get() 内部没有 await，无需加锁。
+    """
+
+    def __init__(self, max_size: int = 32, ttl: int = 600):
+        self.max_size = max_size
+        self.ttl = ttl
+        # key -> (instance, created_at, loop_id)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float, Optional[int]]]" = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+        logger.debug("ProviderPool initialized: max_size=%d, ttl=%d", max_size, ttl)
+
+    @staticmethod
+    def _current_loop_id() -> Optional[int]:
+        try:
+            return id(asyncio.get_running_loop())
+        except RuntimeError:
+            return None
+
+    def get(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """
+        获取池中实例，不存在/已过期时调用 factory 创建
+
+        Args:
+            key: 实例键，如 (project, work_item_type)
+            factory: 无参工厂函数，用于创建新实例
+
+        Returns:
+            Provider 实例
+        """
+        now = time.time()
+        loop_id = self._current_loop_id()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            instance, created_at, entry_loop_id = entry
+            if now - created_at <= self.ttl and entry_loop_id == loop_id:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                logger.debug("ProviderPool hit: key=%s", key)
+                return instance
+            logger.debug("ProviderPool entry expired: key=%s", key)
+            del self._entries[key]
+
+        self.misses += 1
+        instance = factory()
+        self._entries[key] = (instance, now, loop_id)
+
+        while len(self._entries) > self.max_size:
+            evicted_key, _ = self._entries.popitem(last=False)
+            logger.debug("ProviderPool evicted: key=%s", evicted_key)
+
+        return instance
+
+    def invalidate(self, key: Hashable) -> bool:
+        """
+        移除指定键的实例
+
+        Args:
+            key: 实例键
+
+        Returns:
+            如果键存在并被移除则返回 True，否则返回 False
+        """
+        return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """清空实例池"""
+        size = len(self._entries)
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        logger.info("ProviderPool cleared: removed %d entries", size)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        获取实例池统计信息
+
+        Returns:
+            {"size", "max_size", "hits", "misses"}
+        """
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
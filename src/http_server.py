@@ -8,8 +8,18 @@ API 端点:
     POST /call_tool
     请求体: {"tool_name": "list_projects", "parameters": {...}}
     返回: MCP 工具的执行结果
+
+    POST /import?project=...&work_item_type=...&format=jsonl
+    请求体: JSONL/CSV 编辑文件（流式接收）
+    返回: 后台任务 job_id，导入报告为任务结果
+
+    POST /jobs                请求体同 /call_tool，后台执行并立即返回 job_id
+    GET /jobs/{job_id}?user_key=...       查询任务状态、进度与部分结果
+    DELETE /jobs/{job_id}?user_key=...    取消任务（只能访问自己提交的任务，
+                                          匿名任务只对匿名调用方可见）
 """
 
+import hashlib
 import json
 import logging
 import sys
@@ -19,7 +29,8 @@ from typing import Any, Callable, Awaitable
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 
-from fastapi import FastAPI, HTTPException
+import anyio
+from fastapi import FastAPI, HTTPException, Request
 from pydantic import BaseModel
 
 # =============================================================================
@@ -62,6 +73,7 @@ logger = logging.getLogger(__name__)
 logger.info(f"Logging configured. Log file: {log_file.absolute()}")
 
 from src.core.config import settings
+from src.core.jobs import FINISHED_STATUSES, Job, JobManager
 
 
 # =============================================================================
@@ -82,8 +94,10 @@ def _get_tool_registry() -> dict[str, ToolDefinition]:
     from src.mcp_server import (
         list_projects,
         create_task,
+        batch_create_tasks,
         get_tasks,
         get_task_detail,
+        get_task_details,
         update_task,
         get_task_options,
         batch_update_tasks,
@@ -100,6 +114,11 @@ def _get_tool_registry() -> dict[str, ToolDefinition]:
             description="在指定项目中创建新的工作项",
             func=create_task,
         ),
+        "batch_create_tasks": ToolDefinition(
+            name="batch_create_tasks",
+            description="在指定项目中批量创建工作项",
+            func=batch_create_tasks,
+        ),
         "get_tasks": ToolDefinition(
             name="get_tasks",
             description="获取项目中的工作项列表，支持多种过滤条件",
@@ -110,6 +129,11 @@ def _get_tool_registry() -> dict[str, ToolDefinition]:
             description="获取单个工作项的完整详情",
             func=get_task_detail,
         ),
+        "get_task_details": ToolDefinition(
+            name="get_task_details",
+            description="批量获取多个工作项的完整详情",
+            func=get_task_details,
+        ),
         "update_task": ToolDefinition(
             name="update_task",
             description="更新工作项的字段",
@@ -161,8 +185,14 @@ class ToolCallResponse(BaseModel):
 async def lifespan(app: FastAPI):
     """应用生命周期管理"""
     logger.info("Starting HTTP wrapper for MCP Server")
+    await job_manager.start()
     yield
     logger.info("Shutting down HTTP wrapper")
+    await job_manager.stop()
+    # 写出写后合并队列中待写入的更新
+    from src.providers.lark_project.update_coalescer import UpdateCoalescer
+
+    await UpdateCoalescer.get_instance().flush_all()
 
 
 app = FastAPI(
@@ -276,10 +306,183 @@ async def call_tool(request: ToolCallRequest):
         return ToolCallResponse(success=False, error=f"调用工具失败: {str(e)}")
 
 
+@app.post("/jobs")
+async def submit_job(request: ToolCallRequest):
+    """
+    提交后台任务：立即返回任务 ID，工具调用在后台 worker 中执行
+    """
+    registry = get_tool_registry()
+    if request.tool_name not in registry:
+        allowed_tools = list(registry.keys())
+        raise HTTPException(
+            status_code=400,
+            detail=f"不支持的工具: {request.tool_name}。支持的工具: {allowed_tools}",
+        )
+
+    # user_key 不随参数落盘，由 JobManager 在执行时注入
+    parameters = dict(request.parameters)
+    user_key = request.user_key or parameters.pop("user_key", None)
+    parameters.pop("user_key", None)
+
+    job = job_manager.submit(request.tool_name, parameters, user_key=user_key)
+    return {"job_id": job.id, "status": job.status}
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str, results_offset: int = 0, user_key: str | None = None):
+    """
+    查询后台任务状态、进度与部分结果
+
+    results_offset 用于增量轮询：从任务开始计的位置，只返回该位置之后的部分结果；
+    只保留最近的部分结果，早于 results_dropped 的位置从最早保留的一条开始。
+    任务只能由提交时的 user_key 查询（匿名提交的任务只能匿名查询）。
+    """
+    job = job_manager.get(job_id, user_key)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"任务不存在: {job_id}")
+    data = job.to_dict()
+    data.pop("owner", None)
+    offset = max(results_offset, job.results_dropped)
+    data["partial_results"] = job.results_since(offset)
+    data["results_offset"] = offset
+    return data
+
+
+@app.delete("/jobs/{job_id}")
+async def cancel_job(job_id: str, user_key: str | None = None):
+    """取消后台任务（已结束的任务保持原状态；只能取消自己提交的任务）"""
+    job = job_manager.cancel(job_id, user_key)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"任务不存在: {job_id}")
+    return {"job_id": job.id, "status": job.status}
+
+
+# 后台导入任务名称（不在工具注册表中，只能通过 /import 提交）
+IMPORT_JOB = "import_edits"
+
+# 未结束的导入任务（上传文件名 -> Job），防止相同导入并发共用检查点
+_active_imports: dict[str, Job] = {}
+
+
+async def _run_import(
+    path: str,
+    project: str | None = None,
+    work_item_type: str | None = None,
+    dry_run: bool = False,
+    user_key: str | None = None,
+) -> dict[str, Any]:
+    """
+    执行导入任务（在 JobManager 的 worker 中运行）
+
+    成功后删除上传文件；ValueError（内容或检查点与目标不匹配）续传不可能成功，
+    同样删除；其他异常或取消时保留上传文件与检查点，重新提交时续传。
+    """
+    from src.core.context import user_key_context
+    from src.mcp_server import _create_provider
+    from src.services.bulk_import import import_file
+
+    upload = Path(path)
+    token = user_key_context.set(user_key)
+    try:
+        report = await import_file(
+            upload,
+            _create_provider,
+            project=project,
+            work_item_type=work_item_type,
+            dry_run=dry_run,
+        )
+    except ValueError:
+        upload.unlink(missing_ok=True)
+        raise
+    finally:
+        user_key_context.reset(token)
+
+    upload.unlink(missing_ok=True)
+    report["import_id"] = upload.stem
+    return report
+
+
+async def run_job(tool_name: str, parameters: dict[str, Any]) -> Any:
+    """后台任务执行入口：导入任务走导入流程，其余按 MCP 工具调用"""
+    if tool_name == IMPORT_JOB:
+        return await _run_import(**parameters)
+    return await call_mcp_tool(tool_name, parameters)
+
+
+job_manager = JobManager(run_job, settings.JOB_STORE_DIR, workers=settings.JOB_WORKERS)
+
+
+@app.post("/import")
+async def import_edits(
+    request: Request,
+    project: str | None = None,
+    work_item_type: str | None = None,
+    format: str = "jsonl",
+    dry_run: bool = False,
+    user_key: str | None = None,
+):
+    """
+    批量导入 JSONL/CSV 编辑文件（后台任务）
+
+    请求体流式写入 IMPORT_DIR，文件名取内容与导入目标（项目/类型）的哈希，
+    接收完成后提交为后台任务并立即返回 job_id，通过 GET /jobs/{job_id} 查询报告。
+    中断后向同一目标重新提交相同内容会从检查点继续，已完成的行不再重复写入。
+    相同文件与目标的导入同时只允许一个；导入完成后删除上传文件。
+    """
+    from src.services.bulk_import import detect_format
+
+    import_dir = Path(settings.IMPORT_DIR)
+    import_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        fmt = detect_format(Path(f"upload.{format}"))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    digest = hashlib.sha256()
+    spool = import_dir / f"upload-{os.getpid()}-{id(request)}.tmp"
+    try:
+        # 文件写入在线程中执行，不阻塞事件循环
+        async with await anyio.open_file(spool, "wb") as f:
+            async for chunk in request.stream():
+                digest.update(chunk)
+                await f.write(chunk)
+        target = hashlib.sha256(f"{project}\0{work_item_type}".encode()).hexdigest()
+        path = import_dir / f"{digest.hexdigest()[:16]}-{target[:8]}.{fmt}"
+        # 相同内容与目标共用一个检查点，并发运行会互相覆盖
+        active = _active_imports.get(path.name)
+        if active is not None and active.status not in FINISHED_STATUSES:
+            raise HTTPException(
+                status_code=409, detail=f"相同文件正在导入中: {path.stem}"
+            )
+        os.replace(spool, path)
+    finally:
+        # 接收中断或重复导入时清理临时文件（重命名成功后已不存在）
+        spool.unlink(missing_ok=True)
+
+    job = job_manager.submit(
+        IMPORT_JOB,
+        {
+            "path": str(path),
+            "project": project,
+            "work_item_type": work_item_type,
+            "dry_run": dry_run,
+        },
+        user_key=user_key,
+    )
+    _active_imports[path.name] = job
+    return {"job_id": job.id, "status": job.status, "import_id": path.stem}
+
+
 @app.get("/health")
 async def health_check():
-    """健康检查接口"""
-    return {"status": "healthy", "service": "lark-mcp-http-wrapper"}
+    """健康检查接口（附带当前写入并发窗口）"""
+    from src.providers.lark_project.write_limiter import WriteLimiter
+
+    return {
+        "status": "healthy",
+        "service": "lark-mcp-http-wrapper",
+        "write_concurrency": WriteLimiter.get_instance().snapshot(),
+    }
 
 
 @app.get("/tools")
@@ -26,8 +26,9 @@ import re
 import json
 import logging
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional, List, Any, Callable, TypeVar, cast
+from typing import Optional, List, Any, AsyncIterator, Callable, TypeVar, cast
 import functools
 import httpx
 
@@ -35,7 +36,9 @@ from mcp.server.fastmcp import FastMCP
 
 from src.core.config import settings
 from src.core.context import user_key_context
+from src.core.provider_pool import ProviderPool
 from src.providers.lark_project.managers import MetadataManager
+from src.providers.lark_project.update_coalescer import UpdateCoalescer
 from src.providers.lark_project.work_item_provider import WorkItemProvider
 
 
@@ -226,8 +229,21 @@ if not logging.root.handlers:
 logger = logging.getLogger(__name__)
 logger.debug("Logger initialized for module: %s", __name__)
 
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """MCP Server 生命周期：关闭时写出写后合并队列中待写入的更新"""
+    try:
+        yield
+    finally:
+        await UpdateCoalescer.get_instance().flush_all()
+
+
 # Initialize FastMCP server
-mcp = FastMCP("Lark")
+mcp = FastMCP("Lark", lifespan=_lifespan)
+
+# Provider 实例池：MCP 工具与 HTTP 包装器共享，按 (project, work_item_type) 复用
+_provider_pool = ProviderPool(max_size=32, ttl=600)
 
 
 T = TypeVar("T")
@@ -365,10 +381,12 @@ def _create_provider(
     project: Optional[str] = None, work_item_type: Optional[str] = None
 ) -> WorkItemProvider:
     """
-    根据 project 参数创建 Provider
+    根据 project 参数获取 Provider
 
     自动判断传入的是 project_key 还是 project_name，并相应处理。
     如果未提供 project，则使用环境变量 FEISHU_PROJECT_KEY。
+    相同 (project, work_item_type) 的调用复用实例池中的 Provider，
+    以保留其类型 Key 解析结果和名称缓存。
 
     Args:
         project: 项目标识符（可以是 project_key 或 project_name），可选
@@ -395,7 +413,8 @@ def _create_provider(
     else:
         logger.debug("Using default project from FEISHU_PROJECT_KEY")
 
-    return WorkItemProvider(**kwargs)
+    pool_key = (project or settings.FEISHU_PROJECT_KEY, work_item_type)
+    return _provider_pool.get(pool_key, lambda: WorkItemProvider(**kwargs))
 
 
 @mcp.tool()
@@ -503,6 +522,86 @@ async def create_task(
     return f"创建成功，Issue ID: {issue_id}"
 
 
+@mcp.tool()
+@with_user_context
+@with_error_handling("批量创建任务")
+async def batch_create_tasks(
+    items: List[dict],
+    project: Optional[str] = None,
+    work_item_type: Optional[str] = None,
+    user_key: Optional[str] = None,
+) -> str:
+    """
+    在指定项目中批量创建工作项。
+
+    字段 Key、选项值和负责人在整批内只解析一次，然后并发创建；
+    单个工作项失败不影响其他工作项。
+
+    Args:
+        items: 工作项列表，每项为对象，支持以下键:
+               - name: 工作项标题（必填）
+               - priority: 优先级（默认 P2）
+               - description: 描述
+               - assignee: 负责人的姓名或邮箱
+               - extra_fields: 额外字段（{字段名: 值}）
+        project: 项目标识符（可选）。可以是项目名称或 project_key。
+                如不指定，则使用环境变量 FEISHU_PROJECT_KEY 配置的默认项目。
+        work_item_type: 工作项类型名称（可选）。
+        user_key: (可选) 飞书用户标识符 (X-USER-KEY)，用于以特定用户身份进行操作。
+
+    Returns:
+        JSON 格式结果，包含与输入顺序一致的逐项结果（index, success, issue_id, message）。
+
+    Examples:
+        batch_create_tasks(
+            items=[
+                {"name": "修复登录页面崩溃问题", "priority": "P0"},
+                {"name": "优化首页加载速度", "assignee": "张三"},
+            ]
+        )
+    """
+    if not items:
+        return json.dumps(
+            {"success": False, "error": "必须提供 items"},
+            ensure_ascii=False,
+        )
+
+    logger.info(
+        "Batch creating tasks: project=%s, work_item_type=%s, count=%d",
+        _mask_project(project),
+        work_item_type,
+        len(items),
+    )
+    provider = _create_provider(project, work_item_type)
+    results = await provider.batch_create_issues(items)
+
+    created_count = sum(1 for r in results if r.success)
+    logger.info("Batch create completed: %d/%d created", created_count, len(results))
+
+    return json.dumps(
+        {
+            "success": True,
+            "message": f"批量创建完成，成功 {created_count}/{len(results)} 个",
+            "data": {
+                "results": [
+                    {
+                        "index": r.index,
+                        "success": r.success,
+                        "issue_id": r.issue_id,
+                        "name": r.name,
+                        "message": r.message,
+                    }
+                    for r in results
+                ],
+                "created_count": created_count,
+                "failed_count": len(results) - created_count,
+            },
+        },
+        ensure_ascii=False,
+        indent=2,
+    )
+
+
 @mcp.tool()
 @with_user_context
 async def get_tasks(
@@ -515,6 +614,9 @@ async def get_tasks(
     related_to: Optional[str] = None,
     page_num: int = 1,
     page_size: int = 50,
+    role: Optional[str] = None,
+    role_user: Optional[str] = None,
+    include_roles: bool = False,
     user_key: Optional[str] = None,
 ) -> str:
     """
@@ -546,10 +648,16 @@ async def get_tasks(
                    例如：related_to="SG06VA1" 或 related_to=6288163810
         page_num: 页码，从 1 开始（默认 1）。
         page_size: 每页数量（默认 50，最大 100）。
+        role: 角色过滤（可选），如 "经办人"。只返回 role_user 担任该角色的工作项
+              （在当前页内过滤，total 为角色过滤前的总数）。
+        role_user: 角色人员（姓名或邮箱，可选）。默认为当前调用用户 (user_key)。
+        include_roles: 是否在结果中附带各角色及人员（roles 字段，默认 False）。
+                       指定 role 时自动附带。
         user_key: (可选) 飞书用户标识符 (X-USER-KEY)，用于以特定用户身份进行操作。
 
     Returns:
-        JSON 格式的工作项列表，包含 id, name, status, priority, owner。
+        JSON 格式的工作项列表，包含 id, name, status, priority, owner
+        （附带角色时还包含 roles）。
         失败时返回错误信息。
 
     Examples:
@@ -575,6 +683,9 @@ async def get_tasks(
             related_to=6181818812
         )
 
+        # 我担任经办人的工作项
+        get_tasks(role="经办人")
+
         # 指定项目并组合多个条件过滤
         get_tasks(
             project="Project Management",
@@ -625,6 +736,9 @@ async def get_tasks(
             related_to=related_to_id,
             page_num=page_num,
             page_size=page_size,
+            role=role,
+            role_user=role_user,
+            include_role_owners=include_roles,
         )
 
         # 确保 result 是字典类型
@@ -632,40 +746,34 @@ async def get_tasks(
             logger.error("Unexpected result type: %s, value: %s", type(result), result)
             return "获取任务列表失败: 返回数据格式错误"
 
-        # 构建字段映射（字段名称 -> 字段Key）
+        # 构建字段映射（字段名称 -> 字段Key），Provider 内按元数据指纹缓存
         field_mapping = {}
         try:
-            project_key = await provider._get_project_key()
-            type_key = await provider._get_type_key()
-            # 尝试获取常用字段的Key
-            for field_name in ["priority", "status", "owner"]:
-                try:
-                    field_key = await provider.meta.get_field_key(
-                        project_key, type_key, field_name
-                    )
-                    field_mapping[field_name] = field_key
-                    logger.debug("Field mapping %s -> %s", field_name, field_key)
-                except Exception as e:
-                    logger.debug("Field '%s' not found: %s", field_name, e)
+            field_mapping = await provider.get_summary_field_mapping()
         except Exception as e:
             logger.warning("Failed to build field mapping: %s", e)
 
         # 简化返回结果
         simplified = await provider.simplify_work_items(
-            result.get("items", []), field_mapping
+            result.get("items", []),
+            field_mapping,
+            include_roles=include_roles or bool(role),
         )
 
         logger.info(
             "Retrieved %d tasks (total: %d)", len(simplified), result.get("total", 0)
         )
 
+        response = {
+            "total": result.get("total", 0),
+            "page_num": result.get("page_num", page_num),
+            "page_size": result.get("page_size", page_size),
+            "items": simplified,
+        }
+        if role and result.get("hint"):
+            response["hint"] = result["hint"]
         return json.dumps(
-            {
-                "total": result.get("total", 0),
-                "page_num": result.get("page_num", page_num),
-                "page_size": result.get("page_size", page_size),
-                "items": simplified,
-            },
+            response,
             ensure_ascii=False,
             indent=2,
         )
@@ -744,6 +852,56 @@ async def get_task_detail(
     return json.dumps(detail, ensure_ascii=False, indent=2)
 
 
+@mcp.tool()
+@with_user_context
+@with_error_handling("批量获取工作项详情")
+async def get_task_details(
+    issue_ids: List[int],
+    project: Optional[str] = None,
+    work_item_type: Optional[str] = None,
+    user_key: Optional[str] = None,
+) -> str:
+    """
+    一次获取多个工作项的完整详情。
+
+    需要查看多个工作项时使用此工具，代替多次调用 get_task_detail。
+    所有工作项的用户字段与关联工作项会合并为一次批量解析，结果按输入顺序返回。
+
+    Args:
+        issue_ids: 工作项 ID 列表，必填。
+        project: 项目标识符（可选）。可以是项目名称或 project_key。
+                如不指定，则使用环境变量 FEISHU_PROJECT_KEY 配置的默认项目。
+        work_item_type: 工作项类型名称（可选），未知类型的 ID 优先在该类型中查找。
+        user_key: (可选) 飞书用户标识符 (X-USER-KEY)，用于以特定用户身份进行操作。
+
+    Returns:
+        JSON 格式结果，包含 items（工作项详情列表）与 not_found（未找到的 ID）。
+        失败时返回错误信息。
+
+    Examples:
+        get_task_details(issue_ids=[12345, 12346, 12347])
+    """
+    target_ids = list(dict.fromkeys(issue_ids or []))
+    if not target_ids:
+        return _error_response("批量获取工作项详情", "必须提供 issue_ids", "ERR_NO_IDS")
+
+    logger.info(
+        "Getting task details: project=%s, work_item_type=%s, count=%d",
+        _mask_project(project),
+        work_item_type,
+        len(target_ids),
+    )
+    provider = _create_provider(project, work_item_type)
+    result = await provider.get_readable_issues_details(target_ids)
+
+    logger.info(
+        "Retrieved %d task details (not found: %d)",
+        len(result["items"]),
+        len(result["not_found"]),
+    )
+    return json.dumps(result, ensure_ascii=False, indent=2)
+
+
 @mcp.tool()
 @with_user_context
 async def update_task(
@@ -758,6 +916,7 @@ async def update_task(
     field_name: Optional[str] = None,
     field_value: Optional[str] = None,
     fields_json: Optional[str] = None,
+    skip_unchanged: bool = False,
     user_key: Optional[str] = None,
 ) -> str:
     """
@@ -778,6 +937,7 @@ async def update_task(
         field_value: 单个自定义字段值（可选）。
         fields_json: JSON 格式的字段字典（可选），用于批量更新多个自定义字段。
                      例如: '{"Soc Vendor": "Amlogic", "DDR 大小": "128MB"}'
+        skip_unchanged: 跳过当前值与目标值相同的字段（可选，默认 False）。
         user_key: (可选) 飞书用户标识符 (X-USER-KEY)，用于以特定用户身份进行操作。
 
     Returns:
@@ -822,6 +982,7 @@ async def update_task(
             status=status,
             assignee=assignee,
             extra_fields=extra_fields,
+            skip_unchanged=skip_unchanged,
         )
 
         if not results:
@@ -927,6 +1088,7 @@ async def batch_update_tasks(
     assignee: Optional[str] = None,
     field_name: Optional[str] = None,
     field_value: Optional[str] = None,
+    skip_unchanged: bool = False,
     user_key: Optional[str] = None,
 ) -> str:
     """批量更新工作项字段（支持单个或多个工作项）。
@@ -943,6 +1105,7 @@ async def batch_update_tasks(
         assignee: 新负责人（姓名或邮箱）。
         field_name: 自定义字段名称，需配合 field_value 使用。
         field_value: 自定义字段值。
+        skip_unchanged: 跳过当前值与目标值相同的字段（默认 False）。
         user_key: (可选) 飞书用户标识符 (X-USER-KEY)，用于以特定用户身份进行操作。
 
     Returns:
@@ -983,6 +1146,7 @@ async def batch_update_tasks(
         status=status,
         assignee=assignee,
         extra_fields=extra_fields,
+        skip_unchanged=skip_unchanged,
     )
 
     logger.info("Batch update completed: %d results", len(results))
@@ -6,6 +6,7 @@ FieldAPI - L3 原子能力层
 - 配置 > 工作项配置 > 字段配置 > 获取字段信息: POST /open_api/:project_key/field/all
 - 配置 > 工作项配置 > 字段配置 > 创建自定义字段: POST /open_api/:project_key/field/:work_item_type_key/create
 - 配置 > 工作项配置 > 字段配置 > 更新自定义字段: PUT /open_api/:project_key/field/:work_item_type_key
+- 工作项 > 空间关联 > 获取空间关联规则列表: POST /open_api/:project_key/relation/rules
 """
 
 import logging
@@ -316,3 +317,40 @@ class FieldAPI:
         result = data.get("data", {})
         logger.info("Work item relation updated successfully")
         return result
+
+    async def get_relation_rules(self, project_key: str) -> List[Dict]:
+        """
+        获取空间关联规则列表
+
+        对应 Postman: 工作项 > 空间关联 > 获取空间关联规则列表
+        API: POST /open_api/:project_key/relation/rules
+
+        Args:
+            project_key: 项目空间 Key
+
+        Returns:
+            空间关联规则列表
+
+        Raises:
+            Exception: API 调用失败时抛出异常
+        """
+        url = f"/open_api/{project_key}/relation/rules"
+
+        logger.debug("Getting relation rules: project_key=%s", project_key)
+
+        resp = await self.client.post(url, json={})
+        resp.raise_for_status()
+        data = resp.json()
+
+        if data.get("err_code") != 0:
+            err_msg = data.get("err_msg", "Unknown error")
+            logger.error(
+                "获取空间关联规则失败: err_code=%s, err_msg=%s",
+                data.get("err_code"),
+                err_msg,
+            )
+            raise Exception(f"获取空间关联规则失败: {err_msg}")
+
+        rules = data.get("data") or []
+        logger.info("Retrieved %d relation rules", len(rules))
+        return rules
@@ -187,6 +187,48 @@ class MetadataAPI:
         logger.info("Retrieved %d workflow templates", len(templates))
         return templates
 
+    async def get_template_detail(self, project_key: str, template_id: int) -> Dict:
+        """
+        获取流程模板配置详情
+
+        对应 Postman: 配置 > 流程配置 > 获取流程模板配置详情
+        API: GET /open_api/:project_key/template_detail/:template_id
+
+        Args:
+            project_key: 项目空间 Key
+            template_id: 流程模板 ID
+
+        Returns:
+            流程模板详情，包含 workflow_confs, state_flow_confs, connections 等
+
+        Raises:
+            Exception: API 调用失败时抛出异常
+        """
+        url = f"/open_api/{project_key}/template_detail/{template_id}"
+
+        logger.debug(
+            "Getting template detail: project_key=%s, template_id=%s",
+            project_key,
+            template_id,
+        )
+
+        resp = await self.client.get(url)
+        resp.raise_for_status()
+        data = resp.json()
+
+        if data.get("err_code") != 0:
+            err_msg = data.get("err_msg", "Unknown error")
+            logger.error(
+                "获取流程模板详情失败: err_code=%s, err_msg=%s",
+                data.get("err_code"),
+                err_msg,
+            )
+            raise Exception(f"获取流程模板详情失败: {err_msg}")
+
+        detail = data.get("data", {})
+        logger.debug("Retrieved template detail successfully")
+        return detail
+
     async def update_work_item_type_config(
         self,
         project_key: str,
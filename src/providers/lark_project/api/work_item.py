@@ -119,8 +119,9 @@ class WorkItemAPI:
         work_item_type_key: str,
         work_item_ids: List[int],
         expand: Optional[Dict] = None,
+        fields: Optional[List[str]] = None,
     ) -> List[Dict]:
-        """批量获取工作项详情"""
+        """批量获取工作项详情（fields 指定时仅返回这些字段）"""
         self._validate_keys(project_key, work_item_type_key)
         logger.debug(
             "Querying work items: project_key=%s, type_key=%s, ids_count=%d",
@@ -131,6 +132,8 @@ class WorkItemAPI:
 
         url = f"/open_api/{project_key}/work_item/{work_item_type_key}/query"
         payload = {"work_item_ids": work_item_ids, "expand": expand or {}}
+        if fields:
+            payload["fields"] = fields
         resp = await self.client.post(url, json=payload)
         resp.raise_for_status()
         data = resp.json()
@@ -399,6 +402,37 @@ class WorkItemAPI:
         logger.info("Batch update queued: task_id=%s", task_id)
         return task_id
 
+    async def get_task_result(self, task_id: str) -> Dict:
+        """查询批量更新后台任务的执行结果。
+
+        API: GET /open_api/task_result?task_id=
+
+        Args:
+            task_id: batch_update 返回的后台任务 ID。
+
+        Returns:
+            任务结果，通常包含 status、success_work_item_ids、fail_work_item_ids 等。
+
+        Raises:
+            Exception: API 调用失败时抛出异常。
+        """
+        url = "/open_api/task_result"
+        resp = await self.client.get(url, params={"task_id": task_id})
+        resp.raise_for_status()
+        data = resp.json()
+        if data.get("err_code") != 0:
+            err_msg = data.get("err_msg", "Unknown error")
+            logger.error(
+                "Get task result failed: code=%s, msg=%s", data.get("err_code"), err_msg
+            )
+            raise Exception(f"查询批量任务结果失败: {err_msg}")
+
+        result = data.get("data") or {}
+        logger.debug(
+            "Task result: task_id=%s, status=%s", task_id, result.get("status")
+        )
+        return result
+
     async def get_create_meta(self, project_key: str, work_item_type_key: str) -> Dict:
         """获取创建工作项的元数据
 
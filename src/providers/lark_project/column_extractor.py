@@ -0,0 +1,151 @@
+"""
+列式提取引擎 - 一次遍历整页工作项，提取摘要列
+
+职责：
+- 为每个工作项建立一次 field_key -> field_value 索引（fields 优先，field_value_pairs 兜底）
+- 在同一遍历中提取所有请求的列（status、priority、owner 及配置的额外列）
+- 同一遍历中收集需要转换为人名的 owner user_key，并记录所在行，
+  名称查询完成后只回填这些行
+
+设计说明：
+- 纯同步实现，不包含任何 await；调用方负责异步的用户名查询
+- 取值规则与 FieldResolver.extract_field_value 一致
+- WorkItemProvider、WorkItemFormatter 共用同一实现
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.providers.lark_project.field_resolver import FieldResolver
+
+# 摘要列（输出名称），顺序即输出顺序
+SUMMARY_COLUMNS: Tuple[str, ...] = ("status", "priority", "owner")
+
+# 优先级截断长度（脱敏处理）
+PRIORITY_MAX_LENGTH = 20
+
+
+def index_fields(item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    为工作项建立 field_key -> 原始字段值索引
+
+    fields（新版结构）优先；同一 field_key 只保留第一次出现的值；
+    field_value_pairs（旧版结构）只补充 fields 中不存在的 Key。
+
+    Args:
+        item: 工作项字典
+
+    Returns:
+        field_key 到原始 field_value 的映射
+    """
+    index: Dict[str, Any] = {}
+    for source in ("fields", "field_value_pairs"):
+        for field in item.get(source) or ():
+            if not isinstance(field, dict):
+                continue
+            field_key = field.get("field_key")
+            if field_key is not None and field_key not in index:
+                index[field_key] = field.get("field_value")
+    return index
+
+
+def is_user_key(value: Any) -> bool:
+    """判断值是否是 user_key 格式（长数字字符串）"""
+    return isinstance(value, str) and value.isdigit() and len(value) > 10
+
+
+class ColumnExtractor:
+    """
+    列式提取引擎
+
+    Attributes:
+        columns: 输出列名 -> 字段 Key
+    """
+
+    def __init__(
+        self,
+        field_mapping: Optional[Dict[str, str]] = None,
+        extra_columns: Optional[Dict[str, str]] = None,
+    ):
+        """
+        初始化列式提取引擎
+
+        Args:
+            field_mapping: 摘要列名称到字段 Key 的映射（可选，未映射时以列名作为 Key）
+            extra_columns: 额外输出列，列名 -> 字段 Key（可选）
+        """
+        mapping = field_mapping or {}
+        self.columns: Dict[str, str] = {
+            name: mapping.get(name, name) for name in SUMMARY_COLUMNS
+        }
+        for name, field_key in (extra_columns or {}).items():
+            self.columns.setdefault(name, field_key)
+
+    def extract_values(self, item: Dict[str, Any]) -> Dict[str, Optional[str]]:
+        """
+        提取单个工作项所有配置列的可读值（不截断，供结果筛选比较）
+
+        Args:
+            item: 原始工作项字典
+
+        Returns:
+            列名到可读值的映射，字段不存在时为 None
+        """
+        index = index_fields(item)
+        return {
+            name: FieldResolver.parse_raw_field_value(index.get(field_key))
+            for name, field_key in self.columns.items()
+        }
+
+    def extract_row(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        提取单个工作项的摘要行
+
+        Args:
+            item: 原始工作项字典
+
+        Returns:
+            摘要字典，包含 id、name 与所有配置的列
+        """
+        row: Dict[str, Any] = {"id": item.get("id"), "name": item.get("name")}
+        row.update(self.extract_values(item))
+        priority = row.get("priority")
+        if priority:
+            row["priority"] = priority[:PRIORITY_MAX_LENGTH]
+        return row
+
+    def extract(
+        self, items: Iterable[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+        """
+        一次遍历提取整页工作项
+
+        Args:
+            items: 原始工作项列表
+
+        Returns:
+            (摘要行列表, owner user_key -> 引用该 Key 的摘要行列表)
+        """
+        rows: List[Dict[str, Any]] = []
+        owner_rows: Dict[str, List[Dict[str, Any]]] = {}
+        for item in items:
+            row = self.extract_row(item)
+            rows.append(row)
+            owner = row.get("owner")
+            if is_user_key(owner):
+                owner_rows.setdefault(owner, []).append(row)
+        return rows, owner_rows
+
+    @staticmethod
+    def substitute_owners(
+        owner_rows: Dict[str, List[Dict[str, Any]]], key_to_name: Dict[str, str]
+    ) -> None:
+        """
+        将 owner user_key 原地替换为人名（只访问 extract 记录的行）
+
+        Args:
+            owner_rows: extract 返回的 owner user_key -> 摘要行映射
+            key_to_name: user_key 到人名的映射
+        """
+        for user_key, name in key_to_name.items():
+            for row in owner_rows.get(user_key, ()):
+                row["owner"] = name
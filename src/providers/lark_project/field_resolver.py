@@ -73,6 +73,59 @@ class FieldResolver:
         # 其他类型: 转为字符串
         return str(value) if value else None
 
+    @staticmethod
+    def comparable_value(value: Any) -> Any:
+        """
+        将字段值归一化为可比较的形式（用于写入前比对）
+
+        - 空值（None、空字符串、空列表）归一为 None
+        - 选项 {label, value} 取 value，用户 {user_key, ...} 取 user_key
+        - 列表（多选、多用户）归一为无序集合
+        - 其他标量统一转为去除首尾空白的字符串
+
+        Args:
+            value: 当前值或解析后的目标值
+
+        Returns:
+            归一化后的值
+        """
+        if value is None or value == "" or value == []:
+            return None
+        if isinstance(value, list):
+            parts = {FieldResolver.comparable_value(v) for v in value}
+            parts.discard(None)
+            return frozenset(parts) or None
+        if isinstance(value, dict):
+            for key in ("value", "user_key", "id"):
+                if value.get(key) is not None:
+                    return str(value[key]).strip()
+            return FieldResolver.comparable_value(value.get("label"))
+        if isinstance(value, bool):
+            return value
+        return str(value).strip() or None
+
+    @staticmethod
+    def values_equal(current: Any, target: Any) -> bool:
+        """
+        判断字段当前值与目标值是否等价（选项、用户、多选按语义比较）
+
+        单元素集合与同值标量视为相等（如单选负责人与多用户字段）。
+
+        Args:
+            current: 工作项当前的原始字段值
+            target: 解析后的目标值
+
+        Returns:
+            等价时返回 True
+        """
+        a = FieldResolver.comparable_value(current)
+        b = FieldResolver.comparable_value(target)
+        if isinstance(a, frozenset) and not isinstance(b, frozenset):
+            b = frozenset([b])
+        elif isinstance(b, frozenset) and not isinstance(a, frozenset):
+            a = frozenset([a])
+        return a == b
+
     @staticmethod
     def extract_field_value(item: Dict[str, Any], field_key: str) -> Optional[str]:
         """
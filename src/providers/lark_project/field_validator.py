@@ -0,0 +1,105 @@
+"""
+字段写入校验器 - 基于缓存的字段配置在本地拦截必然失败的更新
+
+职责：
+- 拒绝写入只读字段（系统字段、公式计算字段）
+- 拒绝清空必填字段
+- 拒绝不在选项值域内或已停用的选项值
+
+设计说明：
+- 约束来自 MetadataManager 随字段缓存加载的 field/all 配置，不额外请求
+- 只拦截字段配置中明确给出的约束；未知字段或约束缺失时放行，由服务端判定
+- 校验失败返回中文错误信息，由调用方转换为 UpdateResult
+"""
+
+import logging
+from typing import Any, Dict, Iterable, Optional
+
+from src.providers.lark_project.managers import FieldConstraint
+
+logger = logging.getLogger(__name__)
+
+
+class FieldValidator:
+    """
+    单个工作项类型的字段写入校验器
+
+    Attributes:
+        constraints: {field_key: FieldConstraint}
+    """
+
+    def __init__(self, constraints: Optional[Dict[str, FieldConstraint]] = None):
+        """
+        初始化校验器
+
+        Args:
+            constraints: 字段约束映射（可选，为空时不做任何拦截）
+        """
+        self.constraints = constraints or {}
+
+    def check_writable(self, field_key: str, field_name: str) -> Optional[str]:
+        """
+        检查字段是否可写（在解析取值之前调用，避免无意义的选项解析）
+
+        Args:
+            field_key: 字段 Key
+            field_name: 字段显示名称（用于错误信息）
+
+        Returns:
+            错误信息；可写时返回 None
+        """
+        constraint = self.constraints.get(field_key)
+        if constraint is not None and constraint.read_only:
+            return f"字段 '{field_name}' 为只读字段，不支持更新"
+        return None
+
+    def check_value(self, field_key: str, field_name: str, value: Any) -> Optional[str]:
+        """
+        检查解析后的字段取值是否满足必填与选项值域约束
+
+        Args:
+            field_key: 字段 Key
+            field_name: 字段显示名称（用于错误信息）
+            value: 解析后的字段值（{label, value} 结构、列表或原值）
+
+        Returns:
+            错误信息；校验通过时返回 None
+        """
+        constraint = self.constraints.get(field_key)
+        if constraint is None:
+            return None
+
+        if constraint.required and self._is_empty(value):
+            return f"字段 '{field_name}' 为必填字段，不能清空"
+
+        if constraint.option_values is None:
+            return None
+        for option in self._option_values(value):
+            if option not in constraint.option_values:
+                return f"字段 '{field_name}' 的值 '{option}' 不在可用选项中"
+            if option in constraint.disabled_values:
+                return f"字段 '{field_name}' 的选项 '{option}' 已停用"
+        return None
+
+    @staticmethod
+    def _is_empty(value: Any) -> bool:
+        """None、空字符串、空列表/字典视为清空"""
+        if value is None:
+            return True
+        if isinstance(value, str):
+            return not value.strip()
+        if isinstance(value, (list, dict)):
+            return not value
+        return False
+
+    @classmethod
+    def _option_values(cls, value: Any) -> Iterable[str]:
+        """提取取值中的选项 Value（布尔值、数字等非选项取值跳过）"""
+        if isinstance(value, list):
+            for item in value:
+                yield from cls._option_values(item)
+        elif isinstance(value, dict):
+            if value.get("value") is not None:
+                yield str(value["value"])
+        elif isinstance(value, str) and value:
+            yield value
@@ -5,10 +5,21 @@
 
 核心组件:
 - MetadataManager: 级联缓存管理器，实现 Name -> Key 的多级映射
+- MetadataSnapshot: 单个工作项类型的元数据只读快照（同步查找）
+- FieldConstraint: 单个字段的写入约束（只读/必填/选项值域）
+- short_role_key: 完整 Role Key -> 短 Key 规范化
 """
 
-from .metadata_manager import MetadataManager
+from .metadata_manager import (
+    FieldConstraint,
+    MetadataManager,
+    MetadataSnapshot,
+    short_role_key,
+)
 
 __all__ = [
+    "FieldConstraint",
     "MetadataManager",
+    "MetadataSnapshot",
+    "short_role_key",
 ]
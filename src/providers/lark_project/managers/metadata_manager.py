@@ -7,7 +7,11 @@ MetadataManager - 级联缓存管理器
 - L1: Project Name -> Project Key
 - L2: Work Item Type Name -> Type Key
 - L3: Field Name/Alias -> Field Key
+- L3-Create: Type -> 创建时可填写的 Field Keys
+- L3-Relation: Type -> 关联工作项字段 Keys (字段定义 + 关系配置 + 空间关联规则)
+- L3-Constraint: Field Key -> 写入约束 (只读/必填/选项值域，随字段缓存加载)
 - L4: Option Label -> Option Value
+- L6: Workflow Template -> State Transitions
 - L-User: User Name/Email -> User Key
 
 使用示例:
@@ -28,13 +32,130 @@ MetadataManager - 级联缓存管理器
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
 
-from src.providers.lark_project.api import ProjectAPI, MetadataAPI, FieldAPI, UserAPI
+from src.providers.lark_project.api import (
+    ProjectAPI,
+    MetadataAPI,
+    FieldAPI,
+    UserAPI,
+    WorkItemAPI,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def short_role_key(role_key: str) -> str:
+    """
+    将完整 Role Key 规范化为短 Key
+
+    字段配置中的完整 Key 形如 "role_<project>_<type>_role_a06e00"，
+    role_owners 与角色定义中使用短 Key "role_a06e00"。
+
+    Args:
+        role_key: 完整或短 Role Key
+
+    Returns:
+        最后一个 "_role_" 之后的部分加 "role_" 前缀；不含该分隔时原样返回
+    """
+    head, sep, tail = role_key.rpartition("_role_")
+    if sep and head and tail:
+        return f"role_{tail}"
+    return role_key
+
+
+class MetadataSnapshot:
+    """
+    单个工作项类型的元数据只读快照
+
+    整页工作项转换为可读格式时，每个字段/角色都 await 一次 MetadataManager
+    会产生大量协程调度。快照在一次 await 后提供同步查找，供第二遍转换使用。
+
+    缓存重新加载时会整体替换字典而不是原地修改，因此快照直接引用当前字典即可，
+    无需复制。
+    """
+
+    __slots__ = ("_field_names", "_role_map")
+
+    def __init__(
+        self,
+        field_names: Optional[Dict[str, str]] = None,
+        role_map: Optional[Dict[str, str]] = None,
+    ):
+        """
+        初始化快照
+
+        Args:
+            field_names: field_key -> field_name 映射（可选）
+            role_map: role_name -> role_key 映射（可选）
+        """
+        self._field_names = field_names or {}
+        self._role_map = role_map or {}
+
+    def field_name(self, field_key: str) -> Optional[str]:
+        """
+        根据字段 Key 获取 Field Name
+
+        Args:
+            field_key: 字段 Key
+
+        Returns:
+            字段名称，如果未找到则返回 None
+        """
+        return self._field_names.get(field_key)
+
+    def role_name(self, role_key: str) -> Optional[str]:
+        """
+        根据 Role Key 获取角色名称（精确匹配优先，其次部分匹配）
+
+        Args:
+            role_key: Role Key
+
+        Returns:
+            角色名称，未找到返回 None
+        """
+        for name, key in self._role_map.items():
+            if key == role_key:
+                return name
+
+        for name, key in self._role_map.items():
+            if role_key and key in role_key:
+                return name
+
+        return None
+
+
+class FieldConstraint:
+    """
+    单个字段的写入约束（从 field/all 字段配置解析）
+
+    只记录字段配置中明确给出的约束，未给出的约束视为不限制。
+    """
+
+    __slots__ = ("disabled_values", "option_values", "read_only", "required")
+
+    def __init__(
+        self,
+        read_only: bool = False,
+        required: bool = False,
+        option_values: Optional[Set[str]] = None,
+        disabled_values: Optional[Set[str]] = None,
+    ):
+        """
+        初始化字段约束
+
+        Args:
+            read_only: 字段是否只读（如公式计算字段）
+            required: 字段是否必填（不可清空）
+            option_values: 选项字段的全部选项 Value（None 表示不校验值域）
+            disabled_values: 已停用的选项 Value
+        """
+        self.read_only = read_only
+        self.required = required
+        self.option_values = option_values
+        self.disabled_values = disabled_values or set()
+
+
 class MetadataManager:
     """
     级联缓存管理器 (Manager Layer)
@@ -57,6 +178,31 @@ class MetadataManager:
     TYPE_TTL = 1800  # 30分钟
     FIELD_TTL = 1800  # 30分钟
     USER_TTL = 1800  # 30分钟
+    WORKFLOW_TTL = 3600  # 1小时
+    RELATION_TTL = 3600  # 1小时
+
+    # 项目详情分块大小：按块懒加载，命中目标名称即可返回
+    _PROJECT_DETAIL_CHUNK_SIZE = 50
+
+    # 需要校验选项值域的字段类型
+    OPTION_FIELD_TYPES = frozenset(
+        {"select", "multi_select", "radio", "tree_select", "tree_multi_select"}
+    )
+
+    # 系统维护的只读字段（字段配置中不一定带只读标记）
+    SYSTEM_READ_ONLY_FIELDS = frozenset(
+        {"created_at", "created_by", "updated_at", "updated_by"}
+    )
+
+    # 关联工作项字段类型（新旧两种命名）
+    RELATION_FIELD_TYPES = frozenset(
+        {
+            "work_item_related_select",
+            "work_item_related_multi_select",
+            "work_item",
+            "work_item_related",
+        }
+    )
 
     def __init__(
         self,
@@ -64,6 +210,7 @@ class MetadataManager:
         metadata_api: Optional[MetadataAPI] = None,
         field_api: Optional[FieldAPI] = None,
         user_api: Optional[UserAPI] = None,
+        work_item_api: Optional[WorkItemAPI] = None,
     ):
         """
         初始化 MetadataManager
@@ -73,20 +220,25 @@ class MetadataManager:
             metadata_api: MetadataAPI 实例（可选，默认自动创建）
             field_api: FieldAPI 实例（可选，默认自动创建）
             user_api: UserAPI 实例（可选，默认自动创建）
+            work_item_api: WorkItemAPI 实例（可选，默认自动创建，用于创建元数据）
         """
         self.project_api = project_api or ProjectAPI()
         self.metadata_api = metadata_api or MetadataAPI()
         self.field_api = field_api or FieldAPI()
         self.user_api = user_api or UserAPI()
+        self.work_item_api = work_item_api or WorkItemAPI()
 
         # 缓存并发控制锁
         self._cache_lock = asyncio.Lock()  # 用于 field 和 option 缓存
         self._project_lock = asyncio.Lock()  # 用于 project 缓存
         self._type_lock = asyncio.Lock()  # 用于 type 缓存
         self._user_lock = asyncio.Lock()  # 用于 user 缓存
+        self._workflow_lock = asyncio.Lock()  # 用于 workflow 缓存
+        self._create_meta_lock = asyncio.Lock()  # 用于创建元数据缓存
+        self._relation_lock = asyncio.Lock()  # 用于关联定义缓存
 
-        # 缓存大小限制
-        self._max_project_cache_size = 50
+        # 缓存大小限制（L1 项目索引不限大小: 需要完整覆盖 list_projects 返回的
+        # 全部项目才能判定"项目不存在"，其规模以租户可见项目数为上限）
         self._max_type_cache_size = 100
         self._max_field_cache_size = 200
         self._max_option_cache_size = 500
@@ -95,6 +247,13 @@ class MetadataManager:
         # L1: Project Name -> Project Key
         self._project_cache: Dict[str, str] = {}
 
+        # L1-index: Project Key -> Project Name (见过的项目，过期后仍保留，用于加载排序)
+        self._known_project_names: Dict[str, str] = {}
+        # L1 是否已覆盖全部项目（命中目标后提前返回时为 False，由后台补全）
+        self._project_index_complete = False
+        # L1 后台刷新/补全任务
+        self._project_refresh_task: Optional[asyncio.Task] = None
+
         # L2: project_key -> {type_name -> type_key}
         self._type_cache: Dict[str, Dict[str, str]] = {}
 
@@ -104,6 +263,20 @@ class MetadataManager:
         # L3-reverse: project_key -> type_key -> {field_key -> field_name} (反向映射)
         self._field_key_to_name_cache: Dict[str, Dict[str, Dict[str, str]]] = {}
 
+        # L3-create: project_key -> type_key -> {创建时可填写的 field_key}
+        self._create_meta_cache: Dict[str, Dict[str, Set[str]]] = {}
+
+        # L3-relation: project_key -> type_key -> {关联工作项字段 field_key} (随字段缓存加载)
+        self._relation_field_cache: Dict[str, Dict[str, Set[str]]] = {}
+
+        # L3-relation: project_key -> {"relations": [...], "rules": [...]} (关系配置与空间关联规则)
+        self._relation_def_cache: Dict[str, Dict[str, List[Dict]]] = {}
+
+        # L3-constraint: project_key -> type_key -> {field_key -> FieldConstraint}
+        self._field_constraint_cache: Dict[
+            str, Dict[str, Dict[str, FieldConstraint]]
+        ] = {}
+
         # L4: project_key -> type_key -> field_key -> {label -> value}
         self._option_cache: Dict[str, Dict[str, Dict[str, Dict[str, str]]]] = {}
 
@@ -114,6 +287,10 @@ class MetadataManager:
         # 例如: {"67dc...": {"670f...": {"报告人": "role_cc5cef", "经办人": "role_a06e00"}}}
         self._role_cache: Dict[str, Dict[str, Dict[str, str]]] = {}
 
+        # L6: project_key -> type_key -> {flow_mode, templates: {template_id -> {states, transitions}}}
+        # 例如: {"proj": {"issue": {"flow_mode": "stateflow", "templates": {1: {"states": {"open": "待处理"}, "transitions": {"open": ["closed"]}}}}}}
+        self._workflow_cache: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
         # L-User: identifier (name/email) -> user_key
         self._user_cache: Dict[str, str] = {}
 
@@ -122,6 +299,9 @@ class MetadataManager:
         self._type_last_loaded: Dict[str, float] = {}
         self._field_last_loaded: Dict[str, Dict[str, float]] = {}
         self._user_last_loaded: Optional[float] = None
+        self._workflow_last_loaded: Dict[str, Dict[str, float]] = {}
+        self._create_meta_last_loaded: Dict[str, Dict[str, float]] = {}
+        self._relation_def_last_loaded: Dict[str, float] = {}
 
     @classmethod
     def get_instance(cls) -> "MetadataManager":
@@ -138,17 +318,27 @@ class MetadataManager:
     def clear_cache(self) -> None:
         """清空所有缓存"""
         self._project_cache.clear()
+        self._known_project_names.clear()
+        self._project_index_complete = False
         self._type_cache.clear()
         self._field_cache.clear()
         self._field_key_to_name_cache.clear()
         self._field_type_cache.clear()
+        self._field_constraint_cache.clear()
         self._option_cache.clear()
+        self._create_meta_cache.clear()
+        self._relation_field_cache.clear()
+        self._relation_def_cache.clear()
         self._role_cache.clear()
+        self._workflow_cache.clear()
         self._user_cache.clear()
         self._project_last_loaded = None
         self._type_last_loaded.clear()
         self._field_last_loaded.clear()
         self._user_last_loaded = None
+        self._workflow_last_loaded.clear()
+        self._create_meta_last_loaded.clear()
+        self._relation_def_last_loaded.clear()
         logger.debug("MetadataManager cache cleared")
 
     def _is_cache_expired(self, last_loaded: Optional[float], ttl: int) -> bool:
@@ -170,10 +360,147 @@ class MetadataManager:
 
     # ========== L1: Project ==========
 
+    def _merge_project_details(self, projects: Any, target: Dict[str, str]) -> None:
+        """
+        将项目详情合并进 Name -> Key 映射，并记录到已知项目索引
+
+        Args:
+            projects: get_project_details 返回值（{project_key: {name, ...}}）
+            target: 写入的 Name -> Key 映射
+        """
+        # 验证返回类型，防止 List/Dict 不匹配
+        if not isinstance(projects, dict):
+            logger.warning(f"Unexpected project details format: {type(projects)}")
+            if not isinstance(projects, list):
+                return
+            # 尝试做一下兼容转换，假设 List 元素包含 Key
+            temp_map = {}
+            for p in projects:
+                if isinstance(p, dict) and "project_key" in p:
+                    temp_map[p["project_key"]] = p
+            projects = temp_map
+
+        for key, info in projects.items():
+            if isinstance(info, dict):
+                name = info.get("name")
+                if name:
+                    target[name] = key
+                    self._known_project_names[key] = name
+                    logger.debug(
+                        f"Cache set: project_name='{name}' -> project_key='{key}'"
+                    )
+
+    def _order_project_keys(
+        self, project_keys: List[str], project_name: Optional[str] = None
+    ) -> List[str]:
+        """
+        按加载优先级排序项目 Key: 已知对应目标名称的 Key > 新 Key > 见过的 Key
+
+        见过的 Key 已知对应其他名称，只有项目改名后才可能匹配目标，放在最后。
+
+        Args:
+            project_keys: list_projects 返回的项目 Key 列表
+            project_name: 目标项目名称（可选）
+
+        Returns:
+            排序后的项目 Key 列表
+        """
+        hinted = [
+            k
+            for k in project_keys
+            if project_name and self._known_project_names.get(k) == project_name
+        ]
+        seen = [
+            k
+            for k in project_keys
+            if k in self._known_project_names and k not in hinted
+        ]
+        unseen = [k for k in project_keys if k not in self._known_project_names]
+        return hinted + unseen + seen
+
+    async def _load_project_chunks(
+        self,
+        project_keys: List[str],
+        target: Dict[str, str],
+        stop_at_name: Optional[str] = None,
+    ) -> List[str]:
+        """
+        按块拉取项目详情并合并
+
+        Args:
+            project_keys: 待加载的项目 Key（已排序）
+            target: 写入的 Name -> Key 映射
+            stop_at_name: 命中该名称后提前停止（可选）
+
+        Returns:
+            尚未加载的项目 Key 列表（未提前停止时为空）
+        """
+        chunk_size = self._PROJECT_DETAIL_CHUNK_SIZE
+        for i in range(0, len(project_keys), chunk_size):
+            chunk = project_keys[i : i + chunk_size]
+            projects = await self.project_api.get_project_details(chunk)
+            self._merge_project_details(projects, target)
+            if stop_at_name and stop_at_name in target:
+                return project_keys[i + chunk_size :]
+        return []
+
+    def _schedule_project_refresh(self, coro_factory: Any) -> None:
+        """
+        调度 L1 后台任务（同一时间只运行一个）
+
+        Args:
+            coro_factory: 无参函数，返回要运行的协程
+        """
+        task = self._project_refresh_task
+        if task is not None and not task.done():
+            return
+        try:
+            self._project_refresh_task = asyncio.get_running_loop().create_task(
+                coro_factory()
+            )
+        except RuntimeError:
+            logger.debug("No running event loop, skip background project refresh")
+
+    async def _refresh_project_index(self) -> None:
+        """后台全量刷新项目索引，完成后原子替换 L1 缓存"""
+        import time
+
+        try:
+            async with self._project_lock:
+                project_keys = await self.project_api.list_projects()
+                new_cache: Dict[str, str] = {}
+                await self._load_project_chunks(
+                    self._order_project_keys(project_keys or []), new_cache
+                )
+                self._project_cache = new_cache
+                self._project_index_complete = True
+                self._project_last_loaded = time.time()
+                logger.info("Project index refreshed: %d projects", len(new_cache))
+        except Exception as e:
+            logger.warning("Background project index refresh failed: %s", e)
+
+    async def _complete_project_index(self, remaining_keys: List[str]) -> None:
+        """后台补全命中目标后尚未加载的项目详情"""
+        import time
+
+        try:
+            async with self._project_lock:
+                await self._load_project_chunks(remaining_keys, self._project_cache)
+                self._project_index_complete = True
+                self._project_last_loaded = time.time()
+                logger.debug(
+                    "Project index completed: %d projects", len(self._project_cache)
+                )
+        except Exception as e:
+            logger.warning("Background project index completion failed: %s", e)
+
     async def get_project_key(self, project_name: str) -> str:
         """
         根据项目名称获取 Project Key
 
+        项目详情按块懒加载（见过的项目优先），目标名称一出现即返回，
+        剩余部分在后台补全；缓存过期时先返回旧值，并在后台刷新。
+
         Args:
             project_name: 项目空间名称（如 "Project Management"）
 
@@ -187,20 +514,16 @@ class MetadataManager:
 
         # 第一重检查 (无锁，快速路径)
         if project_name in self._project_cache:
-            # 检查缓存是否过期
-            if not self._is_cache_expired(self._project_last_loaded, self.PROJECT_TTL):
+            if self._is_cache_expired(self._project_last_loaded, self.PROJECT_TTL):
+                # 缓存过期：先返回旧值，后台刷新
+                self._schedule_project_refresh(self._refresh_project_index)
+            else:
                 logger.debug(f"Cache hit: project_name='{project_name}'")
-                return self._project_cache[project_name]
-            # 缓存过期，继续执行加载逻辑
+            return self._project_cache[project_name]
 
         # 第二重检查 (加锁，防止竞态条件)
         async with self._project_lock:
-            # 检查缓存过期，如果过期则清空缓存
-            if self._is_cache_expired(self._project_last_loaded, self.PROJECT_TTL):
-                self._project_cache.clear()
-                self._project_last_loaded = None
-
-            # 在锁内再次检查，避免重复加载
+            # 在锁内再次检查（可能刚由后台任务补全）
             if project_name in self._project_cache:
                 return self._project_cache[project_name]
 
@@ -209,99 +532,67 @@ class MetadataManager:
             if not project_keys:
                 raise Exception("未找到任何项目空间")
 
-            # 获取项目详情
-            projects = await self.project_api.get_project_details(project_keys)
-
-            # 验证返回类型，防止 List/Dict 不匹配
-            if not isinstance(projects, dict):
-                logger.warning(f"Unexpected project details format: {type(projects)}")
-                if isinstance(projects, list):
-                    # 尝试做一下兼容转换，假设 List 元素包含 Key
-                    temp_map = {}
-                    for p in projects:  # type: ignore  # type: ignore
-                        if isinstance(p, dict) and "project_key" in p:
-                            temp_map[p["project_key"]] = p
-                    projects = temp_map
-                else:
-                    projects = {}
-
-            # 填充缓存前检查大小，如果超过限制则清理最旧的条目
-            if len(self._project_cache) >= self._max_project_cache_size:
-                # 移除第一个条目（近似LRU）
-                keys = list(self._project_cache.keys())
-                if keys:
-                    oldest_key = keys[0]
-                    del self._project_cache[oldest_key]
-                    logger.debug(
-                        f"Project cache size limit reached, removed oldest entry: {oldest_key}"
-                    )
-
-            # 填充缓存
-            for key, info in projects.items():
-                if isinstance(info, dict):
-                    name = info.get("name")
-                    if name:
-                        self._project_cache[name] = key
-                        logger.debug(
-                            f"Cache set: project_name='{name}' -> project_key='{key}'"
-                        )
+            ordered_keys = self._order_project_keys(project_keys, project_name)
+            remaining_keys = await self._load_project_chunks(
+                ordered_keys, self._project_cache, stop_at_name=project_name
+            )
 
             # 更新最后加载时间戳
             self._project_last_loaded = time.time()
+            self._project_index_complete = not remaining_keys
 
-            # 返回目标项目
-            if project_name in self._project_cache:
-                return self._project_cache[project_name]
+        if remaining_keys:
+            # 已命中目标，剩余项目在后台补全
+            self._schedule_project_refresh(
+                lambda: self._complete_project_index(remaining_keys)
+            )
 
-            raise Exception(f"项目空间 '{project_name}' 未找到")
+        # 返回目标项目
+        if project_name in self._project_cache:
+            return self._project_cache[project_name]
+
+        raise Exception(f"项目空间 '{project_name}' 未找到")
 
     async def list_projects(self) -> Dict[str, str]:
         """
         获取所有项目的 Name -> Key 映射
 
+        缓存过期时先返回旧数据，并在后台刷新。
+
         Returns:
             {project_name: project_key} 字典
         """
         import time
 
-        # 如果缓存已有数据，检查是否过期
-        if self._project_cache:
-            if not self._is_cache_expired(self._project_last_loaded, self.PROJECT_TTL):
+        # 如果缓存已有完整数据，检查是否过期
+        if self._project_cache and self._project_index_complete:
+            if self._is_cache_expired(self._project_last_loaded, self.PROJECT_TTL):
+                self._schedule_project_refresh(self._refresh_project_index)
+            else:
                 logger.debug("Cache hit: project_cache already populated")
-                return self._project_cache.copy()
-            # 缓存过期，继续执行加载逻辑
+            return self._project_cache.copy()
 
         async with self._project_lock:
-            # 检查缓存过期，如果过期则清空缓存
-            if self._is_cache_expired(self._project_last_loaded, self.PROJECT_TTL):
-                self._project_cache.clear()
-                self._project_last_loaded = None
-
             # 在锁内再次检查，避免重复加载
-            if self._project_cache:
+            if self._project_cache and self._project_index_complete:
                 return self._project_cache.copy()
 
             project_keys = await self.project_api.list_projects()
             if not project_keys:
                 return {}
 
-            projects = await self.project_api.get_project_details(project_keys)
-
-            if not isinstance(projects, dict):
-                # 简单防卫，不尝试复杂转换
-                logger.warning(
-                    f"Unexpected project details format in list_projects: {type(projects)}"
-                )
-                return {}
-
-            for key, info in projects.items():
-                if isinstance(info, dict):
-                    name = info.get("name")
-                    if name:
-                        self._project_cache[name] = key
+            # 已加载过的项目无需重复拉取详情
+            loaded_keys = set(self._project_cache.values())
+            pending_keys = [
+                k
+                for k in self._order_project_keys(project_keys)
+                if k not in loaded_keys
+            ]
+            await self._load_project_chunks(pending_keys, self._project_cache)
 
             # 更新最后加载时间戳
             self._project_last_loaded = time.time()
+            self._project_index_complete = True
 
             return self._project_cache.copy()
 
@@ -479,6 +770,76 @@ class MetadataManager:
             if children:
                 self._flatten_options(children, target_map, depth + 1, max_depth)
 
+    @staticmethod
+    def _collect_option_values(
+        options: List[Any],
+        values: Set[str],
+        disabled: Set[str],
+        depth: int = 0,
+        max_depth: int = 20,
+    ) -> None:
+        """
+        递归收集选项树中的全部 Value 与已停用的 Value
+
+        Args:
+            options: 选项列表（可能包含 children）
+            values: 收集全部选项 Value
+            disabled: 收集已停用的选项 Value
+            depth: 当前递归深度
+            max_depth: 最大递归深度
+        """
+        if depth > max_depth:
+            return
+        for opt in options:
+            if not isinstance(opt, dict):
+                continue
+            value = opt.get("value")
+            if value:
+                values.add(str(value))
+                if opt.get("is_disabled") in (True, 1):
+                    disabled.add(str(value))
+            children = opt.get("children") or []
+            if children:
+                MetadataManager._collect_option_values(
+                    children, values, disabled, depth + 1, max_depth
+                )
+
+    @classmethod
+    def _parse_field_constraint(cls, field: Dict[str, Any]) -> FieldConstraint:
+        """
+        从 field/all 的字段配置解析写入约束
+
+        - 只读: 系统字段、公式计算字段 (value_generate_mode=Calculate) 或显式只读标记
+        - 必填: is_required == 1（2 为非必填，3 为条件必填，不做本地校验）
+        - 值域: 选项类字段的全部选项 Value，及 is_disabled 的停用选项
+
+        Args:
+            field: 单个字段配置
+
+        Returns:
+            FieldConstraint
+        """
+        f_key = field.get("field_key")
+        generate_mode = str(field.get("value_generate_mode") or "").lower()
+        read_only = (
+            f_key in cls.SYSTEM_READ_ONLY_FIELDS
+            or generate_mode == "calculate"
+            or field.get("is_readonly") in (True, 1)
+            or field.get("read_only") in (True, 1)
+        )
+        required = field.get("is_required") == 1
+
+        option_values: Optional[Set[str]] = None
+        disabled_values: Set[str] = set()
+        options = field.get("options") or []
+        if options and field.get("field_type_key") in cls.OPTION_FIELD_TYPES:
+            option_values = set()
+            cls._collect_option_values(options, option_values, disabled_values)
+            if not option_values:
+                option_values = None
+
+        return FieldConstraint(read_only, required, option_values, disabled_values)
+
     async def _ensure_field_cache(self, project_key: str, type_key: str) -> None:
         """
         确保字段和选项缓存已加载
@@ -520,6 +881,11 @@ class MetadataManager:
                     and type_key in self._field_type_cache[project_key]
                 ):
                     del self._field_type_cache[project_key][type_key]
+                if (
+                    project_key in self._field_constraint_cache
+                    and type_key in self._field_constraint_cache[project_key]
+                ):
+                    del self._field_constraint_cache[project_key][type_key]
                 if (
                     project_key in self._field_last_loaded
                     and type_key in self._field_last_loaded[project_key]
@@ -547,6 +913,8 @@ class MetadataManager:
             temp_field_type_map = {}  # field_key -> field_type_key (字段类型映射)
             temp_option_map = {}
             temp_role_map = {}
+            temp_relation_keys = set()  # 关联工作项字段 field_key
+            temp_constraint_map = {}  # field_key -> FieldConstraint
 
             # 调用 API 获取字段列表
             fields = await self.field_api.get_all_fields(project_key, type_key)
@@ -577,12 +945,22 @@ class MetadataManager:
                 if f_key and f_type:
                     temp_field_type_map[f_key] = f_type
 
+                # 识别关联工作项字段: 按字段类型或字段上挂载的关系配置
+                if f_key and (
+                    f_type in self.RELATION_FIELD_TYPES or f.get("work_item_relation")
+                ):
+                    temp_relation_keys.add(f_key)
+
                 # 缓存选项
                 options = f.get("options", [])
                 if options and f_key:
                     temp_option_map[f_key] = {}
                     self._flatten_options(options, temp_option_map[f_key])
 
+                # 缓存写入约束
+                if f_key:
+                    temp_constraint_map[f_key] = self._parse_field_constraint(f)
+
                 # 解析角色缓存: 从 current_status_operator_role 字段的 options 中提取
                 # options 格式: [{"label": "经办人", "value": "role_xxx_role_a06e00"}, ...]
                 if f_key == "current_status_operator_role" and options:
@@ -615,6 +993,12 @@ class MetadataManager:
             )
             self._field_type_cache[project_key][type_key] = temp_field_type_map
             self._option_cache[project_key][type_key] = temp_option_map
+            self._relation_field_cache.setdefault(project_key, {})[type_key] = (
+                temp_relation_keys
+            )
+            self._field_constraint_cache.setdefault(project_key, {})[type_key] = (
+                temp_constraint_map
+            )
 
             # 更新角色缓存
             if project_key not in self._role_cache:
@@ -693,6 +1077,27 @@ class MetadataManager:
         await self._ensure_field_cache(project_key, type_key)
         return self._field_cache[project_key].get(type_key, {}).copy()
 
+    async def get_metadata_fingerprint(
+        self, project_key: str, type_key: str
+    ) -> Optional[str]:
+        """
+        获取工作项类型元数据缓存的指纹
+
+        字段缓存每次重新加载后指纹都会变化，调用方可据此判断基于元数据编译的
+        结果（如查询计划）是否仍然有效。不会触发加载。
+
+        Args:
+            project_key: 项目空间 Key
+            type_key: 工作项类型 Key
+
+        Returns:
+            指纹字符串；字段缓存未加载或已过期时返回 None
+        """
+        last_loaded = self._field_last_loaded.get(project_key, {}).get(type_key)
+        if self._is_cache_expired(last_loaded, self.FIELD_TTL):
+            return None
+        return f"{project_key}:{type_key}:{last_loaded}"
+
     async def get_field_name(
         self, project_key: str, type_key: str, field_key: str
     ) -> Optional[str]:
@@ -707,11 +1112,43 @@ class MetadataManager:
         Returns:
             字段名称，如果未找到则返回 None
         """
+        snapshot = await self.get_type_snapshot(project_key, type_key)
+        return snapshot.field_name(field_key)
+
+    async def get_type_snapshot(
+        self, project_key: str, type_key: str
+    ) -> MetadataSnapshot:
+        """
+        获取工作项类型的元数据快照（字段名称、角色名称的同步查找）
+
+        Args:
+            project_key: 项目空间 Key
+            type_key: 工作项类型 Key
+
+        Returns:
+            MetadataSnapshot 实例
+        """
         await self._ensure_field_cache(project_key, type_key)
-        field_key_to_name = self._field_key_to_name_cache.get(project_key, {}).get(
-            type_key, {}
+        return MetadataSnapshot(
+            self._field_key_to_name_cache.get(project_key, {}).get(type_key),
+            self._role_cache.get(project_key, {}).get(type_key),
         )
-        return field_key_to_name.get(field_key)
+
+    async def get_field_constraints(
+        self, project_key: str, type_key: str
+    ) -> Dict[str, FieldConstraint]:
+        """
+        获取工作项类型全部字段的写入约束
+
+        Args:
+            project_key: 项目空间 Key
+            type_key: 工作项类型 Key
+
+        Returns:
+            {field_key: FieldConstraint}
+        """
+        await self._ensure_field_cache(project_key, type_key)
+        return self._field_constraint_cache.get(project_key, {}).get(type_key, {})
 
     async def get_field_type(
         self, project_key: str, type_key: str, field_key: str
@@ -731,6 +1168,158 @@ class MetadataManager:
         field_type_map = self._field_type_cache.get(project_key, {}).get(type_key, {})
         return field_type_map.get(field_key)
 
+    @staticmethod
+    def _parse_create_meta(meta: Any) -> Set[str]:
+        """
+        从创建元数据中提取可在创建时填写的字段 Key
+
+        兼容两种返回结构: 字段列表，或包含 fields/field_metas 列表的字典
+
+        Args:
+            meta: get_create_meta 返回的元数据
+
+        Returns:
+            field_key 集合
+        """
+        if isinstance(meta, dict):
+            meta = meta.get("fields") or meta.get("field_metas") or []
+
+        field_keys: Set[str] = set()
+        for f in meta or []:
+            if isinstance(f, dict) and f.get("field_key"):
+                field_keys.add(f["field_key"])
+        return field_keys
+
+    async def get_creatable_field_keys(
+        self, project_key: str, type_key: str
+    ) -> Set[str]:
+        """
+        获取创建工作项时可直接填写的字段 Key（基于 get_create_meta，按类型缓存）
+
+        Args:
+            project_key: 项目空间 Key
+            type_key: 工作项类型 Key
+
+        Returns:
+            field_key 集合；未出现在集合中的字段需在创建后通过更新接口设置
+        """
+        import time
+
+        # 快速路径
+        field_keys = self._create_meta_cache.get(project_key, {}).get(type_key)
+        if field_keys is not None:
+            last_loaded = self._create_meta_last_loaded.get(project_key, {}).get(
+                type_key
+            )
+            if not self._is_cache_expired(last_loaded, self.FIELD_TTL):
+                return field_keys
+
+        async with self._create_meta_lock:
+            # 在锁内再次检查，避免重复加载
+            field_keys = self._create_meta_cache.get(project_key, {}).get(type_key)
+            last_loaded = self._create_meta_last_loaded.get(project_key, {}).get(
+                type_key
+            )
+            if field_keys is not None and not self._is_cache_expired(
+                last_loaded, self.FIELD_TTL
+            ):
+                return field_keys
+
+            meta = await self.work_item_api.get_create_meta(project_key, type_key)
+            field_keys = self._parse_create_meta(meta)
+
+            self._create_meta_cache.setdefault(project_key, {})[type_key] = field_keys
+            self._create_meta_last_loaded.setdefault(project_key, {})[type_key] = (
+                time.time()
+            )
+            logger.debug(
+                "Create meta loaded: type_key=%s, creatable_fields=%d",
+                type_key,
+                len(field_keys),
+            )
+            return field_keys
+
+    # ========== L3-Relation: Relation ==========
+
+    async def get_relation_definitions(self, project_key: str) -> Dict[str, List[Dict]]:
+        """
+        获取项目的关联定义（工作项关系配置 + 空间关联规则），按项目缓存
+
+        任一接口失败时对应部分返回空列表，不影响另一部分。
+
+        Args:
+            project_key: 项目空间 Key
+
+        Returns:
+            {"relations": [...], "rules": [...]}
+        """
+        import time
+
+        # 快速路径
+        definitions = self._relation_def_cache.get(project_key)
+        if definitions is not None and not self._is_cache_expired(
+            self._relation_def_last_loaded.get(project_key), self.RELATION_TTL
+        ):
+            return definitions
+
+        async with self._relation_lock:
+            definitions = self._relation_def_cache.get(project_key)
+            if definitions is not None and not self._is_cache_expired(
+                self._relation_def_last_loaded.get(project_key), self.RELATION_TTL
+            ):
+                return definitions
+
+            relations: List[Dict] = []
+            rules: List[Dict] = []
+            try:
+                relations = await self.field_api.get_work_item_relations(project_key)
+            except Exception as e:
+                logger.warning("Failed to load work item relations: %s", e)
+            try:
+                rules = await self.field_api.get_relation_rules(project_key)
+            except Exception as e:
+                logger.warning("Failed to load relation rules: %s", e)
+
+            definitions = {"relations": relations or [], "rules": rules or []}
+            self._relation_def_cache[project_key] = definitions
+            self._relation_def_last_loaded[project_key] = time.time()
+            return definitions
+
+    async def get_relation_field_keys(
+        self, project_key: str, type_key: str
+    ) -> Set[str]:
+        """
+        获取工作项类型下的关联工作项字段 Key
+
+        合并两个来源:
+        1. 字段定义中的关联类型字段（field_type_key 或 work_item_relation 配置）
+        2. 关系配置 / 空间关联规则中显式声明的 field_key
+
+        Args:
+            project_key: 项目空间 Key
+            type_key: 工作项类型 Key
+
+        Returns:
+            field_key 集合（副本）
+        """
+        await self._ensure_field_cache(project_key, type_key)
+        field_keys = set(
+            self._relation_field_cache.get(project_key, {}).get(type_key, set())
+        )
+
+        definitions = await self.get_relation_definitions(project_key)
+        for entry in definitions["relations"] + definitions["rules"]:
+            if not isinstance(entry, dict):
+                continue
+            entry_type = entry.get("work_item_type_key")
+            if entry_type and entry_type != type_key:
+                continue
+            for key_name in ("field_key", "relation_field_key"):
+                if entry.get(key_name):
+                    field_keys.add(entry[key_name])
+
+        return field_keys
+
     # ========== L4: Option ==========
 
     def _fuzzy_match_option(
@@ -945,21 +1534,155 @@ class MetadataManager:
         Returns:
             角色名称，未找到返回 None
         """
-        await self._ensure_field_cache(project_key, type_key)
+        snapshot = await self.get_type_snapshot(project_key, type_key)
+        return snapshot.role_name(role_key)
 
-        role_map = self._role_cache.get(project_key, {}).get(type_key, {})
+    # ========== L6: Workflow ==========
 
-        # 1. 精确匹配优先
-        for name, key in role_map.items():
-            if key == role_key:
-                return name
+    @staticmethod
+    def _parse_template_detail(detail: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        将流程模板详情解析为状态流转图
 
-        # 2. 部分匹配 (作为备选)
-        for name, key in role_map.items():
-            if role_key and key in role_key:
-                return name
+        Args:
+            detail: get_template_detail 返回的模板详情
 
-        return None
+        Returns:
+            {"states": {state_key: name}, "transitions": {source_state_key: [target_state_key]}}
+        """
+        states: Dict[str, str] = {}
+        for conf in detail.get("state_flow_confs") or []:
+            state_key = conf.get("state_key")
+            if state_key:
+                states[state_key] = conf.get("name") or state_key
+
+        transitions: Dict[str, List[str]] = {}
+        for conn in detail.get("connections") or []:
+            source = conn.get("source_state_key")
+            target = conn.get("target_state_key")
+            if source and target:
+                transitions.setdefault(source, []).append(target)
+
+        return {"states": states, "transitions": transitions}
+
+    async def get_workflow_model(
+        self, project_key: str, type_key: str
+    ) -> Dict[str, Any]:
+        """
+        获取工作项类型的流程模型（状态及允许的流转）
+
+        数据来源: get_work_item_type_config (流程模式) + get_workflow_templates
+        (模板列表) + get_template_detail (状态与连线)。按 (project, type) 缓存。
+
+        Args:
+            project_key: 项目空间 Key
+            type_key: 工作项类型 Key
+
+        Returns:
+            {"flow_mode": str, "templates": {template_id: {"states": {...}, "transitions": {...}}}}
+            节点流（flow_mode == "workflow"）不包含状态流转，templates 为空
+        """
+        import time
+
+        # 快速路径
+        model = self._workflow_cache.get(project_key, {}).get(type_key)
+        if model is not None:
+            last_loaded = self._workflow_last_loaded.get(project_key, {}).get(type_key)
+            if not self._is_cache_expired(last_loaded, self.WORKFLOW_TTL):
+                return model
+
+        async with self._workflow_lock:
+            # 在锁内再次检查，避免重复加载
+            model = self._workflow_cache.get(project_key, {}).get(type_key)
+            last_loaded = self._workflow_last_loaded.get(project_key, {}).get(type_key)
+            if model is not None and not self._is_cache_expired(
+                last_loaded, self.WORKFLOW_TTL
+            ):
+                return model
+
+            type_config = await self.metadata_api.get_work_item_type_config(
+                project_key, type_key
+            )
+            flow_mode = (type_config or {}).get("flow_mode") or ""
+
+            templates: Dict[int, Dict[str, Any]] = {}
+            if flow_mode != "workflow":
+                template_list = await self.metadata_api.get_workflow_templates(
+                    project_key, type_key
+                )
+                for tpl in template_list or []:
+                    template_id = tpl.get("template_id")
+                    if template_id is None or tpl.get("is_disabled"):
+                        continue
+                    try:
+                        detail = await self.metadata_api.get_template_detail(
+                            project_key, template_id
+                        )
+                    except Exception as e:
+                        logger.warning(
+                            "Failed to load template %s detail: %s", template_id, e
+                        )
+                        continue
+                    templates[int(template_id)] = self._parse_template_detail(detail)
+
+            model = {"flow_mode": flow_mode, "templates": templates}
+            self._workflow_cache.setdefault(project_key, {})[type_key] = model
+            self._workflow_last_loaded.setdefault(project_key, {})[type_key] = (
+                time.time()
+            )
+            logger.info(
+                "Workflow model loaded: type_key=%s, flow_mode=%s, templates=%d",
+                type_key,
+                flow_mode or "unknown",
+                len(templates),
+            )
+            return model
+
+    async def validate_status_transition(
+        self,
+        project_key: str,
+        type_key: str,
+        template_id: Optional[int],
+        current_state: Optional[str],
+        target_state: str,
+    ) -> Optional[str]:
+        """
+        基于缓存的流程模型校验状态流转是否合法
+
+        只在信息完整时判定非法（模板已知、当前状态与目标状态均为模板内状态），
+        其余情况放行，交由服务端最终校验。
+
+        Args:
+            project_key: 项目空间 Key
+            type_key: 工作项类型 Key
+            template_id: 工作项所属流程模板 ID
+            current_state: 当前状态 Key
+            target_state: 目标状态 Key
+
+        Returns:
+            非法时返回原因描述，合法或无法判定时返回 None
+        """
+        if template_id is None or not current_state or current_state == target_state:
+            return None
+
+        model = await self.get_workflow_model(project_key, type_key)
+        template = model.get("templates", {}).get(int(template_id))
+        if not template:
+            return None
+
+        states = template["states"]
+        if current_state not in states or target_state not in states:
+            return None
+
+        allowed = template["transitions"].get(current_state, [])
+        if target_state in allowed:
+            return None
+
+        allowed_names = [states.get(s, s) for s in allowed]
+        return (
+            f"状态不允许从 '{states[current_state]}' 流转到 '{states[target_state]}'。"
+            f"可流转状态: {allowed_names}"
+        )
 
     # ========== L-User: User ==========
 
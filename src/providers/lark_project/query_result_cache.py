@@ -0,0 +1,207 @@
+"""
+QueryResultCache - 列表查询结果短期缓存
+
+n8n 工作流、IDE 助手会在短时间内反复执行相同的 get_tasks/filter_issues 查询，
+每次都消耗一次受频控的 filter/search_params 调用。本缓存以 (查询参数, 分页) 为键
+保存结果，TTL 很短（默认 15 秒），并在写操作后按标签失效。
+
+设计说明:
+- 进程级单例，所有 Provider 共享（同一空间/类型可能对应多个 Provider 实例）
+- 查询键包含调用方 user_key：不同用户权限下的结果互不复用
+- 每个条目带两类标签: (project_key, type_key) 与结果中包含的工作项 ID
+- 写操作（创建/更新/删除）完成后失效对应类型与工作项 ID 的条目
+- 代数计数器: 查询开始后发生过失效，则该查询结果不写入缓存，
+  避免并发读写时把写入前读到的旧结果存回缓存
+"""
+
+import copy
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 标签: ("type", project_key, type_key) 或 ("item", work_item_id)
+Tag = Tuple[Any, ...]
+# 条目: (查询结果, 过期时间, 标签集合)
+Entry = Tuple[Dict[str, Any], float, Set[Tag]]
+
+
+class QueryResultCache:
+    """
+    查询结果缓存（有界 LRU + 短 TTL，单例）
+
+    单线程异步场景下各方法内部没有 await，无需加锁。
+    """
+
+    _instance: Optional["QueryResultCache"] = None
+
+    DEFAULT_MAX_SIZE = 256
+
+    def __init__(self, ttl: Optional[float] = None, max_size: int = DEFAULT_MAX_SIZE):
+        self.ttl = settings.QUERY_CACHE_TTL if ttl is None else ttl
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Entry]" = OrderedDict()
+        # tag -> keys
+        self._tag_index: Dict[Tag, Set[Hashable]] = {}
+        self._generation = 0
+
+    @classmethod
+    def get_instance(cls) -> "QueryResultCache":
+        """获取全局单例实例"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """重置单例实例（主要用于测试）"""
+        cls._instance = None
+
+    @property
+    def enabled(self) -> bool:
+        """TTL <= 0 时禁用缓存"""
+        return self.ttl > 0
+
+    @property
+    def generation(self) -> int:
+        """当前失效代数，查询开始前读取，写入缓存时传回"""
+        return self._generation
+
+    @staticmethod
+    def _copy(result: Dict[str, Any]) -> Dict[str, Any]:
+        # 深拷贝条目，调用方对列表或条目字段的修改不会影响缓存
+        copied = dict(result)
+        if isinstance(copied.get("items"), list):
+            copied["items"] = copy.deepcopy(copied["items"])
+        return copied
+
+    def _remove(self, key: Hashable) -> None:
+        record = self._entries.pop(key, None)
+        if record is None:
+            return
+        for tag in record[2]:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """
+        获取缓存的查询结果
+
+        Args:
+            key: 查询键
+
+        Returns:
+            查询结果副本；未缓存、已过期或缓存禁用时返回 None
+        """
+        record = self._entries.get(key)
+        if record is None:
+            return None
+
+        result, expiry, _ = record
+        if time.time() > expiry:
+            self._remove(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return self._copy(result)
+
+    def set(
+        self,
+        key: Hashable,
+        result: Dict[str, Any],
+        project_key: str,
+        type_key: str,
+        generation: int,
+    ) -> bool:
+        """
+        缓存查询结果
+
+        Args:
+            key: 查询键
+            result: 查询结果（包含 items 列表）
+            project_key: 项目 Key
+            type_key: 工作项类型 Key
+            generation: 查询开始前读取的 generation
+
+        Returns:
+            是否写入缓存（查询期间发生过失效或缓存禁用时不写入）
+        """
+        if not self.enabled or generation != self._generation:
+            return False
+
+        tags: Set[Tag] = {("type", project_key, type_key)}
+        for item in result.get("items") or []:
+            if isinstance(item, dict) and item.get("id") is not None:
+                try:
+                    tags.add(("item", int(item["id"])))
+                except (TypeError, ValueError):
+                    continue
+
+        self._remove(key)
+        self._entries[key] = (self._copy(result), time.time() + self.ttl, tags)
+        for tag in tags:
+            self._tag_index.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self.max_size:
+            self._remove(next(iter(self._entries)))
+        return True
+
+    def _invalidate_tag(self, tag: Tag) -> int:
+        keys = list(self._tag_index.get(tag, ()))
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def invalidate(
+        self,
+        project_key: str,
+        type_key: str,
+        work_item_ids: Optional[Iterable[Any]] = None,
+    ) -> int:
+        """
+        写操作后失效相关条目
+
+        同类型的所有查询都会失效（写入可能改变任意查询的结果集），
+        包含这些工作项的其他类型/空间的查询也一并失效。
+
+        Args:
+            project_key: 项目 Key
+            type_key: 工作项类型 Key
+            work_item_ids: 被写入的工作项 ID 列表（可选）
+
+        Returns:
+            失效的条目数
+        """
+        self._generation += 1
+        removed = self._invalidate_tag(("type", project_key, type_key))
+        for work_item_id in work_item_ids or ():
+            try:
+                removed += self._invalidate_tag(("item", int(work_item_id)))
+            except (TypeError, ValueError):
+                continue
+        if removed:
+            logger.debug(
+                "QueryResultCache invalidated %d entries for %s/%s",
+                removed,
+                project_key,
+                type_key,
+            )
+        return removed
+
+    def clear(self) -> None:
+        """清空缓存"""
+        size = len(self._entries)
+        self._generation += 1
+        self._entries.clear()
+        self._tag_index.clear()
+        logger.info("QueryResultCache cleared: removed %d entries", size)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -4,21 +4,51 @@
 职责：
 - 解析 related_to 参数（ID 或名称）
 - 检查工作项是否关联指定 ID
-- 在多个工作项类型中并行搜索关联项
+- 在多个工作项类型中一次性搜索关联项
 
 设计说明：
 - 依赖 MetadataManager 获取类型元数据
 - 依赖 WorkItemAPI 执行关联查询
-- 支持并行搜索提高效率
+- 名称搜索使用单次多类型 filter，不支持时回退为逐类型查询
 """
 
-import asyncio
 import logging
-from typing import Any, Dict, List, Tuple, Union
+from typing import AbstractSet, Any, Dict, List, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
 
+def select_name_match(
+    items: List[Dict[str, Any]],
+    name: str,
+    type_order: Optional[List[str]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    从名称搜索结果中选出最佳匹配：优先精确匹配，其次部分匹配
+
+    Args:
+        items: 搜索结果（每项应包含 name 和 work_item_type_key）
+        name: 搜索的名称
+        type_order: 类型 Key 优先级顺序（可选），同级匹配时靠前的类型优先
+
+    Returns:
+        最佳匹配的工作项；无结果时返回 None
+    """
+    if not items:
+        return None
+
+    if type_order:
+        rank = {t_key: idx for idx, t_key in enumerate(type_order)}
+        items = sorted(
+            items, key=lambda i: rank.get(i.get("work_item_type_key"), len(rank))
+        )
+
+    for item in items:
+        if item.get("name") == name:
+            return item
+    return items[0]
+
+
 class RelationResolver:
     """
     关联关系解析器
@@ -52,18 +82,25 @@ class RelationResolver:
         self.meta = meta
 
     @staticmethod
-    def is_item_related_to(item: Dict[str, Any], related_to: int) -> bool:
+    def is_item_related_to(
+        item: Dict[str, Any],
+        related_to: int,
+        relation_keys: Optional[AbstractSet[str]] = None,
+    ) -> bool:
         """
         检查工作项是否与指定 ID 关联
 
         Args:
             item: 工作项字典
             related_to: 关联的工作项 ID
+            relation_keys: 关联工作项字段 Key 集合（可选，提供时只检查这些字段）
 
         Returns:
             True: 关联，False: 不关联
         """
         for field in item.get("fields", []):
+            if relation_keys and field.get("field_key") not in relation_keys:
+                continue
             field_value = field.get("field_value")
             if not field_value:
                 continue
@@ -91,7 +128,7 @@ class RelationResolver:
         Args:
             related_to: 工作项 ID 或名称
             project_key: 项目 Key
-            provider_factory: Provider 工厂函数（可选），用于创建子 Provider 搜索
+            provider_factory: Provider 工厂函数（可选），用于创建执行名称搜索的 Provider
 
         Returns:
             工作项 ID
@@ -120,66 +157,30 @@ class RelationResolver:
                     f"无法按名称搜索 '{related_to}': 未提供 provider_factory"
                 )
 
-            async def search_single_type(
-                search_type: str,
-            ) -> Tuple[str, List[Dict[str, Any]]]:
-                """搜索单个工作项类型，返回 (类型名, 结果列表)"""
+            # 解析默认搜索类型的 Key（跳过项目中不存在的类型）
+            type_keys: List[str] = []
+            for search_type in self.DEFAULT_SEARCH_TYPES:
                 try:
-                    temp_provider = provider_factory(
-                        project_key=project_key,
-                        work_item_type_name=search_type,
-                    )
-                    result = await temp_provider.api.filter(
-                        project_key=project_key,
-                        work_item_type_keys=[await temp_provider._get_type_key()],
-                        work_item_name=related_to,
-                        page_num=1,
-                        page_size=10,
-                    )
-                    items = (
-                        result.get("work_items", [])
-                        if isinstance(result, dict)
-                        else result
-                        if isinstance(result, list)
-                        else []
+                    type_keys.append(
+                        await self.meta.get_type_key(project_key, search_type)
                     )
-                    return (search_type, items)
                 except Exception as e:
-                    logger.debug("搜索类型 '%s' 失败: %s", search_type, e)
-                    return (search_type, [])
+                    logger.debug("类型 '%s' 不可用: %s", search_type, e)
 
-            # 并行搜索所有类型
-            results = await asyncio.gather(
-                *(search_single_type(t) for t in self.DEFAULT_SEARCH_TYPES)
+            # 一次多类型查找（不支持时由 Provider 回退为逐类型查询）
+            provider = provider_factory(project_key=project_key)
+            items = await provider.find_work_items(
+                name=related_to, type_keys=type_keys, page_size=10
             )
 
             # 处理结果：优先精确匹配，其次部分匹配
-            candidates: List[Tuple[Dict[str, Any], str]] = []
-
-            for search_type, items in results:
-                for item in items:
-                    item_name = item.get("name")
-                    if item_name == related_to:
-                        # 发现精确匹配，直接返回
-                        logger.info(
-                            "resolve_related_to: 精确匹配 '%s' (ID: %s, Type: %s)",
-                            item_name,
-                            item.get("id"),
-                            search_type,
-                        )
-                        return item.get("id")
-
-                    # 收集部分匹配作为候选
-                    candidates.append((item, search_type))
-
-            # 如果没有精确匹配，检查候选者
-            if candidates:
-                best_match, match_type = candidates[0]
+            best_match = select_name_match(items, related_to, type_keys)
+            if best_match:
                 logger.info(
-                    "resolve_related_to: 部分匹配 '%s' (ID: %s, Type: %s)",
+                    "resolve_related_to: 匹配 '%s' (ID: %s, Type: %s)",
                     best_match.get("name"),
                     best_match.get("id"),
-                    match_type,
+                    best_match.get("work_item_type_key"),
                 )
                 return best_match.get("id")
 
@@ -199,6 +200,7 @@ class RelationResolver:
         self,
         items: List[Dict[str, Any]],
         related_to: int,
+        relation_keys: Optional[AbstractSet[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         过滤出与指定 ID 关联的工作项
@@ -206,8 +208,13 @@ class RelationResolver:
         Args:
             items: 工作项列表
             related_to: 关联的工作项 ID
+            relation_keys: 关联工作项字段 Key 集合（可选，来自 MetadataManager.get_relation_field_keys）
 
         Returns:
             过滤后的工作项列表
         """
-        return [item for item in items if self.is_item_related_to(item, related_to)]
+        return [
+            item
+            for item in items
+            if self.is_item_related_to(item, related_to, relation_keys)
+        ]
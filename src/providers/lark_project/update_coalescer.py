@@ -0,0 +1,169 @@
+"""
+UpdateCoalescer - 同一工作项字段更新的写后合并队列
+
+助手经常在几秒内对同一工作项连续发出多次 update_task（先改状态、再改负责人、
+再改优先级），每次都是一次独立的上游更新，各自重试、各自降级。
+开启合并后，同一 (project_key, type_key, issue_id) 在窗口期内的字段更新
+合并为一次多字段 update，每个调用方通过 Future 获得自己字段的结果。
+
+设计说明:
+- 进程级单例，所有 Provider 共享（同一工作项可能经由不同 Provider 实例更新）
+- 窗口从该工作项第一次入队开始计时；窗口内同一字段以最后一次取值为准
+- 写入函数由入队方提供，本模块不依赖 Provider
+- flush_all() 立即写出所有待合并的更新，服务关闭时调用
+- 窗口 <= 0 时禁用（默认），调用方直接写入
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 合并键: (project_key, type_key, issue_id)
+WriteKey = Tuple[str, str, int]
+# 写入函数: (project_key, type_key, issue_id, 字段列表) -> 与字段列表一一对应的结果
+FlushFn = Callable[[str, str, int, List[Dict[str, Any]]], Awaitable[List[Any]]]
+
+
+class _PendingWrite:
+    """单个工作项窗口期内累积的字段更新"""
+
+    __slots__ = ("fields", "flush_fn", "timer", "waiters")
+
+    def __init__(self, flush_fn: FlushFn):
+        self.flush_fn = flush_fn
+        # field_key -> 解析后的字段（后入队的取值覆盖先入队的）
+        self.fields: Dict[str, Dict[str, Any]] = {}
+        # (调用方的 field_key 列表, 调用方的 Future)
+        self.waiters: List[Tuple[List[str], "asyncio.Future[List[Any]]"]] = []
+        self.timer: Optional["asyncio.Task[None]"] = None
+
+
+class UpdateCoalescer:
+    """
+    写后合并队列（单例）
+
+    单线程异步场景下入队与出队之间没有 await，无需加锁。
+    """
+
+    _instance: Optional["UpdateCoalescer"] = None
+
+    def __init__(self, window: Optional[float] = None):
+        self.window = settings.UPDATE_COALESCE_WINDOW if window is None else window
+        self._pending: Dict[WriteKey, _PendingWrite] = {}
+        # 所有窗口计时/写入任务，flush_all 时等待写入中的任务完成
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    @classmethod
+    def get_instance(cls) -> "UpdateCoalescer":
+        """获取全局单例实例"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """重置单例实例（主要用于测试）"""
+        cls._instance = None
+
+    @property
+    def enabled(self) -> bool:
+        """窗口 <= 0 时禁用合并"""
+        return self.window > 0
+
+    def enqueue(
+        self,
+        project_key: str,
+        type_key: str,
+        issue_id: int,
+        fields: List[Dict[str, Any]],
+        flush_fn: FlushFn,
+    ) -> "asyncio.Future[List[Any]]":
+        """
+        将字段更新加入合并队列
+
+        Args:
+            project_key: 项目 Key
+            type_key: 工作项类型 Key
+            issue_id: 工作项 ID
+            fields: 解析后的字段列表（每项包含 field_key）
+            flush_fn: 窗口结束时执行写入的函数（同一工作项以第一次入队的为准）
+
+        Returns:
+            Future，写入完成后返回本次入队字段对应的结果列表
+        """
+        loop = asyncio.get_running_loop()
+        key = (project_key, type_key, int(issue_id))
+
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = _PendingWrite(flush_fn)
+            self._pending[key] = pending
+            pending.timer = loop.create_task(self._flush_later(key))
+            self._tasks.add(pending.timer)
+            pending.timer.add_done_callback(self._tasks.discard)
+
+        for field in fields:
+            pending.fields[field["field_key"]] = field
+
+        future: "asyncio.Future[List[Any]]" = loop.create_future()
+        pending.waiters.append(([f["field_key"] for f in fields], future))
+        return future
+
+    async def _flush_later(self, key: WriteKey) -> None:
+        await asyncio.sleep(self.window)
+        await self._flush(key)
+
+    async def _flush(self, key: WriteKey) -> None:
+        """写出单个工作项的待合并更新，并把结果分发给各调用方"""
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+
+        fields = list(pending.fields.values())
+        logger.info(
+            "Flushing %d coalesced field update(s) from %d caller(s) for issue %s",
+            len(fields),
+            len(pending.waiters),
+            key[2],
+        )
+        try:
+            results = await pending.flush_fn(*key, fields)
+        except Exception as e:
+            for _, future in pending.waiters:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        by_key = dict(zip(pending.fields, results))
+        for field_keys, future in pending.waiters:
+            if not future.done():
+                future.set_result([by_key[k] for k in field_keys if k in by_key])
+
+    async def flush_all(self) -> int:
+        """
+        立即写出所有待合并的更新，并等待写入中的任务完成（服务关闭时调用）
+
+        Returns:
+            写出的工作项数
+        """
+        keys = list(self._pending)
+        for key in keys:
+            timer = self._pending[key].timer
+            if timer is not None:
+                timer.cancel()
+        await asyncio.gather(*(self._flush(key) for key in keys))
+
+        current = asyncio.current_task()
+        in_flight = [t for t in self._tasks if t is not current and not t.done()]
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+        if keys:
+            logger.info("UpdateCoalescer flushed %d pending issue(s)", len(keys))
+        return len(keys)
+
+    def __len__(self) -> int:
+        return len(self._pending)
@@ -0,0 +1,217 @@
+"""
+WorkItemCache - 进程级工作项名称缓存
+
+用于关联工作项的可读化展示（ID -> 名称）。所有 Provider 与 WorkItemFormatter
+共享同一实例，相同的关联 Epic/Story 在进程内只需解析一次。
+
+设计说明:
+- 键: (project_key, work_item_id)
+- 值: 名称、类型 Key、"未找到"标记
+- 有界 LRU: 超过 max_size 时淘汰最久未使用的条目
+- 双 TTL: 命中条目与"未找到"条目分别设置过期时间，后者更短，
+  避免新建/权限变化的工作项被长期误判为不存在
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class CachedWorkItem(NamedTuple):
+    """缓存条目"""
+
+    name: Optional[str]
+    type_key: Optional[str] = None
+    not_found: bool = False
+
+
+class WorkItemCache:
+    """
+    工作项名称缓存（有界 LRU，单例）
+
+    单线程异步场景下各方法内部没有 await，无需加锁。
+    """
+
+    _instance: Optional["WorkItemCache"] = None
+
+    # 默认配置
+    DEFAULT_MAX_SIZE = 5000
+    DEFAULT_TTL = 300  # 5分钟
+    DEFAULT_NOT_FOUND_TTL = 60  # 1分钟
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl: int = DEFAULT_TTL,
+        not_found_ttl: int = DEFAULT_NOT_FOUND_TTL,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.not_found_ttl = not_found_ttl
+        # (project_key, work_item_id) -> (CachedWorkItem, expiry)
+        self._entries: "OrderedDict[Tuple[str, int], Tuple[CachedWorkItem, float]]" = (
+            OrderedDict()
+        )
+
+    @classmethod
+    def get_instance(cls) -> "WorkItemCache":
+        """获取全局单例实例"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """重置单例实例（主要用于测试）"""
+        cls._instance = None
+
+    def _put(self, key: Tuple[str, int], entry: CachedWorkItem, ttl: int) -> None:
+        self._entries[key] = (entry, time.time() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def get(self, project_key: str, work_item_id: int) -> Optional[CachedWorkItem]:
+        """
+        获取缓存条目
+
+        Args:
+            project_key: 项目 Key
+            work_item_id: 工作项 ID
+
+        Returns:
+            缓存条目；未缓存或已过期时返回 None
+        """
+        key = (project_key, int(work_item_id))
+        record = self._entries.get(key)
+        if record is None:
+            return None
+
+        entry, expiry = record
+        if time.time() > expiry:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    def get_many(
+        self, project_key: str, work_item_ids: Iterable[int]
+    ) -> Tuple[Dict[int, str], List[int]]:
+        """
+        批量读取缓存
+
+        Args:
+            project_key: 项目 Key
+            work_item_ids: 工作项 ID 列表
+
+        Returns:
+            (已缓存的 ID 到名称映射, 未缓存的 ID 列表)。
+            标记为"未找到"的 ID 两边都不出现。
+        """
+        names: Dict[int, str] = {}
+        missing: List[int] = []
+        for item_id in work_item_ids:
+            entry = self.get(project_key, item_id)
+            if entry is None:
+                missing.append(item_id)
+            elif not entry.not_found:
+                names[item_id] = entry.name or ""
+        return names, missing
+
+    def set(
+        self,
+        project_key: str,
+        work_item_id: int,
+        name: str,
+        type_key: Optional[str] = None,
+    ) -> None:
+        """
+        缓存工作项名称
+
+        Args:
+            project_key: 项目 Key
+            work_item_id: 工作项 ID
+            name: 工作项名称
+            type_key: 工作项类型 Key（可选）
+        """
+        self._put(
+            (project_key, int(work_item_id)),
+            CachedWorkItem(name=name, type_key=type_key),
+            self.ttl,
+        )
+
+    def set_items(
+        self, project_key: str, items: Iterable[Dict], type_key: Optional[str] = None
+    ) -> Dict[int, str]:
+        """
+        从 API 返回的工作项列表批量写入缓存
+
+        Args:
+            project_key: 项目 Key（条目自带 project_key 时以条目为准）
+            items: 工作项字典列表，需包含 id 和 name
+            type_key: 工作项类型 Key（条目自带 work_item_type_key 时以条目为准）
+
+        Returns:
+            写入的 ID 到名称映射
+        """
+        written: Dict[int, str] = {}
+        for item in items:
+            item_id = item.get("id")
+            if not item_id:
+                continue
+            name = item.get("name") or ""
+            self.set(
+                item.get("project_key") or project_key,
+                item_id,
+                name,
+                item.get("work_item_type_key") or type_key,
+            )
+            written[item_id] = name
+        return written
+
+    def set_not_found(self, project_key: str, work_item_id: int) -> None:
+        """
+        标记工作项在项目中不存在（使用较短的 not_found_ttl）
+
+        Args:
+            project_key: 项目 Key
+            work_item_id: 工作项 ID
+        """
+        self._put(
+            (project_key, int(work_item_id)),
+            CachedWorkItem(name=None, not_found=True),
+            self.not_found_ttl,
+        )
+
+    def delete(self, work_item_id: int, project_key: Optional[str] = None) -> bool:
+        """
+        删除工作项缓存
+
+        Args:
+            work_item_id: 工作项 ID
+            project_key: 项目 Key（可选，不指定时删除所有项目下该 ID 的条目）
+
+        Returns:
+            如果有条目被删除则返回 True，否则返回 False
+        """
+        item_id = int(work_item_id)
+        if project_key is not None:
+            return self._entries.pop((project_key, item_id), None) is not None
+
+        keys = [key for key in self._entries if key[1] == item_id]
+        for key in keys:
+            del self._entries[key]
+        return bool(keys)
+
+    def clear(self) -> None:
+        """清空缓存"""
+        size = len(self._entries)
+        self._entries.clear()
+        logger.info("WorkItemCache cleared: removed %d entries", size)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -8,16 +8,17 @@
 
 设计说明：
 - 依赖 MetadataManager 获取用户名和工作项名称
-- 依赖 FieldResolver 进行字段值提取
+- 依赖 FieldResolver 进行字段值提取，摘要提取使用 ColumnExtractor
 - 支持新版 (fields) 和旧版 (field_value_pairs) 数据结构
 """
 
-import asyncio
 import logging
 from typing import Any, Dict, List, Optional, Set
 
 from src.providers.lark_project.managers import MetadataManager
+from src.providers.lark_project.column_extractor import ColumnExtractor
 from src.providers.lark_project.field_resolver import FieldResolver
+from src.providers.lark_project.work_item_cache import WorkItemCache
 
 logger = logging.getLogger(__name__)
 
@@ -33,14 +34,11 @@ class WorkItemFormatter:
         field_resolver: FieldResolver 实例
     """
 
-    # 缓存中"未找到"的标记值
-    _NOT_FOUND_MARKER: str = "__NOT_FOUND__"
-
     def __init__(
         self,
         meta: MetadataManager,
         field_resolver: FieldResolver,
-        work_item_cache: Optional[Any] = None,
+        work_item_cache: Optional[WorkItemCache] = None,
     ):
         """
         初始化工作项格式化器
@@ -48,11 +46,11 @@ class WorkItemFormatter:
         Args:
             meta: MetadataManager 实例
             field_resolver: FieldResolver 实例
-            work_item_cache: 工作项缓存（可选）
+            work_item_cache: 工作项缓存（可选，默认使用进程级共享缓存）
         """
         self.meta = meta
         self.field_resolver = field_resolver
-        self._work_item_cache = work_item_cache
+        self._work_item_cache = work_item_cache or WorkItemCache.get_instance()
 
     async def simplify_work_item(
         self, item: Dict[str, Any], field_mapping: Optional[Dict[str, str]] = None
@@ -67,29 +65,13 @@ class WorkItemFormatter:
         Returns:
             简化后的工作项字典，包含 id, name, status, priority, owner
         """
-
-        def get_field_key(field_name: str) -> str:
-            if field_mapping and field_name in field_mapping:
-                return field_mapping[field_name]
-            return field_name
-
-        priority_key = get_field_key("priority")
-        priority_raw = FieldResolver.extract_field_value(item, priority_key)
-        # 脱敏处理：截断优先级值
-        priority_value = priority_raw[:20] if priority_raw else None
-
-        return {
-            "id": item.get("id"),
-            "name": item.get("name"),
-            "status": FieldResolver.extract_field_value(item, get_field_key("status")),
-            "priority": priority_value,
-            "owner": FieldResolver.extract_field_value(item, get_field_key("owner")),
-        }
+        return ColumnExtractor(field_mapping).extract_row(item)
 
     async def simplify_work_items(
         self,
         items: List[Dict[str, Any]],
         field_mapping: Optional[Dict[str, str]] = None,
+        extra_columns: Optional[Dict[str, str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         批量简化工作项列表
@@ -97,49 +79,26 @@ class WorkItemFormatter:
         Args:
             items: 原始工作项列表
             field_mapping: 字段名称到字段Key的映射（可选）
+            extra_columns: 额外输出列，列名 -> 字段 Key（可选）
 
         Returns:
             简化后的工作项列表，owner 字段会转换为人名以提高可读性
         """
         logger.info("simplify_work_items: processing %d items", len(items))
-        if items:
-            logger.info("First item keys: %s", list(items[0].keys()))
-            if "fields" in items[0]:
-                fields = items[0].get("fields", [])
-                logger.info(
-                    "First item fields count: %d, field_keys: %s",
-                    len(fields),
-                    [f.get("field_key") for f in fields],
-                )
-
-        # 并行简化所有工作项
-        tasks = [self.simplify_work_item(item, field_mapping) for item in items]
-        simplified_items = await asyncio.gather(*tasks)
+        simplified_items, owner_rows = ColumnExtractor(
+            field_mapping, extra_columns
+        ).extract(items)
 
         # 批量转换 owner user_key 为人名
-        owner_keys = [
-            item["owner"]
-            for item in simplified_items
-            if (owner := item.get("owner"))
-            and isinstance(owner, str)
-            and owner.isdigit()
-            and len(owner) > 10
-        ]
-
-        if owner_keys:
-            unique_keys = list(set(owner_keys))
-            logger.info("Converting %d unique owner keys to names", len(unique_keys))
+        if owner_rows:
+            logger.info("Converting %d unique owner keys to names", len(owner_rows))
             try:
-                key_to_name = await self.meta.batch_get_user_names(unique_keys)
-                # 替换 owner 字段
-                for item in simplified_items:
-                    owner = item.get("owner")
-                    if owner and owner in key_to_name:
-                        item["owner"] = key_to_name[owner]
+                key_to_name = await self.meta.batch_get_user_names(list(owner_rows))
+                ColumnExtractor.substitute_owners(owner_rows, key_to_name)
             except Exception as e:
                 logger.warning("Failed to convert owner keys to names: %s", e)
 
-        return list(simplified_items)
+        return simplified_items
 
     async def enhance_with_readable_names(
         self,
@@ -166,6 +125,15 @@ class WorkItemFormatter:
         # 创建副本，避免修改原始数据
         enhanced = item.copy()
 
+        # 已知的关联字段 Key（旧版结构没有 field_type_key，需要依赖它识别关联字段）
+        relation_keys: Set[str] = set()
+        try:
+            relation_keys = set(
+                await self.meta.get_relation_field_keys(project_key, type_key)
+            )
+        except Exception as e:
+            logger.debug("Failed to load relation field keys: %s", e)
+
         # 准备收集 ID 的容器
         users_to_fetch: Set[str] = set()
         work_items_to_fetch: Set[int] = set()
@@ -185,6 +153,7 @@ class WorkItemFormatter:
 
         # 第一遍遍历: 收集需要查询的 ID
         for field in fields:
+            f_key = field.get("field_key")
             f_val = field.get("field_value")
             f_type = field.get("field_type_key", "")
 
@@ -205,7 +174,7 @@ class WorkItemFormatter:
                     users_to_fetch.add(f_val)
 
             # 工作项关联字段
-            elif f_type in ["work_item", "work_item_related"]:
+            elif f_type in ["work_item", "work_item_related"] or f_key in relation_keys:
                 if isinstance(f_val, list):
                     for wid in f_val:
                         if isinstance(wid, int):
@@ -235,6 +204,13 @@ class WorkItemFormatter:
             except Exception as e:
                 logger.warning("Failed to fetch work item names: %s", e)
 
+        # 元数据快照: 一次加载，第二遍同步查找字段名称
+        snapshot = None
+        try:
+            snapshot = await self.meta.get_type_snapshot(project_key, type_key)
+        except Exception as e:
+            logger.debug("Failed to get metadata snapshot: %s", e)
+
         # 第二遍遍历: 构建可读字段
         readable_fields: Dict[str, Any] = {}
 
@@ -244,11 +220,9 @@ class WorkItemFormatter:
             f_type = field.get("field_type_key", "")
 
             # 获取字段名称
-            try:
-                field_name = await self.meta.get_field_name(
-                    project_key, type_key, f_key
-                )
-            except Exception:
+            if snapshot is not None:
+                field_name = snapshot.field_name(f_key)
+            else:
                 field_name = field.get("field_alias") or f_key
 
             field["field_name"] = field_name
@@ -276,7 +250,7 @@ class WorkItemFormatter:
                     readable_val = user_map.get(f_val, f_val)
 
             # 工作项关联字段增强
-            elif f_type in ["work_item", "work_item_related"]:
+            elif f_type in ["work_item", "work_item_related"] or f_key in relation_keys:
                 if isinstance(f_val, list):
                     readable_val = [
                         work_item_map.get(
@@ -335,42 +309,23 @@ class WorkItemFormatter:
         Returns:
             (工作项 ID 到名称的映射字典, 未找到的 ID 列表)
         """
-        work_item_map: Dict[int, str] = {}
-        items_to_fetch: List[int] = []
-
-        # 首先检查缓存
-        if self._work_item_cache:
-            for item_id in work_item_ids:
-                cached_value = self._work_item_cache.get(str(item_id))
-                if cached_value is not None:
-                    if cached_value != self._NOT_FOUND_MARKER:
-                        work_item_map[item_id] = cached_value
-                else:
-                    items_to_fetch.append(item_id)
-        else:
-            items_to_fetch = list(work_item_ids)
+        # 首先检查共享缓存（已标记"未找到"的 ID 不再查询）
+        work_item_map, items_to_fetch = self._work_item_cache.get_many(
+            project_key, work_item_ids
+        )
 
         # 如果有未缓存的工作项，批量查询
         not_found_ids: List[int] = []
         if items_to_fetch:
             try:
                 items = await api.query(project_key, type_key, items_to_fetch)
-                found_ids: Set[int] = set()
-                for item in items:
-                    item_id = item.get("id")
-                    item_name = item.get("name") or ""
-                    if item_id:
-                        work_item_map[item_id] = item_name
-                        if self._work_item_cache:
-                            self._work_item_cache.set(str(item_id), item_name)
-                        found_ids.add(item_id)
+                found = self._work_item_cache.set_items(project_key, items, type_key)
+                work_item_map.update(found)
 
+                # 仅查询了当前类型，无法确认其他类型中不存在，因此不缓存"未找到"
                 not_found_ids = [
-                    item_id for item_id in items_to_fetch if item_id not in found_ids
+                    item_id for item_id in items_to_fetch if item_id not in found
                 ]
-                if self._work_item_cache:
-                    for item_id in not_found_ids:
-                        self._work_item_cache.set(str(item_id), self._NOT_FOUND_MARKER)
 
             except Exception as e:
                 logger.debug("Failed to fetch work items in current type: %s", e)
@@ -0,0 +1,182 @@
+"""
+WorkItemLocator - 工作项 ID 到 (project_key, type_key) 的定位索引
+
+飞书项目的查询接口必须指定工作项类型，而调用方通常只持有工作项 ID。
+未知类型时只能逐类型探测（一个 15 类型的空间最多需要 16 次请求）。
+本索引记录系统见过的每个工作项所在的空间与类型，已知 ID 直接定位到正确类型，
+只有真正未知的 ID 才需要跨类型探测。
+
+设计说明:
+- 进程级单例，所有 Provider 共享
+- 工作项的类型创建后不会变化，因此条目不设 TTL，仅按容量做 LRU 淘汰
+- 定位结果失效（工作项被删除）时由调用方 forget() 后回退到探测逻辑
+- 顺带记录读取时见到的流程状态 (template_id, state_key)，供状态流转预校验复用，
+  避免每次状态更新前额外查询；状态会变化，只作为提示，调用方需自行确认
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class WorkItemLocator:
+    """
+    工作项定位索引（有界 LRU，单例）
+
+    单线程异步场景下各方法内部没有 await，无需加锁。
+    """
+
+    _instance: Optional["WorkItemLocator"] = None
+
+    DEFAULT_MAX_SIZE = 100000
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        self.max_size = max_size
+        # work_item_id -> (project_key, type_key)
+        self._index: "OrderedDict[int, Tuple[str, str]]" = OrderedDict()
+        # work_item_id -> (template_id, state_key)，只保留仍在索引中的条目
+        self._states: Dict[int, Tuple[Any, str]] = {}
+
+    @classmethod
+    def get_instance(cls) -> "WorkItemLocator":
+        """获取全局单例实例"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """重置单例实例（主要用于测试）"""
+        cls._instance = None
+
+    def record(self, work_item_id: Any, project_key: str, type_key: str) -> None:
+        """
+        记录工作项位置
+
+        Args:
+            work_item_id: 工作项 ID
+            project_key: 项目 Key
+            type_key: 工作项类型 Key
+        """
+        if not project_key or not type_key:
+            return
+        try:
+            item_id = int(work_item_id)
+        except (TypeError, ValueError):
+            return
+
+        self._index[item_id] = (project_key, type_key)
+        self._index.move_to_end(item_id)
+        while len(self._index) > self.max_size:
+            evicted, _ = self._index.popitem(last=False)
+            self._states.pop(evicted, None)
+
+    def record_items(
+        self,
+        items: Iterable[Dict[str, Any]],
+        project_key: Optional[str] = None,
+        type_key: Optional[str] = None,
+    ) -> int:
+        """
+        从 API 返回的工作项列表批量记录位置
+
+        条目自带的 project_key/work_item_type_key 优先，其次使用参数提供的上下文。
+
+        Args:
+            items: 工作项字典列表
+            project_key: 查询时使用的项目 Key（可选）
+            type_key: 查询时使用的类型 Key（可选）
+
+        Returns:
+            记录的条目数
+        """
+        count = 0
+        for item in items:
+            if not isinstance(item, dict) or not item.get("id"):
+                continue
+            item_project = item.get("project_key") or project_key
+            item_type = item.get("work_item_type_key") or type_key
+            if isinstance(item_project, str) and isinstance(item_type, str):
+                self.record(item["id"], item_project, item_type)
+                state_key = (item.get("work_item_status") or {}).get("state_key")
+                if item.get("template_id") is not None and state_key:
+                    self._states[int(item["id"])] = (item["template_id"], state_key)
+                count += 1
+        return count
+
+    def get_state(self, work_item_id: Any) -> Optional[Tuple[Any, str]]:
+        """
+        查询最近一次读取时见到的流程状态
+
+        Args:
+            work_item_id: 工作项 ID
+
+        Returns:
+            (template_id, state_key)；未记录时返回 None
+        """
+        try:
+            item_id = int(work_item_id)
+        except (TypeError, ValueError):
+            return None
+        return self._states.get(item_id)
+
+    def forget_state(self, work_item_id: Any) -> None:
+        """
+        移除记录的流程状态（写入状态字段后状态未知，等待下次读取）
+
+        Args:
+            work_item_id: 工作项 ID
+        """
+        try:
+            self._states.pop(int(work_item_id), None)
+        except (TypeError, ValueError):
+            pass
+
+    def locate(self, work_item_id: Any) -> Optional[Tuple[str, str]]:
+        """
+        查询工作项位置
+
+        Args:
+            work_item_id: 工作项 ID
+
+        Returns:
+            (project_key, type_key)；未记录时返回 None
+        """
+        try:
+            item_id = int(work_item_id)
+        except (TypeError, ValueError):
+            return None
+
+        location = self._index.get(item_id)
+        if location is not None:
+            self._index.move_to_end(item_id)
+        return location
+
+    def forget(self, work_item_id: Any) -> bool:
+        """
+        移除工作项位置（工作项被删除或定位结果失效时调用）
+
+        Args:
+            work_item_id: 工作项 ID
+
+        Returns:
+            如果条目存在并被移除则返回 True，否则返回 False
+        """
+        try:
+            item_id = int(work_item_id)
+        except (TypeError, ValueError):
+            return False
+        self._states.pop(item_id, None)
+        return self._index.pop(item_id, None) is not None
+
+    def clear(self) -> None:
+        """清空索引"""
+        size = len(self._index)
+        self._index.clear()
+        self._states.clear()
+        logger.info("WorkItemLocator cleared: removed %d entries", size)
+
+    def __len__(self) -> int:
+        return len(self._index)
@@ -1,19 +1,48 @@
 import asyncio
+import json
 import logging
 import random
-from typing import Any, Dict, List, Optional, Set, Tuple, Union, NamedTuple
-
-import httpx
+from collections import OrderedDict
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    NamedTuple,
+)
 
 from src.core.cache import SimpleCache
 from src.core.config import settings
+from src.core.context import report_results, report_total, user_key_context
 from src.providers.base import Provider
 from src.providers.lark_project.api.work_item import WorkItemAPI
 from src.providers.lark_project.api.user import UserAPI
-from src.providers.lark_project.managers import MetadataManager
+from src.providers.lark_project.managers import (
+    MetadataManager,
+    MetadataSnapshot,
+    short_role_key,
+)
+from src.providers.lark_project.work_item_cache import WorkItemCache
+from src.providers.lark_project.work_item_locator import WorkItemLocator
+from src.providers.lark_project.query_result_cache import QueryResultCache
+from src.providers.lark_project.update_coalescer import UpdateCoalescer
+from src.providers.lark_project.relation_resolver import select_name_match
+from src.providers.lark_project.column_extractor import (
+    ColumnExtractor,
+    index_fields,
+    is_user_key,
+)
 from src.providers.lark_project.field_resolver import (
     FieldResolver,
 )
+from src.providers.lark_project.field_validator import FieldValidator
+from src.providers.lark_project.write_limiter import WriteLimiter, is_rate_limited
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +56,48 @@ class UpdateResult(NamedTuple):
     field_value: Any = None  # 添加 field_value 字段，用于记录尝试更新的值
 
 
+class CreateResult(NamedTuple):
+    """批量创建中单个工作项的结果（index 为输入中的位置）"""
+
+    success: bool
+    index: int
+    name: str
+    message: str
+    issue_id: Optional[int] = None
+
+
+class QueryPlan(NamedTuple):
+    """
+    编译后的列表查询计划
+
+    由 get_tasks/filter_issues 的过滤参数编译而来，所有名称 -> Key、
+    标签 -> 选项值、负责人 -> user_key 的解析都在编译时完成。
+    """
+
+    api: str  # "scan" | "filter" | "search_params"
+    search_group: Optional[Dict[str, Any]]  # search_params 使用
+    filter_kwargs: Dict[str, Any]  # filter 使用
+    fields: Optional[List[str]]  # 字段投影
+    field_mapping: Dict[str, str]  # 摘要字段名称 -> 字段 Key
+    owner_key: Optional[str] = None  # filter 路径客户端负责人过滤使用
+    # 负责人无法解析而丢弃了该条件（与元数据无关，此类计划不缓存）
+    owner_dropped: bool = False
+
+
+class BulkWritePlan(NamedTuple):
+    """
+    异构批量写入的执行计划
+
+    相同 (字段, 解析后取值) 的工作项在任务路径请求数更少时合并为 batch_update 调用，
+    其余编辑按工作项合并为一次多字段 update 调用。
+    """
+
+    batch_groups: List[Tuple[Dict[str, Any], List[int]]]  # (解析后的字段, 工作项 ID)
+    item_updates: List[Tuple[int, List[Dict[str, Any]]]]  # (工作项 ID, 解析后的字段)
+    failed: List[UpdateResult]  # 解析失败的编辑
+    edit_count: int  # (工作项, 字段) 编辑总数
+
+
 class WorkItemProvider(Provider):
     """
     工作项业务逻辑提供者 (Service/Provider Layer)
@@ -38,15 +109,38 @@ class WorkItemProvider(Provider):
     - 支持从环境变量 FEISHU_PROJECT_KEY 读取默认项目
     """
 
-    # 类常量：缓存中"未找到"的标记值
-    _NOT_FOUND_MARKER: str = "__NOT_FOUND__"
-
     # 扫描配置常量（用于 related_to 客户端过滤）
     _SCAN_MAX_TOTAL_ITEMS: int = 500  # 最多扫描的记录数
     _SCAN_MAX_PAGES: int = 10  # 最多扫描的页数
     _SCAN_BATCH_SIZE: int = 50  # 每批记录数
     _SCAN_CONCURRENT_PAGES: int = 3  # 每次并发请求的页数
 
+    # 查询计划缓存容量
+    _QUERY_PLAN_CACHE_SIZE: int = 128
+
+    # 多工作项批量更新: 单次 batch_update 的工作项数量上限
+    _BATCH_UPDATE_CHUNK_SIZE: int = 50
+    # 后台任务轮询: 初始间隔、最大间隔（指数退避）与总超时（秒）
+    _TASK_POLL_INITIAL_DELAY: float = 0.5
+    _TASK_POLL_MAX_DELAY: float = 4.0
+    _TASK_POLL_TIMEOUT: float = 60.0
+    # 后台任务仍在执行中的状态
+    _TASK_RUNNING_STATUSES: Tuple[str, ...] = (
+        "",
+        "init",
+        "pending",
+        "waiting",
+        "running",
+        "processing",
+    )
+    _TASK_SUCCESS_STATUSES: Tuple[str, ...] = (
+        "success",
+        "succeeded",
+        "finished",
+        "done",
+        "completed",
+    )
+
     # 负责人字段的候选名称列表（按优先级排序）
     _OWNER_FIELD_CANDIDATES: Tuple[str, ...] = (
         "owner",
@@ -86,11 +180,23 @@ class WorkItemProvider(Provider):
         # 缓存配置
         # 用户ID到姓名的缓存，TTL 10分钟（600秒）
         self._user_cache = SimpleCache(ttl=600)
-        # 工作项ID到名称的缓存，TTL 5分钟（300秒）
-        self._work_item_cache = SimpleCache(ttl=300)
+        # 工作项ID到名称的缓存：进程级共享 LRU，按 (project_key, work_item_id) 索引
+        self._work_item_cache = WorkItemCache.get_instance()
+        # 工作项ID到 (project_key, type_key) 的定位索引：进程级共享
+        self._locator = WorkItemLocator.get_instance()
+
+        # 进程级查询结果短期缓存（所有 Provider 共享，写操作后失效）
+        self._query_cache = QueryResultCache.get_instance()
+        # 进程级写后合并队列（默认禁用，见 UPDATE_COALESCE_WINDOW）
+        self._coalescer = UpdateCoalescer.get_instance()
 
-        # 限制并发 API 请求数量，防止触发 429 频控 (15 QPS 限制)
+        # 限制并发读请求数量，防止触发 429 频控 (15 QPS 限制)
         self._api_semaphore = asyncio.Semaphore(2)
+        # 写请求共享进程级自适应并发窗口 (AIMD)
+        self._write_limiter = WriteLimiter.get_instance()
+
+        # 查询计划缓存：键包含元数据指纹，元数据重新加载后自动失效
+        self._query_plans: "OrderedDict[Tuple[Any, ...], Any]" = OrderedDict()
 
         # 初始化抽取的子模块（P0-P2 重构）
         self.field_resolver = FieldResolver(self.meta)
@@ -103,6 +209,15 @@ class WorkItemProvider(Provider):
                 raise ValueError("Project key not resolved")
         return self._project_key
 
+    async def get_target_keys(self) -> Tuple[str, str]:
+        """
+        获取当前 Provider 写入目标的 (project_key, type_key)
+
+        Returns:
+            (项目 Key, 工作项类型 Key)
+        """
+        return await self._get_project_key(), await self._get_type_key()
+
     async def _get_type_key(self) -> str:
         """
         获取工作项类型 Key（线程安全）
@@ -172,18 +287,44 @@ class WorkItemProvider(Provider):
             logger.debug("Field '%s' not found: %s", field_name, e)
             return False
 
-    def _is_item_related_to(self, item: Dict[str, Any], related_to: int) -> bool:
+    async def _get_relation_field_keys(
+        self, project_key: str, type_key: str
+    ) -> Optional[Set[str]]:
+        """
+        获取关联工作项字段 Key 集合（不抛异常）
+
+        Returns:
+            field_key 集合；关联定义不可用或为空时返回 None（调用方退化为全字段检查）
+        """
+        try:
+            field_keys = await self.meta.get_relation_field_keys(project_key, type_key)
+        except Exception as e:
+            logger.debug("Failed to load relation field keys: %s", e)
+            return None
+        if not isinstance(field_keys, (set, frozenset)) or not field_keys:
+            return None
+        return field_keys
+
+    def _is_item_related_to(
+        self,
+        item: Dict[str, Any],
+        related_to: int,
+        relation_keys: Optional[Set[str]] = None,
+    ) -> bool:
         """
         检查工作项是否与指定 ID 关联（DRY 辅助方法）
 
         Args:
             item: 工作项字典
             related_to: 关联的工作项 ID
+            relation_keys: 关联工作项字段 Key 集合（可选，提供时只检查这些字段）
 
         Returns:
             True: 关联，False: 不关联
         """
         for field in item.get("fields", []):
+            if relation_keys and field.get("field_key") not in relation_keys:
+                continue
             field_value = field.get("field_value")
             if not field_value:
                 continue
@@ -241,6 +382,9 @@ class WorkItemProvider(Provider):
                 "page_num": page_num,
                 "page_size": page_size,
             }
+
+        # 记录返回条目的位置（条目自带 project_key/work_item_type_key）
+        self._locator.record_items(items)
         return items, pagination
 
     async def _resolve_owner_field_key(self, project_key: str, type_key: str) -> str:
@@ -345,66 +489,311 @@ class WorkItemProvider(Provider):
             )
             return None
 
-    def _parse_raw_field_value(self, value: Any) -> Optional[str]:
+    async def _get_metadata_fingerprint(
+        self, project_key: str, type_key: str
+    ) -> Optional[str]:
+        """获取元数据指纹，不可用时返回 None（此时不缓存查询计划）"""
+        try:
+            fingerprint = await self.meta.get_metadata_fingerprint(
+                project_key, type_key
+            )
+        except Exception as e:
+            logger.debug("Metadata fingerprint unavailable: %s", e)
+            return None
+        return fingerprint if isinstance(fingerprint, str) else None
+
+    async def _memoize_by_fingerprint(
+        self,
+        project_key: str,
+        type_key: str,
+        key: Tuple[Any, ...],
+        compile_fn,
+        cacheable: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
         """
-        解析原始字段值为可读字符串（DRY 辅助方法）
+        按 (元数据指纹, key) 缓存编译结果
 
-        Args:
-            value: 原始字段值，可以是 dict、list 或其他类型
+        指纹在编译后获取（编译过程可能触发元数据加载），
+        元数据过期或重新加载后指纹变化，旧结果自然失效。
+        cacheable 返回 False 的结果不缓存（结果取决于元数据以外的状态）。
+        """
+        fingerprint = await self._get_metadata_fingerprint(project_key, type_key)
+        if fingerprint is not None:
+            cached = self._query_plans.get((fingerprint,) + key)
+            if cached is not None:
+                self._query_plans.move_to_end((fingerprint,) + key)
+                return cached
+
+        value = await compile_fn()
+        if cacheable is not None and not cacheable(value):
+            return value
+
+        fingerprint = await self._get_metadata_fingerprint(project_key, type_key)
+        if fingerprint is not None:
+            self._query_plans[(fingerprint,) + key] = value
+            while len(self._query_plans) > self._QUERY_PLAN_CACHE_SIZE:
+                self._query_plans.popitem(last=False)
+        return value
+
+    async def _get_summary_field_mapping(
+        self, project_key: str, type_key: str
+    ) -> Dict[str, str]:
+        """获取摘要字段（priority/status/owner）名称到字段 Key 的映射"""
+
+        async def compile_mapping() -> Dict[str, str]:
+            field_mapping: Dict[str, str] = {}
+            for field_name in ["priority", "status", "owner"]:
+                try:
+                    field_mapping[field_name] = await self.meta.get_field_key(
+                        project_key, type_key, field_name
+                    )
+                except Exception as e:
+                    logger.debug("Field '%s' not found: %s", field_name, e)
+            return field_mapping
+
+        return await self._memoize_by_fingerprint(
+            project_key, type_key, ("summary", project_key, type_key), compile_mapping
+        )
+
+    async def get_summary_field_mapping(self) -> Dict[str, str]:
+        """
+        获取摘要字段名称到字段 Key 的映射（用于 simplify_work_items）
 
         Returns:
-            解析后的字符串值，如果无法解析则返回 None
+            {"priority": key, "status": key, "owner": key}，不存在的字段不包含
         """
-        if value is None:
-            return None
-        # 选项类型字段: {label: "...", value: "..."}
-        if isinstance(value, dict):
-            return value.get("label") or value.get("value")
-        # 用户类型字段: [{name: "...", name_cn: "..."}]
-        if isinstance(value, list) and value and isinstance(value[0], dict):
-            return value[0].get("name") or value[0].get("name_cn")
-        # 其他类型: 转为字符串
-        return str(value) if value else None
+        project_key = await self._get_project_key()
+        type_key = await self._get_type_key()
+        return await self._get_summary_field_mapping(project_key, type_key)
+
+    async def _get_query_plan(
+        self,
+        project_key: str,
+        type_key: str,
+        name_keyword: Optional[str] = None,
+        status: Optional[List[str]] = None,
+        priority: Optional[List[str]] = None,
+        owner: Optional[str] = None,
+        has_related_to: bool = False,
+    ) -> QueryPlan:
+        """
+        获取（编译或复用）列表查询计划
+
+        相同的过滤参数在元数据不变时复用同一计划，跳过所有解析工作。
+        """
+        key = (
+            "plan",
+            project_key,
+            type_key,
+            name_keyword,
+            tuple(status or ()),
+            tuple(priority or ()),
+            owner,
+            has_related_to,
+        )
+        return await self._memoize_by_fingerprint(
+            project_key,
+            type_key,
+            key,
+            lambda: self._compile_query_plan(
+                project_key,
+                type_key,
+                name_keyword,
+                status,
+                priority,
+                owner,
+                has_related_to,
+            ),
+            cacheable=lambda plan: not plan.owner_dropped,
+        )
 
-    def _extract_field_value(self, item: dict, field_key: str) -> Optional[str]:
+    async def _compile_query_plan(
+        self,
+        project_key: str,
+        type_key: str,
+        name_keyword: Optional[str],
+        status: Optional[List[str]],
+        priority: Optional[List[str]],
+        owner: Optional[str],
+        has_related_to: bool,
+    ) -> QueryPlan:
         """
-        从工作项中提取字段值
+        将过滤参数编译为查询计划
 
-        支持两种数据结构：
-        1. fields: 新版结构，字段以对象列表形式存在
-        2. field_value_pairs: 旧版结构，字段以键值对列表形式存在
+        - 仅有 related_to: 分页扫描 + 客户端过滤（关联字段不支持 API 过滤）
+        - 有 name_keyword: filter API（支持名称和状态，其余条件客户端过滤）
+        - 其他: search_params API
 
         Args:
-            item: 工作项字典
-            field_key: 字段 Key
+            project_key: 项目 Key
+            type_key: 工作项类型 Key
+            name_keyword: 名称关键词
+            status: 状态列表
+            priority: 优先级列表
+            owner: 负责人
+            has_related_to: 是否按关联工作项过滤
 
         Returns:
-            字段值（字符串），如果不存在则返回 None
+            QueryPlan
         """
-        # 优先从 fields 数组查找
-        field = next(
-            (f for f in item.get("fields", []) if f.get("field_key") == field_key),
-            None,
-        )
-        if field:
-            return self._parse_raw_field_value(field.get("field_value"))
-
-        # 回退到 field_value_pairs
-        pair = next(
-            (
-                p
-                for p in item.get("field_value_pairs", [])
-                if p.get("field_key") == field_key
-            ),
-            None,
-        )
-        if pair:
-            return self._parse_raw_field_value(pair.get("field_value"))
+        field_mapping = await self._get_summary_field_mapping(project_key, type_key)
+        # 下游（simplify_work_items 与客户端过滤）只需要摘要字段
+        summary_fields = [
+            field_mapping[name]
+            for name in ("priority", "status", "owner")
+            if name in field_mapping
+        ]
+
+        if has_related_to and not (name_keyword or status or priority or owner):
+            return QueryPlan(
+                api="scan",
+                search_group=None,
+                filter_kwargs={},
+                fields=summary_fields or None,
+                field_mapping=field_mapping,
+            )
+
+        if name_keyword:
+            filter_kwargs: Dict[str, Any] = {"work_item_name": name_keyword}
+
+            # filter API 支持 status，但需要转换为状态值
+            if status:
+                try:
+                    field_key = await self.meta.get_field_key(
+                        project_key, type_key, "status"
+                    )
+                    resolved_statuses = []
+                    for s in status:
+                        try:
+                            val = await self._resolve_field_value(
+                                project_key, type_key, field_key, s
+                            )
+                            resolved_statuses.append(val)
+                        except Exception as e:
+                            logger.warning("Failed to resolve status '%s': %s", s, e)
+                    if resolved_statuses:
+                        filter_kwargs["work_item_status"] = resolved_statuses
+                        logger.info(
+                            "Added status filter to filter API: %s", resolved_statuses
+                        )
+                except Exception as e:
+                    logger.warning("Status field not available for filter API: %s", e)
+
+            # filter API 不支持 priority、owner 和 related_to，记录警告
+            if priority:
+                logger.warning(
+                    "Filter API does not support priority filter, "
+                    "will filter results after retrieval"
+                )
+            owner_key = None
+            if owner:
+                logger.warning(
+                    "Filter API does not support owner filter, "
+                    "will filter results after retrieval"
+                )
+                try:
+                    owner_key = await self.meta.get_user_key(owner)
+                except Exception as e:
+                    # 无法解析 owner 时跳过该过滤条件（计划不缓存，下次调用重新解析）
+                    logger.warning("Failed to resolve owner '%s': %s", owner, e)
+            if has_related_to:
+                logger.warning(
+                    "Filter API does not support related_to filter, "
+                    "will filter results after retrieval"
+                )
+
+            # 获取该类型的所有字段映射 (Name -> Key)，利用 MetadataManager 缓存
+            try:
+                all_fields_map = await self.meta.list_fields(project_key, type_key)
+            except Exception as e:
+                logger.warning("Filter API: Failed to list fields: %s", e)
+                all_fields_map = {}
+
+            # 代码逻辑依赖的字段（用于客户端过滤），无论是否传入过滤参数都需要获取
+            fields_to_fetch = []
+            for name in ("priority", "status", "owner"):
+                # 优先从全量 Map 中直接获取 (O(1))，否则使用摘要映射（智能解析结果）
+                if name in all_fields_map:
+                    fields_to_fetch.append(all_fields_map[name])
+                elif name in field_mapping:
+                    fields_to_fetch.append(field_mapping[name])
+                else:
+                    logger.debug("Filter API: Optional field '%s' not found", name)
+
+            return QueryPlan(
+                api="filter",
+                search_group=None,
+                filter_kwargs=filter_kwargs,
+                fields=list(dict.fromkeys(fields_to_fetch)) or None,
+                field_mapping=field_mapping,
+                owner_key=owner_key,
+                owner_dropped=bool(owner) and owner_key is None,
+            )
+
+        # 构建搜索条件（使用辅助方法减少重复代码）
+        conditions: List[Dict[str, Any]] = []
+
+        if status:
+            condition = await self._build_filter_condition(
+                project_key, type_key, "status", status
+            )
+            if condition:
+                conditions.append(condition)
+
+        if priority:
+            condition = await self._build_filter_condition(
+                project_key, type_key, "priority", priority
+            )
+            if condition:
+                conditions.append(condition)
 
-        logger.debug(
-            "Field key '%s' not found in item id=%s", field_key, item.get("id")
+        owner_dropped = False
+        if owner:
+            condition = await self._build_owner_filter_condition(
+                project_key, type_key, owner
+            )
+            if condition:
+                conditions.append(condition)
+            else:
+                owner_dropped = True
+
+        return QueryPlan(
+            api="search_params",
+            search_group={
+                "conjunction": "AND",
+                "search_params": conditions,
+                "search_groups": [],
+            },
+            filter_kwargs={},
+            fields=summary_fields or None,
+            field_mapping=field_mapping,
+            owner_dropped=owner_dropped,
         )
-        return None
+
+    @staticmethod
+    def _projection_fields(
+        plan: QueryPlan,
+        related_to: Optional[int] = None,
+        relation_keys: Optional[Set[str]] = None,
+        with_role_owners: bool = False,
+    ) -> Optional[List[str]]:
+        """
+        计算列表查询的字段投影
+
+        按关联工作项过滤时还需要关联字段；关联字段未知时请求全部字段，
+        以便客户端过滤逐字段检查。按角色过滤或输出角色人员时还需要 role_owners。
+
+        Returns:
+            字段 Key 列表；None 表示请求全部字段
+        """
+        if not plan.fields:
+            return None
+        extra = ["role_owners"] if with_role_owners else []
+        if not related_to:
+            return list(dict.fromkeys([*plan.fields, *extra]))
+        if not relation_keys:
+            return None
+        return list(dict.fromkeys([*plan.fields, *sorted(relation_keys), *extra]))
 
     async def simplify_work_item(
         self, item: dict, field_mapping: Optional[Dict[str, str]] = None
@@ -419,77 +808,53 @@ class WorkItemProvider(Provider):
         Returns:
             简化后的工作项字典，包含 id, name, status, priority, owner
         """
-
-        # 使用field_mapping获取实际的字段Key，如果没有映射则使用字段名称作为Key
-        def get_field_key(field_name: str) -> str:
-            if field_mapping and field_name in field_mapping:
-                return field_mapping[field_name]
-            return field_name
-
-        priority_key = get_field_key("priority")
-        priority_raw = self._extract_field_value(item, priority_key)
-        # 脱敏处理：截断优先级值
-        priority_value = priority_raw[:20] if priority_raw else None
-
-        return {
-            "id": item.get("id"),
-            "name": item.get("name"),
-            "status": self._extract_field_value(item, get_field_key("status")),
-            "priority": priority_value,
-            "owner": self._extract_field_value(item, get_field_key("owner")),
-        }
+        return ColumnExtractor(field_mapping).extract_row(item)
 
     async def simplify_work_items(
-        self, items: List[dict], field_mapping: Optional[Dict[str, str]] = None
+        self,
+        items: List[dict],
+        field_mapping: Optional[Dict[str, str]] = None,
+        extra_columns: Optional[Dict[str, str]] = None,
+        include_roles: bool = False,
     ) -> List[dict]:
         """
         批量简化工作项列表
 
+        使用列式提取引擎一次遍历整页，同时收集需要转换的 owner user_key。
+
         Args:
             items: 原始工作项列表
             field_mapping: 字段名称到字段Key的映射（可选）
+            extra_columns: 额外输出列，列名 -> 字段 Key（可选）
+            include_roles: 输出 roles 列（整页解析 role_owners，可选）
 
         Returns:
             简化后的工作项列表，owner 字段会转换为人名以提高可读性
         """
         logger.info("simplify_work_items: processing %d items", len(items))
-        if items:
-            logger.info("First item keys: %s", list(items[0].keys()))
-            if "fields" in items[0]:
-                fields = items[0].get("fields", [])
-                logger.info(
-                    "First item fields count: %d, field_keys: %s",
-                    len(fields),
-                    [f.get("field_key") for f in fields],
-                )
-        # 并行简化所有工作项
-        tasks = [self.simplify_work_item(item, field_mapping) for item in items]
-        simplified_items = await asyncio.gather(*tasks)
+        simplified_items, owner_rows = ColumnExtractor(
+            field_mapping, extra_columns
+        ).extract(items)
 
         # 批量转换 owner user_key 为人名
-        owner_keys = []
-        for item in simplified_items:
-            owner = item.get("owner")
-            if owner and isinstance(owner, str):
-                # 检查是否是 user_key 格式（长数字字符串）
-                if owner.isdigit() and len(owner) > 10:
-                    owner_keys.append(owner)
-
-        if owner_keys:
-            # 去重
-            unique_keys = list(set(owner_keys))
-            logger.info("Converting %d unique owner keys to names", len(unique_keys))
+        if owner_rows:
+            logger.info("Converting %d unique owner keys to names", len(owner_rows))
             try:
-                key_to_name = await self.meta.batch_get_user_names(unique_keys)
-                # 替换 owner 字段
-                for item in simplified_items:
-                    owner = item.get("owner")
-                    if owner and owner in key_to_name:
-                        item["owner"] = key_to_name[owner]
+                key_to_name = await self.meta.batch_get_user_names(list(owner_rows))
+                ColumnExtractor.substitute_owners(owner_rows, key_to_name)
             except Exception as e:
                 logger.warning("Failed to convert owner keys to names: %s", e)
                 # 失败时保持原样，不影响正常返回
 
+        if include_roles:
+            try:
+                roles = await self.resolve_role_owners(items)
+            except Exception as e:
+                logger.warning("Failed to resolve role owners: %s", e)
+                roles = {}
+            for item, row in zip(items, simplified_items):
+                row["roles"] = roles.get(item.get("id"), [])
+
         return simplified_items
 
     async def resolve_related_to(
@@ -501,7 +866,7 @@ class WorkItemProvider(Provider):
         支持三种输入方式：
         1. 整数: 直接返回
         2. 数字字符串: 转换为整数返回
-        3. 非数字字符串: 在多个工作项类型中并行搜索，返回匹配的 ID
+        3. 非数字字符串: 在多个工作项类型中一次性搜索，返回匹配的 ID
 
         Args:
             related_to: 工作项 ID 或名称
@@ -526,8 +891,8 @@ class WorkItemProvider(Provider):
                 logger.info("resolve_related_to: 字符串转整数 ID: %s", result)
                 return result
 
-            # 非数字字符串: 按名称并行搜索
-            logger.info("resolve_related_to: 按名称并行搜索 '%s'", related_to)
+            # 非数字字符串: 按名称搜索
+            logger.info("resolve_related_to: 按名称搜索 '%s'", related_to)
 
             # 在常见工作项类型中搜索
             search_types = [
@@ -539,58 +904,31 @@ class WorkItemProvider(Provider):
                 "事务管理",
             ]
 
-            async def search_single_type(search_type: str) -> Tuple[str, List[dict]]:
-                """搜索单个工作项类型，返回 (类型名, 结果列表)"""
+            project_key = await self._get_project_key()
+            type_keys: List[str] = []
+            for search_type in search_types:
                 try:
-                    temp_provider = WorkItemProvider(
-                        project_name=self.project_name,
-                        project_key=self._project_key,
-                        work_item_type_name=search_type,
-                    )
-                    search_result = await temp_provider.get_tasks(
-                        name_keyword=related_to, page_num=1, page_size=5
+                    type_keys.append(
+                        await self.meta.get_type_key(project_key, search_type)
                     )
-                    return (search_type, search_result.get("items", []))
                 except Exception as e:
                     logger.debug(
-                        "resolve_related_to: 在类型 '%s' 中搜索失败: %s",
-                        search_type,
-                        e,
+                        "resolve_related_to: 类型 '%s' 不可用: %s", search_type, e
                     )
-                    return (search_type, [])
 
-            # 并行搜索所有类型
-            results = await asyncio.gather(
-                *(search_single_type(t) for t in search_types)
+            # 一次多类型查找（不支持时自动回退为逐类型查询）
+            items = await self.find_work_items(
+                name=related_to, type_keys=type_keys, page_size=10
             )
 
-            # 处理结果：优先精确匹配，其次部分匹配
-            candidates: List[Tuple[dict, str]] = []
-
-            for search_type, items in results:
-                for item in items:
-                    item_name = item.get("name")
-                    if item_name == related_to:
-                        # 发现精确匹配，直接返回
-                        logger.info(
-                            "resolve_related_to: 精确匹配 '%s' (ID: %s, Type: %s)",
-                            item_name,
-                            item.get("id"),
-                            search_type,
-                        )
-                        return item.get("id")
-
-                    # 收集部分匹配作为候选
-                    candidates.append((item, search_type))
-
-            # 如果没有精确匹配，检查候选者
-            if candidates:
-                best_match, match_type = candidates[0]
+            # 处理结果：优先精确匹配，其次部分匹配（按 search_types 顺序）
+            best_match = select_name_match(items, related_to, type_keys)
+            if best_match:
                 logger.info(
-                    "resolve_related_to: 部分匹配 '%s' (ID: %s, Type: %s)",
+                    "resolve_related_to: 匹配 '%s' (ID: %s, Type: %s)",
                     best_match.get("name"),
                     best_match.get("id"),
-                    match_type,
+                    best_match.get("work_item_type_key"),
                 )
                 return best_match.get("id")
 
@@ -820,21 +1158,63 @@ class WorkItemProvider(Provider):
 
             return value  # Fallback: 非选择类型字段直接返回原值
 
+    async def _get_field_validator(
+        self, project_key: str, type_key: str
+    ) -> FieldValidator:
+        """
+        获取工作项类型的字段写入校验器（不抛异常）
+
+        Returns:
+            FieldValidator；字段约束不可用时返回不做拦截的空校验器
+        """
+        try:
+            constraints = await self.meta.get_field_constraints(project_key, type_key)
+        except Exception as e:
+            logger.debug("Failed to load field constraints: %s", e)
+            return FieldValidator()
+        if not isinstance(constraints, dict):
+            return FieldValidator()
+        return FieldValidator(constraints)
+
+    async def _get_creatable_field_keys(
+        self, project_key: str, type_key: str
+    ) -> Optional[Set[str]]:
+        """
+        获取创建时可填写的字段 Key 集合（不抛异常）
+
+        Returns:
+            field_key 集合；创建元数据不可用时返回 None
+        """
+        try:
+            field_keys = await self.meta.get_creatable_field_keys(project_key, type_key)
+        except Exception as e:
+            logger.warning("Failed to load create meta: %s", e)
+            return None
+        if not isinstance(field_keys, (set, frozenset)) or not field_keys:
+            return None
+        return field_keys
+
     async def create_issue(
         self,
         name: str,
         priority: str = "P2",
         description: str = "",
         assignee: Optional[str] = None,
+        extra_fields: Optional[Dict[str, Any]] = None,
     ) -> int:
         """
         创建 Issue
 
+        基于缓存的创建元数据 (get_create_meta) 判断哪些字段可在创建时直接填写，
+        尽量在一次 create 请求中完成；仅对元数据标记为不可创建的字段，
+        在创建后通过一次 update 补充设置。
+
         Args:
             name: Issue 标题
             priority: 优先级 (P0/P1/P2/P3)
             description: 描述
             assignee: 负责人（姓名或邮箱）
+            extra_fields: 额外字段（可选，{字段名: 值}）
 
         Returns:
             创建的 Issue ID
@@ -844,76 +1224,323 @@ class WorkItemProvider(Provider):
 
         logger.info("Creating Issue in Project: %s, Type: %s", project_key, type_key)
 
-        # 1. Prepare fields for creation (minimal set)
-        create_fields = []
-
-        # Description
-        if description:
-            field_key = await self.meta.get_field_key(
-                project_key, type_key, "description"
-            )
-            create_fields.append({"field_key": field_key, "field_value": description})
-
-        # Assignee
-        if assignee:
-            field_key = "owner"
-            user_key = await self.meta.get_user_key(assignee)
-            create_fields.append({"field_key": field_key, "field_value": user_key})
+        # None 表示创建元数据不可用：沿用保守策略，优先级在创建后单独更新
+        creatable = await self._get_creatable_field_keys(project_key, type_key)
+        create_fields, deferred_fields = await self._prepare_create_fields(
+            project_key,
+            type_key,
+            creatable,
+            {},
+            priority=priority,
+            description=description,
+            assignee=assignee,
+            extra_fields=extra_fields,
+        )
+        return await self._submit_create(
+            project_key, type_key, name, create_fields, deferred_fields
+        )
 
-        # 2. Create Work Item
-        issue_data = await self.api.create(project_key, type_key, name, create_fields)
-        # API 返回数据可能是列表 [{id: xxxx}] 或直接是 {id: xxxx}，确保返回整数 ID
-        issue_id = None
-        if isinstance(issue_data, list) and issue_data:
-            issue_id = issue_data[0].get("id")
-        elif isinstance(issue_data, dict):
-            issue_id = issue_data.get("id")
-        elif isinstance(issue_data, int):
-            issue_id = issue_data
+    @staticmethod
+    async def _memoized(
+        memo: Dict[Tuple[Any, ...], Any],
+        key: Tuple[Any, ...],
+        factory: Callable[..., Awaitable[Any]],
+        *args: Any,
+    ) -> Any:
+        """
+        按 key 缓存一次解析的结果（异常同样缓存，重复使用时重新抛出）
 
-        if issue_id is None:
-            raise ValueError("创建工作项失败: 未能获取到有效的 Issue ID")
+        Args:
+            memo: 调用方持有的缓存字典（单次创建或一次批量创建内共享）
+            key: 解析键
+            factory: 执行解析的协程函数
+            *args: 传给 factory 的参数
 
-        # 3. Update Priority (if needed)
-        # Note: Priority cannot be set during creation for some reason, so we update it after.
-        if priority:
+        Returns:
+            解析结果
+        """
+        if key not in memo:
             try:
-                field_key = await self.meta.get_field_key(
-                    project_key, type_key, "priority"
-                )
-                option_val = await self._resolve_field_value(
-                    project_key, type_key, field_key, priority
-                )
+                memo[key] = await factory(*args)
+            except Exception as e:
+                memo[key] = e
+        value = memo[key]
+        if isinstance(value, Exception):
+            raise value
+        return value
 
-                logger.info(
-                    "Updating priority to %s for issue %s...", option_val, issue_id
-                )
-                await self.api.update(
+    async def _prepare_create_fields(
+        self,
+        project_key: str,
+        type_key: str,
+        creatable: Optional[Set[str]],
+        memo: Dict[Tuple[Any, ...], Any],
+        priority: str = "P2",
+        description: str = "",
+        assignee: Optional[str] = None,
+        extra_fields: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        解析创建字段，并按创建元数据分为创建时写入 / 创建后补充更新两组
+
+        Args:
+            project_key: 项目空间 Key
+            type_key: 工作项类型 Key
+            creatable: 创建时可填写的字段 Key 集合（None 表示元数据不可用）
+            memo: 解析缓存，批量创建时在所有工作项间共享
+            priority: 优先级
+            description: 描述
+            assignee: 负责人（姓名或邮箱）
+            extra_fields: 额外字段（{字段名: 值}）
+
+        Returns:
+            (create_fields, deferred_fields)
+
+        Raises:
+            ValueError: 额外字段不存在
+        """
+        create_fields: List[Dict[str, Any]] = []
+        deferred_fields: List[Dict[str, Any]] = []
+
+        def place(field_key: str, field_value: Any, default_creatable: bool) -> None:
+            can_create = (
+                default_creatable if creatable is None else field_key in creatable
+            )
+            target = create_fields if can_create else deferred_fields
+            target.append({"field_key": field_key, "field_value": field_value})
+
+        async def field_key_of(f_name: str) -> str:
+            return await self._memoized(
+                memo,
+                ("field_key", f_name),
+                self.meta.get_field_key,
+                project_key,
+                type_key,
+                f_name,
+            )
+
+        # Description
+        if description:
+            place(await field_key_of("description"), description, True)
+
+        # Assignee
+        if assignee:
+            user_key = await self._memoized(
+                memo, ("user", assignee), self.meta.get_user_key, assignee
+            )
+            place("owner", user_key, True)
+
+        # Priority
+        if priority:
+            try:
+                field_key = await field_key_of("priority")
+                option_val = await self._memoized(
+                    memo,
+                    ("priority", priority),
+                    self._resolve_field_value,
                     project_key,
                     type_key,
+                    field_key,
+                    priority,
+                )
+                place(field_key, option_val, False)
+            except Exception as e:
+                logger.warning("Failed to resolve priority '%s': %s", priority, e)
+
+        # Extra fields（在创建前解析，避免字段不存在时产生半成品工作项）
+        for f_name, f_value in (extra_fields or {}).items():
+            exists = await self._memoized(
+                memo,
+                ("exists", f_name),
+                self._field_exists,
+                project_key,
+                type_key,
+                f_name,
+            )
+            if not exists:
+                raise ValueError(f"字段 '{f_name}' 不存在")
+            field_key = await field_key_of(f_name)
+            field_value = await self._memoized(
+                memo,
+                ("value", field_key, self._value_signature(f_value)),
+                self._resolve_field_value_for_update,
+                project_key,
+                type_key,
+                field_key,
+                f_value,
+            )
+            place(field_key, field_value, True)
+
+        return create_fields, deferred_fields
+
+    async def _submit_create(
+        self,
+        project_key: str,
+        type_key: str,
+        name: str,
+        create_fields: List[Dict[str, Any]],
+        deferred_fields: List[Dict[str, Any]],
+    ) -> int:
+        """
+        提交创建请求，并补充更新创建时不可填写的字段
+
+        Args:
+            project_key: 项目空间 Key
+            type_key: 工作项类型 Key
+            name: 工作项标题
+            create_fields: 创建时写入的字段
+            deferred_fields: 创建后补充更新的字段
+
+        Returns:
+            创建的 Issue ID
+        """
+        issue_data = await self.api.create(project_key, type_key, name, create_fields)
+        # API 返回数据可能是列表 [{id: xxxx}] 或直接是 {id: xxxx}，确保返回整数 ID
+        issue_id = None
+        if isinstance(issue_data, list) and issue_data:
+            issue_id = issue_data[0].get("id")
+        elif isinstance(issue_data, dict):
+            issue_id = issue_data.get("id")
+        elif isinstance(issue_data, int):
+            issue_id = issue_data
+
+        if issue_id is None:
+            raise ValueError("创建工作项失败: 未能获取到有效的 Issue ID")
+
+        # 补充更新创建时不可填写的字段（合并为一次调用）
+        if deferred_fields:
+            try:
+                logger.info(
+                    "Updating %d deferred field(s) for issue %s...",
+                    len(deferred_fields),
                     issue_id,
-                    [{"field_key": field_key, "field_value": option_val}],
                 )
+                await self.api.update(project_key, type_key, issue_id, deferred_fields)
             except Exception as e:
                 logger.warning(
-                    "Failed to update priority for issue %s: %s", issue_id, e
+                    "Failed to update deferred fields for issue %s: %s", issue_id, e
                 )
 
+        # 新建的工作项可能曾被标记为"未找到"
+        self._invalidate_written(project_key, type_key, [issue_id])
         return int(issue_id)
 
+    async def batch_create_issues(
+        self, items: List[Dict[str, Any]]
+    ) -> List[CreateResult]:
+        """
+        批量创建 Issue
+
+        项目、类型与创建元数据只获取一次；字段 Key、选项值与用户在整批内
+        每个不同取值只解析一次。解析完成后在共享限流下并发创建，
+        单个工作项失败不影响其他工作项。
+
+        Args:
+            items: 工作项列表，每项支持 create_issue 的参数
+                   (name, priority, description, assignee, extra_fields)
+
+        Returns:
+            与输入顺序一致的 CreateResult 列表
+        """
+        if not items:
+            return []
+
+        project_key = await self._get_project_key()
+        type_key = await self._get_type_key()
+        logger.info(
+            "Batch creating %d issue(s) in Project: %s, Type: %s",
+            len(items),
+            project_key,
+            type_key,
+        )
+        creatable = await self._get_creatable_field_keys(project_key, type_key)
+
+        report_total(len(items))
+
+        # 1. 解析阶段: 顺序执行，同一取值在整批内只解析一次
+        memo: Dict[Tuple[Any, ...], Any] = {}
+        results: List[Optional[CreateResult]] = [None] * len(items)
+        prepared: List[Tuple[int, str, List[Dict[str, Any]], List[Dict[str, Any]]]] = []
+        for index, item in enumerate(items):
+            name = str(item.get("name") or "")
+            if not name:
+                results[index] = CreateResult(False, index, name, "缺少工作项标题 name")
+                continue
+            try:
+                create_fields, deferred_fields = await self._prepare_create_fields(
+                    project_key,
+                    type_key,
+                    creatable,
+                    memo,
+                    priority=item.get("priority", "P2"),
+                    description=item.get("description") or "",
+                    assignee=item.get("assignee"),
+                    extra_fields=item.get("extra_fields"),
+                )
+            except Exception as e:
+                results[index] = CreateResult(False, index, name, str(e))
+                continue
+            prepared.append((index, name, create_fields, deferred_fields))
+
+        # 2. 创建阶段: 共享限流下并发创建
+        async def create_one(
+            index: int,
+            name: str,
+            create_fields: List[Dict[str, Any]],
+            deferred_fields: List[Dict[str, Any]],
+        ) -> CreateResult:
+            try:
+                async with self._write_limiter.slot():
+                    issue_id = await self._submit_create(
+                        project_key, type_key, name, create_fields, deferred_fields
+                    )
+            except Exception as e:
+                logger.warning("Failed to create item %d: %s", index, e)
+                result = CreateResult(False, index, name, str(e))
+            else:
+                result = CreateResult(True, index, name, "创建成功", issue_id)
+            report_results([result])
+            return result
+
+        report_results([r for r in results if r is not None])
+        for result in await asyncio.gather(*[create_one(*p) for p in prepared]):
+            results[result.index] = result
+
+        created = sum(1 for r in results if r and r.success)
+        logger.info("Batch create completed: %d/%d created", created, len(items))
+        return [r for r in results if r is not None]
+
     async def get_issue_details(self, issue_id: int) -> Dict[str, Any]:
         """
         获取 Issue 详情
 
-        增强逻辑: 如果在当前类型中未找到，会自动尝试在项目的所有其他类型中搜索。
+        增强逻辑:
+        - 定位索引中已知的 ID 直接查询其所在类型
+        - 如果在当前类型中未找到，会自动尝试在项目的所有其他类型中搜索。
         """
         project_key = await self._get_project_key()
         type_key = await self._get_type_key()
+        tried_types: Set[str] = {type_key}
+
+        # 0. 定位索引命中时直接查询已知类型
+        location = self._locator.locate(issue_id)
+        if location and location[0] == project_key and location[1] != type_key:
+            known_type = location[1]
+            tried_types.add(known_type)
+            try:
+                items = await self.api.query(project_key, known_type, [issue_id])
+                if items:
+                    return items[0]
+            except Exception as e:
+                logger.debug("Located query failed for type %s: %s", known_type, e)
+            # 定位结果失效（如工作项已删除），回退到常规查找
+            self._locator.forget(issue_id)
 
         # 1. 尝试从当前类型获取
         try:
             items = await self.api.query(project_key, type_key, [issue_id])
             if items:
+                self._locator.record_items(items, project_key, type_key)
                 return items[0]
         except Exception as e:
             logger.debug("Initial query failed for type %s: %s", type_key, e)
@@ -929,9 +1556,9 @@ class WorkItemProvider(Provider):
             # 获取所有类型
             all_types = await self.meta.list_types(project_key)
 
-            # 排除已经试过的当前类型
+            # 排除已经试过的类型
             other_types = {
-                name: key for name, key in all_types.items() if key != type_key
+                name: key for name, key in all_types.items() if key not in tried_types
             }
 
             if not other_types:
@@ -939,43 +1566,21 @@ class WorkItemProvider(Provider):
                     f"Issue {issue_id} not found (no other types to search)"
                 )
 
-            # 并发搜索其他类型（分批次以防并发过高）
-            found_item = None
-            found_type_name = None
-
-            # 将类型转换为列表以便分批
-            type_items = list(other_types.items())
-            batch_size = 5
-
-            for i in range(0, len(type_items), batch_size):
-                batch = type_items[i : i + batch_size]
-                tasks = [
-                    self.api.query(project_key, t_key, [issue_id])
-                    for _t_name, t_key in batch
-                ]
-
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                for idx, res in enumerate(results):
-                    if isinstance(res, list) and res:
-                        found_item = res[0]
-                        found_type_name = batch[idx][0]
-                        _ = batch[idx][1]  # type_key not used here
-                        break
-
-                if found_item:
-                    break
+            # 一次多类型查找（不支持时自动回退为逐类型查询）
+            found_items = await self.find_work_items(
+                work_item_ids=[issue_id], type_keys=list(other_types.values())
+            )
 
-            if found_item:
+            if found_items:
+                found_item = found_items[0]
                 logger.info(
-                    f"Auto-discovery success: Issue {issue_id} found in type '{found_type_name}'"
+                    "Auto-discovery success: Issue %s found in type '%s'",
+                    issue_id,
+                    found_item.get("work_item_type_key"),
                 )
 
-                # 关键修正：如果是在其他类型中找到的，我们必须更新当前的 provider 状态或元数据上下文
-                # 因为后续的字段解析（readable fields）依赖正确的 type_key
-                # 这里我们临时通过修改 item 中的 work_item_type_key 来确保后续处理正确
-                # 但更彻底的做法可能是更新 self._resolved_type_key，但这会影响该 Provider 实例后续的其他调用
-                # 所以我们选择仅仅返回 item，而在 _enhance_work_item_with_readable_names 中会优先使用 item 中的 type key
+                # 在其他类型中找到时，不修改 self._resolved_type_key（会影响后续调用），
+                # _enhance_work_item_with_readable_names 会优先使用 item 中的 type key
                 return found_item
 
         except Exception as e:
@@ -983,6 +1588,107 @@ class WorkItemProvider(Provider):
 
         raise Exception(f"Issue {issue_id} not found in any work item type")
 
+    async def get_issues_details(self, issue_ids: List[int]) -> Dict[str, Any]:
+        """
+        批量获取多个工作项详情
+
+        - 按定位索引将 ID 分组到所在类型，未知位置的 ID 归入当前类型
+        - 每组按批次调用一次 query（每批最多 _SCAN_BATCH_SIZE 个 ID）
+        - 仍未找到的 ID 合并为一次跨类型查找
+
+        Args:
+            issue_ids: 工作项 ID 列表
+
+        Returns:
+            {
+                "items": [...],      # 找到的工作项，顺序与输入一致
+                "not_found": [...],  # 未找到的 ID
+            }
+        """
+        ids = list(dict.fromkeys(int(i) for i in issue_ids))
+        if not ids:
+            return {"items": [], "not_found": []}
+
+        project_key = await self._get_project_key()
+        type_key = await self._get_type_key()
+
+        # 1. 按定位索引分组
+        groups: Dict[str, List[int]] = {}
+        for item_id in ids:
+            location = self._locator.locate(item_id)
+            t_key = location[1] if location and location[0] == project_key else type_key
+            groups.setdefault(t_key, []).append(item_id)
+
+        # 2. 每组分批查询，所有批次并发
+        requests = [
+            (t_key, group_ids[i : i + self._SCAN_BATCH_SIZE])
+            for t_key, group_ids in groups.items()
+            for i in range(0, len(group_ids), self._SCAN_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(
+            *(self.api.query(project_key, t_key, chunk) for t_key, chunk in requests),
+            return_exceptions=True,
+        )
+
+        found: Dict[int, Dict[str, Any]] = {}
+        tried_types: Set[str] = set()
+        for (t_key, chunk), result in zip(requests, results):
+            tried_types.add(t_key)
+            if isinstance(result, BaseException):
+                logger.debug("Batch query failed for type %s: %s", t_key, result)
+                continue
+            self._locator.record_items(result, project_key, t_key)
+            for item in result:
+                if isinstance(item, dict) and item.get("id") is not None:
+                    found[int(item["id"])] = item
+
+        # 3. 仍未找到的 ID 跨类型查找（定位结果失效的 ID 先移除）
+        missing = [item_id for item_id in ids if item_id not in found]
+        if missing:
+            for item_id in missing:
+                location = self._locator.locate(item_id)
+                if location and location[1] != type_key:
+                    self._locator.forget(item_id)
+            try:
+                all_types = await self.meta.list_types(project_key)
+                other_types = [
+                    key for key in all_types.values() if key not in tried_types
+                ]
+                if other_types:
+                    for item in await self.find_work_items(
+                        work_item_ids=missing, type_keys=other_types
+                    ):
+                        if item.get("id") is not None:
+                            found[int(item["id"])] = item
+            except Exception as e:
+                logger.warning("Cross-type lookup failed: %s", e)
+
+        return {
+            "items": [found[item_id] for item_id in ids if item_id in found],
+            "not_found": [item_id for item_id in ids if item_id not in found],
+        }
+
+    async def get_readable_issues_details(self, issue_ids: List[int]) -> Dict[str, Any]:
+        """
+        批量获取多个工作项详情，并统一转换用户与关联工作项为可读名称
+
+        所有工作项的用户 Key 与关联工作项 ID 合并为一次批量解析。
+
+        Args:
+            issue_ids: 工作项 ID 列表
+
+        Returns:
+            {
+                "items": [...],      # 增强后的工作项，顺序与输入一致
+                "not_found": [...],  # 未找到的 ID
+            }
+        """
+        result = await self.get_issues_details(issue_ids)
+        result["items"] = await self._enhance_work_items_with_readable_names(
+            result["items"]
+        )
+        return result
+
     async def _try_fetch_type(
         self, project_key: str, type_key: str, work_item_ids: List[int]
     ) -> List[Dict[str, Any]]:
@@ -1002,6 +1708,114 @@ class WorkItemProvider(Provider):
         except Exception:
             return []
 
+    async def find_work_items(
+        self,
+        work_item_ids: Optional[List[int]] = None,
+        name: Optional[str] = None,
+        type_keys: Optional[List[str]] = None,
+        page_size: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """
+        在多个工作项类型中查找工作项（按 ID 或名称）
+
+        使用一次多类型 filter 请求代替逐类型查询（N+1 -> 1）；
+        仅当多类型 filter 调用失败（如接口不支持）时，才回退为逐类型查询。
+
+        Args:
+            work_item_ids: 工作项 ID 列表（与 name 二选一）
+            name: 工作项名称关键词（模糊匹配）
+            type_keys: 搜索的类型 Key 列表（可选，默认项目中的所有类型）
+            page_size: 按名称搜索时的返回数量上限
+
+        Returns:
+            找到的工作项列表，每项包含 work_item_type_key
+        """
+        if not work_item_ids and not name:
+            return []
+
+        project_key = await self._get_project_key()
+        if type_keys is None:
+            all_types = await self.meta.list_types(project_key)
+            type_keys = list(all_types.values())
+        if not type_keys:
+            return []
+
+        if work_item_ids:
+            ids = list(dict.fromkeys(int(i) for i in work_item_ids))
+            requests = [
+                {
+                    "work_item_ids": ids[i : i + self._SCAN_BATCH_SIZE],
+                    "page_size": len(ids[i : i + self._SCAN_BATCH_SIZE]),
+                }
+                for i in range(0, len(ids), self._SCAN_BATCH_SIZE)
+            ]
+        else:
+            requests = [{"work_item_name": name, "page_size": page_size}]
+
+        # 1. 单次多类型 filter
+        try:
+            results = await asyncio.gather(
+                *(
+                    self.api.filter(
+                        project_key=project_key,
+                        work_item_type_keys=type_keys,
+                        page_num=1,
+                        **req,
+                    )
+                    for req in requests
+                )
+            )
+            items: List[Dict[str, Any]] = []
+            for req, result in zip(requests, results):
+                page_items, _ = self._normalize_api_result(result, 1, req["page_size"])
+                items.extend(page_items)
+            return items
+        except Exception as e:
+            logger.info(
+                "Multi-type filter unavailable, falling back to per-type lookup: %s", e
+            )
+
+        # 2. 回退：逐类型查询（每批 5 个类型并发，避免触发限流）
+        found_items: List[Dict[str, Any]] = []
+        remaining_ids = set(int(i) for i in work_item_ids or [])
+        batch_size = 5
+
+        for i in range(0, len(type_keys), batch_size):
+            if work_item_ids and not remaining_ids:
+                break
+
+            batch = type_keys[i : i + batch_size]
+            if work_item_ids:
+                tasks = [
+                    self._try_fetch_type(project_key, t_key, list(remaining_ids))
+                    for t_key in batch
+                ]
+            else:
+                tasks = [
+                    self.api.filter(
+                        project_key=project_key,
+                        work_item_type_keys=[t_key],
+                        page_num=1,
+                        page_size=page_size,
+                        work_item_name=name,
+                    )
+                    for t_key in batch
+                ]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+            for t_key, result in zip(batch, results):
+                if isinstance(result, BaseException):
+                    logger.debug("Lookup failed for type %s: %s", t_key, result)
+                    continue
+                type_items, _ = self._normalize_api_result(result, 1, page_size)
+                for item in type_items:
+                    item.setdefault("work_item_type_key", t_key)
+                    remaining_ids.discard(item.get("id"))
+                self._locator.record_items(type_items, project_key, t_key)
+                found_items.extend(type_items)
+
+        return found_items
+
     async def _get_users_with_cache(self, user_keys: List[str]) -> Dict[str, str]:
         """
         通过缓存获取用户信息
@@ -1048,58 +1862,127 @@ class WorkItemProvider(Provider):
         """
         通过缓存获取工作项名称
 
+        未缓存的 ID 中，定位索引已知类型的直接查询其所在类型，其余查询 type_key。
+
         Args:
             work_item_ids: 工作项 ID 列表
             project_key: 项目 Key
-            type_key: 工作项类型 Key
+            type_key: 工作项类型 Key（未知位置的 ID 使用）
 
         Returns:
             (工作项 ID 到名称的映射字典, 未找到的 ID 列表)
         """
-        work_item_map: Dict[int, str] = {}
-        items_to_fetch: List[int] = []
-
-        # 首先检查缓存
-        for item_id in work_item_ids:
-            cached_value = self._work_item_cache.get(str(item_id))
-            if cached_value is not None:
-                if cached_value != self._NOT_FOUND_MARKER:
-                    work_item_map[item_id] = cached_value
-                # 如果是 _NOT_FOUND_MARKER，则跳过，不添加到 items_to_fetch
-            else:
-                items_to_fetch.append(item_id)
+        # 首先检查共享缓存（已标记"未找到"的 ID 不再查询）
+        work_item_map, items_to_fetch = self._work_item_cache.get_many(
+            project_key, work_item_ids
+        )
 
-        # 如果有未缓存的工作项，批量查询当前类型
-        if items_to_fetch:
-            try:
-                items = await self.api.query(project_key, type_key, items_to_fetch)
-                found_ids: Set[int] = set()
-                for item in items:
-                    item_id = item.get("id")
-                    item_name = item.get("name") or ""
-                    if item_id:
-                        work_item_map[item_id] = item_name
-                        # 存入缓存
-                        self._work_item_cache.set(str(item_id), item_name)
-                        found_ids.add(item_id)
+        # 按定位索引分组：已知位置的 ID 直接查询其所在类型，其余查询当前类型
+        groups: Dict[str, List[int]] = {}
+        for item_id in items_to_fetch:
+            location = self._locator.locate(item_id)
+            t_key = location[1] if location and location[0] == project_key else type_key
+            groups.setdefault(t_key, []).append(item_id)
 
-                # 计算未找到的 ID，并缓存"未找到"标记
-                not_found_ids = [
-                    item_id for item_id in items_to_fetch if item_id not in found_ids
-                ]
-                for item_id in not_found_ids:
-                    self._work_item_cache.set(str(item_id), self._NOT_FOUND_MARKER)
+        results = await asyncio.gather(
+            *(self.api.query(project_key, t_key, ids) for t_key, ids in groups.items()),
+            return_exceptions=True,
+        )
 
-            except Exception as e:
-                logger.debug("Failed to fetch work items in current type: %s", e)
+        not_found_ids: List[int] = []
+        for (t_key, ids), items in zip(groups.items(), results):
+            if isinstance(items, BaseException):
+                logger.debug("Failed to fetch work items in type %s: %s", t_key, items)
                 # 如果查询失败，所有待查询的 ID 都视为未找到
-                not_found_ids = items_to_fetch
                 # 不缓存失败结果，因为可能是临时错误
-        else:
-            not_found_ids = []
+                not_found_ids.extend(ids)
+                continue
+
+            found = self._work_item_cache.set_items(project_key, items, t_key)
+            self._locator.record_items(items, project_key, t_key)
+            work_item_map.update(found)
+
+            # 未找到的 ID 交由调用方跨类型查询后再决定是否标记"未找到"
+            for item_id in ids:
+                if item_id not in found:
+                    if t_key != type_key:
+                        self._locator.forget(item_id)
+                    not_found_ids.append(item_id)
 
         return work_item_map, not_found_ids
 
+    async def resolve_work_item_names(self, names: List[str]) -> Dict[str, int]:
+        """
+        按名称精确匹配批量解析当前类型工作项的 ID
+
+        每批名称合并为一次 search_params (name IN [...]) 请求；
+        search_params 不可用时回退为逐名称 filter 查询。
+        未找到或同名对应多个工作项的名称不出现在结果中。
+
+        Args:
+            names: 工作项名称列表
+
+        Returns:
+            {名称: 工作项 ID}
+        """
+        unique = list(dict.fromkeys(n.strip() for n in names if n and n.strip()))
+        if not unique:
+            return {}
+
+        project_key = await self._get_project_key()
+        type_key = await self._get_type_key()
+        size = self._SCAN_BATCH_SIZE
+        # 每批名称数取页大小的一半，为同名工作项预留结果空间
+        step = max(1, size // 2)
+        chunks = [unique[i : i + step] for i in range(0, len(unique), step)]
+
+        async def search_chunk(chunk: List[str]) -> List[Dict[str, Any]]:
+            async with self._api_semaphore:
+                result = await self.api.search_params(
+                    project_key,
+                    type_key,
+                    {
+                        "conjunction": "AND",
+                        "search_params": [
+                            {"field_key": "name", "operator": "IN", "value": chunk}
+                        ],
+                    },
+                    page_num=1,
+                    page_size=size,
+                    fields=["name"],
+                )
+            items, _ = self._normalize_api_result(result, 1, size)
+            return items
+
+        async def filter_name(name: str) -> List[Dict[str, Any]]:
+            async with self._api_semaphore:
+                return await self.find_work_items(
+                    name=name, type_keys=[type_key], page_size=size
+                )
+
+        try:
+            pages = await asyncio.gather(*[search_chunk(c) for c in chunks])
+        except Exception as e:
+            logger.info("Bulk name search unavailable, falling back to filter: %s", e)
+            pages = await asyncio.gather(*[filter_name(n) for n in unique])
+
+        wanted = set(unique)
+        matches: Dict[str, Set[int]] = {}
+        for items in pages:
+            for item in items:
+                name = str(item.get("name") or "").strip()
+                if name in wanted and item.get("id") is not None:
+                    matches.setdefault(name, set()).add(int(item["id"]))
+
+        resolved = {
+            name: next(iter(ids)) for name, ids in matches.items() if len(ids) == 1
+        }
+        ambiguous = [name for name, ids in matches.items() if len(ids) > 1]
+        if ambiguous:
+            logger.warning("Ambiguous work item names skipped: %s", ambiguous)
+        logger.info("Resolved %d/%d work item names", len(resolved), len(unique))
+        return resolved
+
     async def get_readable_issue_details(self, issue_id: int) -> Dict[str, Any]:
         """
         获取 Issue 详情，并将用户相关字段转换为人名以提高可读性
@@ -1127,34 +2010,161 @@ class WorkItemProvider(Provider):
         """
         if not item:
             return item
+        enhanced = await self._enhance_work_items_with_readable_names([item])
+        return enhanced[0]
 
-        # 创建副本，避免修改原始数据
-        enhanced = item.copy()
+    async def _enhance_work_items_with_readable_names(
+        self, items: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        批量增强工作项数据（所有工作项共享一次批量解析）
 
-        # 获取项目和类型 Key
-        project_key = item.get("project_key") or await self._get_project_key()
-        type_key = item.get("work_item_type_key") or await self._get_type_key()
-
-        # 准备收集 ID 的容器
-        users_to_fetch = set()
-        work_items_to_fetch = set()
-
-        # 统一处理 fields (新版) 和 field_value_pairs (旧版)
-        fields = item.get("fields", [])
-        if not fields:
-            # 尝试转换旧版结构
-            field_value_pairs = item.get("field_value_pairs", [])
-            for pair in field_value_pairs:
-                fields.append(
-                    {
-                        "field_key": pair.get("field_key"),
-                        "field_value": pair.get("field_value"),
-                        # 旧版可能没有 type_key，后续只能尽力猜测
-                        "field_type_key": "unknown",
-                    }
-                )
+        - 第一遍: 收集所有工作项的用户 Key 与关联工作项 ID，
+          每个空间/类型获取一次关联字段 Key 与元数据快照
+        - 批量解析: 用户名一次查询，关联工作项名称按空间/类型分组查询
+        - 第二遍: 同步构建可读字段（字段名、角色名从快照查找，不再逐字段 await）
+
+        整页的上游请求数只取决于涉及的类型数，与工作项数量无关。
+
+        Args:
+            items: 原始工作项列表（可来自不同类型）
+
+        Returns:
+            增强后的工作项列表，顺序与输入一致
+        """
+        users_to_fetch: Set[str] = set()
+        # project_key -> type_key -> 关联工作项 ID
+        related_ids: Dict[str, Dict[str, Set[int]]] = {}
+        relation_keys_by_type: Dict[Tuple[str, str], Set[str]] = {}
+        snapshots: Dict[Tuple[str, str], MetadataSnapshot] = {}
+        contexts: List[Optional[Tuple[Tuple[str, str], List[Dict[str, Any]]]]] = []
 
         # 第一遍遍历: 收集需要查询的 ID
+        for item in items:
+            if not item:
+                contexts.append(None)
+                continue
+
+            # 获取项目和类型 Key
+            project_key = item.get("project_key") or await self._get_project_key()
+            type_key = item.get("work_item_type_key") or await self._get_type_key()
+
+            # 已知的关联字段 Key（旧版结构没有 field_type_key，需要依赖它识别关联字段）
+            type_ref = (project_key, type_key)
+            if type_ref not in relation_keys_by_type:
+                relation_keys_by_type[type_ref] = (
+                    await self._get_relation_field_keys(project_key, type_key) or set()
+                )
+                snapshots[type_ref] = await self._get_metadata_snapshot(
+                    project_key, type_key
+                )
+            relation_keys = relation_keys_by_type[type_ref]
+
+            fields = self._normalize_item_fields(item)
+            self._collect_enrichment_keys(
+                item,
+                fields,
+                relation_keys,
+                users_to_fetch,
+                related_ids.setdefault(project_key, {}).setdefault(type_key, set()),
+            )
+            contexts.append((type_ref, fields))
+
+        # 批量获取数据
+        user_map: Dict[str, str] = {}
+        if users_to_fetch:
+            # 使用缓存获取用户信息
+            user_map = await self._get_users_with_cache(list(users_to_fetch))
+
+        work_item_map: Dict[int, str] = {}
+        for project_key, groups in related_ids.items():
+            work_item_map.update(
+                await self._resolve_related_item_names(project_key, groups)
+            )
+
+        # 第二遍遍历: 构建可读字段
+        enhanced_items: List[Dict[str, Any]] = []
+        for item, context in zip(items, contexts):
+            if context is None:
+                enhanced_items.append(item)
+                continue
+            type_ref, fields = context
+            enhanced_items.append(
+                self._build_readable_item(
+                    item,
+                    fields,
+                    snapshots[type_ref],
+                    relation_keys_by_type[type_ref],
+                    user_map,
+                    work_item_map,
+                )
+            )
+        return enhanced_items
+
+    async def _get_metadata_snapshot(
+        self, project_key: str, type_key: str
+    ) -> MetadataSnapshot:
+        """
+        获取工作项类型的元数据快照
+
+        获取失败时返回空快照，字段名退回 field_alias/field_key，角色名退回 role_key。
+
+        Args:
+            project_key: 项目 Key
+            type_key: 工作项类型 Key
+
+        Returns:
+            MetadataSnapshot 实例
+        """
+        try:
+            snapshot = await self.meta.get_type_snapshot(project_key, type_key)
+        except Exception as e:
+            logger.debug(
+                "Failed to get metadata snapshot for %s/%s: %s",
+                project_key,
+                type_key,
+                e,
+            )
+            return MetadataSnapshot()
+        if not isinstance(snapshot, MetadataSnapshot):
+            return MetadataSnapshot()
+        return snapshot
+
+    @staticmethod
+    def _normalize_item_fields(item: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """统一处理 fields (新版) 和 field_value_pairs (旧版)，返回字段对象列表"""
+        fields = item.get("fields") or []
+        if fields:
+            return fields
+        # 尝试转换旧版结构
+        return [
+            {
+                "field_key": pair.get("field_key"),
+                "field_value": pair.get("field_value"),
+                # 旧版可能没有 type_key，后续只能尽力猜测
+                "field_type_key": "unknown",
+            }
+            for pair in item.get("field_value_pairs", [])
+        ]
+
+    @staticmethod
+    def _collect_enrichment_keys(
+        item: Dict[str, Any],
+        fields: List[Dict[str, Any]],
+        relation_keys: Set[str],
+        users_to_fetch: Set[str],
+        work_items_to_fetch: Set[int],
+    ) -> None:
+        """
+        收集单个工作项中需要解析的用户 Key 与关联工作项 ID
+
+        Args:
+            item: 原始工作项字典
+            fields: 标准化后的字段对象列表
+            relation_keys: 关联字段 Key 集合
+            users_to_fetch: 用户 Key 收集容器
+            work_items_to_fetch: 关联工作项 ID 收集容器
+        """
         for field in fields:
             f_key = field.get("field_key")
             f_val = field.get("field_value")
@@ -1172,12 +2182,20 @@ class WorkItemProvider(Provider):
                     for u in f_val:
                         if isinstance(u, str):
                             users_to_fetch.add(u)
+                        # role_owners: [{"role": "role_key", "owners": ["user_key"]}]
+                        elif isinstance(u, dict) and isinstance(u.get("owners"), list):
+                            users_to_fetch.update(
+                                o for o in u["owners"] if isinstance(o, str)
+                            )
             # 兼容 owner 字段 (可能不在 fields 中，而在根目录)
             elif f_key == "owner" and isinstance(f_val, str):
                 users_to_fetch.add(f_val)
 
             # 关联工作项字段
-            if f_type in ["work_item_related_select", "work_item_related_multi_select"]:
+            if (
+                f_type in ["work_item_related_select", "work_item_related_multi_select"]
+                or f_key in relation_keys
+            ):
                 if isinstance(f_val, list):
                     for wid in f_val:
                         if isinstance(wid, (int, str)) and str(wid).isdigit():
@@ -1191,85 +2209,101 @@ class WorkItemProvider(Provider):
             if val and isinstance(val, str):
                 users_to_fetch.add(val)
 
-        # 批量获取数据
-        user_map = {}
-        work_item_map = {}
+    async def _resolve_related_item_names(
+        self, project_key: str, groups: Dict[str, Set[int]]
+    ) -> Dict[int, str]:
+        """
+        批量解析同一空间内的关联工作项名称
 
-        if users_to_fetch:
-            # 使用缓存获取用户信息
-            user_map = await self._get_users_with_cache(list(users_to_fetch))
+        先按来源类型（及定位索引）查询，仍未找到的 ID 合并为一次跨类型查找。
 
-        if work_items_to_fetch:
+        Args:
+            project_key: 项目 Key
+            groups: 来源工作项类型 Key -> 关联工作项 ID 集合
+
+        Returns:
+            工作项 ID 到名称的映射
+        """
+        work_item_map: Dict[int, str] = {}
+        # 未找到的 ID -> 已查询过的类型
+        not_found: Dict[int, str] = {}
+
+        for type_key, ids in groups.items():
+            if not ids:
+                continue
             # 首先使用缓存获取当前类型中的工作项
             cached_map, not_found_ids = await self._get_work_items_with_cache(
-                list(work_items_to_fetch), project_key, type_key
+                list(ids), project_key, type_key
             )
             work_item_map.update(cached_map)
+            for item_id in not_found_ids:
+                not_found.setdefault(item_id, type_key)
 
-            # 如果有未找到的工作项，尝试其他所有类型
-            if not_found_ids:
-                remaining_ids = set(not_found_ids)
+        not_found = {k: v for k, v in not_found.items() if k not in work_item_map}
+        if not not_found:
+            return work_item_map
 
-                try:
-                    # 获取项目中所有可用类型
-                    try:
-                        all_types = await self.meta.list_types(project_key)
-                        target_types = {
-                            name: key
-                            for name, key in all_types.items()
-                            if key != type_key  # 排除当前类型
-                        }
-                    except Exception as e:
-                        logger.warning("Failed to list project types: %s", e)
-                        target_types = {}
-
-                    if target_types:
-                        # 限制并发数，避免触发 API 限流
-                        # 分批处理类型，每批 5 个
-                        type_items = list(target_types.items())
-                        batch_size = 5
-
-                        for i in range(0, len(type_items), batch_size):
-                            if not remaining_ids:
-                                break
+        # 如果有未找到的工作项，尝试其他所有类型
+        remaining_ids = set(not_found)
+        tried_types = set(not_found.values())
+        # 只有所有 ID 都查询过同一类型时才能排除该类型
+        excluded_types = tried_types if len(tried_types) == 1 else set()
 
-                            batch = type_items[i : i + batch_size]
-                            search_tasks = [
-                                self._try_fetch_type(
-                                    project_key, t_key, list(remaining_ids)
-                                )
-                                for _t_name, t_key in batch
-                            ]
-
-                            results = await asyncio.gather(*search_tasks)
-
-                            for items in results:
-                                for related_item in items:
-                                    related_id = related_item.get("id")
-                                    related_name = related_item.get("name") or ""
-                                    if related_id:
-                                        work_item_map[related_id] = related_name
-                                        # 存入缓存
-                                        self._work_item_cache.set(
-                                            str(related_id), related_name
-                                        )
-                                        remaining_ids.discard(related_id)
-
-                        # 缓存仍未找到的 ID（跨类型查询后）
-                        if remaining_ids:
-                            logger.debug(
-                                "Still not found after cross-type search: %s",
-                                remaining_ids,
-                            )
-                            for remaining_id in remaining_ids:
-                                self._work_item_cache.set(
-                                    str(remaining_id), self._NOT_FOUND_MARKER
-                                )
+        try:
+            # 获取项目中所有可用类型
+            try:
+                all_types = await self.meta.list_types(project_key)
+                target_types = {
+                    name: key
+                    for name, key in all_types.items()
+                    if key not in excluded_types  # 排除已查询的类型
+                }
+            except Exception as e:
+                logger.warning("Failed to list project types: %s", e)
+                # 类型列表获取失败时无法确认"未找到"，不缓存标记
+                target_types = None
+
+            if target_types:
+                # 一次多类型查找（不支持时自动回退为逐类型查询）
+                found_items = await self.find_work_items(
+                    work_item_ids=list(remaining_ids),
+                    type_keys=list(target_types.values()),
+                )
+                found = self._work_item_cache.set_items(project_key, found_items)
+                work_item_map.update(found)
+                remaining_ids.difference_update(found)
 
-                except Exception as e:
-                    logger.warning(
-                        "Failed to fetch related items from other types: %s", e
-                    )
+            # 缓存仍未找到的 ID（跨类型查询后，或项目只有当前类型）
+            if remaining_ids and target_types is not None:
+                logger.debug(
+                    "Still not found after cross-type search: %s",
+                    remaining_ids,
+                )
+                for remaining_id in remaining_ids:
+                    self._work_item_cache.set_not_found(project_key, remaining_id)
+
+        except Exception as e:
+            logger.warning("Failed to fetch related items from other types: %s", e)
+
+        return work_item_map
+
+    def _build_readable_item(
+        self,
+        item: Dict[str, Any],
+        fields: List[Dict[str, Any]],
+        snapshot: MetadataSnapshot,
+        relation_keys: Set[str],
+        user_map: Dict[str, str],
+        work_item_map: Dict[int, str],
+    ) -> Dict[str, Any]:
+        """
+        使用已解析的用户与关联工作项名称构建单个工作项的可读字段（纯同步）
+
+        Returns:
+            增强后的工作项字典，包含 readable_fields 字段
+        """
+        # 创建副本，避免修改原始数据
+        enhanced = item.copy()
 
         # 第二遍遍历: 构建可读字段并添加 field_name
         readable_fields = {}
@@ -1287,14 +2321,7 @@ class WorkItemProvider(Provider):
             # 确定字段名称
             # 优先级: metadata_manager 缓存中的 field_name > field_alias > field_key
             # 原因: metadata_manager 中存储的是 API 返回的 field_name，最准确
-            field_name = None
-            try:
-                # 优先从 metadata_manager 缓存中获取 field_name
-                field_name = await self.meta.get_field_name(
-                    project_key, type_key, f_key
-                )
-            except Exception as e:
-                logger.debug("Failed to get field_name for %s: %s", f_key, e)
+            field_name = snapshot.field_name(f_key)
 
             # 如果缓存中没有，使用 field_alias 作为备选
             if not field_name:
@@ -1362,17 +2389,7 @@ class WorkItemProvider(Provider):
                                 owners = []
 
                             # Resolve Role Name
-                            role_name = role_key
-                            try:
-                                name = await self.meta.get_role_name(
-                                    project_key, type_key, role_key
-                                )
-                                if name:
-                                    role_name = name
-                            except Exception as e:
-                                logger.debug(
-                                    f"Failed to resolve role name for key '{role_key}': {e}"
-                                )
+                            role_name = snapshot.role_name(role_key) or role_key
 
                             # Resolve Owner Names
                             owner_names = []
@@ -1384,10 +2401,14 @@ class WorkItemProvider(Provider):
                             )
                         readable_val = readable_roles
                 # 关联工作项
-                elif f_type in [
-                    "work_item_related_select",
-                    "work_item_related_multi_select",
-                ]:
+                elif (
+                    f_type
+                    in [
+                        "work_item_related_select",
+                        "work_item_related_multi_select",
+                    ]
+                    or f_key in relation_keys
+                ):
                     if isinstance(f_val, list):
                         new_list = []
                         for wid in f_val:
@@ -1406,13 +2427,13 @@ class WorkItemProvider(Provider):
                     # 如果是用户字段（已在上面处理过），跳过此处理
                     if not is_user_field:
                         new_list = []
-                        for item in f_val:
-                            if isinstance(item, dict):
+                        for option in f_val:
+                            if isinstance(option, dict):
                                 new_list.append(
-                                    item.get("label") or item.get("name") or item
+                                    option.get("label") or option.get("name") or option
                                 )
                             else:
-                                new_list.append(item)
+                                new_list.append(option)
                         readable_val = new_list
 
             readable_fields[field_name] = readable_val
@@ -1496,12 +2517,15 @@ class WorkItemProvider(Provider):
         status: Optional[str] = None,
         assignee: Optional[str] = None,
         extra_fields: Optional[Dict[str, Any]] = None,
+        skip_unchanged: bool = False,
     ) -> List[UpdateResult]:
         """
         更新 Issue（容错模式）
 
         将更新任务委托给 batch_update_issues 以实现字段级容错。
         如果某些字段更新失败，会继续尝试其他字段，并返回详细的结果列表。
+        开启写后合并（UPDATE_COALESCE_WINDOW > 0）时，窗口期内对同一工作项的
+        多次更新合并为一次多字段写入。
 
         Args:
             issue_id: Issue ID
@@ -1511,7 +2535,20 @@ class WorkItemProvider(Provider):
             status: 状态（可选）
             assignee: 负责人（可选）
             extra_fields: 额外字段字典（可选）
+            skip_unchanged: 跳过当前值与目标值相同的字段（可选）
         """
+        if self._coalescer.enabled and not skip_unchanged:
+            future = await self.enqueue_update(
+                issue_id,
+                name=name,
+                priority=priority,
+                description=description,
+                status=status,
+                assignee=assignee,
+                extra_fields=extra_fields,
+            )
+            return await future
+
         return await self.batch_update_issues(
             issue_ids=[issue_id],
             name=name,
@@ -1520,13 +2557,134 @@ class WorkItemProvider(Provider):
             status=status,
             assignee=assignee,
             extra_fields=extra_fields,
+            skip_unchanged=skip_unchanged,
+        )
+
+    async def enqueue_update(
+        self,
+        issue_id: int,
+        *,
+        name: Optional[str] = None,
+        priority: Optional[str] = None,
+        description: Optional[str] = None,
+        status: Optional[str] = None,
+        assignee: Optional[str] = None,
+        extra_fields: Optional[Dict[str, Any]] = None,
+    ) -> "asyncio.Future[List[UpdateResult]]":
+        """
+        解析字段后加入写后合并队列
+
+        字段解析与状态流转预校验立即执行；写入在合并窗口结束时与同一工作项的
+        其他更新一起完成。
+
+        Args:
+            issue_id: Issue ID
+            name: 标题（可选）
+            priority: 优先级（可选）
+            description: 描述（可选）
+            status: 状态（可选）
+            assignee: 负责人（可选）
+            extra_fields: 额外字段字典（可选）
+
+        Returns:
+            Future，写入完成后返回本次更新各字段的 UpdateResult（含解析失败结果）
+        """
+        project_key = await self._get_project_key()
+        type_key = await self._get_type_key()
+
+        resolved_fields, results = await self._resolve_update_fields(
+            project_key,
+            type_key,
+            issue_id,
+            name,
+            priority,
+            description,
+            status,
+            assignee,
+            extra_fields,
         )
+        rejections = await self._check_status_transitions(
+            project_key, type_key, [issue_id], resolved_fields
+        )
+        if issue_id in rejections:
+            results.append(
+                UpdateResult(
+                    success=False,
+                    issue_id=issue_id,
+                    field_name="status",
+                    message=rejections[issue_id],
+                )
+            )
+            resolved_fields = [
+                f for f in resolved_fields if f["field_name"] != "status"
+            ]
+
+        if not resolved_fields:
+            future: "asyncio.Future[List[UpdateResult]]" = (
+                asyncio.get_running_loop().create_future()
+            )
+            future.set_result(results)
+            return future
+
+        write = self._coalescer.enqueue(
+            project_key, type_key, issue_id, resolved_fields, self._write_coalesced
+        )
+
+        async def collect() -> List[UpdateResult]:
+            return results + await write
+
+        return asyncio.ensure_future(collect())
+
+    async def _write_coalesced(
+        self,
+        project_key: str,
+        type_key: str,
+        issue_id: int,
+        fields: List[Dict[str, Any]],
+    ) -> List[UpdateResult]:
+        """写后合并队列的写入函数：一次多字段 update 并失效查询缓存"""
+        results = await self._update_issue_fields(
+            project_key, type_key, issue_id, fields
+        )
+        self._invalidate_written(project_key, type_key, [issue_id], fields)
+        return results
+
+    async def delete_issue(self, issue_id: int) -> None:
+        """删除 Issue"""
+        project_key = await self._get_project_key()
+        type_key = await self._get_type_key()
+        await self.api.delete(project_key, type_key, issue_id)
+        self._invalidate_written(project_key, type_key, [issue_id])
+
+    def _invalidate_written(
+        self,
+        project_key: str,
+        type_key: str,
+        issue_ids: Iterable[int],
+        fields: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        """
+        写操作后失效缓存
 
-    async def delete_issue(self, issue_id: int) -> None:
-        """删除 Issue"""
-        project_key = await self._get_project_key()
-        type_key = await self._get_type_key()
-        await self.api.delete(project_key, type_key, issue_id)
+        查询结果缓存总是失效；名称缓存（进程级共享）在创建、删除（fields 为 None）
+        或写入了标题字段时失效，避免其他 Provider 继续展示旧名称或误判为不存在；
+        写入了状态字段时移除定位索引中记录的流程状态。
+
+        Args:
+            project_key: 项目 Key
+            type_key: 工作项类型 Key
+            issue_ids: 被写入的工作项 ID
+            fields: 写入的字段列表（可选）
+        """
+        ids = list(issue_ids)
+        self._query_cache.invalidate(project_key, type_key, ids)
+        # 写入状态后记录的流程状态不再可信，等待下次读取
+        if fields is None or any(f.get("field_name") == "status" for f in fields):
+            for issue_id in ids:
+                self._locator.forget_state(issue_id)
+        if fields is None or any(f.get("field_key") == "name" for f in fields):
+            for issue_id in ids:
+                self._work_item_cache.delete(issue_id, project_key)
 
     async def _resolve_update_fields(
         self,
@@ -1540,9 +2698,26 @@ class WorkItemProvider(Provider):
         assignee: Optional[str] = None,
         extra_fields: Optional[Dict[str, Any]] = None,
     ) -> Tuple[List[Dict[str, Any]], List[UpdateResult]]:
-        """将人类可读的字段解析为 API 所需的 field_key/value 结构。同时返回解析失败的字段结果。"""
+        """
+        将人类可读的字段解析为 API 所需的 field_key/value 结构。同时返回解析失败的字段结果。
+
+        解析后按缓存的字段配置做本地校验（只读、必填、选项值域），
+        必然被服务端拒绝的写入直接作为失败结果返回，不再请求 API。
+        """
         resolved_fields: List[Dict[str, Any]] = []
         failed_results: List[UpdateResult] = []
+        validator = await self._get_field_validator(project_key, type_key)
+
+        def reject(f_name: str, message: str) -> None:
+            logger.info("Rejected update of field '%s' locally: %s", f_name, message)
+            failed_results.append(
+                UpdateResult(
+                    success=False,
+                    issue_id=issue_id,
+                    field_name=f_name,
+                    message=f"字段校验失败: {message}",
+                )
+            )
 
         async def add_field(
             f_name: str, f_value: Any, f_key: Optional[str] = None
@@ -1564,7 +2739,16 @@ class WorkItemProvider(Provider):
                 if f_key is None:
                     f_key = await self.meta.get_field_key(project_key, type_key, f_name)
 
+                error = validator.check_writable(f_key, f_name)
+                if error:
+                    reject(f_name, error)
+                    return
+
                 if f_key == "name":
+                    error = validator.check_value(f_key, f_name, f_value)
+                    if error:
+                        reject(f_name, error)
+                        return
                     resolved_fields.append(
                         {
                             "field_key": "name",
@@ -1591,6 +2775,10 @@ class WorkItemProvider(Provider):
                 option_val = await self._resolve_field_value_for_update(
                     project_key, type_key, f_key, f_value
                 )
+                error = validator.check_value(f_key, f_name, option_val)
+                if error:
+                    reject(f_name, error)
+                    return
                 resolved_fields.append(
                     {
                         "field_key": f_key,
@@ -1657,15 +2845,14 @@ class WorkItemProvider(Provider):
 
         for attempt in range(max_retries + 1):
             try:
-                # 调用 API 进行更新，使用信号量限制并发
-                async with self._api_semaphore:
+                # 调用 API 进行更新，由共享写入窗口限制并发
+                async with self._write_limiter.slot():
                     await self.api.update(
                         project_key,
                         type_key,
                         issue_id,
                         [{"field_key": field_key, "field_value": resolved_value}],
                     )
-                    await asyncio.sleep(0.1)
 
                 return UpdateResult(
                     success=True,
@@ -1675,16 +2862,8 @@ class WorkItemProvider(Provider):
                 )
 
             except Exception as e:
-                is_429 = False
-                if (
-                    isinstance(e, httpx.HTTPStatusError)
-                    and e.response.status_code == 429
-                ):
-                    is_429 = True
-                elif "429" in str(e) and "Too Many Requests" in str(e):
-                    is_429 = True
-
-                if is_429 and attempt < max_retries:
+                # 写入窗口已对 429 降窗，这里只为本次调用退避重试
+                if is_rate_limited(e) and attempt < max_retries:
                     delay = base_delay * (2**attempt) + random.uniform(0, 1)
                     logger.warning(
                         "Rate limit (429) hit. Retrying in %.2f seconds...", delay
@@ -1739,6 +2918,311 @@ class WorkItemProvider(Provider):
             message="重试次数耗尽",
         )
 
+    async def _bulk_update_field(
+        self,
+        project_key: str,
+        type_key: str,
+        issue_ids: List[int],
+        field: Dict[str, Any],
+    ) -> Tuple[List[UpdateResult], List[int]]:
+        """
+        使用 batch_update 将单个字段写入多个工作项
+
+        按 _BATCH_UPDATE_CHUNK_SIZE 分块提交后台任务并轮询结果，
+        任务结果中的成功/失败 ID 映射为逐工作项的 UpdateResult。
+        提交失败、任务超时或结果无法判定的工作项由调用方按工作项回退写入
+        （覆盖写入，重复执行不影响结果）。
+
+        Args:
+            project_key: 项目空间 Key
+            type_key: 工作项类型 Key
+            issue_ids: 待更新的工作项 ID 列表
+            field: _resolve_update_fields 的单个解析结果
+
+        Returns:
+            (已确定的结果列表, 需要回退写入的工作项 ID)
+        """
+        field_name = field["field_name"]
+        payload = [
+            {"field_key": field["field_key"], "field_value": field["field_value"]}
+        ]
+
+        async def run_chunk(chunk: List[int]) -> Tuple[List[UpdateResult], List[int]]:
+            try:
+                async with self._write_limiter.slot():
+                    task_id = await self.api.batch_update(
+                        project_key, type_key, chunk, payload
+                    )
+                outcome = await self._wait_for_task(task_id) if task_id else None
+            except Exception as e:
+                logger.warning(
+                    "Batch update of field '%s' failed for %d issue(s), "
+                    "falling back to individual updates: %s",
+                    field_name,
+                    len(chunk),
+                    e,
+                )
+                outcome = None
+            mapped, unresolved = self._map_task_outcome(chunk, field_name, outcome)
+            report_results(mapped)
+            return mapped, unresolved
+
+        size = self._BATCH_UPDATE_CHUNK_SIZE
+        chunk_results = await asyncio.gather(
+            *[
+                run_chunk(issue_ids[i : i + size])
+                for i in range(0, len(issue_ids), size)
+            ]
+        )
+
+        results: List[UpdateResult] = []
+        fallback_ids: List[int] = []
+        for mapped, unresolved in chunk_results:
+            results.extend(mapped)
+            fallback_ids.extend(unresolved)
+        return results, fallback_ids
+
+    def _prefer_bulk_tasks(self, issue_count: int, field_count: int) -> bool:
+        """
+        判断多工作项更新是否使用 batch_update 后台任务
+
+        后台任务路径每个字段每块至少需要提交与轮询两次请求；
+        逐工作项一次多字段 update 共需 issue_count 次请求。取请求数较少的路径。
+
+        Args:
+            issue_count: 工作项数量
+            field_count: 字段数量
+
+        Returns:
+            后台任务路径请求数更少时返回 True
+        """
+        chunks = -(-issue_count // self._BATCH_UPDATE_CHUNK_SIZE)
+        return 2 * field_count * chunks < issue_count
+
+    async def _update_issues_individually(
+        self,
+        project_key: str,
+        type_key: str,
+        issue_fields: Dict[int, List[Dict[str, Any]]],
+    ) -> List[UpdateResult]:
+        """
+        逐工作项一次多字段 update，在共享限流下并发执行
+
+        只有多字段写入失败的工作项才降级为逐字段更新。
+
+        Args:
+            project_key: 项目空间 Key
+            type_key: 工作项类型 Key
+            issue_fields: {issue_id: 解析后的字段列表}
+
+        Returns:
+            所有工作项各字段的 UpdateResult
+        """
+        targets = {i: fields for i, fields in issue_fields.items() if fields}
+        if not targets:
+            return []
+        logger.info("Running multi-field updates for %d issue(s)", len(targets))
+
+        async def update_one(
+            issue_id: int, fields: List[Dict[str, Any]]
+        ) -> List[UpdateResult]:
+            results = await self._update_issue_fields(
+                project_key, type_key, issue_id, fields
+            )
+            report_results(results)
+            return results
+
+        outcomes = await asyncio.gather(
+            *[update_one(issue_id, fields) for issue_id, fields in targets.items()]
+        )
+        return [result for results in outcomes for result in results]
+
+    async def _wait_for_task(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        以指数退避轮询 batch_update 后台任务，直到任务结束
+
+        Args:
+            task_id: 后台任务 ID
+
+        Returns:
+            任务结果；超时返回 None
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._TASK_POLL_TIMEOUT
+        delay = self._TASK_POLL_INITIAL_DELAY
+
+        while True:
+            await asyncio.sleep(delay)
+            async with self._api_semaphore:
+                outcome = await self.api.get_task_result(task_id)
+            status = str(outcome.get("status") or "").lower()
+            if status not in self._TASK_RUNNING_STATUSES:
+                return outcome
+            if loop.time() + delay > deadline:
+                logger.warning("Batch update task %s timed out", task_id)
+                return None
+            delay = min(delay * 2, self._TASK_POLL_MAX_DELAY)
+
+    @classmethod
+    def _map_task_outcome(
+        cls,
+        issue_ids: List[int],
+        field_name: str,
+        outcome: Optional[Dict[str, Any]],
+    ) -> Tuple[List[UpdateResult], List[int]]:
+        """
+        将后台任务结果映射为逐工作项的 UpdateResult
+
+        Args:
+            issue_ids: 该任务提交的工作项 ID
+            field_name: 字段显示名称
+            outcome: 任务结果（None 表示提交失败或超时）
+
+        Returns:
+            (已确定的结果列表, 结果无法判定、需要逐个更新的工作项 ID)
+        """
+        if outcome is None:
+            return [], list(issue_ids)
+
+        status = str(outcome.get("status") or "").lower()
+        task_succeeded = status in cls._TASK_SUCCESS_STATUSES
+        reason = (
+            outcome.get("err_msg")
+            or outcome.get("fail_reason")
+            or f"任务状态: {status}"
+        )
+
+        def parse_ids(key: str) -> Optional[Dict[int, str]]:
+            # 兼容 ID 列表与 {"work_item_id": ..., "err_msg": ...} 列表两种结构
+            entries = outcome.get(key)
+            if not isinstance(entries, list):
+                return None
+            parsed: Dict[int, str] = {}
+            for entry in entries:
+                message = reason
+                if isinstance(entry, dict):
+                    message = entry.get("err_msg") or entry.get("msg") or reason
+                    entry = entry.get("work_item_id") or entry.get("id")
+                try:
+                    parsed[int(entry)] = message
+                except (TypeError, ValueError):
+                    continue
+            return parsed
+
+        succeeded = parse_ids("success_work_item_ids")
+        failed = parse_ids("fail_work_item_ids") or parse_ids("failed_work_item_ids")
+
+        results: List[UpdateResult] = []
+        unresolved: List[int] = []
+        for issue_id in issue_ids:
+            if failed and issue_id in failed:
+                results.append(
+                    UpdateResult(
+                        success=False,
+                        issue_id=issue_id,
+                        field_name=field_name,
+                        message=f"更新字段 '{field_name}' 失败: {failed[issue_id]}",
+                    )
+                )
+            elif (succeeded and issue_id in succeeded) or (
+                task_succeeded and succeeded is None
+            ):
+                results.append(
+                    UpdateResult(
+                        success=True,
+                        issue_id=issue_id,
+                        field_name=field_name,
+                        message=f"字段 '{field_name}' 更新成功",
+                    )
+                )
+            else:
+                unresolved.append(issue_id)
+        return results, unresolved
+
+    async def _check_status_transitions(
+        self,
+        project_key: str,
+        type_key: str,
+        issue_ids: List[int],
+        resolved_fields: List[Dict[str, Any]],
+    ) -> Dict[int, str]:
+        """
+        基于缓存的流程模型预校验状态流转
+
+        当前状态与模板取自 WorkItemLocator 记录的最近一次读取结果，不为校验额外查询；
+        状态未知的工作项直接放行。只有按记录判定为非法的工作项才重新查询一次确认
+        （记录可能已过期），确认非法才在本地拒绝，省下一次必然失败的写入。
+        任何加载失败都放行，由服务端做最终校验。
+
+        Args:
+            project_key: 项目空间 Key
+            type_key: 工作项类型 Key
+            issue_ids: 待更新的工作项 ID 列表
+            resolved_fields: _resolve_update_fields 的解析结果
+
+        Returns:
+            {issue_id: 拒绝原因}，只包含已确认非法的流转
+        """
+        status_field = next(
+            (f for f in resolved_fields if f["field_name"] == "status"), None
+        )
+        if status_field is None:
+            return {}
+        target_state = status_field["field_value"]
+        if isinstance(target_state, dict):
+            target_state = target_state.get("value")
+        if not isinstance(target_state, str) or not target_state:
+            return {}
+
+        known = {
+            issue_id: state
+            for issue_id in issue_ids
+            if (state := self._locator.get_state(issue_id)) is not None
+        }
+        if not known:
+            return {}
+
+        async def check(template_id: Any, current_state: Any) -> Optional[str]:
+            return await self.meta.validate_status_transition(
+                project_key, type_key, template_id, current_state, target_state
+            )
+
+        try:
+            model = await self.meta.get_workflow_model(project_key, type_key)
+            if not isinstance(model, dict) or not model.get("templates"):
+                return {}
+
+            suspects = [
+                issue_id
+                for issue_id, (template_id, current_state) in known.items()
+                if await check(template_id, current_state)
+            ]
+            if not suspects:
+                return {}
+
+            items: List[Dict] = []
+            for i in range(0, len(suspects), self._SCAN_BATCH_SIZE):
+                chunk = suspects[i : i + self._SCAN_BATCH_SIZE]
+                items.extend(await self.api.query(project_key, type_key, chunk))
+            self._locator.record_items(items, project_key, type_key)
+        except Exception as e:
+            logger.warning("Skipping status transition pre-check: %s", e)
+            return {}
+
+        rejections: Dict[int, str] = {}
+        for item in items:
+            current_state = (item.get("work_item_status") or {}).get("state_key")
+            reason = await check(item.get("template_id"), current_state)
+            if reason:
+                rejections[item.get("id")] = reason
+
+        if rejections:
+            logger.info(
+                "Rejected %d status update(s) locally before calling API",
+                len(rejections),
+            )
+        return rejections
+
     async def batch_update_issues(
         self,
         issue_ids: List[int],
@@ -1749,8 +3233,14 @@ class WorkItemProvider(Provider):
         status: Optional[str] = None,
         assignee: Optional[str] = None,
         extra_fields: Optional[Dict[str, Any]] = None,
+        skip_unchanged: bool = False,
     ) -> List[UpdateResult]:
-        """批量更新多个工作项。采用乐观并发策略优化耗时。"""
+        """
+        批量更新多个工作项。采用乐观并发策略优化耗时。
+
+        skip_unchanged 为 True 时先批量读取当前值，与目标值相同的字段不再写入，
+        以 UpdateResult(success=True, message="unchanged") 返回。
+        """
         if not issue_ids:
             return []
 
@@ -1780,68 +3270,433 @@ class WorkItemProvider(Provider):
         if not resolved_fields:
             return all_results
 
+        # 状态流转本地预校验：已知非法的流转直接拒绝，不消耗写配额
+        status_rejections = await self._check_status_transitions(
+            project_key, type_key, issue_ids, resolved_fields
+        )
+        for issue_id, reason in status_rejections.items():
+            all_results.append(
+                UpdateResult(
+                    success=False,
+                    issue_id=issue_id,
+                    field_name="status",
+                    message=reason,
+                )
+            )
+
+        def candidate_fields(issue_id: int) -> List[Dict[str, Any]]:
+            if issue_id not in status_rejections:
+                return resolved_fields
+            return [f for f in resolved_fields if f["field_name"] != "status"]
+
+        # 写入前比对：当前值与目标值相同的字段不消耗写配额
+        unchanged: Dict[int, Set[str]] = {}
+        if skip_unchanged:
+            unchanged = await self._find_unchanged_fields(
+                project_key, type_key, issue_ids, resolved_fields
+            )
+            for issue_id in issue_ids:
+                for f in candidate_fields(issue_id):
+                    if f["field_key"] in unchanged.get(issue_id, ()):
+                        all_results.append(
+                            UpdateResult(
+                                success=True,
+                                issue_id=issue_id,
+                                field_name=f["field_name"],
+                                message="unchanged",
+                                field_value=f["field_value"],
+                            )
+                        )
+
+        def fields_for(issue_id: int) -> List[Dict[str, Any]]:
+            skipped = unchanged.get(issue_id, ())
+            return [
+                f for f in candidate_fields(issue_id) if f["field_key"] not in skipped
+            ]
+
         # 2. 乐观执行策略：如果只有一个 Issue，尝试一次性更新所有字段
         if len(issue_ids) == 1:
             issue_id = issue_ids[0]
-            try:
-                logger.info("Optimistic batch update for issue %d", issue_id)
-                api_payload = [
-                    {"field_key": f["field_key"], "field_value": f["field_value"]}
-                    for f in resolved_fields
+            issue_fields = fields_for(issue_id)
+            if not issue_fields:
+                return all_results
+            all_results.extend(
+                await self._update_issue_fields(
+                    project_key, type_key, issue_id, issue_fields
+                )
+            )
+            # 写入完成后失效缓存（部分失败时也可能有字段已写入）
+            self._invalidate_written(project_key, type_key, issue_ids, issue_fields)
+            return all_results
+
+        # 3. 多 Issue 路径: 工作项多于后台任务请求数时，每个字段一次分块 batch_update；
+        # 否则（或后台任务无法判定结果的工作项）逐工作项一次多字段 update
+        issue_fields = {issue_id: fields_for(issue_id) for issue_id in issue_ids}
+        report_total(len(all_results) + sum(len(f) for f in issue_fields.values()))
+        report_results(all_results)
+        if self._prefer_bulk_tasks(len(issue_ids), len(resolved_fields)):
+            field_targets = [
+                (field, ids)
+                for field in resolved_fields
+                if (ids := [i for i in issue_ids if field in issue_fields[i]])
+            ]
+            field_results = await asyncio.gather(
+                *[
+                    self._bulk_update_field(project_key, type_key, ids, field)
+                    for field, ids in field_targets
                 ]
+            )
+            fallback: Dict[int, List[Dict[str, Any]]] = {}
+            for (field, _), (mapped, unresolved) in zip(field_targets, field_results):
+                all_results.extend(mapped)
+                for issue_id in unresolved:
+                    fallback.setdefault(issue_id, []).append(field)
+            issue_fields = fallback
+
+        all_results.extend(
+            await self._update_issues_individually(project_key, type_key, issue_fields)
+        )
+        self._invalidate_written(project_key, type_key, issue_ids, resolved_fields)
+        return all_results
+
+    async def _comparable_target(
+        self, project_key: str, type_key: str, field: Dict[str, Any]
+    ) -> Any:
+        """
+        获取用于比对的目标值：用户字段的姓名/邮箱转换为 user_key
+
+        Args:
+            project_key: 项目空间 Key
+            type_key: 工作项类型 Key
+            field: _resolve_update_fields 的单个解析结果
+
+        Returns:
+            目标值（转换失败时返回原值，比对不相等时照常写入）
+        """
+        target = field["field_value"]
+        if not isinstance(target, str) or is_user_key(target):
+            return target
+        try:
+            field_type = await self.meta.get_field_type(
+                project_key, type_key, field["field_key"]
+            )
+            if field["field_key"] == "owner" or field_type in ("user", "multi_user"):
+                user_key = await self.meta.get_user_key(target)
+                if isinstance(user_key, str) and user_key:
+                    return user_key
+        except Exception as e:
+            logger.debug("Failed to resolve comparable user '%s': %s", target, e)
+        return target
+
+    async def _find_unchanged_fields(
+        self,
+        project_key: str,
+        type_key: str,
+        issue_ids: List[int],
+        resolved_fields: List[Dict[str, Any]],
+    ) -> Dict[int, Set[str]]:
+        """
+        批量读取当前值，找出与目标值相同、无需写入的字段
+
+        分块 query 并只投影待更新的字段；读取失败时返回空结果（全部照常写入）。
+
+        Args:
+            project_key: 项目空间 Key
+            type_key: 工作项类型 Key
+            issue_ids: 待更新的工作项 ID 列表
+            resolved_fields: _resolve_update_fields 的解析结果
+
+        Returns:
+            {issue_id: 无需写入的 field_key 集合}
+        """
+        targets = {
+            f["field_key"]: await self._comparable_target(project_key, type_key, f)
+            for f in resolved_fields
+        }
+
+        try:
+            items: List[Dict] = []
+            for i in range(0, len(issue_ids), self._SCAN_BATCH_SIZE):
+                chunk = issue_ids[i : i + self._SCAN_BATCH_SIZE]
+                async with self._api_semaphore:
+                    items.extend(
+                        await self.api.query(
+                            project_key, type_key, chunk, fields=list(targets)
+                        )
+                    )
+            self._locator.record_items(items, project_key, type_key)
+        except Exception as e:
+            logger.warning("Skipping unchanged-field check: %s", e)
+            return {}
+
+        unchanged: Dict[int, Set[str]] = {}
+        for item in items:
+            if not isinstance(item, dict) or item.get("id") is None:
+                continue
+            index = index_fields(item)
+            for field_key, target in targets.items():
+                current = (
+                    item.get("name") if field_key == "name" else index.get(field_key)
+                )
+                if FieldResolver.values_equal(current, target):
+                    unchanged.setdefault(int(item["id"]), set()).add(field_key)
+
+        skipped = sum(len(keys) for keys in unchanged.values())
+        if skipped:
+            logger.info("Skipping %d unchanged field update(s)", skipped)
+        return unchanged
+
+    # batch_update_issues 的固定参数名，其余字段按 extra_fields 解析
+    _FIXED_UPDATE_FIELDS: Tuple[str, ...] = (
+        "name",
+        "priority",
+        "description",
+        "status",
+        "assignee",
+    )
+
+    @staticmethod
+    def _value_signature(value: Any) -> str:
+        """生成字段值的可哈希签名（值可能是 dict/list）"""
+        return json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+
+    async def _plan_bulk_edits(
+        self,
+        project_key: str,
+        type_key: str,
+        edits: List[Tuple[int, Dict[str, Any]]],
+    ) -> BulkWritePlan:
+        """
+        编译异构批量写入计划
+
+        每个不同的 (字段名, 取值) 只解析一次；解析后取值相同的编辑在任务路径
+        请求数更少时（见 _prefer_bulk_tasks）合并为 batch_update，
+        其余编辑按工作项合并为一次多字段 update。
+
+        Args:
+            project_key: 项目空间 Key
+            type_key: 工作项类型 Key
+            edits: [(issue_id, {字段名: 取值})] 列表
+
+        Returns:
+            BulkWritePlan
+        """
+        # (字段名, 取值签名) -> (解析结果, 解析失败结果)
+        resolved: Dict[
+            Tuple[str, str], Tuple[Optional[Dict[str, Any]], List[UpdateResult]]
+        ] = {}
+        # (field_key, 解析后取值签名) -> (解析后的字段, 工作项 ID)
+        groups: Dict[Tuple[str, str], Tuple[Dict[str, Any], List[int]]] = {}
+        failed: List[UpdateResult] = []
+        edit_count = 0
+
+        # 同一工作项的多条编辑合并，同一字段以后出现的取值为准
+        merged: Dict[int, Dict[str, Any]] = {}
+        for issue_id, fields in edits:
+            merged.setdefault(issue_id, {}).update(fields or {})
+
+        for issue_id, fields in merged.items():
+            for f_name, f_value in fields.items():
+                edit_count += 1
+                signature = (f_name, self._value_signature(f_value))
+                if signature not in resolved:
+                    if f_name in self._FIXED_UPDATE_FIELDS:
+                        kwargs: Dict[str, Any] = {f_name: f_value}
+                    else:
+                        kwargs = {"extra_fields": {f_name: f_value}}
+                    fields_resolved, fields_failed = await self._resolve_update_fields(
+                        project_key, type_key, issue_id, **kwargs
+                    )
+                    resolved[signature] = (
+                        fields_resolved[0] if fields_resolved else None,
+                        fields_failed,
+                    )
+
+                field, field_failed = resolved[signature]
+                failed.extend(r._replace(issue_id=issue_id) for r in field_failed)
+                if field is None:
+                    continue
+                group_key = (
+                    field["field_key"],
+                    self._value_signature(field["field_value"]),
+                )
+                groups.setdefault(group_key, (field, []))[1].append(issue_id)
+
+        batch_groups: List[Tuple[Dict[str, Any], List[int]]] = []
+        per_item: Dict[int, List[Dict[str, Any]]] = {}
+        for field, issue_ids in groups.values():
+            unique_ids = list(dict.fromkeys(issue_ids))
+            # 工作项较少时任务路径（提交 + 轮询）请求更多，并入各自的多字段 update
+            if self._prefer_bulk_tasks(len(unique_ids), 1):
+                batch_groups.append((field, unique_ids))
+            else:
+                for issue_id in unique_ids:
+                    per_item.setdefault(issue_id, []).append(field)
+
+        return BulkWritePlan(
+            batch_groups=batch_groups,
+            item_updates=list(per_item.items()),
+            failed=failed,
+            edit_count=edit_count,
+        )
+
+    async def bulk_update_issues(
+        self,
+        edits: List[Tuple[int, Dict[str, Any]]],
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        异构批量更新：不同工作项写入不同取值
+
+        相同 (字段, 取值) 的工作项足够多时合并为分块 batch_update，
+        其余编辑按工作项合并为一次多字段 update（失败时降级为逐字段更新）。
+
+        Args:
+            edits: [(issue_id, {字段名: 取值})] 列表，字段名规则同 batch_update_issues
+                （name/priority/description/status/assignee 或自定义字段名）
+            dry_run: 仅生成计划并返回预计的上游写请求数，不执行写入
+
+        Returns:
+            {
+                "dry_run": bool,
+                "edit_count": 10,      # (工作项, 字段) 编辑总数
+                "planned_calls": 4,    # 预计的上游请求数（batch_update 每块计提交+轮询）
+                "batch_groups": [{"field_name", "field_key", "issue_ids"}],
+                "item_updates": [{"issue_id", "fields"}],
+                "results": [UpdateResult, ...]  # dry_run 时仅包含解析失败结果
+            }
+        """
+        project_key = await self._get_project_key()
+        type_key = await self._get_type_key()
+        plan = await self._plan_bulk_edits(project_key, type_key, edits)
+
+        # batch_update 每块至少需要提交与轮询两次请求（与 _prefer_bulk_tasks 一致）
+        size = self._BATCH_UPDATE_CHUNK_SIZE
+        planned_calls = len(plan.item_updates) + sum(
+            2 * ((len(ids) + size - 1) // size) for _, ids in plan.batch_groups
+        )
+        report: Dict[str, Any] = {
+            "dry_run": dry_run,
+            "edit_count": plan.edit_count,
+            "planned_calls": planned_calls,
+            "batch_groups": [
+                {
+                    "field_name": field["field_name"],
+                    "field_key": field["field_key"],
+                    "issue_ids": ids,
+                }
+                for field, ids in plan.batch_groups
+            ],
+            "item_updates": [
+                {"issue_id": issue_id, "fields": [f["field_name"] for f in fields]}
+                for issue_id, fields in plan.item_updates
+            ],
+            "results": list(plan.failed),
+        }
+        logger.info(
+            "Bulk write plan: %d edits -> %d upstream calls (dry_run=%s)",
+            plan.edit_count,
+            planned_calls,
+            dry_run,
+        )
+        if dry_run or planned_calls == 0:
+            return report
+        report_total(plan.edit_count)
+        report_results(plan.failed)
+
+        # batch_update 无法判定结果的工作项并入逐工作项多字段写入
+        issue_fields: Dict[int, List[Dict[str, Any]]] = {
+            issue_id: list(fields) for issue_id, fields in plan.item_updates
+        }
+        group_outcomes = await asyncio.gather(
+            *[
+                self._bulk_update_field(project_key, type_key, ids, field)
+                for field, ids in plan.batch_groups
+            ]
+        )
+        for (field, _), (mapped, unresolved) in zip(plan.batch_groups, group_outcomes):
+            report["results"].extend(mapped)
+            for issue_id in unresolved:
+                issue_fields.setdefault(issue_id, []).append(field)
+        report["results"].extend(
+            await self._update_issues_individually(project_key, type_key, issue_fields)
+        )
+
+        written_ids = {issue_id for issue_id, _ in plan.item_updates}
+        written_fields = [f for _, fields in plan.item_updates for f in fields]
+        for field, ids in plan.batch_groups:
+            written_ids.update(ids)
+            written_fields.append(field)
+        self._invalidate_written(project_key, type_key, written_ids, written_fields)
+        return report
+
+    async def _update_issue_fields(
+        self,
+        project_key: str,
+        type_key: str,
+        issue_id: int,
+        issue_fields: List[Dict[str, Any]],
+    ) -> List[UpdateResult]:
+        """
+        一次请求写入单个工作项的多个字段，失败时降级为逐字段更新
+
+        Args:
+            project_key: 项目空间 Key
+            type_key: 工作项类型 Key
+            issue_id: 工作项 ID
+            issue_fields: _resolve_update_fields 的解析结果
 
-                async with self._api_semaphore:
-                    await self.api.update(project_key, type_key, issue_id, api_payload)
+        Returns:
+            每个字段一条 UpdateResult
+        """
+        try:
+            logger.info("Optimistic batch update for issue %d", issue_id)
+            api_payload = [
+                {"field_key": f["field_key"], "field_value": f["field_value"]}
+                for f in issue_fields
+            ]
 
-                # 全部成功
-                all_results.extend(
-                    [
-                        UpdateResult(
-                            success=True,
-                            issue_id=issue_id,
-                            field_name=f["field_name"],
-                            message="更新成功",
-                        )
-                        for f in resolved_fields
-                    ]
+            async with self._write_limiter.slot():
+                await self.api.update(project_key, type_key, issue_id, api_payload)
+
+            # 全部成功
+            return [
+                UpdateResult(
+                    success=True,
+                    issue_id=issue_id,
+                    field_name=f["field_name"],
+                    message="更新成功",
                 )
-                return all_results
-            except Exception as e:
-                is_429 = "429" in str(e) or (
-                    isinstance(e, httpx.HTTPStatusError)
-                    and e.response.status_code == 429
+                for f in issue_fields
+            ]
+        except Exception as e:
+            if is_rate_limited(e):
+                logger.warning(
+                    "Optimistic update hit rate limit (429), falling back to individual updates."
                 )
-                if is_429:
-                    logger.warning(
-                        "Optimistic update hit rate limit (429), falling back to individual updates."
-                    )
-                else:
-                    logger.warning(
-                        "Optimistic update failed for issue %d: %s. Falling back to individual updates for fault tolerance.",
-                        issue_id,
-                        e,
-                    )
-                # 降级执行：进入下方的逐字段更新逻辑
-
-        # 3. 逐字段更新（降级或多 Issue 路径）
-        tasks = []
-        for issue_id in issue_ids:
-            for field in resolved_fields:
-                tasks.append(
-                    self._perform_single_field_update(
-                        project_key,
-                        type_key,
-                        issue_id,
-                        field["field_name"],
-                        field["field_key"],
-                        field["field_value"],
-                    )
+            else:
+                logger.warning(
+                    "Optimistic update failed for issue %d: %s. Falling back to individual updates for fault tolerance.",
+                    issue_id,
+                    e,
                 )
 
-        logger.info("Running %d individual update tasks", len(tasks))
-        results = await asyncio.gather(*tasks)
-        all_results.extend([res for res in results if isinstance(res, UpdateResult)])
-        return all_results
+        # 降级执行：逐字段更新
+        logger.info("Running %d individual update tasks", len(issue_fields))
+        results = await asyncio.gather(
+            *[
+                self._perform_single_field_update(
+                    project_key,
+                    type_key,
+                    issue_id,
+                    field["field_name"],
+                    field["field_key"],
+                    field["field_value"],
+                )
+                for field in issue_fields
+            ]
+        )
+        return [res for res in results if isinstance(res, UpdateResult)]
 
     async def filter_issues(
         self,
@@ -1850,11 +3705,15 @@ class WorkItemProvider(Provider):
         owner: Optional[str] = None,
         page_num: int = 1,
         page_size: int = 20,
+        role: Optional[str] = None,
+        role_user: Optional[str] = None,
+        include_role_owners: bool = False,
     ) -> Dict[str, Any]:
         """
         过滤查询 Issues
 
         支持按状态、优先级、负责人进行过滤，自动将人类可读的值转换为 API 所需的 Key。
+        返回的工作项只包含摘要字段（优先级、状态、负责人），完整字段请使用 get_issue_details。
 
         Args:
             status: 状态列表（如 ["待处理", "进行中"]）
@@ -1862,6 +3721,9 @@ class WorkItemProvider(Provider):
             owner: 负责人（姓名或邮箱）
             page_num: 页码（从 1 开始）
             page_size: 每页数量
+            role: 角色名称或 Role Key（可选），只保留 role_user 担任该角色的工作项
+            role_user: 角色人员（姓名、邮箱或 user_key，默认当前调用用户）
+            include_role_owners: 返回的工作项包含 role_owners（可选）
 
         Returns:
             {
@@ -1881,41 +3743,35 @@ class WorkItemProvider(Provider):
         project_key = await self._get_project_key()
         type_key = await self._get_type_key()
 
-        # 构建搜索条件（使用辅助方法减少重复代码）
-        conditions: List[Dict[str, Any]] = []
-
-        # 处理状态过滤
-        if status:
-            condition = await self._build_filter_condition(
-                project_key, type_key, "status", status
-            )
-            if condition:
-                conditions.append(condition)
-
-        # 处理优先级过滤
-        if priority:
-            condition = await self._build_filter_condition(
-                project_key, type_key, "priority", priority
-            )
-            if condition:
-                conditions.append(condition)
-
-        # 处理负责人过滤（使用简化的辅助方法）
-        if owner:
-            condition = await self._build_owner_filter_condition(
-                project_key, type_key, owner
-            )
-            if condition:
-                conditions.append(condition)
+        # 复用编译后的查询计划，相同过滤条件无需重复解析
+        plan = await self._get_query_plan(
+            project_key, type_key, status=status, priority=priority, owner=owner
+        )
+        search_group = plan.search_group
+        with_role_owners = bool(role) or include_role_owners
 
-        # 构建 search_group
-        search_group = {
-            "conjunction": "AND",
-            "search_params": conditions,
-            "search_groups": [],
-        }
+        # 结果受调用方权限影响，键中包含当前 user_key
+        cache_key = (
+            "filter_issues",
+            user_key_context.get(),
+            project_key,
+            type_key,
+            tuple(status or ()),
+            tuple(priority or ()),
+            owner,
+            with_role_owners,
+            page_num,
+            page_size,
+        )
+        cached = self._query_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("filter_issues: query result cache hit")
+            return await self._apply_role_filter(cached, role, role_user)
+        generation = self._query_cache.generation
 
-        logger.info("Filtering issues with conditions: %s", conditions)
+        logger.info(
+            "Filtering issues with conditions: %s", search_group["search_params"]
+        )
         logger.debug("filter_issues: Built search_group: %s", search_group)
 
         # 调用 API
@@ -1925,17 +3781,54 @@ class WorkItemProvider(Provider):
             search_group=search_group,
             page_num=page_num,
             page_size=page_size,
+            fields=self._projection_fields(plan, with_role_owners=with_role_owners),
         )
 
         # 使用辅助方法标准化返回结果
         items, pagination = self._normalize_api_result(result, page_num, page_size)
 
-        return {
+        response = {
             "items": items,
             "total": pagination.get("total", len(items)),
             "page_num": pagination.get("page_num", page_num),
             "page_size": pagination.get("page_size", page_size),
         }
+        # 负责人条件被丢弃时结果未过滤，不写入缓存
+        if not plan.owner_dropped:
+            self._query_cache.set(
+                cache_key, response, project_key, type_key, generation
+            )
+        return await self._apply_role_filter(response, role, role_user)
+
+    async def _apply_role_filter(
+        self, result: Dict[str, Any], role: Optional[str], role_user: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        在查询结果页内按角色人员过滤（role_owners 不支持服务端过滤）
+
+        Args:
+            result: 列表查询结果（items 需包含 role_owners）
+            role: 角色名称或 Role Key；为空时原样返回
+            role_user: 角色人员（可选，默认当前调用用户）
+
+        Returns:
+            过滤后的结果；total 保持角色过滤前的总数
+
+        Raises:
+            ValueError: 未指定 role_user 且没有调用用户上下文
+        """
+        if not role:
+            return result
+        user = role_user or user_key_context.get()
+        if not user:
+            raise ValueError("按角色过滤需要指定 role_user")
+
+        filtered = dict(result)
+        filtered["items"] = await self.filter_items_by_role(
+            result.get("items", []), role, user
+        )
+        filtered.setdefault("hint", "角色过滤在当前页内进行，total 为角色过滤前的总数")
+        return filtered
 
     async def get_tasks(
         self,
@@ -1946,6 +3839,9 @@ class WorkItemProvider(Provider):
         related_to: Optional[int] = None,
         page_num: int = 1,
         page_size: int = 50,
+        role: Optional[str] = None,
+        role_user: Optional[str] = None,
+        include_role_owners: bool = False,
     ) -> Dict[str, Any]:
         """
         获取工作项列表（支持全量或按条件过滤）
@@ -1956,6 +3852,7 @@ class WorkItemProvider(Provider):
         - 支持多维度组合过滤
         - 如果提供 name_keyword，优先使用高效的 filter API
         - 支持按关联工作项 ID 过滤（客户端过滤）
+        - 只请求摘要字段（优先级、状态、负责人）及关联过滤所需字段，缩小分页载荷
 
         Args:
             name_keyword: 任务名称关键词（可选，支持模糊搜索）
@@ -1965,6 +3862,10 @@ class WorkItemProvider(Provider):
             related_to: 关联工作项 ID（可选），用于查找与指定工作项关联的其他工作项
             page_num: 页码（从 1 开始）
             page_size: 每页数量
+            role: 角色名称或 Role Key（可选），只保留 role_user 担任该角色的工作项
+                （页内客户端过滤，total 为角色过滤前的总数）
+            role_user: 角色人员（姓名、邮箱或 user_key，默认当前调用用户）
+            include_role_owners: 返回的工作项包含 role_owners（可选）
 
         Returns:
             {
@@ -1986,20 +3887,95 @@ class WorkItemProvider(Provider):
 
             # 查找与指定工作项关联的工作项
             result = await provider.get_tasks(related_to=6181818812)
+
+            # 我担任经办人的工作项
+            result = await provider.get_tasks(role="经办人", role_user="张三")
         """
         project_key = await self._get_project_key()
         type_key = await self._get_type_key()
 
+        # 编译（或复用）查询计划：API 选择、搜索条件、字段投影一次性确定
+        plan = await self._get_query_plan(
+            project_key,
+            type_key,
+            name_keyword=name_keyword,
+            status=status,
+            priority=priority,
+            owner=owner,
+            has_related_to=bool(related_to),
+        )
+        with_role_owners = bool(role) or include_role_owners
+
+        # 短期结果缓存：相同用户、计划与分页直接复用，写操作后按类型/工作项 ID 失效
+        cache_key = (
+            "get_tasks",
+            user_key_context.get(),
+            project_key,
+            type_key,
+            name_keyword,
+            tuple(status or ()),
+            tuple(priority or ()),
+            owner,
+            related_to,
+            with_role_owners,
+            page_num,
+            page_size,
+        )
+        cached = self._query_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("get_tasks: query result cache hit")
+            return await self._apply_role_filter(cached, role, role_user)
+
+        generation = self._query_cache.generation
+        result = await self._execute_task_query(
+            project_key,
+            type_key,
+            plan,
+            name_keyword=name_keyword,
+            status=status,
+            priority=priority,
+            owner=owner,
+            related_to=related_to,
+            page_num=page_num,
+            page_size=page_size,
+            with_role_owners=with_role_owners,
+        )
+        # 负责人条件被丢弃时结果未过滤，不写入缓存
+        if not plan.owner_dropped:
+            self._query_cache.set(cache_key, result, project_key, type_key, generation)
+        return await self._apply_role_filter(result, role, role_user)
+
+    async def _execute_task_query(
+        self,
+        project_key: str,
+        type_key: str,
+        plan: QueryPlan,
+        name_keyword: Optional[str],
+        status: Optional[List[str]],
+        priority: Optional[List[str]],
+        owner: Optional[str],
+        related_to: Optional[int],
+        page_num: int,
+        page_size: int,
+        with_role_owners: bool = False,
+    ) -> Dict[str, Any]:
+        """按查询计划执行 get_tasks 查询（不经过结果缓存）"""
+        # 关联过滤只检查已知的关联字段，避免逐字段扫描
+        relation_keys = (
+            await self._get_relation_field_keys(project_key, type_key)
+            if related_to
+            else None
+        )
+        # 字段投影：只请求摘要字段（及关联过滤需要的关联字段），缩小分页载荷
+        fields = self._projection_fields(
+            plan, related_to, relation_keys, with_role_owners
+        )
+        projection_kwargs: Dict[str, Any] = {"fields": fields} if fields else {}
+
         # 特殊处理：当只有 related_to 参数时，需要获取工作项进行客户端过滤
         # 因为关联字段不支持 API 级别的过滤
         # ⚠️ 安全加固：限制扫描深度，防止 DoS 攻击或资源耗尽
-        if (
-            related_to
-            and not name_keyword
-            and not status
-            and not priority
-            and not owner
-        ):
+        if plan.api == "scan":
             logger.warning(
                 "⚠️ related_to filter without other conditions requires client-side scanning. "
                 "This is an expensive operation. Consider adding name_keyword, status, or priority "
@@ -2028,6 +4004,7 @@ class WorkItemProvider(Provider):
                         work_item_type_keys=[type_key],
                         page_num=p,
                         page_size=self._SCAN_BATCH_SIZE,
+                        **projection_kwargs,
                     )
                     for p in range(current_page, end_page)
                 ]
@@ -2072,7 +4049,7 @@ class WorkItemProvider(Provider):
                     found_items.extend(
                         item
                         for item in items
-                        if self._is_item_related_to(item, related_to)
+                        if self._is_item_related_to(item, related_to, relation_keys)
                     )
 
                     # 如果某一页的数据少于 BATCH_SIZE，说明已经是最后一页
@@ -2129,96 +4106,16 @@ class WorkItemProvider(Provider):
 
         # 如果提供了 name_keyword，优先使用 filter API（更高效）
         # filter API 支持 work_item_name 和 work_item_status，但不支持 priority/owner/related_to
-        if name_keyword:
+        if plan.api == "filter":
             logger.info("Using filter API for name keyword search: '%s'", name_keyword)
 
-            # 准备 filter API 参数
-            filter_kwargs = {}
-            if name_keyword:
-                filter_kwargs["work_item_name"] = name_keyword
-
-            # filter API 支持 status，但需要转换为状态值
-            if status:
-                # 尝试解析状态值
-                try:
-                    field_key = await self.meta.get_field_key(
-                        project_key, type_key, "status"
-                    )
-                    resolved_statuses = []
-                    for s in status:
-                        try:
-                            val = await self._resolve_field_value(
-                                project_key, type_key, field_key, s
-                            )
-                            resolved_statuses.append(val)
-                        except Exception as e:
-                            logger.warning("Failed to resolve status '%s': %s", s, e)
-                    if resolved_statuses:
-                        filter_kwargs["work_item_status"] = resolved_statuses
-                        logger.info(
-                            "Added status filter to filter API: %s", resolved_statuses
-                        )
-                except Exception as e:
-                    logger.warning("Status field not available for filter API: %s", e)
-
-            # filter API 不支持 priority、owner 和 related_to，记录警告
-            if priority:
-                logger.warning(
-                    "Filter API does not support priority filter, "
-                    "will filter results after retrieval"
-                )
-            if owner:
-                logger.warning(
-                    "Filter API does not support owner filter, "
-                    "will filter results after retrieval"
-                )
-            if related_to:
-                logger.warning(
-                    "Filter API does not support related_to filter, "
-                    "will filter results after retrieval"
-                )
-
-            # 1. 获取该类型的所有字段映射 (Name -> Key)
-            # 这利用了 MetadataManager 的缓存机制，避免多次 API 调用
-            try:
-                all_fields_map = await self.meta.list_fields(project_key, type_key)
-            except Exception as e:
-                logger.warning("Filter API: Failed to list fields: %s", e)
-                all_fields_map = {}
-
-            # 定义业务逻辑需要的基础字段
-            # 这些是代码逻辑依赖的字段（用于客户端过滤），无论用户是否传入过滤参数都需要获取
-            needed_fields = {"priority", "status", "owner"}
-
-            # 3. 解析字段 Key
-            fields_to_fetch = []
-
-            for name in needed_fields:
-                # 优先尝试从全量 Map 中直接获取 (最快，O(1))
-                if name in all_fields_map:
-                    fields_to_fetch.append(all_fields_map[name])
-                else:
-                    # 如果 Map 中没有（例如字段名是中文 "优先级" 但我们需要 "priority"），
-                    # 则委托给 MetadataManager 进行智能解析（支持模糊匹配、别名查找等）
-                    try:
-                        key = await self.meta.get_field_key(project_key, type_key, name)
-                        fields_to_fetch.append(key)
-                    except Exception as e:
-                        # 某些非关键字段如果找不到，可以忽略，不影响整体流程
-                        logger.debug(
-                            "Filter API: Optional field '%s' not found: %s", name, e
-                        )
-
-            if fields_to_fetch:
-                # 去重并赋值
-                filter_kwargs["fields"] = list(set(fields_to_fetch))
-
             result = await self.api.filter(
                 project_key=project_key,
                 work_item_type_keys=[type_key],
                 page_num=page_num,
                 page_size=page_size,
-                **filter_kwargs,
+                **plan.filter_kwargs,
+                **projection_kwargs,
             )
 
             # 使用辅助方法标准化返回结果
@@ -2226,30 +4123,31 @@ class WorkItemProvider(Provider):
 
             # 如果 filter API 不支持某些条件，在结果中进一步筛选
             if priority or owner or related_to:
+                # 每个工作项只建立一次字段索引，同时取出 priority 与 owner
+                extractor = ColumnExtractor()
                 filtered_items = []
                 for item in items:
+                    values = extractor.extract_values(item)
+
                     # 检查优先级
                     if priority:
-                        item_priority = self._extract_field_value(item, "priority")
+                        item_priority = values["priority"]
                         if item_priority not in priority:
                             continue
 
-                    # 检查负责人
-                    if owner:
-                        try:
-                            user_key = await self.meta.get_user_key(owner)
-                            item_owner_key = self._extract_field_value(item, "owner")
-                            # 如果提取的是 user_key，直接比较
-                            if item_owner_key and item_owner_key != user_key:
-                                # 尝试匹配名称（owner 字段可能返回名称）
-                                if owner.lower() not in (item_owner_key or "").lower():
-                                    continue
-                        except Exception as e:
-                            logger.debug("Failed to filter by owner '%s': %s", owner, e)
-                            # 如果无法解析 owner，跳过该过滤条件
+                    # 检查负责人（owner_key 在编译计划时已解析，无法解析时跳过该条件）
+                    if owner and plan.owner_key:
+                        item_owner_key = values["owner"]
+                        # 如果提取的是 user_key，直接比较
+                        if item_owner_key and item_owner_key != plan.owner_key:
+                            # 尝试匹配名称（owner 字段可能返回名称）
+                            if owner.lower() not in item_owner_key.lower():
+                                continue
 
                     # 使用辅助方法检查关联工作项
-                    if related_to and not self._is_item_related_to(item, related_to):
+                    if related_to and not self._is_item_related_to(
+                        item, related_to, relation_keys
+                    ):
                         continue
 
                     filtered_items.append(item)
@@ -2272,62 +4170,16 @@ class WorkItemProvider(Provider):
             }
 
         # 没有 name_keyword，使用 search_params API 进行复杂条件查询
-        # 构建搜索条件（使用辅助方法减少重复代码）
-        conditions: List[Dict[str, Any]] = []
-
-        # 处理状态过滤
-        if status:
-            condition = await self._build_filter_condition(
-                project_key, type_key, "status", status
-            )
-            if condition:
-                conditions.append(condition)
-
-        # 处理优先级过滤
-        if priority:
-            condition = await self._build_filter_condition(
-                project_key, type_key, "priority", priority
-            )
-            if condition:
-                conditions.append(condition)
-
-        # 处理负责人过滤
-        if owner:
-            condition = await self._build_owner_filter_condition(
-                project_key, type_key, owner
-            )
-            if condition:
-                conditions.append(condition)
-
-        # 构建 search_group
-        search_group = {
-            "conjunction": "AND",
-            "search_params": conditions,
-            "search_groups": [],
-        }
+        search_group = plan.search_group
 
         logger.info(
             "Querying tasks with %d conditions, page_num=%d, page_size=%d",
-            len(conditions),
+            len(search_group["search_params"]),
             page_num,
             page_size,
         )
         logger.debug("get_tasks: Built search_group: %s", search_group)
 
-        # 构建需要返回的字段列表
-        fields_to_fetch = []
-        if status or priority or owner or related_to:
-            # 我们需要这些字段进行客户端过滤或显示
-            needed_fields = ["priority", "status", "owner"]
-            for field_name in needed_fields:
-                try:
-                    field_key = await self.meta.get_field_key(
-                        project_key, type_key, field_name
-                    )
-                    fields_to_fetch.append(field_key)
-                except Exception as e:
-                    logger.debug("Failed to get field key for '%s': %s", field_name, e)
-
         # 调用 API
         result = await self.api.search_params(
             project_key=project_key,
@@ -2335,7 +4187,7 @@ class WorkItemProvider(Provider):
             search_group=search_group,
             page_num=page_num,
             page_size=page_size,
-            fields=fields_to_fetch if fields_to_fetch else None,
+            fields=fields,
         )
 
         # 使用辅助方法标准化返回结果
@@ -2350,7 +4202,9 @@ class WorkItemProvider(Provider):
         if related_to:
             logger.info("Applying client-side related_to filter: %s", related_to)
             items = [
-                item for item in items if self._is_item_related_to(item, related_to)
+                item
+                for item in items
+                if self._is_item_related_to(item, related_to, relation_keys)
             ]
             logger.info(
                 "Filtered results: %d items after related_to filtering", len(items)
@@ -2363,6 +4217,136 @@ class WorkItemProvider(Provider):
             "page_size": pagination.get("page_size", page_size),
         }
 
+    @staticmethod
+    def _extract_role_owners(item: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        提取工作项的 role_owners 列表
+
+        兼容 fields 中的 role_owners 字段与根目录的 role_owners 两种位置。
+
+        Returns:
+            [{"role": "role_key", "owners": ["user_key"]}]，不存在时返回空列表
+        """
+        for field in item.get("fields", []):
+            if (
+                field.get("field_type_key") == "role_owners"
+                or field.get("field_key") == "role_owners"
+            ):
+                value = field.get("field_value")
+                return value if isinstance(value, list) else []
+        value = item.get("role_owners")
+        return value if isinstance(value, list) else []
+
+    async def resolve_role_owners(
+        self, items: List[Dict[str, Any]]
+    ) -> Dict[Any, List[Dict[str, Any]]]:
+        """
+        整页解析 role_owners 为可读结构
+
+        一次遍历收集整页的角色与人员，人员名称批量查询一次，
+        角色名称按唯一 role_key 各解析一次，避免逐项逐人查询。
+
+        Args:
+            items: 工作项列表（同一项目、同一类型）
+
+        Returns:
+            {item_id: [{"role": 角色名称, "owners": [人员名称]}]}
+        """
+        if not items:
+            return {}
+
+        project_key = await self._get_project_key()
+        type_key = await self._get_type_key()
+
+        role_owners_by_item: Dict[Any, List[Dict[str, Any]]] = {}
+        role_keys: Set[str] = set()
+        user_keys: Set[str] = set()
+        for item in items:
+            entries = [
+                e
+                for e in self._extract_role_owners(item)
+                if isinstance(e, dict) and e.get("role")
+            ]
+            role_owners_by_item[item.get("id")] = entries
+            for entry in entries:
+                role_keys.add(entry["role"])
+                owners = entry.get("owners")
+                if isinstance(owners, list):
+                    user_keys.update(o for o in owners if isinstance(o, str))
+
+        user_map = (
+            await self._get_users_with_cache(list(user_keys)) if user_keys else {}
+        )
+
+        role_names: Dict[str, str] = {}
+        for role_key in role_keys:
+            try:
+                name = await self.meta.get_role_name(project_key, type_key, role_key)
+            except Exception as e:
+                logger.debug("Failed to resolve role name for '%s': %s", role_key, e)
+                name = None
+            role_names[role_key] = name if isinstance(name, str) and name else role_key
+
+        result: Dict[Any, List[Dict[str, Any]]] = {}
+        for item_id, entries in role_owners_by_item.items():
+            result[item_id] = [
+                {
+                    "role": role_names[entry["role"]],
+                    "owners": [
+                        user_map.get(o, o)
+                        for o in (entry.get("owners") or [])
+                        if isinstance(o, str)
+                    ],
+                }
+                for entry in entries
+            ]
+        return result
+
+    async def filter_items_by_role(
+        self, items: List[Dict[str, Any]], role: str, user: str
+    ) -> List[Dict[str, Any]]:
+        """
+        过滤出指定用户在指定角色中的工作项（"我在角色 X 中的工作项"）
+
+        只在内存中比对每个工作项的 role_owners，不做逐项查询。
+        不以项目级角色成员预判：工作项的角色人员可以不是项目级角色成员。
+
+        Args:
+            items: 工作项列表
+            role: 角色名称或 Role Key（如 "经办人"）
+            user: 用户姓名、邮箱或 user_key
+
+        Returns:
+            过滤后的工作项列表
+        """
+        if not items:
+            return []
+
+        project_key = await self._get_project_key()
+        type_key = await self._get_type_key()
+        user_key = await self.meta.get_user_key(user)
+
+        try:
+            role_key = await self.meta.get_role_key(project_key, type_key, role)
+        except Exception:
+            role_key = role
+        target = short_role_key(role_key)
+
+        def matches(entry_role: str) -> bool:
+            return short_role_key(entry_role) == target
+
+        return [
+            item
+            for item in items
+            if any(
+                isinstance(entry, dict)
+                and isinstance(entry.get("role"), str)
+                and matches(entry["role"])
+                and user_key in (entry.get("owners") or [])
+                for entry in self._extract_role_owners(item)
+            )
+        ]
+
     async def list_available_options(self, field_name: str) -> Dict[str, str]:
         """
         列出字段的可用选项
@@ -2393,7 +4377,8 @@ class WorkItemProvider(Provider):
         """
         清理工作项缓存
 
-        当工作项信息发生变化时调用此方法
+        当工作项信息发生变化时调用此方法。
+        注意：工作项名称缓存为进程级共享，会影响所有 Provider 实例。
         """
         self._work_item_cache.clear()
         logger.info("Cleared work item cache")
@@ -2404,7 +4389,8 @@ class WorkItemProvider(Provider):
         """
         self._user_cache.clear()
         self._work_item_cache.clear()
-        logger.info("Cleared all caches (user + work_item)")
+        self._query_cache.clear()
+        logger.info("Cleared all caches (user + work_item + query)")
 
     def invalidate_work_item_cache(self, work_item_id: int) -> None:
         """
@@ -2415,8 +4401,7 @@ class WorkItemProvider(Provider):
         Args:
             work_item_id: 工作项 ID
         """
-        key = str(work_item_id)
-        if self._work_item_cache.delete(key):
+        if self._work_item_cache.delete(work_item_id):
             logger.info("Invalidated work item cache for ID: %d", work_item_id)
         else:
             logger.debug("Work item cache not found for ID: %d", work_item_id)
@@ -0,0 +1,186 @@
+"""
+WriteLimiter - 写入请求的 AIMD 自适应并发控制
+
+固定的 Semaphore(2) 在配额宽裕时浪费吞吐，在多个 Provider 同时写入时又互不知情；
+各调用自己的 429 指数退避也不会让其他在途请求放慢。
+本模块在所有写入路径之间共享一个并发窗口:
+- 加性增长: 每个成功请求使窗口增长 1/窗口，约每轮往返增长 1
+- 乘性下降: 遇到 429 或延迟明显膨胀时窗口乘以 BACKOFF_FACTOR
+
+设计说明:
+- 进程级单例，所有 Provider 共享（频控按租户/插件计算，而不是按 Provider 实例）
+- 每次下降开启新的"轮次"，只有在下降之后发起的请求才能再次触发下降，
+  避免同一波突发的多个 429 把窗口连续减半
+- 延迟基线取观测到的最小延迟（缓慢上漂以适应服务端整体变慢），
+  平滑延迟超过基线 * WRITE_LATENCY_TOLERANCE 视为排队膨胀
+- snapshot() 返回当前窗口与统计，供 /health 等观测
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def is_rate_limited(error: BaseException) -> bool:
+    """判断异常是否为频控 (HTTP 429)"""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code == 429
+    message = str(error)
+    return "429" in message and "Too Many Requests" in message
+
+
+class WriteLimiter:
+    """
+    写入并发窗口（单例）
+
+    单线程异步场景下窗口调整之间没有 await，只有排队等待需要 Condition。
+    """
+
+    _instance: Optional["WriteLimiter"] = None
+
+    # 乘性下降系数
+    BACKOFF_FACTOR = 0.5
+    # 平滑延迟的 EWMA 权重
+    LATENCY_SMOOTHING = 0.2
+    # 延迟基线每次高于基线的采样向上漂移的比例
+    BASELINE_DRIFT = 0.01
+
+    def __init__(
+        self,
+        initial: Optional[int] = None,
+        min_limit: Optional[int] = None,
+        max_limit: Optional[int] = None,
+        latency_tolerance: Optional[float] = None,
+    ):
+        """
+        初始化并发窗口
+
+        Args:
+            initial: 初始窗口（默认取配置）
+            min_limit: 窗口下限（默认取配置）
+            max_limit: 窗口上限（默认取配置）
+            latency_tolerance: 平滑延迟相对基线的容忍倍数（默认取配置，<= 0 禁用）
+        """
+        self.min_limit = max(
+            1, settings.WRITE_CONCURRENCY_MIN if min_limit is None else min_limit
+        )
+        self.max_limit = max(
+            self.min_limit,
+            settings.WRITE_CONCURRENCY_MAX if max_limit is None else max_limit,
+        )
+        start = settings.WRITE_CONCURRENCY_INITIAL if initial is None else initial
+        self.window = float(min(max(start, self.min_limit), self.max_limit))
+        self.latency_tolerance = (
+            settings.WRITE_LATENCY_TOLERANCE
+            if latency_tolerance is None
+            else latency_tolerance
+        )
+
+        self._in_flight = 0
+        self._epoch = 0
+        self._cond = asyncio.Condition()
+        self._baseline: Optional[float] = None
+        self._smoothed: Optional[float] = None
+        self._successes = 0
+        self._rate_limited = 0
+        self._decreases = 0
+
+    @classmethod
+    def get_instance(cls) -> "WriteLimiter":
+        """获取全局单例实例"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """重置单例实例（主要用于测试）"""
+        cls._instance = None
+
+    @property
+    def limit(self) -> int:
+        """当前允许的在途写入数"""
+        return int(self.window)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """
+        占用一个写入名额，并根据请求结果调整窗口
+
+        429 与成功都会反馈给窗口；其他异常（参数错误等）不影响窗口。
+        """
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        epoch = self._epoch
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            yield
+        except Exception as e:
+            if is_rate_limited(e):
+                self._rate_limited += 1
+                self._decrease(epoch, "rate limited (429)")
+            raise
+        else:
+            self._on_success(epoch, loop.time() - started)
+        finally:
+            async with self._cond:
+                self._in_flight -= 1
+                # 窗口可能增长，唤醒所有等待者重新判断
+                self._cond.notify_all()
+
+    def _on_success(self, epoch: int, latency: float) -> None:
+        self._successes += 1
+        if self._baseline is None or latency < self._baseline:
+            self._baseline = latency
+        else:
+            self._baseline += (latency - self._baseline) * self.BASELINE_DRIFT
+        if self._smoothed is None:
+            self._smoothed = latency
+        else:
+            self._smoothed += (latency - self._smoothed) * self.LATENCY_SMOOTHING
+
+        if (
+            self.latency_tolerance > 0
+            and self._smoothed > self._baseline * self.latency_tolerance
+        ):
+            self._decrease(epoch, f"latency {self._smoothed:.2f}s")
+            return
+        self.window = min(float(self.max_limit), self.window + 1 / self.window)
+
+    def _decrease(self, epoch: int, reason: str) -> None:
+        """乘性下降；同一轮次内发起的请求只触发一次"""
+        if epoch != self._epoch:
+            return
+        self._epoch += 1
+        self._decreases += 1
+        # 下降后重新测量平滑延迟，避免旧的高延迟样本连续触发下降
+        self._smoothed = None
+        previous = self.window
+        self.window = max(float(self.min_limit), self.window * self.BACKOFF_FACTOR)
+        logger.info(
+            "Write concurrency %.1f -> %.1f (%s)", previous, self.window, reason
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """返回当前窗口与统计信息"""
+        return {
+            "window": round(self.window, 2),
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "baseline_latency": self._baseline,
+            "smoothed_latency": self._smoothed,
+            "successes": self._successes,
+            "rate_limited": self._rate_limited,
+            "decreases": self._decreases,
+        }
@@ -1,3 +1,4 @@
+from .bulk_import import BulkImporter
 from .issue_service import IssueService
 
-__all__ = ["IssueService"]
+__all__ = ["BulkImporter", "IssueService"]
@@ -0,0 +1,411 @@
+"""
+批量导入 - 流式读取 JSONL/CSV 编辑文件并批量写入工作项
+
+文件每行（CSV 每条记录）描述一次字段编辑:
+    {"work_item": "SR6D2VA-7552-Lark", "field": "Wi-Fi Module", "value": "MT7668BSN"}
+    {"work_item": 12345, "field": "priority", "value": "P1"}
+
+CSV 需包含表头 work_item,field,value。work_item 为纯数字时视为工作项 ID，否则按名称精确匹配。
+
+处理流程（按块，每块 chunk_size 行）:
+1. 块内名称一次批量解析为 ID（跨块缓存，同一名称只解析一次）
+2. 块内编辑交给 WorkItemProvider.bulk_update_issues：每个不同取值只解析一次，
+   相同取值合并为 batch_update，其余按工作项合并为一次多字段 update
+3. 块完成后原子写入检查点（已完成行数与计数）
+
+中断后以相同参数重新运行即从检查点继续，已完成的块不再重复写入；
+中断时正在处理的块会整体重做（字段写入为覆盖写入，重复执行不影响结果）。
+检查点记录目标 project_key/type_key，目标不同时拒绝续传（否则已完成的行会被跳过）。
+全部完成后删除检查点。
+
+命令行:
+    python -m src.services.bulk_import edits.jsonl --project "Project Management" \\
+        --work-item-type "项目管理"
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from src.providers.lark_project.work_item_provider import WorkItemProvider
+
+logger = logging.getLogger(__name__)
+
+# 每块处理的行数
+DEFAULT_CHUNK_SIZE = 500
+# 报告中保留的失败行数上限（计数不受限制）
+MAX_REPORTED_FAILURES = 200
+
+SUPPORTED_FORMATS = ("jsonl", "csv")
+
+# (project, work_item_type) -> WorkItemProvider
+ProviderFactory = Callable[[Optional[str], Optional[str]], WorkItemProvider]
+
+
+class ImportRow(NamedTuple):
+    """单行编辑（row 为从 1 开始的数据行序号）"""
+
+    row: int
+    work_item: str
+    field: str
+    value: Any
+    error: Optional[str] = None  # 行格式错误时的说明
+
+
+def detect_format(path: Path, fmt: Optional[str] = None) -> str:
+    """
+    确定文件格式（显式指定优先，其次按扩展名）
+
+    Raises:
+        ValueError: 不支持的格式
+    """
+    fmt = (fmt or path.suffix.lstrip(".")).lower()
+    if fmt == "json":
+        fmt = "jsonl"
+    if fmt not in SUPPORTED_FORMATS:
+        raise ValueError(f"不支持的导入格式: {fmt}，支持: {list(SUPPORTED_FORMATS)}")
+    return fmt
+
+
+def _to_row(row: int, record: Any) -> ImportRow:
+    """将单条记录转换为 ImportRow，字段缺失时记录错误而不是抛出异常"""
+    if not isinstance(record, dict):
+        return ImportRow(row, "", "", None, "记录必须是对象")
+    work_item = str(record.get("work_item") or "").strip()
+    field = str(record.get("field") or "").strip()
+    if not work_item or not field:
+        return ImportRow(row, work_item, field, None, "缺少 work_item 或 field")
+    return ImportRow(row, work_item, field, record.get("value"))
+
+
+def iter_rows(path: Path, fmt: str) -> Iterator[ImportRow]:
+    """
+    流式读取编辑文件，逐行产出 ImportRow（空行跳过且不计数）
+
+    Args:
+        path: 文件路径
+        fmt: "jsonl" 或 "csv"
+
+    Yields:
+        ImportRow
+    """
+    with path.open(encoding="utf-8-sig", newline="") as f:
+        if fmt == "csv":
+            for row, record in enumerate(csv.DictReader(f), start=1):
+                yield _to_row(row, record)
+            return
+
+        row = 0
+        for line in f:
+            if not line.strip():
+                continue
+            row += 1
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield ImportRow(row, "", "", None, f"JSON 解析失败: {e}")
+                continue
+            yield _to_row(row, record)
+
+
+class BulkImporter:
+    """
+    编辑文件导入器
+
+    Attributes:
+        provider: 目标项目/类型的 WorkItemProvider
+        chunk_size: 每块处理的行数
+    """
+
+    def __init__(
+        self, provider: WorkItemProvider, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ):
+        self.provider = provider
+        self.chunk_size = max(1, chunk_size)
+        # 名称 -> 工作项 ID（None 表示未找到），跨块复用
+        self._name_ids: Dict[str, Optional[int]] = {}
+
+    @staticmethod
+    def checkpoint_path_for(path: Path) -> Path:
+        """默认检查点路径: 与导入文件同目录的 <文件名>.checkpoint.json"""
+        return path.with_name(path.name + ".checkpoint.json")
+
+    @staticmethod
+    def _load_checkpoint(
+        checkpoint: Path, source: Path, project_key: str, type_key: str
+    ) -> Dict[str, Any]:
+        """
+        读取检查点；不存在、损坏或与源文件不匹配时从头开始
+
+        Raises:
+            ValueError: 检查点属于其他项目/类型（续传会跳过目标中从未写入的行）
+        """
+        fresh: Dict[str, Any] = {
+            "source": str(source.resolve()),
+            "size": source.stat().st_size,
+            "project_key": project_key,
+            "type_key": type_key,
+            "rows_done": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "upstream_calls": 0,
+        }
+        if not checkpoint.exists():
+            return fresh
+        try:
+            state = json.loads(checkpoint.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable checkpoint %s: %s", checkpoint, e)
+            return fresh
+        if state.get("source") != fresh["source"] or state.get("size") != fresh["size"]:
+            logger.warning(
+                "Checkpoint %s does not match source, restarting", checkpoint
+            )
+            return fresh
+        if (state.get("project_key"), state.get("type_key")) != (project_key, type_key):
+            raise ValueError(
+                f"检查点 {checkpoint} 属于项目 {state.get('project_key')} / 类型 "
+                f"{state.get('type_key')}，与本次导入目标 {project_key} / {type_key} "
+                "不一致；请删除检查点后重新导入"
+            )
+        return state
+
+    @staticmethod
+    def _save_checkpoint(checkpoint: Path, state: Dict[str, Any]) -> None:
+        """原子写入检查点（先写临时文件再替换）"""
+        tmp = checkpoint.with_name(checkpoint.name + ".tmp")
+        tmp.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, checkpoint)
+
+    async def run(
+        self,
+        path: Path,
+        fmt: Optional[str] = None,
+        checkpoint: Optional[Path] = None,
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        导入编辑文件
+
+        Args:
+            path: JSONL/CSV 文件路径
+            fmt: 文件格式（可选，默认按扩展名判断）
+            checkpoint: 检查点路径（可选，默认 <文件名>.checkpoint.json）
+            dry_run: 只解析并生成写入计划，不执行写入、不写检查点
+
+        Returns:
+            {
+                "rows_total": 10000,     # 文件总行数
+                "rows_resumed": 4000,    # 从检查点跳过的行数
+                "succeeded": 9990,       # 累计成功行数（含检查点之前）
+                "failed": 10,            # 累计失败行数（含检查点之前）
+                "upstream_calls": 120,   # 累计预计的上游请求数（含任务轮询）
+                "failures": [{"row", "work_item", "field", "message"}],  # 本次运行
+                "dry_run": False,
+            }
+        """
+        path = Path(path)
+        fmt = detect_format(path, fmt)
+        checkpoint = checkpoint or self.checkpoint_path_for(path)
+        project_key, type_key = await self.provider.get_target_keys()
+        state = self._load_checkpoint(checkpoint, path, project_key, type_key)
+        resumed = state["rows_done"] if not dry_run else 0
+        if resumed:
+            logger.info("Resuming import of %s after row %d", path, resumed)
+
+        failures: List[Dict[str, Any]] = []
+        rows_total = 0
+        chunk: List[ImportRow] = []
+
+        async def flush() -> None:
+            outcomes, calls = await self._process_chunk(chunk, dry_run)
+            for row, message in outcomes:
+                if message is None:
+                    state["succeeded"] += 1
+                    continue
+                state["failed"] += 1
+                if len(failures) < MAX_REPORTED_FAILURES:
+                    failures.append(
+                        {
+                            "row": row.row,
+                            "work_item": row.work_item,
+                            "field": row.field,
+                            "message": message,
+                        }
+                    )
+            state["upstream_calls"] += calls
+            state["rows_done"] = chunk[-1].row
+            if not dry_run:
+                self._save_checkpoint(checkpoint, state)
+            logger.info(
+                "Import progress: %d rows done (%d failed)",
+                state["rows_done"],
+                state["failed"],
+            )
+            chunk.clear()
+
+        for row in iter_rows(path, fmt):
+            rows_total = row.row
+            if row.row <= resumed:
+                continue
+            chunk.append(row)
+            if len(chunk) >= self.chunk_size:
+                await flush()
+        if chunk:
+            await flush()
+
+        if not dry_run and checkpoint.exists():
+            checkpoint.unlink()
+        return {
+            "rows_total": rows_total,
+            "rows_resumed": resumed,
+            "succeeded": state["succeeded"],
+            "failed": state["failed"],
+            "upstream_calls": state["upstream_calls"],
+            "failures": failures,
+            "dry_run": dry_run,
+        }
+
+    async def _resolve_ids(self, rows: List[ImportRow]) -> None:
+        """批量解析块内尚未解析过的工作项名称"""
+        names = [
+            r.work_item
+            for r in rows
+            if not r.error
+            and not r.work_item.isdigit()
+            and r.work_item not in self._name_ids
+        ]
+        if not names:
+            return
+        resolved = await self.provider.resolve_work_item_names(names)
+        for name in names:
+            self._name_ids[name] = resolved.get(name)
+
+    def _issue_id(self, row: ImportRow) -> Optional[int]:
+        if row.work_item.isdigit():
+            return int(row.work_item)
+        return self._name_ids.get(row.work_item)
+
+    async def _process_chunk(
+        self, rows: List[ImportRow], dry_run: bool
+    ) -> Tuple[List[Tuple[ImportRow, Optional[str]]], int]:
+        """
+        处理一块编辑
+
+        Returns:
+            ([(行, 失败信息或 None)], 计划的上游写请求数)
+        """
+        await self._resolve_ids(rows)
+
+        outcomes: List[Tuple[ImportRow, Optional[str]]] = []
+        pending: List[Tuple[ImportRow, int]] = []
+        for row in rows:
+            if row.error:
+                outcomes.append((row, row.error))
+                continue
+            issue_id = self._issue_id(row)
+            if issue_id is None:
+                outcomes.append((row, f"未找到名称唯一匹配 '{row.work_item}' 的工作项"))
+                continue
+            pending.append((row, issue_id))
+
+        if not pending:
+            return outcomes, 0
+
+        report = await self.provider.bulk_update_issues(
+            [(issue_id, {row.field: row.value}) for row, issue_id in pending],
+            dry_run=dry_run,
+        )
+        results = {(r.issue_id, r.field_name): r for r in report["results"]}
+        for row, issue_id in pending:
+            result = results.get((issue_id, row.field))
+            if result is None:
+                # dry_run 时没有写入结果，未出现在失败结果中即视为可写入
+                message = None if dry_run else "未返回写入结果"
+            else:
+                message = None if result.success else result.message
+            outcomes.append((row, message))
+        return outcomes, report["planned_calls"]
+
+
+def _cli_provider(
+    project: Optional[str] = None, work_item_type: Optional[str] = None
+) -> WorkItemProvider:
+    """命令行入口的 Provider 构建（"project_" 开头视为 project_key，否则为项目名称）"""
+    kwargs: Dict[str, str] = {}
+    if work_item_type:
+        kwargs["work_item_type_name"] = work_item_type
+    if project:
+        key = "project_key" if project.startswith("project_") else "project_name"
+        kwargs[key] = project
+    return WorkItemProvider(**kwargs)
+
+
+async def import_file(
+    path: Path,
+    provider_factory: ProviderFactory,
+    project: Optional[str] = None,
+    work_item_type: Optional[str] = None,
+    fmt: Optional[str] = None,
+    checkpoint: Optional[Path] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """
+    导入编辑文件到指定项目/类型（CLI 与 HTTP 接口共用）
+
+    Args:
+        path: JSONL/CSV 文件路径
+        provider_factory: (project, work_item_type) -> WorkItemProvider，
+            由调用方提供（MCP/HTTP 传入共享实例池的构建函数）
+        project: 项目名称或 project_key（可选，默认 FEISHU_PROJECT_KEY）
+        work_item_type: 工作项类型名称（可选）
+        fmt: 文件格式（可选）
+        checkpoint: 检查点路径（可选）
+        chunk_size: 每块处理的行数
+        dry_run: 只生成写入计划
+
+    Returns:
+        BulkImporter.run 的报告
+    """
+    provider = provider_factory(project, work_item_type)
+    importer = BulkImporter(provider, chunk_size=chunk_size)
+    return await importer.run(Path(path), fmt, checkpoint, dry_run)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """命令行入口"""
+    parser = argparse.ArgumentParser(
+        description="从 JSONL/CSV 编辑文件批量更新飞书项目工作项（支持断点续传）"
+    )
+    parser.add_argument("path", help="编辑文件路径 (.jsonl / .csv)")
+    parser.add_argument("--project", help="项目名称或 project_key")
+    parser.add_argument("--work-item-type", help="工作项类型名称")
+    parser.add_argument("--format", choices=SUPPORTED_FORMATS, help="文件格式")
+    parser.add_argument("--checkpoint", help="检查点文件路径")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--dry-run", action="store_true", help="只生成写入计划")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(
+        import_file(
+            Path(args.path),
+            _cli_provider,
+            project=args.project,
+            work_item_type=args.work_item_type,
+            fmt=args.format,
+            checkpoint=Path(args.checkpoint) if args.checkpoint else None,
+            chunk_size=args.chunk_size,
+            dry_run=args.dry_run,
+        )
+    )
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -107,3 +107,25 @@ def mock_settings_env(request, monkeypatch):
     monkeypatch.setattr(settings, "FEISHU_PROJECT_USER_TOKEN", "mock_static_token_for_tests")
     monkeypatch.setattr(settings, "FEISHU_PROJECT_PLUGIN_ID", "mock_plugin_id")
     monkeypatch.setattr(settings, "FEISHU_PROJECT_PLUGIN_SECRET", "mock_plugin_secret")
+
+
+@pytest.fixture(autouse=True)
+def reset_work_item_cache():
+    """重置进程级工作项名称缓存、定位索引、查询结果缓存、更新合并队列与写入并发窗口，避免用例之间共享状态。"""
+    from src.providers.lark_project.query_result_cache import QueryResultCache
+    from src.providers.lark_project.update_coalescer import UpdateCoalescer
+    from src.providers.lark_project.work_item_cache import WorkItemCache
+    from src.providers.lark_project.work_item_locator import WorkItemLocator
+    from src.providers.lark_project.write_limiter import WriteLimiter
+
+    WorkItemCache.reset_instance()
+    WorkItemLocator.reset_instance()
+    QueryResultCache.reset_instance()
+    UpdateCoalescer.reset_instance()
+    WriteLimiter.reset_instance()
+    yield
+    WorkItemCache.reset_instance()
+    WorkItemLocator.reset_instance()
+    QueryResultCache.reset_instance()
+    UpdateCoalescer.reset_instance()
+    WriteLimiter.reset_instance()
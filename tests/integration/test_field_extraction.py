@@ -5,6 +5,7 @@
 
 import pytest
 
+from src.providers.lark_project.field_resolver import FieldResolver
 from src.providers.lark_project.work_item_provider import WorkItemProvider
 from tests.integration.conftest import TEST_PROJECT_KEY, skip_without_credentials
 
@@ -66,28 +67,28 @@ async def test_field_extraction():
     }
 
     print("\n1. 测试新格式字段提取:")
-    priority = provider._extract_field_value(test_item_new, "priority")
-    owner = provider._extract_field_value(test_item_new, "owner")
-    status = provider._extract_field_value(test_item_new, "status")
+    priority = FieldResolver.extract_field_value(test_item_new, "priority")
+    owner = FieldResolver.extract_field_value(test_item_new, "owner")
+    status = FieldResolver.extract_field_value(test_item_new, "status")
 
     print(f"   优先级: {priority} (期望: 'P0')")
     print(f"   负责人: {owner} (期望: 'user_123')")
     print(f"   状态: {status} (期望: '进行中')")
 
     print("\n2. 测试旧格式字段提取:")
-    priority2 = provider._extract_field_value(test_item_old, "priority")
-    owner2 = provider._extract_field_value(test_item_old, "owner")
+    priority2 = FieldResolver.extract_field_value(test_item_old, "priority")
+    owner2 = FieldResolver.extract_field_value(test_item_old, "owner")
 
     print(f"   优先级: {priority2} (期望: 'P1')")
     print(f"   负责人: {owner2} (期望: 'user_456')")
 
     print("\n3. 测试实际API格式字段提取:")
-    priority3 = provider._extract_field_value(test_item_realistic, "priority")
+    priority3 = FieldResolver.extract_field_value(test_item_realistic, "priority")
     print(f"   优先级: {priority3} (期望: 'P1')")
 
     # 测试字段不存在的情况
     print("\n4. 测试不存在的字段:")
-    nonexistent = provider._extract_field_value(test_item_new, "nonexistent_field")
+    nonexistent = FieldResolver.extract_field_value(test_item_new, "nonexistent_field")
     print(f"   不存在的字段: {nonexistent} (期望: None)")
 
     # 测试实际API调用
@@ -102,7 +103,7 @@ async def test_field_extraction():
         print(f"字段数量: {len(detail.get('fields', []))}")
 
         # 提取优先级
-        extracted_priority = provider._extract_field_value(detail, "priority")
+        extracted_priority = FieldResolver.extract_field_value(detail, "priority")
         print(f"提取的优先级: {extracted_priority}")
 
         # 查找priority字段
@@ -7,6 +7,7 @@ import logging
 import pytest
 
 
+from src.providers.lark_project.field_resolver import FieldResolver
 from src.providers.lark_project.work_item_provider import WorkItemProvider
 from tests.integration.conftest import TEST_PROJECT_KEY, skip_without_credentials
 
@@ -46,7 +47,7 @@ async def test_priority_extraction():
                 try:
                     detail = await provider.get_issue_details(item["id"])
                     print(
-                        f"  原始数据优先级字段: {provider._extract_field_value(detail, 'priority')}"
+                        f"  原始数据优先级字段: {FieldResolver.extract_field_value(detail, 'priority')}"
                     )
 
                     # 检查fields结构
@@ -63,7 +64,7 @@ async def test_priority_extraction():
 
         traceback.print_exc()
 
-    print("\n2. 测试_extract_field_value方法...")
+    print("\n2. 测试 FieldResolver.extract_field_value 方法...")
     # 模拟一个工作项数据
     test_item = {
         "id": 12345,
@@ -77,7 +78,7 @@ async def test_priority_extraction():
         ],
     }
 
-    priority_value = provider._extract_field_value(test_item, "priority")
+    priority_value = FieldResolver.extract_field_value(test_item, "priority")
     print(f"测试提取优先级: {priority_value} (期望: 'P0')")
 
     # 测试另一个结构
@@ -92,7 +93,7 @@ async def test_priority_extraction():
         ],
     }
 
-    priority_value2 = provider._extract_field_value(test_item2, "priority")
+    priority_value2 = FieldResolver.extract_field_value(test_item2, "priority")
     print(f"测试提取优先级(旧格式): {priority_value2} (期望: 'P1')")
 
 
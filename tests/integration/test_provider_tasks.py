@@ -6,6 +6,7 @@
 import json
 import pytest
 
+from src.providers.lark_project.field_resolver import FieldResolver
 from src.providers.lark_project.work_item_provider import WorkItemProvider
 from tests.integration.conftest import TEST_PROJECT_KEY, skip_without_credentials
 
@@ -94,7 +95,7 @@ async def test_provider_tasks():
                                 if field.get("field_key") == "priority":
                                     print(f"  原始优先级字段: {field}")
                                     print(
-                                        f"  提取的优先级: {provider._extract_field_value(raw_item, 'priority')}"
+                                        f"  提取的优先级: {FieldResolver.extract_field_value(raw_item, 'priority')}"
                                     )
                             break
 
@@ -132,5 +133,5 @@ async def test_provider_tasks():
     print(f"简化结果: {simplified}")
 
     # 测试提取
-    priority = provider._extract_field_value(test_raw_item, "priority")
+    priority = FieldResolver.extract_field_value(test_raw_item, "priority")
     print(f"提取的优先级: {priority}")
@@ -0,0 +1,194 @@
+"""
+JobManager 单元测试
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.core.context import report_results, report_total
+from src.core.jobs import (
+    CANCELLED,
+    FAILED,
+    INTERRUPTED,
+    QUEUED,
+    RUNNING,
+    SUCCEEDED,
+    Job,
+    JobManager,
+)
+from src.providers.lark_project.work_item_provider import UpdateResult
+
+
+async def _wait_for(job, *statuses, timeout=2.0):
+    """轮询直到任务进入指定状态"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while job.status not in statuses:
+        assert loop.time() < deadline, f"job stuck in {job.status}"
+        await asyncio.sleep(0.01)
+
+
+class TestJobManager:
+    """JobManager 测试类"""
+
+    @pytest.mark.asyncio
+    async def test_job_reports_progress_and_result(self, tmp_path):
+        """工具上报的进度与部分结果记录在任务上，完成后持久化"""
+
+        async def runner(tool_name, parameters):
+            report_total(2)
+            report_results([UpdateResult(True, 1, "priority", "更新成功")])
+            report_results([UpdateResult(False, 2, "priority", "选项不存在")])
+            return {"tool": tool_name, "n": parameters["n"]}
+
+        manager = JobManager(runner, str(tmp_path))
+        await manager.start()
+        try:
+            job = manager.submit("batch_update_tasks", {"n": 1})
+            await _wait_for(job, SUCCEEDED)
+        finally:
+            await manager.stop()
+
+        assert job.total == 2 and job.done == 2
+        assert job.partial_results[1]["success"] is False
+        assert job.result == {"tool": "batch_update_tasks", "n": 1}
+        saved = json.loads((tmp_path / f"{job.id}.json").read_text())
+        assert saved["status"] == SUCCEEDED
+        assert saved["partial_results"][0]["issue_id"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_job_records_error(self, tmp_path):
+        async def runner(tool_name, parameters):
+            raise RuntimeError("boom")
+
+        manager = JobManager(runner, str(tmp_path))
+        await manager.start()
+        try:
+            job = manager.submit("get_tasks", {})
+            await _wait_for(job, FAILED)
+        finally:
+            await manager.stop()
+
+        assert job.error == "boom"
+
+    @pytest.mark.asyncio
+    async def test_cancel_running_and_queued_jobs(self, tmp_path):
+        """运行中的任务取消其协程，排队中的任务不再执行"""
+        started = asyncio.Event()
+        calls = []
+
+        async def runner(tool_name, parameters):
+            calls.append(parameters["n"])
+            started.set()
+            await asyncio.sleep(10)
+
+        manager = JobManager(runner, str(tmp_path), workers=1)
+        await manager.start()
+        try:
+            running = manager.submit("batch_update_tasks", {"n": 1})
+            queued = manager.submit("batch_update_tasks", {"n": 2})
+            await started.wait()
+
+            manager.cancel(queued.id)
+            manager.cancel(running.id)
+            await _wait_for(running, CANCELLED)
+        finally:
+            await manager.stop()
+
+        assert queued.status == CANCELLED
+        assert calls == [1]
+        assert manager.cancel("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_restart_requeues_queued_and_interrupts_running(self, tmp_path):
+        """重启后排队中的任务重新执行，运行中的任务标记为 interrupted 不重跑"""
+        queued = Job("get_tasks", {"n": 1})
+        running = Job("batch_update_tasks", {"n": 2})
+        running.status = RUNNING
+        for job in (queued, running):
+            (tmp_path / f"{job.id}.json").write_text(json.dumps(job.to_dict()))
+        assert queued.status == QUEUED
+
+        calls = []
+
+        async def runner(tool_name, parameters):
+            calls.append(parameters["n"])
+            return "ok"
+
+        manager = JobManager(runner, str(tmp_path))
+        await manager.start()
+        try:
+            await _wait_for(manager.get(queued.id), SUCCEEDED)
+        finally:
+            await manager.stop()
+
+        assert manager.get(running.id).status == INTERRUPTED
+        assert calls == [1]
+
+    @pytest.mark.asyncio
+    async def test_user_key_not_persisted_and_scopes_access(self, tmp_path):
+        """user_key 只在执行时注入，落盘的只有哈希；其他用户无法查询或取消"""
+        seen = []
+
+        async def runner(tool_name, parameters):
+            seen.append(parameters.get("user_key"))
+            return "ok"
+
+        manager = JobManager(runner, str(tmp_path))
+        await manager.start()
+        try:
+            job = manager.submit("get_tasks", {"n": 1}, user_key="secret_user_a")
+            await _wait_for(job, SUCCEEDED)
+        finally:
+            await manager.stop()
+
+        assert seen == ["secret_user_a"]
+        assert "secret_user_a" not in (tmp_path / f"{job.id}.json").read_text()
+        assert manager.get(job.id, "secret_user_a") is job
+        assert manager.get(job.id, "user_b") is None
+        assert manager.get(job.id) is None
+        assert manager.cancel(job.id, "user_b") is None
+
+    def test_anonymous_job_hidden_from_identified_callers(self, tmp_path):
+        """匿名提交的任务不能被带 user_key 的调用方查询或取消"""
+        manager = JobManager(AsyncMock(), str(tmp_path))
+        job = manager.submit("get_tasks", {"n": 1})
+
+        assert manager.get(job.id) is job
+        assert manager.get(job.id, "user_b") is None
+        assert manager.cancel(job.id, "user_b") is None
+        assert job.status == QUEUED
+
+    def test_partial_results_are_capped(self, monkeypatch):
+        """只保留最近的部分结果，计数覆盖全部结果，偏移量按绝对位置计算"""
+        monkeypatch.setattr(Job, "MAX_PARTIAL_RESULTS", 3)
+        job = Job("batch_update_tasks", {})
+
+        job.advance([UpdateResult(i % 2 == 0, i, "priority", "") for i in range(5)])
+
+        assert job.done == 5 and job.failed == 2
+        assert job.results_dropped == 2
+        assert [r["issue_id"] for r in job.partial_results] == [2, 3, 4]
+        assert [r["issue_id"] for r in job.results_since(4)] == [4]
+        assert [r["issue_id"] for r in job.results_since(0)] == [2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_restart_does_not_run_owned_job_without_identity(self, tmp_path):
+        """重启后带归属的排队任务无法恢复身份，标记为 interrupted 而不是匿名执行"""
+        owned = Job("get_tasks", {"n": 1}, user_key="secret_user_a")
+        (tmp_path / f"{owned.id}.json").write_text(json.dumps(owned.to_dict()))
+        calls = []
+
+        async def runner(tool_name, parameters):
+            calls.append(parameters)
+
+        manager = JobManager(runner, str(tmp_path))
+        await manager.start()
+        await manager.stop()
+
+        restored = manager.get(owned.id, "secret_user_a")
+        assert restored.status == INTERRUPTED
+        assert calls == []
@@ -0,0 +1,79 @@
+"""
+ProviderPool 单元测试
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.core.provider_pool import ProviderPool
+
+
+class TestProviderPool:
+    """ProviderPool 测试类"""
+
+    def test_reuses_instance_for_same_key(self):
+        """相同 key 复用同一实例"""
+        pool = ProviderPool(max_size=4, ttl=600)
+        first = pool.get(("proj", "需求"), object)
+        second = pool.get(("proj", "需求"), object)
+
+        assert first is second
+        assert pool.stats()["hits"] == 1
+        assert pool.stats()["misses"] == 1
+
+    def test_different_keys_get_different_instances(self):
+        """不同 key 创建不同实例"""
+        pool = ProviderPool(max_size=4, ttl=600)
+        a = pool.get(("proj", "需求"), object)
+        b = pool.get(("proj", "缺陷"), object)
+
+        assert a is not b
+        assert len(pool) == 2
+
+    def test_lru_eviction_when_full(self):
+        """超过容量时淘汰最久未使用的实例"""
+        pool = ProviderPool(max_size=2, ttl=600)
+        a = pool.get("a", object)
+        pool.get("b", object)
+        # 访问 a，使 b 成为最久未使用
+        pool.get("a", object)
+        pool.get("c", object)
+
+        assert len(pool) == 2
+        assert pool.get("a", object) is a
+        assert pool.invalidate("b") is False
+
+    def test_ttl_expiry_rebuilds_instance(self):
+        """超过 TTL 的实例被重建"""
+        pool = ProviderPool(max_size=4, ttl=10)
+        with patch("src.core.provider_pool.time.time", return_value=1000.0):
+            first = pool.get("k", object)
+        with patch("src.core.provider_pool.time.time", return_value=1011.0):
+            second = pool.get("k", object)
+
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_instance_on_event_loop_change(self):
+        """事件循环变化时重建实例（Provider 内部锁绑定事件循环）"""
+        pool = ProviderPool(max_size=4, ttl=600)
+        outside = await asyncio.to_thread(pool.get, "k", object)
+        inside = pool.get("k", object)
+
+        assert outside is not inside
+        assert pool.get("k", object) is inside
+
+    def test_invalidate_and_clear(self):
+        """invalidate 移除单个实例，clear 清空全部"""
+        pool = ProviderPool(max_size=4, ttl=600)
+        pool.get("a", object)
+        pool.get("b", object)
+
+        assert pool.invalidate("a") is True
+        assert len(pool) == 1
+
+        pool.clear()
+        assert len(pool) == 0
+        assert pool.stats()["hits"] == 0
@@ -6,6 +6,7 @@ FieldAPI 测试模块
 2. create_field - 正常响应、错误处理
 3. update_field - 正常响应、错误处理
 4. get_work_item_relations - 正常响应、错误处理
+5. get_relation_rules - 正常响应、错误处理
 """
 
 import pytest
@@ -254,3 +255,32 @@ class TestGetWorkItemRelations:
             await api.get_work_item_relations("no_access_project")
 
         assert "获取工作项关系列表失败" in str(exc_info.value)
+
+
+class TestGetRelationRules:
+    """测试 get_relation_rules 方法"""
+
+    @pytest.mark.asyncio
+    async def test_get_relation_rules_success(self, api, mock_client):
+        """测试正常获取空间关联规则"""
+        mock_client.post.return_value = create_mock_response(
+            {"err_code": 0, "data": [{"id": "rule_1", "name": "关联项目"}]}
+        )
+
+        result = await api.get_relation_rules("test_project")
+
+        assert result[0]["name"] == "关联项目"
+        call_args = mock_client.post.call_args
+        assert call_args[0][0] == "/open_api/test_project/relation/rules"
+
+    @pytest.mark.asyncio
+    async def test_get_relation_rules_error(self, api, mock_client):
+        """测试 API 错误处理"""
+        mock_client.post.return_value = create_mock_response(
+            {"err_code": 10001, "err_msg": "无权限"}
+        )
+
+        with pytest.raises(Exception) as exc_info:
+            await api.get_relation_rules("project")
+
+        assert "获取空间关联规则失败" in str(exc_info.value)
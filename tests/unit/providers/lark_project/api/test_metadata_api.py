@@ -6,6 +6,7 @@ MetadataAPI 测试模块
 2. get_business_lines - 正常响应、错误处理
 3. get_work_item_type_config - 正常响应、错误处理
 4. get_workflow_templates - 正常响应、错误处理
+5. get_template_detail - 正常响应、错误处理
 """
 
 import pytest
@@ -212,3 +213,43 @@ class TestGetWorkflowTemplates:
             await api.get_workflow_templates("project", "type")
 
         assert "获取流程模板列表失败" in str(exc_info.value)
+
+
+class TestGetTemplateDetail:
+    """测试 get_template_detail 方法"""
+
+    @pytest.mark.asyncio
+    async def test_get_template_detail_success(self, api, mock_client):
+        """测试正常获取流程模板详情"""
+        mock_client.get.return_value = create_mock_response(
+            {
+                "err_code": 0,
+                "data": {
+                    "template_id": 1,
+                    "state_flow_confs": [{"state_key": "open", "name": "待处理"}],
+                    "connections": [
+                        {"source_state_key": "open", "target_state_key": "closed"}
+                    ],
+                },
+            }
+        )
+
+        result = await api.get_template_detail("test_project", 1)
+
+        assert result["template_id"] == 1
+        assert len(result["connections"]) == 1
+
+        call_args = mock_client.get.call_args
+        assert call_args[0][0] == "/open_api/test_project/template_detail/1"
+
+    @pytest.mark.asyncio
+    async def test_get_template_detail_error(self, api, mock_client):
+        """测试 API 错误处理"""
+        mock_client.get.return_value = create_mock_response(
+            {"err_code": 10004, "err_msg": "模板不存在"}
+        )
+
+        with pytest.raises(Exception) as exc_info:
+            await api.get_template_detail("project", 999)
+
+        assert "获取流程模板详情失败" in str(exc_info.value)
@@ -72,6 +72,15 @@ class TestQuery:
         assert len(result) == 1
         assert result[0]["id"] == 1
 
+    @pytest.mark.asyncio
+    async def test_query_with_fields(self, api, mock_client):
+        """测试字段投影"""
+        mock_client.post.return_value = _create_response({"err_code": 0, "data": []})
+
+        await api.query("pk", "tk", [1], fields=["priority"])
+
+        assert mock_client.post.call_args[1]["json"]["fields"] == ["priority"]
+
 
 class TestUpdate:
     """测试 update 方法"""
@@ -99,6 +108,34 @@ class TestDelete:
         mock_client.delete.assert_awaited_once()
 
 
+class TestGetTaskResult:
+    """测试 get_task_result 方法"""
+
+    @pytest.mark.asyncio
+    async def test_get_task_result_success(self, api, mock_client):
+        """测试查询批量更新任务结果"""
+        mock_client.get.return_value = _create_response(
+            {"err_code": 0, "data": {"status": "success"}}
+        )
+
+        result = await api.get_task_result("task_1")
+
+        assert result["status"] == "success"
+        args = mock_client.get.call_args
+        assert args[0][0] == "/open_api/task_result"
+        assert args[1]["params"] == {"task_id": "task_1"}
+
+    @pytest.mark.asyncio
+    async def test_get_task_result_error(self, api, mock_client):
+        """测试业务错误时抛出异常"""
+        mock_client.get.return_value = _create_response(
+            {"err_code": 1, "err_msg": "task not found"}
+        )
+
+        with pytest.raises(Exception, match="查询批量任务结果失败"):
+            await api.get_task_result("task_1")
+
+
 class TestFilter:
     """测试 filter 方法"""
 
@@ -13,7 +13,10 @@ MetadataManager 测试模块
 
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
-from src.providers.lark_project.managers.metadata_manager import MetadataManager
+from src.providers.lark_project.managers.metadata_manager import (
+    MetadataManager,
+    short_role_key,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -53,13 +56,27 @@ def mock_user_api():
 
 
 @pytest.fixture
-def manager(mock_project_api, mock_metadata_api, mock_field_api, mock_user_api):
+def mock_work_item_api():
+    """模拟 WorkItemAPI"""
+    api = AsyncMock()
+    return api
+
+
+@pytest.fixture
+def manager(
+    mock_project_api,
+    mock_metadata_api,
+    mock_field_api,
+    mock_user_api,
+    mock_work_item_api,
+):
     """创建 MetadataManager 实例"""
     return MetadataManager(
         project_api=mock_project_api,
         metadata_api=mock_metadata_api,
         field_api=mock_field_api,
         user_api=mock_user_api,
+        work_item_api=mock_work_item_api,
     )
 
 
@@ -110,6 +127,75 @@ class TestGetProjectKey:
         assert "未找到" in str(exc_info.value)
 
 
+class TestProjectIndex:
+    """测试项目索引的分块懒加载与后台刷新"""
+
+    @pytest.fixture(autouse=True)
+    def setup_projects(self, mock_project_api):
+        self.all_keys = [f"key_{i}" for i in range(120)]
+        mock_project_api.list_projects.return_value = self.all_keys
+        mock_project_api.get_project_details.side_effect = lambda keys: {
+            k: {"name": f"Project {k[4:]}"} for k in keys
+        }
+
+    @pytest.mark.asyncio
+    async def test_returns_after_first_matching_chunk(self, manager, mock_project_api):
+        """目标名称出现在第一块时立即返回，剩余块在后台补全"""
+        result = await manager.get_project_key("Project 3")
+
+        assert result == "key_3"
+        first_call = mock_project_api.get_project_details.call_args_list[0]
+        assert len(first_call.args[0]) == manager._PROJECT_DETAIL_CHUNK_SIZE
+
+        await manager._project_refresh_task
+        assert mock_project_api.get_project_details.call_count == 3
+        assert len(await manager.list_projects()) == 120
+        assert mock_project_api.list_projects.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_known_keys_are_prioritized(self, manager, mock_project_api):
+        """见过的项目 Key 优先加载"""
+        manager._known_project_names["key_110"] = "Project 110"
+
+        result = await manager.get_project_key("Project 110")
+
+        assert result == "key_110"
+        first_chunk = mock_project_api.get_project_details.call_args_list[0].args[0]
+        assert first_chunk[0] == "key_110"
+        await manager._project_refresh_task
+
+    @pytest.mark.asyncio
+    async def test_seen_keys_with_other_names_load_last(
+        self, manager, mock_project_api
+    ):
+        """已知对应其他名称的 Key 排在新 Key 之后"""
+        for i in range(60):
+            manager._known_project_names[f"key_{i}"] = f"Project {i}"
+
+        result = await manager.get_project_key("Project 119")
+
+        assert result == "key_119"
+        first_chunk = mock_project_api.get_project_details.call_args_list[0].args[0]
+        assert first_chunk[0] == "key_60"
+        assert not set(first_chunk) & {f"key_{i}" for i in range(60)}
+        await manager._project_refresh_task
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_refreshes_in_background(self, manager, mock_project_api):
+        """缓存过期时返回旧值并在后台刷新"""
+        await manager.list_projects()
+        manager._project_last_loaded -= manager.PROJECT_TTL + 1
+
+        result = await manager.get_project_key("Project 5")
+
+        assert result == "key_5"
+        await manager._project_refresh_task
+        assert mock_project_api.list_projects.call_count == 2
+        assert not manager._is_cache_expired(
+            manager._project_last_loaded, manager.PROJECT_TTL
+        )
+
+
 class TestGetTypeKey:
     """测试 get_type_key 方法"""
 
@@ -425,6 +511,90 @@ class TestCacheManagement:
         await manager.get_project_key("Project A")
         assert mock_project_api.list_projects.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_metadata_fingerprint(self, manager, mock_field_api):
+        """测试元数据指纹：未加载时为 None，加载后稳定，重新加载后变化"""
+        mock_field_api.get_all_fields.return_value = [
+            {"field_name": "优先级", "field_key": "priority"}
+        ]
+
+        assert await manager.get_metadata_fingerprint("project_1", "type_1") is None
+
+        await manager.get_field_key("project_1", "type_1", "优先级")
+        first = await manager.get_metadata_fingerprint("project_1", "type_1")
+        assert first is not None
+        assert await manager.get_metadata_fingerprint("project_1", "type_1") == first
+
+        manager.clear_cache()
+        assert await manager.get_metadata_fingerprint("project_1", "type_1") is None
+
+    @pytest.mark.asyncio
+    async def test_type_snapshot(self, manager, mock_field_api):
+        """测试元数据快照：一次加载后同步查找字段名与角色名"""
+        mock_field_api.get_all_fields.return_value = [
+            {"field_name": "优先级", "field_key": "priority"},
+            {
+                "field_name": "当前负责角色",
+                "field_key": "current_status_operator_role",
+                "options": [{"label": "经办人", "value": "role_p_t_role_a06e00"}],
+            },
+        ]
+
+        snapshot = await manager.get_type_snapshot("project_1", "type_1")
+
+        assert snapshot.field_name("priority") == "优先级"
+        assert snapshot.field_name("unknown") is None
+        assert snapshot.role_name("role_a06e00") == "经办人"
+        assert snapshot.role_name("role_p_t_role_a06e00") == "经办人"
+        assert snapshot.role_name("role_other") is None
+        assert mock_field_api.get_all_fields.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_field_constraints(self, manager, mock_field_api):
+        """测试字段写入约束：只读、必填、选项值域与停用选项随字段缓存加载"""
+        mock_field_api.get_all_fields.return_value = [
+            {
+                "field_name": "优先级",
+                "field_key": "priority",
+                "field_type_key": "select",
+                "is_required": 1,
+                "options": [
+                    {"label": "P0", "value": "p0"},
+                    {"label": "P9", "value": "p9", "is_disabled": 1},
+                ],
+            },
+            {
+                "field_name": "模块",
+                "field_key": "module",
+                "field_type_key": "tree_select",
+                "options": [
+                    {
+                        "label": "A",
+                        "value": "a",
+                        "children": [{"label": "B", "value": "b"}],
+                    }
+                ],
+            },
+            {
+                "field_name": "得分",
+                "field_key": "score",
+                "field_type_key": "number",
+                "value_generate_mode": "Calculate",
+            },
+            {"field_name": "创建时间", "field_key": "created_at"},
+        ]
+
+        constraints = await manager.get_field_constraints("project_1", "type_1")
+
+        assert constraints["priority"].required is True
+        assert constraints["priority"].option_values == {"p0", "p9"}
+        assert constraints["priority"].disabled_values == {"p9"}
+        assert constraints["module"].option_values == {"a", "b"}
+        assert constraints["module"].required is False
+        assert constraints["score"].read_only is True
+        assert constraints["score"].option_values is None
+        assert constraints["created_at"].read_only is True
+
     def test_singleton_pattern(self):
         """测试单例模式"""
         instance1 = MetadataManager.get_instance()
@@ -499,3 +669,189 @@ class TestListMethods:
         result = await manager.list_options("project_1", "type_1", "priority")
 
         assert result == {"P0": "option_1", "P1": "option_2"}
+
+
+class TestWorkflowModel:
+    """测试流程模型缓存与状态流转校验"""
+
+    @pytest.fixture(autouse=True)
+    def setup_workflow(self, mock_metadata_api):
+        mock_metadata_api.get_work_item_type_config.return_value = {
+            "flow_mode": "stateflow"
+        }
+        mock_metadata_api.get_workflow_templates.return_value = [
+            {"template_id": 1, "template_name": "默认流程"},
+            {"template_id": 2, "template_name": "停用流程", "is_disabled": True},
+        ]
+        mock_metadata_api.get_template_detail.return_value = {
+            "state_flow_confs": [
+                {"state_key": "open", "name": "待处理"},
+                {"state_key": "doing", "name": "进行中"},
+                {"state_key": "closed", "name": "已关闭"},
+            ],
+            "connections": [
+                {"source_state_key": "open", "target_state_key": "doing"},
+                {"source_state_key": "doing", "target_state_key": "closed"},
+            ],
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_workflow_model_cached(self, manager, mock_metadata_api):
+        """测试流程模型按 (project, type) 缓存"""
+        model = await manager.get_workflow_model("proj", "issue")
+        await manager.get_workflow_model("proj", "issue")
+
+        assert list(model["templates"].keys()) == [1]
+        assert model["templates"][1]["transitions"]["open"] == ["doing"]
+        assert mock_metadata_api.get_workflow_templates.call_count == 1
+        # 停用的模板不加载详情
+        assert mock_metadata_api.get_template_detail.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_node_workflow_skips_templates(self, manager, mock_metadata_api):
+        """测试节点流不加载状态流转"""
+        mock_metadata_api.get_work_item_type_config.return_value = {
+            "flow_mode": "workflow"
+        }
+
+        model = await manager.get_workflow_model("proj", "story")
+
+        assert model["templates"] == {}
+        mock_metadata_api.get_workflow_templates.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_validate_status_transition(self, manager):
+        """测试合法、非法与无法判定的流转"""
+        assert (
+            await manager.validate_status_transition(
+                "proj", "issue", 1, "open", "doing"
+            )
+            is None
+        )
+
+        reason = await manager.validate_status_transition(
+            "proj", "issue", 1, "open", "closed"
+        )
+        assert "待处理" in reason and "已关闭" in reason
+
+        # 未知模板或未知状态时放行
+        assert (
+            await manager.validate_status_transition(
+                "proj", "issue", 9, "open", "closed"
+            )
+            is None
+        )
+        assert (
+            await manager.validate_status_transition(
+                "proj", "issue", 1, "open", "unknown"
+            )
+            is None
+        )
+
+    @pytest.mark.asyncio
+    async def test_clear_cache_resets_workflow(self, manager, mock_metadata_api):
+        """测试 clear_cache 清空流程模型缓存"""
+        await manager.get_workflow_model("proj", "issue")
+        manager.clear_cache()
+        await manager.get_workflow_model("proj", "issue")
+
+        assert mock_metadata_api.get_workflow_templates.call_count == 2
+
+
+class TestCreatableFieldKeys:
+    """测试创建元数据缓存"""
+
+    @pytest.mark.asyncio
+    async def test_creatable_field_keys_cached(self, manager, mock_work_item_api):
+        """测试按类型缓存创建元数据"""
+        mock_work_item_api.get_create_meta.return_value = [
+            {"field_key": "description", "field_name": "描述"},
+            {"field_key": "priority", "field_name": "优先级"},
+        ]
+
+        result = await manager.get_creatable_field_keys("proj", "issue")
+        await manager.get_creatable_field_keys("proj", "issue")
+
+        assert result == {"description", "priority"}
+        assert mock_work_item_api.get_create_meta.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_creatable_field_keys_dict_response(
+        self, manager, mock_work_item_api
+    ):
+        """测试字典结构的元数据"""
+        mock_work_item_api.get_create_meta.return_value = {
+            "fields": [{"field_key": "owner"}, {"field_name": "无 Key 字段"}]
+        }
+
+        result = await manager.get_creatable_field_keys("proj", "issue")
+
+        assert result == {"owner"}
+
+
+class TestRelationFieldKeys:
+    """测试关联定义缓存"""
+
+    @pytest.fixture(autouse=True)
+    def setup_relations(self, mock_field_api):
+        mock_field_api.get_all_fields.return_value = [
+            {
+                "field_key": "field_related",
+                "field_name": "关联项目",
+                "field_type_key": "work_item_related_select",
+            },
+            {
+                "field_key": "field_parent",
+                "field_name": "父需求",
+                "field_type_key": "unknown",
+                "work_item_relation": {"id": "rel_1"},
+            },
+            {
+                "field_key": "priority",
+                "field_name": "优先级",
+                "field_type_key": "select",
+            },
+        ]
+        mock_field_api.get_work_item_relations.return_value = [
+            {"relation_id": "rel_1", "name": "父子关系"}
+        ]
+        mock_field_api.get_relation_rules.return_value = [
+            {"id": "rule_1", "work_item_type_key": "issue", "field_key": "field_rule"},
+            {"id": "rule_2", "work_item_type_key": "story", "field_key": "field_other"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_relation_field_keys(self, manager):
+        """测试合并字段定义与关联规则"""
+        result = await manager.get_relation_field_keys("proj", "issue")
+
+        assert result == {"field_related", "field_parent", "field_rule"}
+
+    @pytest.mark.asyncio
+    async def test_relation_definitions_cached(self, manager, mock_field_api):
+        """测试关联定义按项目缓存"""
+        await manager.get_relation_field_keys("proj", "issue")
+        await manager.get_relation_field_keys("proj", "story")
+
+        assert mock_field_api.get_work_item_relations.call_count == 1
+        assert mock_field_api.get_relation_rules.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_relation_rules_failure_tolerated(self, manager, mock_field_api):
+        """测试关联规则接口失败时仍返回字段定义中的关联字段"""
+        mock_field_api.get_relation_rules.side_effect = Exception("无权限")
+
+        result = await manager.get_relation_field_keys("proj", "issue")
+
+        assert result == {"field_related", "field_parent"}
+
+
+class TestShortRoleKey:
+    """测试 Role Key 规范化"""
+
+    def test_full_key_normalized_exactly(self):
+        """完整 Key 取最后一个 "_role_" 之后的部分，不做任意后缀截取"""
+        assert short_role_key("role_67dc_670f_role_cc5cef") == "role_cc5cef"
+        assert short_role_key("role_cc5cef") == "role_cc5cef"
+        assert short_role_key("cc5cef") == "cc5cef"
+        assert short_role_key("xrole_cc5cef") == "xrole_cc5cef"
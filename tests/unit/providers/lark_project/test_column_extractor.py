@@ -0,0 +1,110 @@
+"""
+ColumnExtractor 单元测试
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.providers.lark_project.column_extractor import ColumnExtractor, index_fields
+from src.providers.lark_project.field_resolver import FieldResolver
+from src.providers.lark_project.work_item_formatter import WorkItemFormatter
+
+OWNER_KEY = "7300000000000000001"
+
+ITEMS = [
+    {
+        "id": 1,
+        "name": "New format",
+        "fields": [
+            {"field_key": "field_status", "field_value": {"label": "进行中"}},
+            {"field_key": "field_priority", "field_value": {"label": "P0" * 20}},
+            {"field_key": "field_owner", "field_value": OWNER_KEY},
+            {"field_key": "field_biz", "field_value": {"label": "平台"}},
+        ],
+    },
+    {
+        "id": 2,
+        "name": "Legacy format",
+        "field_value_pairs": [
+            {"field_key": "field_status", "field_value": {"value": "done"}},
+            {"field_key": "field_owner", "field_value": [{"name": "Bob"}]},
+        ],
+    },
+    {"id": 3, "name": "No fields"},
+]
+
+MAPPING = {
+    "status": "field_status",
+    "priority": "field_priority",
+    "owner": "field_owner",
+}
+
+
+class TestColumnExtractor:
+    """ColumnExtractor 测试类"""
+
+    def test_index_prefers_fields_over_pairs(self):
+        """fields 优先，field_value_pairs 只补充缺失的 Key"""
+        item = {
+            "fields": [{"field_key": "a", "field_value": 1}],
+            "field_value_pairs": [
+                {"field_key": "a", "field_value": 2},
+                {"field_key": "b", "field_value": 3},
+            ],
+        }
+
+        assert index_fields(item) == {"a": 1, "b": 3}
+
+    def test_matches_field_resolver(self):
+        """与 FieldResolver.extract_field_value 的取值规则一致"""
+        rows, _ = ColumnExtractor(MAPPING).extract(ITEMS)
+
+        for item, row in zip(ITEMS, rows):
+            for name, field_key in MAPPING.items():
+                expected = FieldResolver.extract_field_value(item, field_key)
+                if name == "priority" and expected:
+                    expected = expected[:20]
+                assert row[name] == expected
+
+    def test_extract_values_not_truncated(self):
+        """筛选用的列值解析选项与人员字段，且不做展示截断"""
+        values = ColumnExtractor(MAPPING).extract_values(ITEMS[0])
+        assert values["priority"] == "P0" * 20
+        assert values["status"] == "进行中"
+
+        legacy = ColumnExtractor().extract_values(
+            {
+                "field_value_pairs": [
+                    {"field_key": "priority", "field_value": "P1"},
+                    {"field_key": "owner", "field_value": [{"name_cn": "张三"}]},
+                ]
+            }
+        )
+        assert legacy == {"status": None, "priority": "P1", "owner": "张三"}
+
+    def test_extra_columns_and_owner_collection(self):
+        """额外列与 owner user_key 在同一遍历中提取"""
+        rows, owner_rows = ColumnExtractor(
+            MAPPING, extra_columns={"business": "field_biz"}
+        ).extract(ITEMS)
+
+        assert rows[0]["business"] == "平台"
+        assert rows[1]["business"] is None
+        assert owner_rows == {OWNER_KEY: [rows[0]]}
+
+        ColumnExtractor.substitute_owners(owner_rows, {OWNER_KEY: "Alice"})
+        assert rows[0]["owner"] == "Alice"
+        assert rows[1]["owner"] == "Bob"
+
+    @pytest.mark.asyncio
+    async def test_formatter_uses_engine(self):
+        """WorkItemFormatter 共用列式提取并批量转换 owner"""
+        meta = MagicMock()
+        meta.batch_get_user_names = AsyncMock(return_value={OWNER_KEY: "Alice"})
+        formatter = WorkItemFormatter(meta, FieldResolver(meta))
+
+        rows = await formatter.simplify_work_items(ITEMS, MAPPING)
+
+        assert [row["owner"] for row in rows] == ["Alice", "Bob", None]
+        meta.batch_get_user_names.assert_awaited_once_with([OWNER_KEY])
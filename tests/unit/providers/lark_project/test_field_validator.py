@@ -0,0 +1,54 @@
+"""
+FieldValidator 单元测试
+"""
+
+from src.providers.lark_project.field_validator import FieldValidator
+from src.providers.lark_project.managers import FieldConstraint
+
+VALIDATOR = FieldValidator(
+    {
+        "priority": FieldConstraint(
+            required=True, option_values={"p0", "p1", "p9"}, disabled_values={"p9"}
+        ),
+        "tags": FieldConstraint(option_values={"t1", "t2"}),
+        "score": FieldConstraint(read_only=True),
+        "title": FieldConstraint(required=True),
+    }
+)
+
+
+class TestFieldValidator:
+    """FieldValidator 测试类"""
+
+    def test_read_only(self):
+        """只读字段在解析前拒绝，未知字段放行"""
+        assert "只读" in VALIDATOR.check_writable("score", "得分")
+        assert VALIDATOR.check_writable("priority", "优先级") is None
+        assert VALIDATOR.check_writable("unknown", "未知") is None
+
+    def test_required(self):
+        """必填字段不能清空"""
+        assert "必填" in VALIDATOR.check_value("title", "标题", "  ")
+        assert "必填" in VALIDATOR.check_value("priority", "优先级", None)
+        assert VALIDATOR.check_value("title", "标题", "New") is None
+
+    def test_option_domain(self):
+        """选项值需在值域内且未停用，支持 {label, value}、列表与原值"""
+        assert VALIDATOR.check_value("priority", "优先级", {"value": "p0"}) is None
+        assert "不在可用选项" in VALIDATOR.check_value("priority", "优先级", "P5")
+        assert "已停用" in VALIDATOR.check_value(
+            "priority", "优先级", {"label": "P9", "value": "p9"}
+        )
+        assert VALIDATOR.check_value("tags", "标签", [{"value": "t1"}, "t2"]) is None
+        assert "不在可用选项" in VALIDATOR.check_value(
+            "tags", "标签", [{"value": "t1"}, {"value": "t3"}]
+        )
+        # 清空非必填多选字段、非选项取值不校验值域
+        assert VALIDATOR.check_value("tags", "标签", []) is None
+        assert VALIDATOR.check_value("tags", "标签", True) is None
+
+    def test_empty_validator_allows_everything(self):
+        """约束不可用时不做任何拦截"""
+        validator = FieldValidator()
+        assert validator.check_writable("score", "得分") is None
+        assert validator.check_value("priority", "优先级", None) is None
@@ -0,0 +1,83 @@
+"""
+QueryResultCache 单元测试
+"""
+
+from unittest.mock import patch
+
+from src.providers.lark_project.query_result_cache import QueryResultCache
+
+
+def _result(*ids):
+    return {"items": [{"id": i} for i in ids], "total": len(ids)}
+
+
+class TestQueryResultCache:
+    """QueryResultCache 测试类"""
+
+    def test_set_and_get_returns_copy(self):
+        """命中返回副本，调用方修改列表或条目不影响缓存"""
+        cache = QueryResultCache(ttl=15)
+        assert cache.set("k", _result(1, 2), "proj", "story", cache.generation)
+
+        hit = cache.get("k")
+        hit["items"][0]["project_name"] = "changed"
+        hit["items"].clear()
+
+        assert cache.get("k")["items"] == [{"id": 1}, {"id": 2}]
+
+    def test_ttl_expiry(self):
+        """超过 TTL 的条目不再返回"""
+        cache = QueryResultCache(ttl=10)
+        with patch(
+            "src.providers.lark_project.query_result_cache.time.time",
+            return_value=1000.0,
+        ):
+            cache.set("k", _result(1), "proj", "story", cache.generation)
+        with patch(
+            "src.providers.lark_project.query_result_cache.time.time",
+            return_value=1011.0,
+        ):
+            assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_invalidate_by_type_and_item(self):
+        """写操作失效同类型条目，以及包含该工作项的其他类型条目"""
+        cache = QueryResultCache(ttl=15)
+        cache.set("story", _result(1), "proj", "story", cache.generation)
+        cache.set("bug", _result(2), "proj", "bug", cache.generation)
+        cache.set("task", _result(3, 9), "proj", "task", cache.generation)
+
+        removed = cache.invalidate("proj", "story", [9])
+
+        assert removed == 2
+        assert cache.get("story") is None
+        assert cache.get("task") is None
+        assert cache.get("bug") is not None
+
+    def test_skip_set_when_invalidated_during_query(self):
+        """查询期间发生写入时不缓存旧结果"""
+        cache = QueryResultCache(ttl=15)
+        generation = cache.generation
+        cache.invalidate("proj", "story", [1])
+
+        assert cache.set("k", _result(1), "proj", "story", generation) is False
+        assert cache.get("k") is None
+
+    def test_disabled_when_ttl_zero(self):
+        """TTL 为 0 时不缓存"""
+        cache = QueryResultCache(ttl=0)
+
+        assert cache.set("k", _result(1), "proj", "story", cache.generation) is False
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """超过容量时淘汰最久未使用的条目"""
+        cache = QueryResultCache(ttl=15, max_size=2)
+        cache.set("a", _result(1), "proj", "story", cache.generation)
+        cache.set("b", _result(2), "proj", "story", cache.generation)
+        cache.get("a")
+        cache.set("c", _result(3), "proj", "story", cache.generation)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert len(cache) == 2
@@ -63,25 +63,16 @@ async def test_resolve_related_to_exact_match_priority(mock_work_item_api, mock_
     mock_metadata.get_type_key.side_effect = lambda project, type_name: f"key_{type_name}"
 
     async def mock_filter_impl(project_key, work_item_type_keys, page_num, page_size, work_item_name=None, **kwargs):
-        type_key = work_item_type_keys[0]
-
-        if type_key == "key_Issue管理":
-            # Returns partial match
-            return {
-                "work_items": [
-                    {"id": 101, "name": "Bug Fix", "fields": []}
-                ],
-                "total": 1
-            }
-        elif type_key == "key_任务":
-            # Returns exact match
-            return {
-                "work_items": [
-                    {"id": 102, "name": "Bug", "fields": []}
-                ],
-                "total": 1
-            }
-        return {"work_items": [], "total": 0}
+        # 单次多类型 filter：汇总所有请求类型的结果
+        work_items = []
+        for type_key in work_item_type_keys:
+            if type_key == "key_Issue管理":
+                # Returns partial match
+                work_items.append({"id": 101, "name": "Bug Fix", "fields": []})
+            elif type_key == "key_任务":
+                # Returns exact match
+                work_items.append({"id": 102, "name": "Bug", "fields": []})
+        return {"work_items": work_items, "total": len(work_items)}
 
     mock_work_item_api.filter.side_effect = mock_filter_impl
 
@@ -103,10 +94,8 @@ async def test_resolve_related_to_partial_match_fallback(mock_work_item_api, moc
     mock_metadata.get_type_key.side_effect = lambda project, type_name: f"key_{type_name}"
 
     async def mock_filter_impl(project_key, work_item_type_keys, page_num, page_size, work_item_name=None, **kwargs):
-        type_key = work_item_type_keys[0]
-
-        if type_key == "key_Issue管理":
-            # Returns partial match
+        # 单次多类型 filter：只有 Issue管理 中有部分匹配
+        if "key_Issue管理" in work_item_type_keys:
             return {
                 "work_items": [
                     {"id": 101, "name": "Bug Fix", "fields": []}
@@ -126,3 +115,42 @@ async def test_resolve_related_to_partial_match_fallback(mock_work_item_api, moc
     # Verify
     # Should be 101 ("Bug Fix") as it's the only match
     assert result_id == 101
+
+
+@pytest.mark.asyncio
+async def test_resolve_related_to_uses_single_multi_type_filter(mock_work_item_api, mock_metadata):
+    """名称搜索使用一次多类型 filter，而不是逐类型请求"""
+    mock_metadata.get_project_key.return_value = "proj_123"
+    mock_metadata.get_type_key.side_effect = lambda project, type_name: f"key_{type_name}"
+    mock_work_item_api.filter = AsyncMock(
+        return_value={"work_items": [{"id": 102, "name": "Bug"}], "total": 1}
+    )
+
+    provider = WorkItemProvider("My Project")
+    result_id = await provider.resolve_related_to("Bug")
+
+    assert result_id == 102
+    mock_work_item_api.filter.assert_awaited_once()
+    type_keys = mock_work_item_api.filter.call_args.kwargs["work_item_type_keys"]
+    assert "key_任务" in type_keys and "key_Issue管理" in type_keys
+
+
+@pytest.mark.asyncio
+async def test_resolve_related_to_falls_back_to_per_type(mock_work_item_api, mock_metadata):
+    """多类型 filter 不支持时回退为逐类型查询"""
+    mock_metadata.get_project_key.return_value = "proj_123"
+    mock_metadata.get_type_key.side_effect = lambda project, type_name: f"key_{type_name}"
+
+    async def mock_filter_impl(project_key, work_item_type_keys, page_num, page_size, work_item_name=None, **kwargs):
+        if len(work_item_type_keys) > 1:
+            raise Exception("Filter WorkItem failed: multi-type not supported")
+        if work_item_type_keys[0] == "key_任务":
+            return {"work_items": [{"id": 102, "name": "Bug"}], "total": 1}
+        return {"work_items": [], "total": 0}
+
+    mock_work_item_api.filter = AsyncMock(side_effect=mock_filter_impl)
+
+    provider = WorkItemProvider("My Project")
+    result_id = await provider.resolve_related_to("Bug")
+
+    assert result_id == 102
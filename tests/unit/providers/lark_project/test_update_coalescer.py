@@ -0,0 +1,81 @@
+"""
+UpdateCoalescer 单元测试
+"""
+
+import asyncio
+
+import pytest
+
+from src.providers.lark_project.update_coalescer import UpdateCoalescer
+
+
+def _field(key, value):
+    return {"field_key": key, "field_value": value, "field_name": key}
+
+
+class _Recorder:
+    """记录写入调用，按字段返回结果"""
+
+    def __init__(self, error=None):
+        self.calls = []
+        self.error = error
+
+    async def __call__(self, project_key, type_key, issue_id, fields):
+        self.calls.append(
+            (issue_id, [(f["field_key"], f["field_value"]) for f in fields])
+        )
+        if self.error:
+            raise self.error
+        return [f"{issue_id}:{f['field_key']}={f['field_value']}" for f in fields]
+
+
+class TestUpdateCoalescer:
+    """UpdateCoalescer 测试类"""
+
+    @pytest.mark.asyncio
+    async def test_merges_updates_within_window(self):
+        """窗口内同一工作项的多次更新合并为一次写入，各自拿到自己字段的结果"""
+        coalescer = UpdateCoalescer(window=0.01)
+        flush = _Recorder()
+
+        status = coalescer.enqueue("proj", "story", 1, [_field("status", "a")], flush)
+        owner = coalescer.enqueue("proj", "story", 1, [_field("owner", "u")], flush)
+        again = coalescer.enqueue("proj", "story", 1, [_field("status", "b")], flush)
+        other = coalescer.enqueue("proj", "story", 2, [_field("status", "c")], flush)
+
+        assert await status == ["1:status=b"]
+        assert await owner == ["1:owner=u"]
+        assert await again == ["1:status=b"]
+        assert await other == ["2:status=c"]
+        assert sorted(flush.calls) == [
+            (1, [("status", "b"), ("owner", "u")]),
+            (2, [("status", "c")]),
+        ]
+        assert len(coalescer) == 0
+
+    @pytest.mark.asyncio
+    async def test_flush_all_writes_immediately(self):
+        """flush_all 不等待窗口结束"""
+        coalescer = UpdateCoalescer(window=60)
+        flush = _Recorder()
+        future = coalescer.enqueue("proj", "story", 1, [_field("status", "a")], flush)
+
+        assert await asyncio.wait_for(coalescer.flush_all(), timeout=1) == 1
+        assert future.result() == ["1:status=a"]
+
+    @pytest.mark.asyncio
+    async def test_write_error_propagates_to_callers(self):
+        """写入异常传递给所有等待的调用方"""
+        coalescer = UpdateCoalescer(window=0.01)
+        flush = _Recorder(error=RuntimeError("boom"))
+        first = coalescer.enqueue("proj", "story", 1, [_field("status", "a")], flush)
+        second = coalescer.enqueue("proj", "story", 1, [_field("owner", "u")], flush)
+
+        with pytest.raises(RuntimeError):
+            await first
+        with pytest.raises(RuntimeError):
+            await second
+
+    def test_disabled_by_default(self):
+        """默认窗口为 0，不启用合并"""
+        assert UpdateCoalescer.get_instance().enabled is False
@@ -0,0 +1,88 @@
+"""
+WorkItemCache 单元测试
+"""
+
+from unittest.mock import patch
+
+from src.providers.lark_project.work_item_cache import WorkItemCache
+
+
+class TestWorkItemCache:
+    """WorkItemCache 测试类"""
+
+    def test_set_and_get(self):
+        """按 (project_key, work_item_id) 存取名称与类型"""
+        cache = WorkItemCache()
+        cache.set("proj_a", 1001, "Epic A", "epic")
+
+        entry = cache.get("proj_a", 1001)
+        assert entry.name == "Epic A"
+        assert entry.type_key == "epic"
+        assert entry.not_found is False
+        assert cache.get("proj_b", 1001) is None
+
+    def test_get_many_skips_not_found(self):
+        """get_many 返回命中名称与未缓存 ID，"未找到"的 ID 两边都不出现"""
+        cache = WorkItemCache()
+        cache.set("proj_a", 1, "One")
+        cache.set_not_found("proj_a", 2)
+
+        names, missing = cache.get_many("proj_a", [1, 2, 3])
+        assert names == {1: "One"}
+        assert missing == [3]
+
+    def test_set_items_prefers_item_context(self):
+        """set_items 优先使用条目自带的 project_key/work_item_type_key"""
+        cache = WorkItemCache()
+        written = cache.set_items(
+            "proj_a",
+            [
+                {"id": 1, "name": "One"},
+                {"id": 2, "name": "Two", "work_item_type_key": "story"},
+                {"name": "no id"},
+            ],
+            type_key="epic",
+        )
+
+        assert written == {1: "One", 2: "Two"}
+        assert cache.get("proj_a", 1).type_key == "epic"
+        assert cache.get("proj_a", 2).type_key == "story"
+
+    def test_lru_eviction(self):
+        """超过容量时淘汰最久未使用的条目"""
+        cache = WorkItemCache(max_size=2)
+        cache.set("p", 1, "One")
+        cache.set("p", 2, "Two")
+        cache.get("p", 1)
+        cache.set("p", 3, "Three")
+
+        assert cache.get("p", 2) is None
+        assert cache.get("p", 1).name == "One"
+        assert len(cache) == 2
+
+    def test_not_found_uses_shorter_ttl(self):
+        """ "未找到"标记使用独立且更短的 TTL"""
+        cache = WorkItemCache(ttl=300, not_found_ttl=60)
+        with patch(
+            "src.providers.lark_project.work_item_cache.time.time", return_value=1000.0
+        ):
+            cache.set("p", 1, "One")
+            cache.set_not_found("p", 2)
+        with patch(
+            "src.providers.lark_project.work_item_cache.time.time", return_value=1061.0
+        ):
+            assert cache.get("p", 1).name == "One"
+            assert cache.get("p", 2) is None
+
+    def test_delete_by_id_across_projects(self):
+        """不指定 project_key 时删除所有项目下该 ID 的条目"""
+        cache = WorkItemCache()
+        cache.set("proj_a", 1, "One")
+        cache.set("proj_b", 1, "One")
+        cache.set("proj_a", 2, "Two")
+
+        assert cache.delete(1) is True
+        assert cache.get("proj_a", 1) is None
+        assert cache.get("proj_b", 1) is None
+        assert cache.delete(2, project_key="proj_b") is False
+        assert cache.get("proj_a", 2).name == "Two"
@@ -0,0 +1,76 @@
+"""
+WorkItemLocator 单元测试
+"""
+
+from src.providers.lark_project.work_item_locator import WorkItemLocator
+
+
+class TestWorkItemLocator:
+    """WorkItemLocator 测试类"""
+
+    def test_record_and_locate(self):
+        """记录后可按 ID（int 或数字字符串）定位"""
+        locator = WorkItemLocator()
+        locator.record(1001, "proj_a", "story")
+
+        assert locator.locate(1001) == ("proj_a", "story")
+        assert locator.locate("1001") == ("proj_a", "story")
+        assert locator.locate(9999) is None
+        assert locator.locate("abc") is None
+
+    def test_record_items_prefers_item_context(self):
+        """条目自带的 project_key/work_item_type_key 优先于参数"""
+        locator = WorkItemLocator()
+        count = locator.record_items(
+            [
+                {"id": 1, "work_item_type_key": "epic", "project_key": "proj_b"},
+                {"id": 2},
+                {"name": "no id"},
+            ],
+            project_key="proj_a",
+            type_key="story",
+        )
+
+        assert count == 2
+        assert locator.locate(1) == ("proj_b", "epic")
+        assert locator.locate(2) == ("proj_a", "story")
+
+    def test_record_items_without_context_skips_incomplete(self):
+        """缺少类型信息的条目不记录"""
+        locator = WorkItemLocator()
+        assert locator.record_items([{"id": 1, "project_key": "proj_a"}]) == 0
+        assert locator.locate(1) is None
+
+    def test_lru_eviction_and_forget(self):
+        """超过容量时淘汰最久未使用的条目，forget 移除单个条目"""
+        locator = WorkItemLocator(max_size=2)
+        locator.record(1, "p", "a")
+        locator.record(2, "p", "b")
+        locator.locate(1)
+        locator.record(3, "p", "c")
+
+        assert locator.locate(2) is None
+        assert len(locator) == 2
+        assert locator.forget(1) is True
+        assert locator.forget(1) is False
+
+    def test_records_workflow_state_with_location(self):
+        """读取时见到的流程状态随定位条目记录，淘汰或 forget 时一并移除"""
+        locator = WorkItemLocator(max_size=1)
+        locator.record_items(
+            [{"id": 1, "template_id": 7, "work_item_status": {"state_key": "open"}}],
+            project_key="p",
+            type_key="a",
+        )
+
+        assert locator.get_state(1) == (7, "open")
+        locator.forget_state(1)
+        assert locator.get_state(1) is None
+
+        locator.record_items(
+            [{"id": 1, "template_id": 7, "work_item_status": {"state_key": "open"}}],
+            project_key="p",
+            type_key="a",
+        )
+        locator.record(2, "p", "a")
+        assert locator.get_state(1) is None
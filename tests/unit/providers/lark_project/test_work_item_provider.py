@@ -1,7 +1,11 @@
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from src.core.context import user_key_context
+from src.providers.lark_project.managers import FieldConstraint, MetadataSnapshot
+from src.providers.lark_project.work_item_locator import WorkItemLocator
 from src.providers.lark_project.work_item_provider import WorkItemProvider
 
 
@@ -73,6 +77,145 @@ async def test_create_issue(mock_work_item_api, mock_metadata):
     assert update_fields[0]["field_value"] == "opt_high"
 
 
+@pytest.mark.asyncio
+async def test_create_issue_single_request_with_create_meta(
+    mock_work_item_api, mock_metadata
+):
+    """创建元数据允许时，所有字段在一次 create 请求中写入"""
+    mock_metadata.get_project_key.return_value = "proj_123"
+    mock_metadata.get_type_key.return_value = "type_issue"
+    mock_metadata.get_field_key.side_effect = lambda pk, tk, name: f"field_{name}"
+    mock_metadata.get_option_value.return_value = "opt_high"
+    mock_metadata.get_user_key.return_value = "user_456"
+    mock_metadata.get_field_type.return_value = "text"
+    mock_metadata.get_creatable_field_keys.return_value = {
+        "field_description",
+        "owner",
+        "field_priority",
+        "field_版本",
+    }
+
+    mock_work_item_api.create = AsyncMock(return_value=1001)
+    mock_work_item_api.update = AsyncMock()
+
+    provider = WorkItemProvider("My Project")
+    issue_id = await provider.create_issue(
+        name="Test Issue",
+        priority="High",
+        description="Desc",
+        assignee="Alice",
+        extra_fields={"版本": "v1"},
+    )
+
+    assert issue_id == 1001
+    args, _ = mock_work_item_api.create.call_args
+    field_dict = {f["field_key"]: f["field_value"] for f in args[3]}
+    assert field_dict["field_priority"] == "opt_high"
+    assert field_dict["owner"] == "user_456"
+    assert "field_版本" in field_dict
+    mock_work_item_api.update.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_create_issue_defers_non_creatable_fields(
+    mock_work_item_api, mock_metadata
+):
+    """创建元数据未包含的字段在创建后合并为一次 update"""
+    mock_metadata.get_project_key.return_value = "proj_123"
+    mock_metadata.get_type_key.return_value = "type_issue"
+    mock_metadata.get_field_key.side_effect = lambda pk, tk, name: f"field_{name}"
+    mock_metadata.get_option_value.return_value = "opt_high"
+    mock_metadata.get_creatable_field_keys.return_value = {"field_description"}
+
+    mock_work_item_api.create = AsyncMock(return_value=[{"id": 1001}])
+    mock_work_item_api.update = AsyncMock()
+
+    provider = WorkItemProvider("My Project")
+    await provider.create_issue(name="Test Issue", priority="High", description="D")
+
+    args, _ = mock_work_item_api.create.call_args
+    assert [f["field_key"] for f in args[3]] == ["field_description"]
+    mock_work_item_api.update.assert_awaited_once()
+    update_fields = mock_work_item_api.update.call_args.args[3]
+    assert update_fields == [{"field_key": "field_priority", "field_value": "opt_high"}]
+
+
+@pytest.mark.asyncio
+async def test_batch_create_issues(mock_work_item_api, mock_metadata):
+    """整批只解析一次字段与取值，逐项结果与输入顺序一致，部分失败不影响其他项"""
+    mock_metadata.get_project_key.return_value = "proj_123"
+    mock_metadata.get_type_key.return_value = "type_issue"
+    mock_metadata.get_field_key.side_effect = lambda pk, tk, name: f"field_{name}"
+    mock_metadata.get_option_value.side_effect = lambda pk, tk, fk, val: f"opt_{val}"
+    mock_metadata.get_user_key.side_effect = lambda name: f"user_{name}"
+    mock_metadata.get_creatable_field_keys.return_value = {
+        "field_description",
+        "owner",
+        "field_priority",
+    }
+
+    async def create(pk, tk, name, fields):
+        if name == "Broken":
+            raise Exception("创建工作项失败: 字段校验失败")
+        return 1000 + int(name[-1])
+
+    mock_work_item_api.create = AsyncMock(side_effect=create)
+    mock_work_item_api.update = AsyncMock()
+
+    results = await WorkItemProvider("My Project").batch_create_issues(
+        [
+            {"name": "Item 1", "priority": "P0", "assignee": "Alice"},
+            {"name": "Broken", "priority": "P0"},
+            {"name": ""},
+            {"name": "Item 4", "priority": "P0", "assignee": "Alice"},
+        ]
+    )
+
+    assert [r.index for r in results] == [0, 1, 2, 3]
+    assert [r.success for r in results] == [True, False, False, True]
+    assert [r.issue_id for r in results] == [1001, None, None, 1004]
+    assert "字段校验失败" in results[1].message
+    # 相同的优先级与负责人在整批内只解析一次
+    mock_metadata.get_project_key.assert_awaited_once()
+    mock_metadata.get_option_value.assert_awaited_once()
+    mock_metadata.get_user_key.assert_awaited_once()
+    assert mock_work_item_api.create.await_count == 3
+    mock_work_item_api.update.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_resolve_work_item_names(mock_work_item_api, mock_metadata):
+    """名称批量精确匹配：同名多项与未找到的名称不返回；search_params 失败时回退"""
+    mock_metadata.get_project_key.return_value = "proj_123"
+    mock_metadata.get_type_key.return_value = "type_issue"
+    mock_work_item_api.search_params = AsyncMock(
+        return_value={
+            "work_items": [
+                {"id": 1, "name": "Alpha"},
+                {"id": 2, "name": "Beta"},
+                {"id": 3, "name": "Beta"},
+                {"id": 4, "name": "Alpha 2"},
+            ]
+        }
+    )
+    provider = WorkItemProvider("My Project")
+
+    resolved = await provider.resolve_work_item_names(
+        ["Alpha", "Beta", "Gamma", "Alpha"]
+    )
+
+    assert resolved == {"Alpha": 1}
+    mock_work_item_api.search_params.assert_awaited_once()
+    condition = mock_work_item_api.search_params.call_args.args[2]["search_params"][0]
+    assert condition["value"] == ["Alpha", "Beta", "Gamma"]
+
+    mock_work_item_api.search_params.side_effect = Exception("Search Params failed")
+    mock_work_item_api.filter = AsyncMock(
+        return_value={"work_items": [{"id": 9, "name": "Gamma"}]}
+    )
+    assert await provider.resolve_work_item_names(["Gamma"]) == {"Gamma": 9}
+
+
 @pytest.mark.asyncio
 async def test_get_issue_details(mock_work_item_api, mock_metadata):
     mock_metadata.get_project_key.return_value = "proj_123"
@@ -99,6 +242,39 @@ async def test_delete_issue(mock_work_item_api, mock_metadata):
     mock_work_item_api.delete.assert_awaited_with("proj_123", "type_issue", 1001)
 
 
+@pytest.mark.asyncio
+async def test_writes_invalidate_shared_name_cache(mock_work_item_api, mock_metadata):
+    """改名、删除与创建使进程级名称缓存失效，其他 Provider 不再使用旧名称"""
+    mock_metadata.get_project_key.return_value = "proj_123"
+    mock_metadata.get_type_key.return_value = "type_issue"
+    mock_metadata.get_field_key.side_effect = lambda pk, tk, name: (
+        "name" if name == "name" else f"field_{name}"
+    )
+    mock_metadata.get_option_value.return_value = "opt_p1"
+    mock_work_item_api.update = AsyncMock()
+    mock_work_item_api.delete = AsyncMock()
+    mock_work_item_api.create = AsyncMock(return_value=1003)
+
+    provider = WorkItemProvider("My Project")
+    cache = provider._work_item_cache
+    cache.set("proj_123", 1001, "Old name")
+    cache.set("proj_123", 1002, "Kept name")
+    cache.set_not_found("proj_123", 1003)
+
+    # 只改优先级不影响名称缓存
+    await provider.update_issue(1002, priority="P1")
+    assert cache.get("proj_123", 1002).name == "Kept name"
+
+    await provider.update_issue(1001, name="New name")
+    assert cache.get("proj_123", 1001) is None
+
+    await WorkItemProvider("My Project").delete_issue(1002)
+    assert cache.get("proj_123", 1002) is None
+
+    await provider.create_issue("Created")
+    assert cache.get("proj_123", 1003) is None
+
+
 @pytest.mark.asyncio
 async def test_filter_issues(mock_work_item_api, mock_metadata):
     """测试过滤查询 Issues"""
@@ -218,6 +394,149 @@ async def test_get_tasks(mock_work_item_api, mock_metadata):
     mock_work_item_api.search_params.assert_awaited_once()
 
 
+@pytest.mark.asyncio
+async def test_get_tasks_reuses_compiled_query_plan(mock_work_item_api, mock_metadata):
+    """相同过滤条件复用查询计划，不再重复解析字段、选项和负责人"""
+    mock_metadata.get_project_key.return_value = "proj_123"
+    mock_metadata.get_type_key.return_value = "type_issue"
+    mock_metadata.get_metadata_fingerprint.return_value = "fp1"
+    mock_metadata.get_field_key.side_effect = lambda pk, tk, name: f"field_{name}"
+    mock_metadata.get_option_value.side_effect = lambda pk, tk, fk, val: f"opt_{val}"
+    mock_metadata.get_user_key.return_value = "user_alice"
+
+    mock_work_item_api.search_params = AsyncMock(
+        return_value={
+            "work_items": [{"id": 1001, "name": "Task 1"}],
+            "pagination": {"total": 1, "page_num": 1, "page_size": 50},
+        }
+    )
+
+    provider = WorkItemProvider("My Project")
+    await provider.get_tasks(status=["进行中"], priority=["P0"], owner="Alice")
+    field_calls = mock_metadata.get_field_key.await_count
+    option_calls = mock_metadata.get_option_value.await_count
+
+    await provider.get_tasks(
+        status=["进行中"], priority=["P0"], owner="Alice", page_num=2
+    )
+    mapping = await provider.get_summary_field_mapping()
+
+    assert mock_metadata.get_field_key.await_count == field_calls
+    assert mock_metadata.get_option_value.await_count == option_calls
+    assert mock_metadata.get_user_key.await_count == 1
+    assert mapping == {
+        "priority": "field_priority",
+        "status": "field_status",
+        "owner": "field_owner",
+    }
+
+    first, second = mock_work_item_api.search_params.call_args_list
+    assert first.kwargs["search_group"] == second.kwargs["search_group"]
+    assert len(second.kwargs["search_group"]["search_params"]) == 3
+    assert second.kwargs["page_num"] == 2
+
+    # 元数据重新加载（指纹变化）后重新编译
+    mock_metadata.get_metadata_fingerprint.return_value = "fp2"
+    await provider.get_tasks(status=["进行中"], priority=["P0"], owner="Alice")
+    assert mock_metadata.get_user_key.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_does_not_cache_plan_with_dropped_owner(
+    mock_work_item_api, mock_metadata
+):
+    """负责人解析失败时不缓存查询计划与结果，下次调用重新解析"""
+    mock_metadata.get_project_key.return_value = "proj_123"
+    mock_metadata.get_type_key.return_value = "type_issue"
+    mock_metadata.get_metadata_fingerprint.return_value = "fp1"
+    mock_metadata.get_field_key.side_effect = lambda pk, tk, name: f"field_{name}"
+    mock_metadata.get_option_value.side_effect = lambda pk, tk, fk, val: f"opt_{val}"
+    mock_metadata.get_user_key.side_effect = [Exception("user not found"), "user_alice"]
+
+    mock_work_item_api.search_params = AsyncMock(
+        return_value={
+            "work_items": [{"id": 1001, "name": "Task 1"}],
+            "pagination": {"total": 1, "page_num": 1, "page_size": 50},
+        }
+    )
+
+    provider = WorkItemProvider("My Project")
+    await provider.get_tasks(status=["进行中"], priority=["P0"], owner="Alice")
+    await provider.get_tasks(status=["进行中"], priority=["P0"], owner="Alice")
+
+    assert mock_metadata.get_user_key.await_count == 2
+    first, second = mock_work_item_api.search_params.call_args_list
+    assert len(first.kwargs["search_group"]["search_params"]) == 2
+    assert len(second.kwargs["search_group"]["search_params"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_result_cache_invalidated_by_writes(
+    mock_work_item_api, mock_metadata
+):
+    """重复查询命中结果缓存，写操作后重新查询"""
+    mock_metadata.get_project_key.return_value = "proj_123"
+    mock_metadata.get_type_key.return_value = "type_issue"
+    mock_metadata.get_field_key.side_effect = lambda pk, tk, name: f"field_{name}"
+
+    mock_work_item_api.search_params = AsyncMock(
+        return_value={
+            "work_items": [{"id": 1001, "name": "Task 1"}],
+            "pagination": {"total": 1, "page_num": 1, "page_size": 50},
+        }
+    )
+    mock_work_item_api.delete = AsyncMock()
+
+    provider = WorkItemProvider("My Project")
+    first = await provider.get_tasks()
+    second = await provider.get_tasks()
+
+    assert first == second
+    assert mock_work_item_api.search_params.await_count == 1
+
+    # 其他用户的相同查询不复用缓存（权限可能不同）
+    token = user_key_context.set("user_b")
+    try:
+        await provider.get_tasks()
+    finally:
+        user_key_context.reset(token)
+    assert mock_work_item_api.search_params.await_count == 2
+
+    # 另一个 Provider 实例写入同一类型后，缓存失效
+    await WorkItemProvider("My Project").delete_issue(1001)
+    await provider.get_tasks()
+
+    assert mock_work_item_api.search_params.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_list_queries_request_projected_fields(mock_work_item_api, mock_metadata):
+    """所有列表路径只请求摘要字段，关联扫描额外请求关联字段"""
+    mock_metadata.get_project_key.return_value = "proj_123"
+    mock_metadata.get_type_key.return_value = "type_issue"
+    mock_metadata.get_field_key.side_effect = lambda pk, tk, name: f"field_{name}"
+    mock_metadata.get_relation_field_keys.return_value = {"field_epic"}
+
+    page = {"work_items": [], "pagination": {"total": 0}}
+    mock_work_item_api.search_params = AsyncMock(return_value=page)
+    mock_work_item_api.filter = AsyncMock(return_value=page)
+
+    provider = WorkItemProvider("My Project")
+    summary = ["field_priority", "field_status", "field_owner"]
+
+    await provider.get_tasks()
+    assert mock_work_item_api.search_params.call_args.kwargs["fields"] == summary
+
+    await provider.filter_issues()
+    assert mock_work_item_api.search_params.call_args.kwargs["fields"] == summary
+
+    await provider.get_tasks(related_to=999)
+    assert mock_work_item_api.filter.call_args.kwargs["fields"] == [
+        *summary,
+        "field_epic",
+    ]
+
+
 @pytest.mark.asyncio
 async def test_list_available_options(mock_work_item_api, mock_metadata):
     """测试列出字段可用选项"""
@@ -519,16 +838,14 @@ async def test_get_readable_issue_details(mock_work_item_api, mock_metadata):
     )
 
     # 模拟 field_key -> field_name 映射
-    async def mock_get_field_name(project_key, type_key, field_key):
-        field_key_to_name = {
+    mock_metadata.get_type_snapshot.return_value = MetadataSnapshot(
+        {
             "owner": "owner",
             "status": "status",
             "priority": "priority",
             "creator": "creator",
         }
-        return field_key_to_name.get(field_key)
-
-    mock_metadata.get_field_name = AsyncMock(side_effect=mock_get_field_name)
+    )
 
     # 模拟 API 返回包含用户字段的工作项
     mock_work_item_api.query = AsyncMock(
@@ -592,6 +909,262 @@ async def test_get_readable_issue_details(mock_work_item_api, mock_metadata):
     assert "field_value_pairs" in result
 
 
+@pytest.mark.asyncio
+async def test_related_item_names_shared_across_providers(
+    mock_work_item_api, mock_metadata
+):
+    """关联工作项名称在进程级缓存中共享，跨 Provider 只查询一次"""
+    mock_metadata.get_project_key.return_value = "proj_123"
+    mock_metadata.get_type_key.return_value = "type_issue"
+    mock_metadata.get_type_snapshot.return_value = MetadataSnapshot()
+
+    def make_item(item_id):
+        return {
+            "id": item_id,
+            "name": f"Issue {item_id}",
+            "fields": [
+                {
+                    "field_key": "related_epic",
+                    "field_value": 2002,
+                    "field_type_key": "work_item_related_select",
+                }
+            ],
+        }
+
+    async def mock_query(project_key, type_key, ids):
+        if ids == [2002]:
+            return [{"id": 2002, "name": "Epic A"}]
+        return [make_item(i) for i in ids]
+
+    mock_work_item_api.query = AsyncMock(side_effect=mock_query)
+
+    first = await WorkItemProvider("My Project").get_readable_issue_details(1001)
+    second = await WorkItemProvider("My Project").get_readable_issue_details(1002)
+
+    assert first["readable_fields"]["related_epic"] == "Epic A"
+    assert second["readable_fields"]["related_epic"] == "Epic A"
+    related_queries = [
+        c for c in mock_work_item_api.query.await_args_list if c.args[2] == [2002]
+    ]
+    assert len(related_queries) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_readable_issues_details_shares_enrichment(
+    mock_work_item_api, mock_metadata
+):
+    """多个工作项按类型分组查询，用户与关联工作项合并为一次批量解析"""
+    mock_metadata.get_project_key.return_value = "proj_123"
+    mock_metadata.get_type_key.return_value = "type_issue"
+    mock_metadata.get_type_snapshot.return_value = MetadataSnapshot()
+    mock_metadata.list_types.return_value = {"Issue": "type_issue"}
+
+    def make_item(item_id, type_key):
+        return {
+            "id": item_id,
+            "name": f"Item {item_id}",
+            "work_item_type_key": type_key,
+            "fields": [
+                {
+                    "field_key": "owner",
+                    "field_value": f"user_{item_id % 2}",
+                    "field_type_key": "user",
+                },
+                {
+                    "field_key": "related_epic",
+                    "field_value": 9000 + item_id % 2,
+                    "field_type_key": "work_item_related_select",
+                },
+            ],
+        }
+
+    async def mock_query(project_key, type_key, ids):
+        if all(i >= 9000 for i in ids):
+            return [{"id": i, "name": f"Epic {i}"} for i in ids]
+        return [make_item(i, type_key) for i in ids if i != 404]
+
+    mock_work_item_api.query = AsyncMock(side_effect=mock_query)
+    mock_work_item_api.filter = AsyncMock(return_value={"work_items": []})
+
+    provider = WorkItemProvider("My Project")
+    # 3003 已知位于 type_story
+    provider._locator.record(3003, "proj_123", "type_story")
+
+    provider.user_api.query_users = AsyncMock(
+        return_value=[
+            {"user_key": "user_0", "name_cn": "张三"},
+            {"user_key": "user_1", "name_cn": "李四"},
+        ]
+    )
+    result = await provider.get_readable_issues_details([3003, 1001, 404, 1002])
+
+    assert [item["id"] for item in result["items"]] == [3003, 1001, 1002]
+    assert result["not_found"] == [404]
+    assert [item["readable_fields"]["owner"] for item in result["items"]] == [
+        "李四",
+        "李四",
+        "张三",
+    ]
+    assert result["items"][2]["readable_fields"]["related_epic"] == "Epic 9000"
+
+    provider.user_api.query_users.assert_awaited_once()
+    item_queries = [
+        c.args[1:]
+        for c in mock_work_item_api.query.await_args_list
+        if not all(i >= 9000 for i in c.args[2])
+    ]
+    assert sorted(item_queries) == [
+        ("type_issue", [1001, 404, 1002]),
+        ("type_story", [3003]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_enrich_page_uses_constant_upstream_calls(
+    mock_work_item_api, mock_metadata
+):
+    """整页增强: 每个类型一次元数据快照、一次用户查询，字段名与角色名同步查找"""
+    mock_metadata.get_project_key.return_value = "proj_123"
+    mock_metadata.get_type_key.return_value = "type_issue"
+    mock_metadata.get_type_snapshot.return_value = MetadataSnapshot(
+        {"owner": "负责人", "role_owners": "角色人员"},
+        {"经办人": "role_a06e00"},
+    )
+
+    items = [
+        {
+            "id": i,
+            "name": f"Issue {i}",
+            "fields": [
+                {
+                    "field_key": "owner",
+                    "field_value": f"user_{i % 3}",
+                    "field_type_key": "user",
+                },
+                {
+                    "field_key": "role_owners",
+                    "field_value": [{"role": "role_a06e00", "owners": ["user_0"]}],
+                    "field_type_key": "role_owners",
+                },
+            ],
+        }
+        for i in range(100)
+    ]
+
+    provider = WorkItemProvider("My Project")
+    provider.user_api.query_users = AsyncMock(
+        return_value=[
+            {"user_key": f"user_{i}", "name_cn": f"用户{i}"} for i in range(3)
+        ]
+    )
+    enhanced = await provider._enhance_work_items_with_readable_names(items)
+
+    assert enhanced[4]["readable_fields"]["负责人"] == "用户1"
+    assert enhanced[4]["readable_fields"]["角色人员"] == [
+        {"role": "经办人", "owners": ["用户0"]}
+    ]
+    mock_metadata.get_type_snapshot.assert_awaited_once_with("proj_123", "type_issue")
+    provider.user_api.query_users.assert_awaited_once()
+    mock_metadata.get_field_name.assert_not_awaited()
+    mock_metadata.get_role_name.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_issue_details_uses_locator_for_known_ids(
+    mock_work_item_api, mock_metadata
+):
+    """列表查询返回过的工作项直接按已知类型查询，不再逐类型探测"""
+    mock_metadata.get_project_key.return_value = "proj_123"
+    mock_metadata.get_type_key.return_value = "type_issue"
+    mock_work_item_api.search_params = AsyncMock(
+        return_value={
+            "work_items": [
+                {
+                    "id": 3003,
+                    "name": "Story",
+                    "project_key": "proj_123",
+                    "work_item_type_key": "type_story",
+                }
+            ],
+            "pagination": {"total": 1, "page_num": 1, "page_size": 20},
+        }
+    )
+    mock_work_item_api.query = AsyncMock(return_value=[{"id": 3003, "name": "Story"}])
+
+    provider = WorkItemProvider("My Project")
+    await provider.get_tasks()
+    detail = await provider.get_issue_details(3003)
+
+    assert detail["id"] == 3003
+    mock_work_item_api.query.assert_awaited_once_with("proj_123", "type_story", [3003])
+    mock_metadata.list_types.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_issue_details_records_discovered_type(
+    mock_work_item_api, mock_metadata
+):
+    """跨类型探测找到后记录位置，再次查询直达该类型"""
+    mock_metadata.get_project_key.return_value = "proj_123"
+    mock_metadata.get_type_key.return_value = "type_issue"
+    mock_metadata.list_types.return_value = {
+        "问题管理": "type_issue",
+        "需求": "type_story",
+        "缺陷": "type_bug",
+    }
+
+    async def mock_query(project_key, type_key, ids):
+        return [{"id": ids[0]}] if type_key == "type_bug" else []
+
+    mock_work_item_api.query = AsyncMock(side_effect=mock_query)
+
+    provider = WorkItemProvider("My Project")
+    await provider.get_issue_details(4004)
+    first_calls = mock_work_item_api.query.await_count
+
+    mock_work_item_api.query.reset_mock()
+    await provider.get_issue_details(4004)
+
+    assert first_calls == 3
+    mock_work_item_api.query.assert_awaited_once_with("proj_123", "type_bug", [4004])
+
+
+@pytest.mark.asyncio
+async def test_get_issue_details_cross_type_single_filter(
+    mock_work_item_api, mock_metadata
+):
+    """当前类型未找到时，用一次多类型 filter 查找其他所有类型"""
+    mock_metadata.get_project_key.return_value = "proj_123"
+    mock_metadata.get_type_key.return_value = "type_issue"
+    mock_metadata.list_types.return_value = {
+        "问题管理": "type_issue",
+        "需求": "type_story",
+        "缺陷": "type_bug",
+    }
+    mock_work_item_api.query = AsyncMock(return_value=[])
+    mock_work_item_api.filter = AsyncMock(
+        return_value={
+            "work_items": [
+                {
+                    "id": 5005,
+                    "project_key": "proj_123",
+                    "work_item_type_key": "type_bug",
+                }
+            ]
+        }
+    )
+
+    provider = WorkItemProvider("My Project")
+    detail = await provider.get_issue_details(5005)
+
+    assert detail["work_item_type_key"] == "type_bug"
+    mock_work_item_api.query.assert_awaited_once()
+    mock_work_item_api.filter.assert_awaited_once()
+    kwargs = mock_work_item_api.filter.call_args.kwargs
+    assert kwargs["work_item_ids"] == [5005]
+    assert sorted(kwargs["work_item_type_keys"]) == ["type_bug", "type_story"]
+
+
 class TestBatchUpdateIssues:
     """测试批量更新工作项"""
 
@@ -615,6 +1188,10 @@ class TestBatchUpdateIssues:
         # mock_work_item_api.update 会被 _perform_single_field_update 调用
         # 模拟每次更新都成功
         mock_work_item_api.update = AsyncMock(return_value=None)
+        # 默认 batch_update 不可用，多 Issue 路径回退到逐 Issue 多字段更新
+        mock_work_item_api.batch_update = AsyncMock(
+            side_effect=RuntimeError("批量更新失败: Invalid Param")
+        )
 
     @pytest.mark.asyncio
     async def test_batch_update_issues_all_success(self, mock_work_item_api):
@@ -634,32 +1211,20 @@ class TestBatchUpdateIssues:
             assert result.issue_id in issue_ids
             assert "更新成功" in result.message
 
-        # Verify calls for each field and each issue
-        # 总共 2 issues * 3 fields = 6 次调用 WorkItemAPI.update
-        assert mock_work_item_api.update.call_count == len(issue_ids) * 3
+        # 每个 issue 一次多字段 update: 2 issues = 2 次调用 WorkItemAPI.update
+        assert mock_work_item_api.update.call_count == len(issue_ids)
+        mock_work_item_api.batch_update.assert_not_awaited()
 
-        call_args_list = mock_work_item_api.update.call_args_list
-        # 检查 issue 101 的 'name' 字段更新
-        assert any(
-            call.args[2] == 101
-            and call.args[3][0]["field_key"] == "name"
-            and call.args[3][0]["field_value"] == "New Title"
-            for call in call_args_list
-        )
+        payloads = {
+            call.args[2]: {f["field_key"]: f["field_value"] for f in call.args[3]}
+            for call in mock_work_item_api.update.call_args_list
+        }
+        assert set(payloads) == set(issue_ids)
+        # 检查 issue 101 的 'name' 与 '自定义字段' 更新
+        assert payloads[101]["name"] == "New Title"
+        assert payloads[101]["field_自定义字段"] == "Custom Value"
         # 检查 issue 102 的 'priority' 字段更新
-        assert any(
-            call.args[2] == 102
-            and call.args[3][0]["field_key"] == "field_priority"
-            and call.args[3][0]["field_value"]["value"] == "opt_val"
-            for call in call_args_list
-        )
-        # 检查 issue 101 的 '自定义字段' 更新
-        assert any(
-            call.args[2] == 101
-            and call.args[3][0]["field_key"] == "field_自定义字段"
-            and call.args[3][0]["field_value"] == "Custom Value"
-            for call in call_args_list
-        )
+        assert payloads[102]["field_priority"]["value"] == "opt_val"
 
     @pytest.mark.asyncio
     async def test_batch_update_issues_partial_failure(
@@ -699,9 +1264,70 @@ class TestBatchUpdateIssues:
             assert "不存在" in failed_res.message
             assert failed_res.issue_id in issue_ids
 
-        # 检查成功的调用 WorkItemAPI.update 的次数
-        # 2 issues * 3 (name, priority, ValidField) = 6 次 api.update 调用
-        assert mock_work_item_api.update.call_count == 6
+        # 每个 issue 一次多字段 update (name, priority, ValidField)
+        assert mock_work_item_api.update.call_count == 2
+        for call in mock_work_item_api.update.call_args_list:
+            assert len(call.args[3]) == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_update_issues_combined_failure_degrades_per_field(
+        self, mock_work_item_api
+    ):
+        """多字段写入失败的 issue 才降级为逐字段更新"""
+
+        async def update(pk, tk, issue_id, fields):
+            if issue_id == 102 and len(fields) > 1:
+                raise Exception("更新工作项失败: 字段只读")
+
+        mock_work_item_api.update = AsyncMock(side_effect=update)
+
+        results = await WorkItemProvider("My Project").batch_update_issues(
+            issue_ids=[101, 102], name="New Title", priority="P1"
+        )
+
+        assert len(results) == 4
+        assert all(r.success for r in results)
+        calls = [
+            (c.args[2], len(c.args[3]))
+            for c in mock_work_item_api.update.call_args_list
+        ]
+        # 101: 一次 2 字段；102: 一次 2 字段失败后逐字段 2 次
+        assert sorted(calls) == [(101, 2), (102, 1), (102, 1), (102, 2)]
+
+    @pytest.mark.asyncio
+    async def test_batch_update_rejects_doomed_fields_locally(
+        self, mock_work_item_api, mock_metadata
+    ):
+        """只读字段、停用选项在本地拒绝，不请求 API"""
+        mock_metadata.get_field_constraints.return_value = {
+            "field_score": FieldConstraint(read_only=True),
+            "field_priority": FieldConstraint(
+                option_values={"opt_val"}, disabled_values={"opt_val"}
+            ),
+        }
+
+        results = await WorkItemProvider("My Project").batch_update_issues(
+            issue_ids=[101, 102],
+            name="New Title",
+            priority="P9",
+            extra_fields={"score": "10"},
+        )
+
+        failed = {
+            (r.issue_id, r.field_name): r.message for r in results if not r.success
+        }
+        assert set(failed) == {
+            (101, "priority"),
+            (102, "priority"),
+            (101, "score"),
+            (102, "score"),
+        }
+        assert all(m.startswith("字段校验失败") for m in failed.values())
+        assert "已停用" in failed[(101, "priority")]
+        assert "只读" in failed[(101, "score")]
+        for call in mock_work_item_api.update.call_args_list:
+            assert [f["field_key"] for f in call.args[3]] == ["name"]
+        assert mock_work_item_api.update.call_count == 2
 
     @pytest.mark.asyncio
     async def test_batch_update_issues_no_fields_to_update(self, mock_work_item_api):
@@ -719,3 +1345,457 @@ class TestBatchUpdateIssues:
         )
         assert len(results) == 0
         mock_work_item_api.update.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_batch_update_issues_uses_bulk_task(self, mock_work_item_api):
+        """多 Issue 每个字段一次分块 batch_update，按任务结果映射逐 Issue 结果"""
+        mock_work_item_api.batch_update = AsyncMock(
+            side_effect=lambda pk, tk, ids, fields: f"task_{ids[0]}"
+        )
+        outcomes = {
+            "task_101": [
+                {"status": "running"},
+                {
+                    "status": "failed",
+                    "success_work_item_ids": [101, 102],
+                    "fail_work_item_ids": [
+                        {"work_item_id": 103, "err_msg": "字段只读"}
+                    ],
+                },
+            ],
+            "task_104": [{"status": "failed"}],
+        }
+        mock_work_item_api.get_task_result = AsyncMock(
+            side_effect=lambda task_id: outcomes[task_id].pop(0)
+        )
+        provider = WorkItemProvider("My Project")
+        provider._TASK_POLL_INITIAL_DELAY = 0
+        provider._BATCH_UPDATE_CHUNK_SIZE = 3
+
+        # 5 个 issue、1 个字段、2 块: 后台任务约 4 次请求 < 逐个更新 5 次
+        results = await provider.batch_update_issues(
+            issue_ids=[101, 102, 103, 104, 105], priority="P1"
+        )
+
+        by_issue = {r.issue_id: r for r in results}
+        assert by_issue[101].success and by_issue[102].success
+        assert by_issue[103].success is False
+        assert "字段只读" in by_issue[103].message
+        # 第二块未在任务结果中出现，回退到逐个更新
+        assert by_issue[104].success and by_issue[105].success
+        assert [c.args[2] for c in mock_work_item_api.batch_update.await_args_list] == [
+            [101, 102, 103],
+            [104, 105],
+        ]
+        (payload,) = mock_work_item_api.batch_update.call_args.args[3]
+        assert payload["field_key"] == "field_priority"
+        assert payload["field_value"]["value"] == "opt_val"
+        assert sorted(c.args[2] for c in mock_work_item_api.update.call_args_list) == [
+            104,
+            105,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_batch_update_task_timeout_falls_back(self, mock_work_item_api):
+        """任务超时的 Issue 回退到逐字段更新"""
+        mock_work_item_api.batch_update = AsyncMock(return_value="task_1")
+        mock_work_item_api.get_task_result = AsyncMock(
+            return_value={"status": "running"}
+        )
+        provider = WorkItemProvider("My Project")
+        provider._TASK_POLL_INITIAL_DELAY = 0
+        provider._TASK_POLL_TIMEOUT = 0
+
+        results = await provider.batch_update_issues(
+            issue_ids=[101, 102, 103], name="New Title"
+        )
+
+        assert all(r.success for r in results)
+        mock_work_item_api.batch_update.assert_awaited_once()
+        assert mock_work_item_api.update.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_update_issue_coalesces_within_window(self, mock_work_item_api):
+        """开启写后合并时，同一工作项的连续更新合并为一次多字段 update"""
+        from src.providers.lark_project.update_coalescer import UpdateCoalescer
+
+        UpdateCoalescer.get_instance().window = 0.01
+        provider = WorkItemProvider("My Project")
+
+        status, owner, priority = await asyncio.gather(
+            provider.update_issue(101, status="进行中"),
+            provider.update_issue(101, assignee="张三"),
+            provider.update_issue(101, priority="P1"),
+        )
+
+        assert [r.field_name for r in status] == ["status"]
+        assert [r.field_name for r in owner] == ["assignee"]
+        assert [r.field_name for r in priority] == ["priority"]
+        assert all(r.success for r in status + owner + priority)
+        mock_work_item_api.update.assert_awaited_once()
+        payload = mock_work_item_api.update.call_args.args[3]
+        assert {f["field_key"] for f in payload} == {
+            "field_status",
+            "owner",
+            "field_priority",
+        }
+
+    @pytest.mark.asyncio
+    async def test_batch_update_skip_unchanged(self, mock_work_item_api):
+        """skip_unchanged: 选项、用户、多选按语义比对，相同值不再写入"""
+        mock_work_item_api.query = AsyncMock(
+            return_value=[
+                {
+                    "id": 101,
+                    "fields": [
+                        {
+                            "field_key": "field_priority",
+                            "field_value": {"label": "P1", "value": "opt_val"},
+                        },
+                        {"field_key": "owner", "field_value": "user_abc"},
+                        {
+                            "field_key": "field_标签",
+                            "field_value": [
+                                {"label": "B", "value": "B"},
+                                {"label": "A", "value": "A"},
+                            ],
+                        },
+                    ],
+                },
+                {
+                    "id": 102,
+                    "fields": [
+                        {
+                            "field_key": "field_priority",
+                            "field_value": {"label": "P0", "value": "opt_p0"},
+                        },
+                        {"field_key": "owner", "field_value": "user_xyz"},
+                    ],
+                },
+            ]
+        )
+
+        results = await WorkItemProvider("My Project").batch_update_issues(
+            issue_ids=[101, 102],
+            priority="P1",
+            assignee="张三",
+            extra_fields={"标签": ["A", "B"]},
+            skip_unchanged=True,
+        )
+
+        by_issue = {}
+        for r in results:
+            by_issue.setdefault(r.issue_id, []).append(r)
+        assert [r.message for r in by_issue[101]] == ["unchanged"] * 3
+        assert all(r.success and r.message != "unchanged" for r in by_issue[102])
+        assert len(by_issue[102]) == 3
+        # 当前值只读取一次，并投影到待更新字段
+        mock_work_item_api.query.assert_awaited_once()
+        assert sorted(mock_work_item_api.query.call_args.kwargs["fields"]) == [
+            "field_priority",
+            "field_标签",
+            "owner",
+        ]
+        assert {c.args[2] for c in mock_work_item_api.update.await_args_list} == {102}
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_issues_groups_by_resolved_value(
+        self, mock_work_item_api, mock_metadata
+    ):
+        """相同解析值合并为 batch_update，其余按工作项合并为一次多字段 update"""
+        mock_work_item_api.batch_update = AsyncMock(return_value="task_1")
+        mock_work_item_api.get_task_result = AsyncMock(
+            return_value={"status": "success"}
+        )
+        provider = WorkItemProvider("My Project")
+        provider._TASK_POLL_INITIAL_DELAY = 0
+        edits = [
+            (101, {"priority": "P1"}),
+            (102, {"priority": "P1"}),
+            (103, {"priority": "P1", "容量": "512G"}),
+            (104, {"容量": "256G", "名称备注": "A"}),
+            (105, {"InvalidField": "x"}),
+        ]
+
+        plan = await provider.bulk_update_issues(edits, dry_run=True)
+
+        assert plan["edit_count"] == 7
+        # 两次多字段 update + batch_update 一块（提交 + 轮询）
+        assert plan["planned_calls"] == 4
+        assert plan["batch_groups"] == [
+            {
+                "field_name": "priority",
+                "field_key": "field_priority",
+                "issue_ids": [101, 102, 103],
+            }
+        ]
+        assert plan["item_updates"] == [
+            {"issue_id": 103, "fields": ["容量"]},
+            {"issue_id": 104, "fields": ["容量", "名称备注"]},
+        ]
+        assert [(r.issue_id, r.success) for r in plan["results"]] == [(105, False)]
+        mock_work_item_api.batch_update.assert_not_awaited()
+        mock_work_item_api.update.assert_not_awaited()
+        # 每个不同的 (字段, 取值) 只解析一次: P1、512G、256G、A
+        assert mock_metadata.get_option_value.call_count == 4
+
+        report = await provider.bulk_update_issues(edits)
+
+        results = report["results"]
+        assert sum(r.success for r in results) == 6
+        mock_work_item_api.batch_update.assert_awaited_once()
+        assert mock_work_item_api.update.call_count == 2
+        multi_field = next(
+            c for c in mock_work_item_api.update.await_args_list if c.args[2] == 104
+        )
+        assert len(multi_field.args[3]) == 2
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_issues_folds_small_groups_into_item_updates(
+        self, mock_work_item_api, mock_metadata
+    ):
+        """相同取值只涉及少量工作项时并入多字段 update，不走提交 + 轮询的任务路径"""
+        plan = await WorkItemProvider("My Project").bulk_update_issues(
+            [
+                (101, {"priority": "P1"}),
+                (102, {"priority": "P1", "容量": "512G"}),
+            ],
+            dry_run=True,
+        )
+
+        assert plan["batch_groups"] == []
+        assert plan["item_updates"] == [
+            {"issue_id": 101, "fields": ["priority"]},
+            {"issue_id": 102, "fields": ["priority", "容量"]},
+        ]
+        assert plan["planned_calls"] == 2
+
+    @staticmethod
+    def _seed_states(states):
+        """在定位索引中记录最近读取到的流程状态"""
+        WorkItemLocator.get_instance().record_items(
+            [
+                {"id": i, "template_id": 1, "work_item_status": {"state_key": st}}
+                for i, st in states.items()
+            ],
+            "proj_123",
+            "type_issue",
+        )
+
+    @pytest.fixture
+    def workflow(self, mock_metadata):
+        mock_metadata.get_workflow_model.return_value = {
+            "flow_mode": "stateflow",
+            "templates": {1: {"states": {}, "transitions": {}}},
+        }
+        mock_metadata.validate_status_transition.side_effect = (
+            lambda pk, tk, tpl, cur, target: (
+                "状态不允许流转" if cur == "closed" else None
+            )
+        )
+
+    @pytest.mark.asyncio
+    async def test_batch_update_rejects_illegal_status_transition(
+        self, mock_work_item_api, workflow
+    ):
+        """已记录状态判定非法的流转重新查询确认后在本地拒绝，不调用更新接口"""
+        self._seed_states({101: "open", 102: "closed"})
+        mock_work_item_api.query = AsyncMock(
+            return_value=[
+                {
+                    "id": 102,
+                    "template_id": 1,
+                    "work_item_status": {"state_key": "closed"},
+                },
+            ]
+        )
+
+        results = await WorkItemProvider("My Project").batch_update_issues(
+            issue_ids=[101, 102], status="进行中"
+        )
+
+        by_issue = {r.issue_id: r for r in results}
+        assert by_issue[101].success is True
+        assert by_issue[102].success is False
+        assert "不允许" in by_issue[102].message
+        # 只有疑似非法的工作项需要确认查询
+        mock_work_item_api.query.assert_awaited_once()
+        assert mock_work_item_api.query.call_args.args[2] == [102]
+        assert mock_work_item_api.update.call_count == 1
+        assert mock_work_item_api.update.call_args.args[2] == 101
+        # 写入状态后记录的状态失效
+        assert WorkItemLocator.get_instance().get_state(101) is None
+
+    @pytest.mark.asyncio
+    async def test_status_update_without_known_state_skips_precheck(
+        self, mock_work_item_api, mock_metadata, workflow
+    ):
+        """状态未知时不为校验额外查询，直接交由服务端校验"""
+        mock_work_item_api.query = AsyncMock()
+
+        results = await WorkItemProvider("My Project").batch_update_issues(
+            issue_ids=[101], status="进行中"
+        )
+
+        assert results[0].success is True
+        mock_work_item_api.query.assert_not_awaited()
+        mock_metadata.get_workflow_model.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_stale_state_is_confirmed_before_rejecting(
+        self, mock_work_item_api, workflow
+    ):
+        """记录的状态已过期时以重新查询的当前状态为准"""
+        self._seed_states({101: "closed"})
+        mock_work_item_api.query = AsyncMock(
+            return_value=[
+                {"id": 101, "template_id": 1, "work_item_status": {"state_key": "open"}}
+            ]
+        )
+
+        results = await WorkItemProvider("My Project").batch_update_issues(
+            issue_ids=[101], status="进行中"
+        )
+
+        assert results[0].success is True
+        mock_work_item_api.update.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_batch_update_status_without_workflow_model(
+        self, mock_work_item_api, mock_metadata
+    ):
+        """流程模型不可用时放行，交由服务端校验"""
+        self._seed_states({101: "closed"})
+        mock_metadata.get_workflow_model.side_effect = Exception("加载失败")
+
+        results = await WorkItemProvider("My Project").batch_update_issues(
+            issue_ids=[101], status="进行中"
+        )
+
+        assert len(results) == 1
+        assert results[0].success is True
+        mock_work_item_api.update.assert_awaited_once()
+
+
+class TestRoleOwners:
+    """测试整页 role_owners 解析与按角色过滤"""
+
+    @pytest.fixture(autouse=True)
+    def setup_mocks(self, mock_work_item_api, mock_metadata):
+        mock_metadata.get_project_key.return_value = "proj_123"
+        mock_metadata.get_type_key.return_value = "type_issue"
+        mock_metadata.get_role_name.side_effect = lambda pk, tk, rk: {
+            "role_a06e00": "经办人"
+        }.get(rk)
+        mock_metadata.get_role_key.return_value = "role_a06e00"
+        mock_metadata.get_user_key.return_value = "u1"
+
+    @staticmethod
+    def _items():
+        return [
+            {
+                "id": 1,
+                "fields": [
+                    {
+                        "field_key": "role_owners",
+                        "field_type_key": "role_owners",
+                        "field_value": [
+                            {"role": "role_a06e00", "owners": ["u1", "u2"]},
+                            {"role": "role_other", "owners": ["u3"]},
+                        ],
+                    }
+                ],
+            },
+            {
+                "id": 2,
+                "role_owners": [{"role": "role_a06e00", "owners": ["u2"]}],
+            },
+        ]
+
+    @pytest.mark.asyncio
+    async def test_resolve_role_owners_batches_user_lookup(self, mock_metadata):
+        provider = WorkItemProvider("My Project")
+        provider._get_users_with_cache = AsyncMock(
+            return_value={"u1": "张三", "u2": "李四", "u3": "王五"}
+        )
+
+        result = await provider.resolve_role_owners(self._items())
+
+        provider._get_users_with_cache.assert_awaited_once()
+        assert sorted(provider._get_users_with_cache.call_args.args[0]) == [
+            "u1",
+            "u2",
+            "u3",
+        ]
+        assert result[1][0] == {"role": "经办人", "owners": ["张三", "李四"]}
+        assert result[1][1] == {"role": "role_other", "owners": ["王五"]}
+        assert result[2] == [{"role": "经办人", "owners": ["李四"]}]
+        # 每个唯一角色只解析一次
+        assert mock_metadata.get_role_name.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_filter_items_by_role(self, mock_metadata):
+        items = await WorkItemProvider("My Project").filter_items_by_role(
+            self._items(), "经办人", "张三"
+        )
+
+        assert [item["id"] for item in items] == [1]
+
+    @pytest.mark.asyncio
+    async def test_filter_items_by_role_matches_exact_short_key(self):
+        """完整 Key 按短 Key 匹配，仅后缀相同的其他角色不匹配"""
+        items = [
+            {
+                "id": 1,
+                "role_owners": [{"role": "role_p_t_role_a06e00", "owners": ["u1"]}],
+            },
+            {"id": 2, "role_owners": [{"role": "xrole_a06e00", "owners": ["u1"]}]},
+        ]
+
+        result = await WorkItemProvider("My Project").filter_items_by_role(
+            items, "经办人", "u1"
+        )
+
+        assert [item["id"] for item in result] == [1]
+
+    @pytest.mark.asyncio
+    async def test_get_tasks_role_filter(self, mock_work_item_api, mock_metadata):
+        """get_tasks 按角色过滤时请求 role_owners，默认角色人员为当前调用用户"""
+        mock_metadata.get_field_key.side_effect = lambda pk, tk, name: f"field_{name}"
+        mock_metadata.get_user_key.side_effect = lambda user: user
+        mock_work_item_api.search_params = AsyncMock(
+            return_value={
+                "work_items": self._items(),
+                "pagination": {"total": 2, "page_num": 1, "page_size": 50},
+            }
+        )
+        provider = WorkItemProvider("My Project")
+
+        token = user_key_context.set("u1")
+        try:
+            mine = await provider.get_tasks(role="经办人")
+            others = await provider.get_tasks(role="经办人", role_user="u2")
+        finally:
+            user_key_context.reset(token)
+
+        assert [item["id"] for item in mine["items"]] == [1]
+        assert mine["total"] == 2
+        assert [item["id"] for item in others["items"]] == [1, 2]
+        fields = mock_work_item_api.search_params.call_args.kwargs["fields"]
+        assert "role_owners" in fields
+        # 同一用户、同一投影的页由结果缓存复用，角色过滤在缓存之后进行
+        assert mock_work_item_api.search_params.await_count == 1
+
+        with pytest.raises(ValueError, match="role_user"):
+            await provider.get_tasks(role="经办人")
+
+    @pytest.mark.asyncio
+    async def test_simplify_work_items_include_roles(self):
+        provider = WorkItemProvider("My Project")
+        provider._get_users_with_cache = AsyncMock(
+            return_value={"u1": "张三", "u2": "李四", "u3": "王五"}
+        )
+
+        rows = await provider.simplify_work_items(self._items(), include_roles=True)
+
+        assert rows[1]["roles"] == [{"role": "经办人", "owners": ["李四"]}]
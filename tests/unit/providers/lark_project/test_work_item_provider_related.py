@@ -79,3 +79,34 @@ async def test_get_tasks_related_to_concurrency(mock_work_item_api, mock_metadat
     # So it should stop after Batch 2.
     
     assert mock_work_item_api.filter.call_count >= 8
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_related_to_only_checks_relation_fields(
+    mock_work_item_api, mock_metadata
+):
+    """已知关联字段时，只检查这些字段的值"""
+    mock_metadata.get_project_key.return_value = "proj_123"
+    mock_metadata.get_type_key.return_value = "type_issue"
+    mock_metadata.get_relation_field_keys.return_value = {"field_related"}
+
+    async def mock_filter(project_key, work_item_type_keys, page_num, page_size, **kwargs):
+        if page_num > 1:
+            return {"work_items": [], "total": 2}
+        return {
+            "work_items": [
+                # 非关联字段恰好等于目标 ID，不应命中
+                {"id": 1, "fields": [{"field_key": "field_points", "field_value": 999}]},
+                {"id": 2, "fields": [{"field_key": "field_related", "field_value": [999]}]},
+            ],
+            "total": 2,
+        }
+
+    mock_work_item_api.filter.side_effect = mock_filter
+
+    result = await WorkItemProvider("My Project").get_tasks(related_to=999)
+
+    assert [item["id"] for item in result["items"]] == [2]
+    mock_metadata.get_relation_field_keys.assert_awaited_once_with(
+        "proj_123", "type_issue"
+    )
@@ -0,0 +1,99 @@
+"""
+WriteLimiter 单元测试
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.providers.lark_project.write_limiter import WriteLimiter, is_rate_limited
+
+
+def _rate_limit_error():
+    request = httpx.Request("PUT", "https://example.com")
+    response = httpx.Response(429, request=request)
+    return httpx.HTTPStatusError("429", request=request, response=response)
+
+
+async def _call(limiter, error=None):
+    async with limiter.slot():
+        await asyncio.sleep(0)
+        if error is not None:
+            raise error
+
+
+class TestWriteLimiter:
+    """WriteLimiter 测试类"""
+
+    def test_is_rate_limited(self):
+        assert is_rate_limited(_rate_limit_error())
+        assert is_rate_limited(Exception("HTTP 429 Too Many Requests"))
+        assert not is_rate_limited(Exception("字段不存在"))
+
+    @pytest.mark.asyncio
+    async def test_additive_increase_up_to_max(self):
+        """连续成功时窗口加性增长，不超过上限"""
+        limiter = WriteLimiter(initial=2, max_limit=4, latency_tolerance=0)
+
+        for _ in range(5):
+            await _call(limiter)
+        assert 3 <= limiter.window < 4
+
+        for _ in range(50):
+            await _call(limiter)
+        assert limiter.limit == 4
+        assert limiter.snapshot()["successes"] == 55
+
+    @pytest.mark.asyncio
+    async def test_burst_of_429_halves_window_once(self):
+        """同一轮次的多个 429 只触发一次乘性下降，其他异常不影响窗口"""
+        limiter = WriteLimiter(initial=8, max_limit=8, latency_tolerance=0)
+
+        results = await asyncio.gather(
+            *[_call(limiter, _rate_limit_error()) for _ in range(8)],
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+        assert limiter.window == 4
+
+        with pytest.raises(ValueError):
+            await _call(limiter, ValueError("bad payload"))
+        assert limiter.window == 4
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await _call(limiter, _rate_limit_error())
+        assert limiter.window == 2
+        snapshot = limiter.snapshot()
+        assert snapshot["rate_limited"] == 9
+        assert snapshot["decreases"] == 2
+
+    @pytest.mark.asyncio
+    async def test_window_bounds_in_flight(self):
+        """在途请求数不超过当前窗口"""
+        limiter = WriteLimiter(initial=2, max_limit=2, latency_tolerance=0)
+        peak = 0
+
+        async def tracked():
+            nonlocal peak
+            async with limiter.slot():
+                peak = max(peak, limiter.snapshot()["in_flight"])
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*[tracked() for _ in range(6)])
+
+        assert peak == 2
+        assert limiter.snapshot()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_latency_inflation_decreases_window(self):
+        """平滑延迟超过基线容忍倍数时降窗"""
+        limiter = WriteLimiter(initial=8, max_limit=8, latency_tolerance=2.0)
+
+        limiter._on_success(limiter._epoch, 0.1)
+        assert limiter.window == 8
+        for _ in range(5):
+            limiter._on_success(limiter._epoch, 1.0)
+
+        assert limiter.window < 8
+        assert limiter.snapshot()["decreases"] >= 1
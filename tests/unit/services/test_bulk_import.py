@@ -0,0 +1,145 @@
+"""
+BulkImporter 单元测试
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.providers.lark_project.work_item_provider import UpdateResult
+from src.services.bulk_import import BulkImporter, iter_rows
+
+ROWS = [
+    {"work_item": "Alpha", "field": "priority", "value": "P1"},
+    {"work_item": "Beta", "field": "priority", "value": "P1"},
+    {"work_item": "12345", "field": "Wi-Fi Module", "value": "MT7668BSN"},
+    {"work_item": "Alpha", "field": "status", "value": "进行中"},
+    {"work_item": "Missing", "field": "priority", "value": "P0"},
+]
+NAME_IDS = {"Alpha": 101, "Beta": 102}
+
+
+def _write_jsonl(path, rows):
+    path.write_text(
+        "\n".join(json.dumps(r, ensure_ascii=False) for r in rows) + "\n",
+        encoding="utf-8",
+    )
+
+
+def _provider(fail_on_call=None, target=("proj", "story")):
+    """模拟 Provider: 名称解析 + bulk_update_issues 按编辑返回成功结果"""
+    provider = MagicMock()
+    provider.get_target_keys = AsyncMock(return_value=target)
+    provider.resolve_work_item_names = AsyncMock(
+        side_effect=lambda names: {n: NAME_IDS[n] for n in names if n in NAME_IDS}
+    )
+    calls = []
+
+    async def bulk_update_issues(edits, dry_run=False):
+        calls.append(edits)
+        if fail_on_call is not None and len(calls) == fail_on_call:
+            raise RuntimeError("connection reset")
+        results = [
+            UpdateResult(True, issue_id, field, "更新成功")
+            for issue_id, fields in edits
+            for field in fields
+        ]
+        return {"results": results, "planned_calls": len(edits)}
+
+    provider.bulk_update_issues = AsyncMock(side_effect=bulk_update_issues)
+    return provider, calls
+
+
+class TestIterRows:
+    """编辑文件读取测试"""
+
+    def test_jsonl_and_malformed_rows(self, tmp_path):
+        path = tmp_path / "edits.jsonl"
+        path.write_text(
+            '{"work_item": "A", "field": "f", "value": 1}\n\nnot json\n{"field": "f"}\n',
+            encoding="utf-8",
+        )
+
+        rows = list(iter_rows(path, "jsonl"))
+
+        assert [r.row for r in rows] == [1, 2, 3]
+        assert rows[0].error is None and rows[0].value == 1
+        assert "JSON" in rows[1].error
+        assert "缺少" in rows[2].error
+
+    def test_csv(self, tmp_path):
+        path = tmp_path / "edits.csv"
+        path.write_text(
+            "work_item,field,value\n123,priority,P1\nAlpha,状态,进行中\n",
+            encoding="utf-8",
+        )
+
+        rows = list(iter_rows(path, "csv"))
+
+        assert [(r.work_item, r.field, r.value) for r in rows] == [
+            ("123", "priority", "P1"),
+            ("Alpha", "状态", "进行中"),
+        ]
+
+
+class TestBulkImporter:
+    """BulkImporter 测试类"""
+
+    @pytest.mark.asyncio
+    async def test_import_resolves_names_once_and_reports_failures(self, tmp_path):
+        """名称跨块只解析一次，未匹配的行计为失败，完成后删除检查点"""
+        path = tmp_path / "edits.jsonl"
+        _write_jsonl(path, ROWS)
+        provider, calls = _provider()
+
+        report = await BulkImporter(provider, chunk_size=2).run(path)
+
+        assert report["rows_total"] == 5
+        assert report["succeeded"] == 4
+        assert report["failed"] == 1
+        assert report["failures"][0]["row"] == 5
+        assert calls == [
+            [(101, {"priority": "P1"}), (102, {"priority": "P1"})],
+            [(12345, {"Wi-Fi Module": "MT7668BSN"}), (101, {"status": "进行中"})],
+        ]
+        resolved = [c.args[0] for c in provider.resolve_work_item_names.await_args_list]
+        assert resolved == [["Alpha", "Beta"], ["Missing"]]
+        assert not BulkImporter.checkpoint_path_for(path).exists()
+
+    @pytest.mark.asyncio
+    async def test_resume_from_checkpoint(self, tmp_path):
+        """中断后重新运行，已完成的块不再写入"""
+        path = tmp_path / "edits.jsonl"
+        _write_jsonl(path, ROWS)
+        provider, _ = _provider(fail_on_call=2)
+
+        with pytest.raises(RuntimeError):
+            await BulkImporter(provider, chunk_size=2).run(path)
+        checkpoint = BulkImporter.checkpoint_path_for(path)
+        assert json.loads(checkpoint.read_text())["rows_done"] == 2
+
+        provider, calls = _provider()
+        report = await BulkImporter(provider, chunk_size=2).run(path)
+
+        assert report["rows_resumed"] == 2
+        assert report["succeeded"] == 4
+        assert report["failed"] == 1
+        assert calls[0][0] == (12345, {"Wi-Fi Module": "MT7668BSN"})
+        assert not checkpoint.exists()
+
+    @pytest.mark.asyncio
+    async def test_refuses_checkpoint_of_other_target(self, tmp_path):
+        """检查点属于其他项目/类型时拒绝续传，不跳过任何行"""
+        path = tmp_path / "edits.jsonl"
+        _write_jsonl(path, ROWS)
+        provider, _ = _provider(fail_on_call=2)
+        with pytest.raises(RuntimeError):
+            await BulkImporter(provider, chunk_size=2).run(path)
+
+        provider, calls = _provider(target=("other_proj", "story"))
+        with pytest.raises(ValueError, match="other_proj"):
+            await BulkImporter(provider, chunk_size=2).run(path)
+
+        assert calls == []
+        assert BulkImporter.checkpoint_path_for(path).exists()
@@ -18,6 +18,10 @@ class TestMCPTools:
     @pytest.fixture
     def mock_provider(self):
         """Mock WorkItemProvider"""
+        from src.mcp_server import _provider_pool
+
+        # 清空实例池，避免复用其他用例创建的 Provider
+        _provider_pool.clear()
         with patch("src.mcp_server.WorkItemProvider") as mock_cls:
             mock_instance = MagicMock()
             # 设置异步方法
@@ -28,9 +32,12 @@ class TestMCPTools:
             mock_instance.update_issue = AsyncMock()
             mock_instance.list_available_options = AsyncMock()
             mock_instance.resolve_related_to = AsyncMock()
+            mock_instance.get_summary_field_mapping = AsyncMock(return_value={})
 
             # 设置异步方法
-            async def mock_simplify_work_items(items, field_mapping=None):
+            async def mock_simplify_work_items(
+                items, field_mapping=None, include_roles=False
+            ):
                 return [
                     {
                         "id": item.get("id"),
@@ -47,6 +54,7 @@ class TestMCPTools:
             )
             mock_cls.return_value = mock_instance
             yield mock_instance
+        _provider_pool.clear()
 
     # =========================================================================
     # create_task 测试 (返回纯文本)
@@ -92,6 +100,29 @@ class TestMCPTools:
         # 验证错误信息被传递（核心信息）
         assert "系统内部错误" in result
 
+    @pytest.mark.asyncio
+    async def test_batch_create_tasks(self, mock_provider):
+        """测试批量创建 - 验证逐项结果与统计"""
+        from src.mcp_server import batch_create_tasks
+        from src.providers.lark_project.work_item_provider import CreateResult
+
+        items = [{"name": "A", "priority": "P0"}, {"name": "B"}]
+        mock_provider.batch_create_issues = AsyncMock(
+            return_value=[
+                CreateResult(True, 0, "A", "创建成功", 1001),
+                CreateResult(False, 1, "B", "字段 'x' 不存在"),
+            ]
+        )
+
+        result = await batch_create_tasks(items=items, project="proj_xxx")
+        data = json.loads(result)
+
+        assert data["success"] is True
+        assert data["data"]["created_count"] == 1
+        assert data["data"]["failed_count"] == 1
+        assert [r["issue_id"] for r in data["data"]["results"]] == [1001, None]
+        mock_provider.batch_create_issues.assert_awaited_once_with(items)
+
     # =========================================================================
     # get_tasks 测试 (返回 JSON)
     # =========================================================================
@@ -133,6 +164,9 @@ class TestMCPTools:
             related_to=None,
             page_num=1,
             page_size=50,
+            role=None,
+            role_user=None,
+            include_role_owners=False,
         )
 
     @pytest.mark.asyncio
@@ -207,6 +241,34 @@ class TestMCPTools:
         # 验证错误信息被传递
         assert "系统内部错误" in result
 
+    @pytest.mark.asyncio
+    async def test_get_task_details_success(self, mock_provider):
+        """测试批量获取工作项详情 - 去重并保持输入顺序"""
+        from src.mcp_server import get_task_details
+
+        mock_provider.get_readable_issues_details = AsyncMock(
+            return_value={
+                "items": [{"id": 2, "name": "B"}, {"id": 1, "name": "A"}],
+                "not_found": [3],
+            }
+        )
+
+        result = await get_task_details(issue_ids=[2, 1, 2, 3], project="proj_xxx")
+
+        data = json.loads(result)
+        assert [item["id"] for item in data["items"]] == [2, 1]
+        assert data["not_found"] == [3]
+        mock_provider.get_readable_issues_details.assert_awaited_once_with([2, 1, 3])
+
+    @pytest.mark.asyncio
+    async def test_get_task_details_requires_ids(self, mock_provider):
+        """测试未提供 ID 时返回错误"""
+        from src.mcp_server import get_task_details
+
+        result = await get_task_details(issue_ids=[], project="proj_xxx")
+
+        assert json.loads(result)["success"] is False
+
     # =========================================================================
     # update_task 测试 (返回纯文本)
     # =========================================================================
@@ -243,6 +305,7 @@ class TestMCPTools:
             status="已完成",
             assignee=None,
             extra_fields=None,
+            skip_unchanged=False,
         )
 
     @pytest.mark.asyncio
@@ -300,6 +363,22 @@ class TestMCPTools:
         # 验证错误信息被传递
         assert "系统内部错误" in result
 
+    @pytest.mark.asyncio
+    async def test_provider_reused_across_calls(self, mock_provider):
+        """测试相同 (project, work_item_type) 复用 Provider 实例"""
+        from src.mcp_server import WorkItemProvider, get_task_options
+
+        mock_provider.list_available_options.return_value = {"待处理": "opt_1"}
+
+        await get_task_options(project="proj_xxx", field_name="status")
+        await get_task_options(project="proj_xxx", field_name="priority")
+        assert WorkItemProvider.call_count == 1
+
+        await get_task_options(
+            project="proj_xxx", field_name="status", work_item_type="需求管理"
+        )
+        assert WorkItemProvider.call_count == 2
+
 
 class TestHelperFunctions:
     """辅助函数测试 - 测试 WorkItemProvider 中的辅助方法"""
@@ -315,45 +394,6 @@ class TestHelperFunctions:
 
             return WorkItemProvider()
 
-    def test_extract_field_value_simple(self, provider):
-        """测试提取简单字段值"""
-        item = {
-            "field_value_pairs": [
-                {"field_key": "name", "field_value": "Task Name"},
-                {"field_key": "priority", "field_value": "P0"},
-            ]
-        }
-
-        assert provider._extract_field_value(item, "name") == "Task Name"
-        assert provider._extract_field_value(item, "priority") == "P0"
-        assert provider._extract_field_value(item, "nonexistent") is None
-
-    def test_extract_field_value_dict(self, provider):
-        """测试提取字典类型字段值（选项类型）"""
-        item = {
-            "field_value_pairs": [
-                {
-                    "field_key": "status",
-                    "field_value": {"label": "进行中", "value": "opt_in_progress"},
-                }
-            ]
-        }
-
-        assert provider._extract_field_value(item, "status") == "进行中"
-
-    def test_extract_field_value_user_list(self, provider):
-        """测试提取用户列表类型字段值"""
-        item = {
-            "field_value_pairs": [
-                {
-                    "field_key": "owner",
-                    "field_value": [{"name": "张三", "user_key": "user_xxx"}],
-                }
-            ]
-        }
-
-        assert provider._extract_field_value(item, "owner") == "张三"
-
     @pytest.mark.asyncio
     async def test_simplify_work_item(self, provider):
         """测试简化工作项"""